@@ -1,5 +1,8 @@
 import os
+from fnmatch import fnmatchcase
+
 from celery import Celery
+from celery.signals import celeryd_init, task_postrun, task_prerun
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
@@ -8,5 +11,66 @@ app = Celery('diamond_web')
 # Load config from Django settings, using CELERY_ namespace
 app.config_from_object('django.conf:settings', namespace='CELERY')
 
+
+def queue_for_task(task_name):
+    """Return the queue CELERY_TASK_ROUTES sends *task_name* to."""
+    from django.conf import settings
+    for pattern, route in settings.CELERY_TASK_ROUTES.items():
+        if fnmatchcase(task_name, pattern):
+            return route['queue']
+    return settings.CELERY_TASK_DEFAULT_QUEUE
+
+
+class QueueTimeLimits:
+    """Task annotation applying the time limits of the task's queue (TASK_QUEUE_CONFIG)."""
+
+    def annotate(self, task):
+        from django.conf import settings
+        if not task.name.startswith('diamond_web.'):
+            return None
+        config = settings.TASK_QUEUE_CONFIG.get(queue_for_task(task.name), {})
+        return {
+            key: config[key] for key in ('soft_time_limit', 'time_limit') if key in config
+        } or None
+
+
+app.conf.task_annotations = (QueueTimeLimits(),)
+
+
+@celeryd_init.connect
+def configure_queue_worker(sender=None, conf=None, options=None, **kwargs):
+    """Use the queue's concurrency when a worker is started for a single queue.
+
+    ``celery -A config worker -Q sync`` runs with TASK_QUEUE_CONFIG['sync']
+    concurrency unless ``--concurrency`` is passed explicitly.
+    """
+    from django.conf import settings
+    options = options or {}
+    queues = options.get('queues') or []
+    if isinstance(queues, str):
+        queues = [q for q in queues.split(',') if q]
+    if len(queues) != 1 or options.get('concurrency'):
+        return
+    config = settings.TASK_QUEUE_CONFIG.get(queues[0])
+    if config and 'concurrency' in config:
+        conf.worker_concurrency = config['concurrency']
+
+
+@task_prerun.connect
+@task_postrun.connect
+def close_stale_db_connections(task=None, **kwargs):
+    """Drop DB connections that are broken or older than CONN_MAX_AGE.
+
+    Django does this around every HTTP request; Celery has no request cycle,
+    so without it a worker keeps reusing a connection the server already
+    closed (or never returns one to the pool).  Eager tasks run inside the
+    caller's request or transaction and are left alone.
+    """
+    if task is not None and task.request.is_eager:
+        return
+    from django.db import close_old_connections
+    close_old_connections()
+
+
 # Auto-discover tasks from all INSTALLED_APPS
 app.autodiscover_tasks()
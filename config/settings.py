@@ -74,6 +74,12 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    # Opt-in via QUERY_BUDGET_ENABLED; removed at startup otherwise
+    "diamond_web.middleware.QueryBudgetMiddleware",
+    # Removed at startup when the reporting alias is disabled
+    "diamond_web.middleware.ReportingPinMiddleware",
+    # Superuser-triggered / sampled cProfile profiles (PROFILER_*)
+    "diamond_web.middleware.ProfilerMiddleware",
 ]
 
 # Add debug toolbar middleware in development (skip during test runs)
@@ -137,6 +143,63 @@ else:
         }
     }
 
+# Read-only "reporting" alias for the report and DataTables endpoints
+# (diamond_web.utils.db_routing).  SQLite: a second connection to the same WAL
+# file that refuses writes.  PostgreSQL: a replica set via DB_REPORTING_*.
+# Tests mirror it onto "default" so they see the same test transaction.
+REPORTING_DB_ENABLED = os.getenv("REPORTING_DB_ENABLED", "True").lower() == "true"
+if DB_ENGINE == "postgresql":
+    if os.getenv("DB_REPORTING_HOST"):
+        DATABASES["reporting"] = {
+            **DATABASES["default"],
+            "NAME": os.getenv("DB_REPORTING_NAME", DATABASES["default"]["NAME"]),
+            "USER": os.getenv("DB_REPORTING_USER", DATABASES["default"]["USER"]),
+            "PASSWORD": os.getenv("DB_REPORTING_PASSWORD", DATABASES["default"]["PASSWORD"]),
+            "HOST": os.getenv("DB_REPORTING_HOST"),
+            "PORT": os.getenv("DB_REPORTING_PORT", DATABASES["default"]["PORT"]),
+            "TEST": {"MIRROR": "default"},
+        }
+else:
+    DATABASES["reporting"] = {
+        **DATABASES["default"],
+        "OPTIONS": {
+            "init_command": "PRAGMA query_only=ON;",
+            "timeout": 30,
+        },
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["diamond_web.utils.db_routing.ReportingRouter"]
+# After a request that wrote, the session reads from "default" for this long
+# so pages reloaded right after a save never see replica lag
+REPORTING_DB_PIN_SECONDS = int(os.getenv("REPORTING_DB_PIN_SECONDS", "5"))
+
+# Connection profile.  "persistent" (default) keeps each gunicorn thread's and
+# Celery worker's connection open for DB_CONN_MAX_AGE seconds, checked before
+# reuse, instead of reconnecting on every request/task; "off" restores one
+# connection per request.  Celery closes stale connections around each task
+# (config/celery.py).
+DB_CONNECTION_PROFILE = os.getenv("DB_CONNECTION_PROFILE", "persistent").lower()
+if DB_CONNECTION_PROFILE == "persistent":
+    for _db in DATABASES.values():
+        _db["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+        _db["CONN_HEALTH_CHECKS"] = True
+        if _db["ENGINE"] == "django.db.backends.sqlite3":
+            # Runs once per connection, so only worth it on persistent ones
+            _db["OPTIONS"]["init_command"] += (
+                f" PRAGMA mmap_size={int(os.getenv('DB_SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))};"
+                f" PRAGMA cache_size=-{int(os.getenv('DB_SQLITE_CACHE_KB', '65536'))};"
+                f" PRAGMA busy_timeout={_db['OPTIONS']['timeout'] * 1000};"
+            )
+        elif os.getenv("DB_POOL_ENABLED", "False").lower() == "true":
+            # psycopg 3 connection pool per process (pip install "psycopg[pool]");
+            # Django requires CONN_MAX_AGE=0 when pooling
+            _db["CONN_MAX_AGE"] = 0
+            _db.setdefault("OPTIONS", {})["pool"] = {
+                "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+                "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+            }
+
 # ---------------------------------------------------------------------------
 # django-dbbackup — database backup and restore
 # https://django-dbbackup.readthedocs.io/
@@ -310,8 +373,104 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_ACKS_LATE = True  # re-queue task if worker crashes mid-execution
-CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # one task per worker at a time (sync jobs are long)
-CELERY_WORKER_POOL = 'solo'           # Windows: prefork uses POSIX semaphores (unsupported); solo runs tasks in-process
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # one task per worker process at a time (sync jobs are long)
+
+# Worker pool: Windows cannot use prefork (POSIX semaphores), so it runs tasks
+# in-process with 'solo'; Linux uses prefork (or 'threads' via env) so several
+# tasks run in parallel.
+CELERY_WORKER_POOL = os.getenv('CELERY_WORKER_POOL', 'solo' if os.name == 'nt' else 'prefork')
+CELERY_WORKER_MAX_TASKS_PER_CHILD = 50  # recycle prefork children (large sync batches hold memory)
+
+# Queue topology: a long tiket sync must not block referensi checks, so each
+# kind of work has its own queue (run one worker per queue, see
+# docs/PRODUCTION_SETUP.md).  Tasks not listed here go to 'default'.
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_ROUTES = {
+    'diamond_web.tasks.sync_*': {'queue': 'sync'},
+    'diamond_web.tasks.check_*': {'queue': 'check'},
+    'diamond_web.tasks.cleanup_*': {'queue': 'cleanup'},
+    'diamond_web.tasks.*document*': {'queue': 'documents'},
+}
+
+# Per-queue worker concurrency and task time limits (seconds).  Concurrency is
+# applied when a worker consumes a single queue (``-Q sync``) and no
+# ``--concurrency`` is given; time limits are applied to every task routed to
+# the queue.  The sync time limit also bounds the singleton sync lock.
+TASK_QUEUE_CONFIG = {
+    'default': {'concurrency': 2, 'soft_time_limit': 600, 'time_limit': 660},
+    'sync': {'concurrency': 2, 'soft_time_limit': 3 * 3600, 'time_limit': 3 * 3600 + 300},
+    'check': {'concurrency': 2, 'soft_time_limit': 1800, 'time_limit': 1800 + 120},
+    'cleanup': {'concurrency': 1, 'soft_time_limit': 3600, 'time_limit': 3600 + 300},
+    'documents': {'concurrency': 4, 'soft_time_limit': 600, 'time_limit': 660},
+}
+
+# ---------------------------------------------------------------------------
+# Sync log rotation (files referenced by the SyncRun catalog)
+# ---------------------------------------------------------------------------
+SYNC_LOG_COMPRESS_AFTER_DAYS = int(os.getenv('SYNC_LOG_COMPRESS_AFTER_DAYS', '7'))
+SYNC_LOG_RETENTION_DAYS = int(os.getenv('SYNC_LOG_RETENTION_DAYS', '90'))
+
+# ---------------------------------------------------------------------------
+# Reference data cache (diamond_web/utils/reference_data.py)
+# ---------------------------------------------------------------------------
+# Seconds a process trusts its copy of the version before re-reading it
+REFERENCE_DATA_LOCAL_TTL = int(os.getenv('REFERENCE_DATA_LOCAL_TTL', '5'))
+# Lifetime of a built option list in the shared cache
+REFERENCE_DATA_CACHE_TIMEOUT = int(os.getenv('REFERENCE_DATA_CACHE_TIMEOUT', str(24 * 60 * 60)))
+
+# ---------------------------------------------------------------------------
+# Bulk workflow actions on the tiket list (diamond_web/views/tiket/bulk_action.py)
+# ---------------------------------------------------------------------------
+# Most tikets one bulk identifikasi / transfer / selesaikan / batalkan may select
+TIKET_BULK_ACTION_MAX = int(os.getenv('TIKET_BULK_ACTION_MAX', '200'))
+
+# ---------------------------------------------------------------------------
+# Notifications (diamond_web/services/notifications.py)
+# ---------------------------------------------------------------------------
+# Unread notifications of one title to one user within this window are merged into a digest
+NOTIFICATION_DIGEST_WINDOW_MINUTES = int(os.getenv('NOTIFICATION_DIGEST_WINDOW_MINUTES', '60'))
+# Read notifications older than this are deleted by `manage.py cleanup_read_notifications`
+# (daily, scripts/db_backup_daily.sh) or cleanup_read_notifications_task
+NOTIFICATION_RETENTION_DAYS = int(os.getenv('NOTIFICATION_RETENTION_DAYS', '90'))
+
+# ---------------------------------------------------------------------------
+# Tiket action archive (diamond_web/utils/tiket_timeline.py)
+# ---------------------------------------------------------------------------
+# Actions of closed tikets idle for longer than this move to tiket_action_archive
+TIKET_ACTION_ARCHIVE_AFTER_DAYS = int(os.getenv('TIKET_ACTION_ARCHIVE_AFTER_DAYS', '365'))
+
+# ---------------------------------------------------------------------------
+# Query budget instrumentation (diamond_web/middleware.py, /diagnostics/queries/)
+# ---------------------------------------------------------------------------
+QUERY_BUDGET_ENABLED = os.getenv('QUERY_BUDGET_ENABLED', 'False').lower() == 'true'
+# A request above either limit is logged as over budget
+QUERY_BUDGET_MAX_QUERIES = int(os.getenv('QUERY_BUDGET_MAX_QUERIES', '50'))
+QUERY_BUDGET_MAX_SQL_MS = int(os.getenv('QUERY_BUDGET_MAX_SQL_MS', '500'))
+# Per URL name overrides, e.g. {'tiket_detail': {'queries': 20}}
+QUERY_BUDGET_OVERRIDES = {}
+# Same query shape executed this many times in one request = likely N+1
+QUERY_BUDGET_DUPLICATE_THRESHOLD = int(os.getenv('QUERY_BUDGET_DUPLICATE_THRESHOLD', '5'))
+# Long-lived streams and the diagnostics page itself are not measured
+QUERY_BUDGET_EXCLUDED_VIEWS = (
+    'oracle_sync_events', 'sync_tiket_events', 'query_diagnostics',
+    'profile_diagnostics', 'profile_detail', 'profile_download',
+)
+# Histogram slot length and rolling window (seconds)
+QUERY_STATS_SLOT_SECONDS = int(os.getenv('QUERY_STATS_SLOT_SECONDS', '300'))
+QUERY_STATS_WINDOW_SECONDS = int(os.getenv('QUERY_STATS_WINDOW_SECONDS', str(24 * 60 * 60)))
+
+# ---------------------------------------------------------------------------
+# Profiler (diamond_web/utils/profiling.py, /diagnostics/profiles/)
+# ---------------------------------------------------------------------------
+# Superusers profile a request with the X-Profile: 1 header or ?_profile=1
+PROFILER_ENABLED = os.getenv('PROFILER_ENABLED', 'True').lower() == 'true'
+# Fraction of all requests profiled without being asked (0.0 - 1.0)
+PROFILER_SAMPLE_RATE = float(os.getenv('PROFILER_SAMPLE_RATE', '0'))
+# Celery tasks profiled on every run, e.g. PROFILER_TASKS=diamond_web.tasks.sync_tiket_data_task
+PROFILER_TASKS = tuple(name for name in os.getenv('PROFILER_TASKS', '').split(',') if name)
+# Ring of stored profiles (oldest deleted first)
+PROFILER_DIR = os.getenv('PROFILER_DIR', str(MEDIA_ROOT / 'profiles'))
+PROFILER_MAX_PROFILES = int(os.getenv('PROFILER_MAX_PROFILES', '50'))
 
 # ---------------------------------------------------------------------------
 # Cache — use Redis so the Celery worker and the web process share state.
@@ -18,3 +18,14 @@ for middleware in essential_middleware:
 
 DEBUG = False
 
+
+# Use an in-process cache so tests do not need a running Redis server
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Report views read from "default" unless a test enables the reporting alias
+# (it needs databases=['default', 'reporting'] and transaction=True)
+REPORTING_DB_ENABLED = False
@@ -0,0 +1,43 @@
+from django import forms
+from ..utils import validate_not_future_datetime
+
+DATETIME_INPUT_FORMATS = ['%Y-%m-%dT%H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M']
+
+
+class BulkIdentifikasiForm(forms.Form):
+    """Shared input of a bulk Identifikasi: the Tanggal Rekam PIDE of every selected tiket."""
+    tgl_rekam_pide = forms.DateTimeField(label='Tanggal Rekam PIDE', input_formats=DATETIME_INPUT_FORMATS)
+
+    def clean_tgl_rekam_pide(self):
+        value = self.cleaned_data.get('tgl_rekam_pide')
+        return validate_not_future_datetime(value, "Tanggal Rekam PIDE")
+
+
+class BulkTransferKePMDEForm(forms.Form):
+    """Shared input of a bulk Transfer ke PMDE: the Tanggal Transfer."""
+    tgl_transfer = forms.DateTimeField(label='Tanggal Transfer', input_formats=DATETIME_INPUT_FORMATS)
+
+    def clean_tgl_transfer(self):
+        value = self.cleaned_data.get('tgl_transfer')
+        return validate_not_future_datetime(value, "Tanggal Transfer")
+
+
+class BulkBatalkanForm(forms.Form):
+    """Shared input of a bulk Batalkan: the cancellation note."""
+    catatan = forms.CharField(label='Catatan', max_length=1000)
+
+
+class TransferKePMDERowForm(forms.Form):
+    """Row counts of one tiket in a bulk Transfer ke PMDE."""
+    baris_i = forms.IntegerField(label='Baris I', min_value=0)
+    baris_u = forms.IntegerField(label='Baris U', min_value=0)
+    baris_res = forms.IntegerField(label='Baris Res', min_value=0)
+    baris_cde = forms.IntegerField(label='Baris CDE', min_value=0)
+
+
+class SelesaikanRowForm(forms.Form):
+    """QC counts of one tiket in a bulk Selesaikan."""
+    sudah_qc = forms.IntegerField(label='Sudah QC')
+    lolos_qc = forms.IntegerField(label='Lolos QC')
+    tidak_lolos_qc = forms.IntegerField(label='Tidak Lolos QC')
+    qc_c = forms.IntegerField(label='QC C')
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from ...utils import tiket_timeline
+
+
+class Command(BaseCommand):
+    help = "Pindahkan TiketAction tiket yang sudah ditutup (Selesai/Dibatalkan) ke tabel arsip"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            default=None,
+            help='Arsipkan tiket yang aksi terakhirnya lebih dari N hari lalu '
+                 '(default: TIKET_ACTION_ARCHIVE_AFTER_DAYS)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=tiket_timeline.ARCHIVE_CHUNK_SIZE,
+            help='Jumlah aksi yang dipindahkan per transaksi',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Hitung tiket yang akan diarsipkan tanpa memindahkan data',
+        )
+
+    def handle(self, *args, **options):
+        tikets = tiket_timeline.archivable_tikets(options['older_than_days']).count()
+        self.stdout.write(f"- Tiket yang diarsipkan: {tikets}")
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('Dry-run: tidak ada data yang dipindahkan.'))
+            return
+
+        archived = tiket_timeline.archive_closed_tiket_actions(
+            older_than_days=options['older_than_days'],
+            chunk_size=options['batch_size'],
+        )
+        self.stdout.write(f"- Aksi dipindahkan    : {archived}")
+        self.stdout.write(self.style.SUCCESS('Pengarsipan aksi tiket selesai.'))
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import SyncRun
+from ...utils import sync_log
+
+
+class Command(BaseCommand):
+    help = "Catat run script cron (daily sync, cleanup) beserta file lognya di katalog Status Sinkronisasi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['start', 'finish'], help='Awal atau akhir run')
+        parser.add_argument('log_file', help='Path file log run ini')
+        parser.add_argument(
+            '--type',
+            dest='sync_type',
+            choices=sorted(sync_log.SYNC_TYPE_DISPLAY),
+            help='Jenis run (wajib untuk start, atau finish tanpa start)',
+        )
+        parser.add_argument(
+            '--exit-code',
+            type=int,
+            default=0,
+            help='Exit code run; selain 0 dicatat sebagai gagal (untuk finish)',
+        )
+        parser.add_argument(
+            '--message',
+            default=None,
+            help='Pesan error yang dicatat bila run gagal (untuk finish)',
+        )
+
+    def handle(self, *args, **options):
+        log_file = options['log_file']
+        run_id = sync_log.file_run_id(log_file)
+
+        if options['action'] == 'start':
+            if not options['sync_type']:
+                raise CommandError('--type wajib diisi untuk start.')
+            sync_log.start_run(options['sync_type'], run_id, log_path=log_file)
+            self.stdout.write(f"- Run dimulai : {run_id}")
+            return
+
+        run = SyncRun.objects.filter(run_id=run_id).first()
+        if run is None:
+            # One-shot entries (e.g. an error log) may skip start when --type is given
+            if not options['sync_type']:
+                raise CommandError(f'Run {run_id} belum dicatat (jalankan start atau isi --type).')
+            run = sync_log.start_run(options['sync_type'], run_id, log_path=log_file)
+        error = None
+        if options['exit_code']:
+            error = options['message'] or f"Exit code {options['exit_code']}"
+        run = sync_log.finish_run(run, error=error)
+        self.stdout.write(f"- Run selesai : {run_id} ({run.status})")
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Tiket
+from ...utils import sla
+
+
+class Command(BaseCommand):
+    help = "Bandingkan kolom SLA tiket (deadline/prioritas) dengan perhitungan ulang"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Perbaiki nilai yang tidak sesuai dengan perhitungan ulang',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help='Jumlah maksimum selisih yang ditampilkan',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=sla.RECOMPUTE_BATCH_SIZE,
+            help='Jumlah tiket yang dibaca per batch',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Tiket.objects.all()
+        diffs = 0
+        for tiket_id, stored, expected in sla.iter_sla_diffs(queryset, batch_size=options['batch_size']):
+            diffs += 1
+            if diffs <= options['limit']:
+                changed = ', '.join(
+                    f"{name}: {stored[name]} -> {expected[name]}"
+                    for name in sla.SLA_FIELDS
+                    if stored[name] != expected[name]
+                )
+                self.stdout.write(f"- Tiket {tiket_id}: {changed}")
+
+        total = queryset.count()
+        self.stdout.write(f"- Tiket diperiksa: {total}")
+        self.stdout.write(f"- Tidak sesuai   : {diffs}")
+
+        if not diffs:
+            self.stdout.write(self.style.SUCCESS('Kolom SLA konsisten.'))
+            return
+
+        if options['fix']:
+            fixed = sla.recompute_sla(queryset, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Kolom SLA diperbaiki untuk {fixed} tiket.'))
+            return
+
+        raise CommandError(f'{diffs} tiket memiliki kolom SLA yang tidak sesuai (jalankan dengan --fix).')
@@ -22,10 +22,12 @@ from django.db import transaction
 from diamond_web.models.tiket import Tiket
 from diamond_web.models.tiket_pic import TiketPIC
 from diamond_web.models.tiket_action import TiketAction
+from diamond_web.models.tiket_action_archive import TiketActionArchive
 from diamond_web.models.kirim_pide_temp import KirimPideTemp
 from diamond_web.models.detil_tanda_terima import DetilTandaTerima
 from diamond_web.models.backup_data import BackupData
 from diamond_web.models.tanda_terima_data import TandaTerimaData
+from diamond_web.utils import tiket_timeline
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +61,10 @@ class Command(BaseCommand):
                 'BackupData (semua)': BackupData.objects.count(),
                 'TandaTerimaData (semua)': TandaTerimaData.objects.count(),
                 'DetilTandaTerima (semua)': DetilTandaTerima.objects.count(),
-                'TiketAction (selain action=301)': TiketAction.objects.exclude(action=301).count(),
+                'TiketAction (selain action=301)': (
+                    TiketAction.objects.exclude(action=301).count()
+                    + TiketActionArchive.objects.exclude(action=301).count()
+                ),
             }
             total_test_data = sum(test_data_counts.values())
 
@@ -98,7 +103,10 @@ class Command(BaseCommand):
             # Count related records for reporting
             old_db_counts = {
                 'TiketPIC': TiketPIC.objects.filter(id_tiket__in=tiket_ids).count(),
-                'TiketAction': TiketAction.objects.filter(id_tiket__in=tiket_ids).count(),
+                'TiketAction': (
+                    TiketAction.objects.filter(id_tiket__in=tiket_ids).count()
+                    + TiketActionArchive.objects.filter(id_tiket__in=tiket_ids).count()
+                ),
                 'KirimPideTemp': KirimPideTemp.objects.filter(id_tiket__in=tiket_ids).count(),
             }
 
@@ -141,6 +149,7 @@ class Command(BaseCommand):
 
                 self.stdout.write("Menghapus TiketAction (kecuali action=301)...")
                 deleted, _ = TiketAction.objects.exclude(action=301).delete()
+                deleted += TiketActionArchive.objects.exclude(action=301).delete()[0]
                 self.stdout.write(f"  -> {deleted} TiketAction dihapus")
 
             # ---- PHASE 2: Hapus Tiket old_db=False ----
@@ -153,6 +162,7 @@ class Command(BaseCommand):
 
                 self.stdout.write("Menghapus TiketAction (old_db=False)...")
                 deleted, _ = TiketAction.objects.filter(id_tiket__in=tiket_ids).delete()
+                deleted += TiketActionArchive.objects.filter(id_tiket__in=tiket_ids).delete()[0]
                 self.stdout.write(f"  -> {deleted} TiketAction dihapus")
 
                 self.stdout.write("Menghapus KirimPideTemp...")
@@ -164,6 +174,10 @@ class Command(BaseCommand):
                 deleted, _ = Tiket.objects.filter(old_db=False).delete()
                 self.stdout.write(f"  -> {deleted} Tiket dihapus")
 
+            # The latest action per type may have been among the deleted actions
+            if (not skip_test_data and total_test_data > 0) or total_tiket > 0:
+                tiket_timeline.rebuild_latest_actions()
+
         # ---- Summary ----
         phase1_msg = ""
         if not skip_test_data:
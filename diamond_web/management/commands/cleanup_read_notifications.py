@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from ...services import notifications
+
+
+class Command(BaseCommand):
+    help = "Hapus notifikasi yang sudah dibaca dan lebih lama dari masa retensi"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=None,
+            help='Hapus notifikasi terbaca yang dibuat lebih dari N hari lalu '
+                 '(default: NOTIFICATION_RETENTION_DAYS)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=notifications.ARCHIVE_CHUNK_SIZE,
+            help='Jumlah notifikasi yang dihapus per statement',
+        )
+
+    def handle(self, *args, **options):
+        deleted = notifications.archive_read_notifications(
+            retention_days=options['retention_days'],
+            chunk_size=options['batch_size'],
+        )
+        self.stdout.write(f"- Notifikasi dihapus : {deleted}")
+        self.stdout.write(self.style.SUCCESS('Pembersihan notifikasi terbaca selesai.'))
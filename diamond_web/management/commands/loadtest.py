@@ -0,0 +1,95 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+
+def login_cookie(username):
+    """Return a ``Cookie`` header value for a new session of *username*."""
+    User = get_user_model()
+    try:
+        user = User.objects.get(username=username)
+    except User.DoesNotExist:
+        raise CommandError(f'User "{username}" tidak ditemukan.')
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return f'{settings.SESSION_COOKIE_NAME}={session.session_key}'
+
+
+def run_load(urls, total, concurrency, headers=None, timeout=30):
+    """Request *urls* round-robin *total* times from *concurrency* threads.
+
+    Returns ``{'requests', 'errors', 'seconds', 'rps', 'p50_ms', 'p95_ms'}``.
+    """
+    def fetch(index):
+        request = Request(urls[index % len(urls)], headers=headers or {})
+        started = time.perf_counter()
+        try:
+            with urlopen(request, timeout=timeout) as response:
+                response.read()
+                ok = response.status < 400
+        except HTTPError:
+            ok = False
+        except URLError as exc:
+            raise CommandError(f'Server tidak dapat dihubungi: {exc.reason}')
+        return ok, (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(fetch, range(total)))
+    seconds = time.perf_counter() - started
+
+    latencies = sorted(ms for _, ms in results)
+    return {
+        'requests': total,
+        'errors': sum(1 for ok, _ in results if not ok),
+        'seconds': seconds,
+        'rps': total / seconds if seconds else 0.0,
+        'p50_ms': statistics.median(latencies) if latencies else 0.0,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Ukur request per detik terhadap server yang sedang berjalan (runserver/gunicorn). "
+        "Bandingkan DB_CONNECTION_PROFILE=persistent dengan DB_CONNECTION_PROFILE=off."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='Path yang diminta bergiliran, mis. /tiket/data/?draw=1')
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000', help='Alamat server')
+        parser.add_argument('--requests', type=int, default=500, help='Jumlah request total')
+        parser.add_argument('--concurrency', type=int, default=8, help='Jumlah thread klien')
+        parser.add_argument('--warmup', type=int, default=20, help='Request pemanasan (tidak diukur)')
+        parser.add_argument('--user', help='Username yang dipakai (session dibuat langsung di database)')
+
+    def handle(self, *args, **options):
+        if options['requests'] <= 0 or options['concurrency'] <= 0:
+            raise CommandError('--requests dan --concurrency harus lebih besar dari 0.')
+
+        urls = [urljoin(options['base_url'], path) for path in options['paths']]
+        headers = {'Cookie': login_cookie(options['user'])} if options['user'] else {}
+
+        if options['warmup']:
+            run_load(urls, options['warmup'], options['concurrency'], headers)
+        result = run_load(urls, options['requests'], options['concurrency'], headers)
+
+        self.stdout.write(
+            f"{result['requests']} request, {options['concurrency']} thread, "
+            f"{result['seconds']:.2f} detik"
+        )
+        self.stdout.write(f"p50 {result['p50_ms']:.1f} ms, p95 {result['p95_ms']:.1f} ms")
+        if result['errors']:
+            self.stdout.write(self.style.WARNING(f"{result['errors']} request gagal (status >= 400)"))
+        self.stdout.write(self.style.SUCCESS(f"{result['rps']:.1f} request/detik"))
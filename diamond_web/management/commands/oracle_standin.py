@@ -0,0 +1,59 @@
+from django.contrib.auth.models import Group, User
+from django.core.management.base import BaseCommand, CommandError
+
+from ...utils.oracle_standin import SourceScenario
+
+
+class Command(BaseCommand):
+    help = (
+        "Buat database SQLite pengganti Oracle untuk sinkronisasi referensi/tiket. "
+        "Gunakan dengan ORACLE_SOURCE_ADAPTER=sqlite dan ORACLE_STANDIN_PATH=<path>."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Direktori tujuan (file lama di dalamnya diganti)')
+        parser.add_argument('--ilap', type=int, default=20, help='Jumlah ILAP sintetis')
+        parser.add_argument('--jenis-data-per-ilap', type=int, default=2, help='Jumlah jenis data per ILAP')
+        parser.add_argument('--tiket-per-jenis-data', type=int, default=2, help='Jumlah tiket per jenis data')
+        parser.add_argument('--years', type=int, nargs='+', default=[2024, 2025], help='Tahun kolom PRIORITAS_<tahun>')
+        parser.add_argument('--update', type=int, default=0, help='Jumlah ILAP yang datanya diubah')
+        parser.add_argument('--delete', type=int, default=0, help='Jumlah ILAP yang dihapus dari sumber')
+        parser.add_argument('--orphan', type=int, default=0, help='Jumlah baris yatim per jenis (jenis data, PIC, tiket)')
+        parser.add_argument('--seed', type=int, default=0, help='Seed generator acak')
+        parser.add_argument(
+            '--create-users',
+            action='store_true',
+            help='Buat user (username = NIP) untuk PIC sumber yang belum ada di database',
+        )
+
+    def handle(self, *args, **options):
+        if options['ilap'] < 0 or options['update'] < 0 or options['delete'] < 0 or options['orphan'] < 0:
+            raise CommandError('Jumlah tidak boleh negatif.')
+
+        scenario = SourceScenario(
+            ilap=options['ilap'],
+            jenis_data_per_ilap=options['jenis_data_per_ilap'],
+            tiket_per_jenis_data=options['tiket_per_jenis_data'],
+            years=options['years'],
+            seed=options['seed'],
+        )
+        scenario.update(options['update'])
+        scenario.delete(options['delete'])
+        for kind in ('jenis_data', 'pic', 'tiket'):
+            scenario.orphan(options['orphan'], kind=kind)
+        path = scenario.write(options['path'])
+
+        for table, count in scenario.counts().items():
+            self.stdout.write(f'{table:<34}: {count}')
+
+        if options['create_users']:
+            created = 0
+            for role, nips in scenario.nips.items():
+                group, _ = Group.objects.get_or_create(name=f'user_{role}')
+                existing = set(User.objects.filter(username__in=nips).values_list('username', flat=True))
+                users = User.objects.bulk_create([User(username=nip) for nip in nips if nip not in existing])
+                group.user_set.add(*users)
+                created += len(users)
+            self.stdout.write(f'User PIC dibuat: {created}')
+
+        self.stdout.write(self.style.SUCCESS(f'Database stand-in Oracle dibuat di {path}.'))
@@ -0,0 +1,117 @@
+import os
+import re
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from ...models import SyncRun
+from ...utils import sync_log
+
+# <type>_YYYY-MM-DD_HH-MM-SS.log (optionally already gzip-compressed)
+LOG_FILENAME_PATTERN = re.compile(r'^(.+)_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2}-\d{2})\.log(\.gz)?$')
+# <type>_error.log, appended to by scripts/cleanup_pre_production.sh before it was timestamped
+ERROR_LOG_PATTERN = re.compile(r'^(.+_error)\.log(\.gz)?$')
+# <prefix>_<uuid>.csv
+FAILED_ROWS_CSV_PATTERN = re.compile(
+    r'^(sync_failed_rows|sync_referensi_failed_rows)_([a-f0-9\-]+)\.csv(\.gz)?$'
+)
+
+
+class Command(BaseCommand):
+    help = "Kompres/hapus file log sinkronisasi lama berdasarkan katalog SyncRun"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--import-existing',
+            action='store_true',
+            help='Daftarkan file di folder sync_logs yang belum ada di katalog (sekali saja saat migrasi)',
+        )
+        parser.add_argument(
+            '--compress-after-days',
+            type=int,
+            default=sync_log.COMPRESS_AFTER_DAYS,
+            help='Kompres log run yang selesai lebih dari N hari lalu',
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=sync_log.RETENTION_DAYS,
+            help='Hapus file log run yang selesai lebih dari N hari lalu',
+        )
+
+    def handle(self, *args, **options):
+        if options['import_existing']:
+            imported = self._import_existing()
+            self.stdout.write(f"- File diimpor ke katalog: {imported}")
+
+        compressed, expired = sync_log.rotate_sync_logs(
+            compress_after_days=options['compress_after_days'],
+            retention_days=options['retention_days'],
+        )
+        self.stdout.write(self.style.SUCCESS('Rotasi log sinkronisasi selesai.'))
+        self.stdout.write(f"- Run dikompres : {compressed}")
+        self.stdout.write(f"- Run kedaluwarsa: {expired}")
+
+    def _import_existing(self):
+        """Register log files created before the catalog existed."""
+        if not os.path.isdir(sync_log.SYNC_LOGS_DIR):
+            return 0
+
+        known_paths = set(SyncRun.objects.values_list('log_path', flat=True))
+        known_paths.update(SyncRun.objects.values_list('error_file_path', flat=True))
+        known_run_ids = set(SyncRun.objects.values_list('run_id', flat=True))
+
+        to_create = []
+        for entry in os.scandir(sync_log.SYNC_LOGS_DIR):
+            if not entry.is_file() or entry.path in known_paths:
+                continue
+            mtime = datetime.fromtimestamp(entry.stat().st_mtime)
+
+            match = LOG_FILENAME_PATTERN.match(entry.name)
+            if match:
+                try:
+                    started_at = datetime.strptime(
+                        f"{match.group(2)} {match.group(3).replace('-', ':')}", '%Y-%m-%d %H:%M:%S'
+                    )
+                except ValueError:
+                    started_at = mtime
+                run_id = sync_log.file_run_id(entry.path)
+                if run_id in known_run_ids:
+                    continue
+                to_create.append(SyncRun(
+                    run_id=run_id, sync_type=match.group(1), status=SyncRun.STATUS_SUCCESS,
+                    started_at=started_at, finished_at=mtime, log_path=entry.path,
+                    compressed=bool(match.group(4)),
+                ))
+                continue
+
+            match = ERROR_LOG_PATTERN.match(entry.name)
+            if match:
+                run_id = sync_log.file_run_id(entry.path)
+                if run_id in known_run_ids:
+                    continue
+                to_create.append(SyncRun(
+                    run_id=run_id, sync_type=match.group(1), status=SyncRun.STATUS_SUCCESS,
+                    started_at=mtime, finished_at=mtime, log_path=entry.path,
+                    compressed=bool(match.group(2)),
+                ))
+                continue
+
+            match = FAILED_ROWS_CSV_PATTERN.match(entry.name)
+            if match:
+                sync_type = (
+                    sync_log.TIKET_SYNC if match.group(1) == sync_log.TIKET_FAILED_ROWS_PREFIX
+                    else sync_log.REFERENSI_SYNC
+                )
+                run_id = match.group(2)
+                if run_id in known_run_ids:
+                    continue
+                known_run_ids.add(run_id)
+                to_create.append(SyncRun(
+                    run_id=run_id, sync_type=sync_type, status=SyncRun.STATUS_SUCCESS,
+                    started_at=mtime, finished_at=mtime, error_file_path=entry.path,
+                    compressed=bool(match.group(3)),
+                ))
+
+        SyncRun.objects.bulk_create(to_create, batch_size=500)
+        return len(to_create)
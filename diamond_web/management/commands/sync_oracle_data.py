@@ -1,5 +1,10 @@
+import uuid
+
 from django.core.management.base import BaseCommand, CommandError
 
+from ...utils import sync_log
+from ...utils.job_state import SYNC_REFERENSI
+from ...utils.task_lock import SingletonLock
 from ...utils.oracle_sync import OracleDataSyncService, OracleSyncConfigError
 
 
@@ -12,13 +17,40 @@ class Command(BaseCommand):
             action='store_true',
             help='Hanya cek perubahan tanpa insert/update ke DB aplikasi',
         )
+        parser.add_argument(
+            '--log-file',
+            default=None,
+            help='Path file log run ini (dicatat di katalog Status Sinkronisasi)',
+        )
 
     def handle(self, *args, **options):
         check_only = options.get('check_only', False)
+        sync_id = str(uuid.uuid4())
+
+        # Only one referensi sync at a time (UI task, cron or manual run)
+        lock = None if check_only else SingletonLock(SYNC_REFERENSI, owner=sync_id)
+        if lock is not None and not lock.acquire():
+            raise CommandError(f'Sync referensi lain sedang berjalan (run {lock.holder()}). Dibatalkan.')
+        try:
+            self._run(sync_id, check_only, options)
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def _run(self, sync_id, check_only, options):
+        run = sync_log.start_run(
+            sync_log.REFERENSI_CHECK if check_only else sync_log.REFERENSI_SYNC,
+            sync_id,
+            log_path=options.get('log_file'),
+        )
 
         try:
             service = OracleDataSyncService()
             summary = service.check() if check_only else service.sync()
+            sync_log.finish_run(
+                run, summary=summary.as_dict(),
+                error='Error data ditemukan' if summary.errors else None,
+            )
 
             self.stdout.write(self.style.SUCCESS('Oracle sync selesai.'))
             self.stdout.write(f"- Source rows : {summary.source_rows}")
@@ -36,4 +68,13 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING('Mode check-only: tidak ada perubahan DB.'))
 
         except OracleSyncConfigError as exc:
-            raise CommandError(str(exc)) from exc
\ No newline at end of file
+            sync_log.finish_run(run, error=str(exc))
+            raise CommandError(str(exc)) from exc
+        except BaseException as exc:
+            # Close the run like the Celery tasks do, whatever went wrong
+            if run.finished_at is None:
+                sync_log.finish_run(
+                    run, error=str(exc) or type(exc).__name__,
+                    stopped=isinstance(exc, (InterruptedError, KeyboardInterrupt)),
+                )
+            raise
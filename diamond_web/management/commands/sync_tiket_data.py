@@ -5,6 +5,9 @@ from datetime import datetime
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
+from ...utils import sync_log
+from ...utils.job_state import SYNC_TIKET
+from ...utils.task_lock import SingletonLock
 from ...utils.oracle_sync import OracleDataSyncService, OracleSyncConfigError
 from ...views.sync_tiket import _sync_tiket_data, _check_tiket_data
 
@@ -20,13 +23,35 @@ class Command(BaseCommand):
             action='store_true',
             help='Hanya cek perubahan tanpa insert/update ke DB aplikasi',
         )
+        parser.add_argument(
+            '--log-file',
+            default=None,
+            help='Path file log run ini (dicatat di katalog Status Sinkronisasi)',
+        )
 
     def handle(self, *args, **options):
         check_only = options.get('check_only', False)
+        sync_id = str(uuid.uuid4())
+
+        # Only one tiket sync at a time (UI task, cron or manual run)
+        lock = None if check_only else SingletonLock(SYNC_TIKET, owner=sync_id)
+        if lock is not None and not lock.acquire():
+            raise CommandError(f'Sync tiket lain sedang berjalan (run {lock.holder()}). Dibatalkan.')
+        try:
+            self._run(sync_id, check_only, options)
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def _run(self, sync_id, check_only, options):
+        run = sync_log.start_run(
+            sync_log.TIKET_CHECK if check_only else sync_log.TIKET_SYNC,
+            sync_id,
+            log_path=options.get('log_file'),
+        )
 
         try:
             service = OracleDataSyncService(connection_only=True)
-            sync_id = str(uuid.uuid4())
 
             start_time = timezone.now()
             self.stdout.write(f"Mulai {'check' if check_only else 'sync'} tiket (sync_id={sync_id})...")
@@ -48,6 +73,11 @@ class Command(BaseCommand):
                 self.stdout.write(f"- Tidak berubah: {summary.get('unchanged', 0)}")
                 self.stdout.write(f"- Waktu eksekusi: {elapsed:.1f} detik")
 
+            sync_log.finish_run(
+                run, summary=summary,
+                error_file_path=sync_log.failed_rows_path(sync_log.TIKET_FAILED_ROWS_PREFIX, sync_id),
+            )
+
             errors = summary.get('errors', [])
             if errors:
                 self.stdout.write(self.style.WARNING(f'Error ({len(errors)}):'))
@@ -61,4 +91,14 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING('Mode check-only: tidak ada perubahan DB.'))
 
         except OracleSyncConfigError as exc:
+            sync_log.finish_run(run, error=str(exc))
             raise CommandError(str(exc)) from exc
+        except BaseException as exc:
+            # Close the run like the Celery tasks do, whatever went wrong
+            if run.finished_at is None:
+                sync_log.finish_run(
+                    run, error=str(exc) or type(exc).__name__,
+                    stopped=isinstance(exc, (InterruptedError, KeyboardInterrupt)),
+                    error_file_path=sync_log.failed_rows_path(sync_log.TIKET_FAILED_ROWS_PREFIX, sync_id),
+                )
+            raise
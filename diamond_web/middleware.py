@@ -0,0 +1,85 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .utils.db_routing import pin_primary, reporting_available, track_writes
+from .utils.profiling import profile, should_profile
+from .utils.query_stats import QueryRecorder, record_request
+
+
+class QueryBudgetMiddleware:
+    """Record SQL query count/time and wall time per resolved URL name.
+
+    Opt-in: enabled with ``QUERY_BUDGET_ENABLED``; otherwise Django drops the
+    middleware at startup.  Statistics are shown on ``/diagnostics/queries/``
+    (see utils/query_stats.py).
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'QUERY_BUDGET_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.excluded_views = set(getattr(settings, 'QUERY_BUDGET_EXCLUDED_VIEWS', ()))
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        wall_seconds = time.perf_counter() - started
+
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else None
+        if view_name and view_name not in self.excluded_views:
+            record_request(view_name, recorder, wall_seconds, path=request.path)
+        return response
+
+
+class ReportingPinMiddleware:
+    """Pin a session's reads to ``default`` right after it changed data.
+
+    A request that wrote to the database keeps its session off the reporting
+    alias for ``REPORTING_DB_PIN_SECONDS`` so the list reloaded after a save
+    shows it even when the replica lags (see utils/db_routing.py).  DataTables
+    endpoints that merely read over POST do not pin.
+    """
+
+    def __init__(self, get_response):
+        if not reporting_available():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with track_writes() as writes:
+            response = self.get_response(request)
+        if writes['wrote']:
+            pin_primary(request)
+        return response
+
+
+class ProfilerMiddleware:
+    """Profile a request with cProfile on demand (see utils/profiling.py).
+
+    A superuser starts a profile with the ``X-Profile: 1`` header or the
+    ``_profile=1`` query parameter; ``PROFILER_SAMPLE_RATE`` additionally
+    profiles a random fraction of all requests.  Disabled with
+    ``PROFILER_ENABLED=False``.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILER_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not should_profile(request):
+            return self.get_response(request)
+        with profile('request', request.get_full_path(), method=request.method) as meta:
+            response = self.get_response(request)
+            meta['status'] = response.status_code
+        return response
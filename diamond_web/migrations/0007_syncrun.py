@@ -0,0 +1,44 @@
+# Generated by Django 5.2.14 on 2026-10-19 22:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diamond_web', '0006_sequencetandaterima'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncRun',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('run_id', models.CharField(max_length=64, unique=True, verbose_name='Run ID')),
+                ('sync_type', models.CharField(max_length=50, verbose_name='Tipe Sinkronisasi')),
+                ('status', models.CharField(choices=[('running', 'Berjalan'), ('success', 'Berhasil'), ('failed', 'Gagal'), ('stopped', 'Dihentikan')], default='running', max_length=10, verbose_name='Status')),
+                ('started_at', models.DateTimeField(verbose_name='Mulai')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Selesai')),
+                ('duration_seconds', models.FloatField(blank=True, null=True, verbose_name='Durasi (detik)')),
+                ('source_rows', models.IntegerField(default=0, verbose_name='Source Rows')),
+                ('inserts', models.IntegerField(default=0, verbose_name='Insert')),
+                ('updates', models.IntegerField(default=0, verbose_name='Update')),
+                ('error_count', models.IntegerField(default=0, verbose_name='Jumlah Error')),
+                ('message', models.CharField(blank=True, max_length=255, null=True, verbose_name='Pesan')),
+                ('log_path', models.CharField(blank=True, max_length=500, null=True, verbose_name='File Log')),
+                ('error_file_path', models.CharField(blank=True, max_length=500, null=True, verbose_name='File Error')),
+                ('compressed', models.BooleanField(default=False, verbose_name='Dikompresi')),
+                ('triggered_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Dijalankan Oleh')),
+            ],
+            options={
+                'verbose_name': 'Sync Run',
+                'verbose_name_plural': 'Sync Runs',
+                'db_table': 'sync_run',
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['sync_type', '-started_at'], name='sync_run_type_start_idx'), models.Index(fields=['-started_at'], name='sync_run_start_idx'), models.Index(fields=['compressed', 'finished_at'], name='sync_run_rotate_idx')],
+            },
+        ),
+    ]
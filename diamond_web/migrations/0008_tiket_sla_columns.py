@@ -0,0 +1,51 @@
+# Generated by Django 5.2.14 on 2026-10-19 22:31
+
+from django.db import migrations, models
+
+
+def backfill_sla(apps, schema_editor):
+    from diamond_web.utils.sla import SlaRules, recompute_sla
+
+    rules = SlaRules.load(
+        durasi_model=apps.get_model('diamond_web', 'DurasiJatuhTempo'),
+        prioritas_model=apps.get_model('diamond_web', 'JenisPrioritasData'),
+    )
+    recompute_sla(apps.get_model('diamond_web', 'Tiket').objects.all(), rules=rules)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diamond_web', '0007_syncrun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tiket',
+            name='deadline_identifikasi',
+            field=models.DateField(blank=True, editable=False, null=True, verbose_name='Deadline Identifikasi'),
+        ),
+        migrations.AddField(
+            model_name='tiket',
+            name='deadline_pengendalian',
+            field=models.DateField(blank=True, editable=False, null=True, verbose_name='Deadline Pengendalian Mutu'),
+        ),
+        migrations.AddField(
+            model_name='tiket',
+            name='is_prioritas',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Prioritas'),
+        ),
+        migrations.AddIndex(
+            model_name='tiket',
+            index=models.Index(fields=['deadline_identifikasi'], name='tiket_deadline_idf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiket',
+            index=models.Index(fields=['deadline_pengendalian'], name='tiket_deadline_pmt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiket',
+            index=models.Index(fields=['is_prioritas'], name='tiket_prioritas_idx'),
+        ),
+        migrations.RunPython(backfill_sla, migrations.RunPython.noop),
+    ]
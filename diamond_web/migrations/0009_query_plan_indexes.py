@@ -0,0 +1,32 @@
+# Generated by Django 5.2.14 on 2026-10-20 00:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('diamond_web', '0008_tiket_sla_columns'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='durasijatuhtempo',
+            index=models.Index(fields=['id_sub_jenis_data', 'seksi', 'start_date', 'end_date'], name='durasi_sub_seksi_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['recipient', '-created_at'], name='notification_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiketaction',
+            index=models.Index(fields=['id_tiket', 'timestamp'], name='tiket_action_tiket_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiketpic',
+            index=models.Index(fields=['id_user', 'role', 'active', 'id_tiket'], name='tiket_pic_user_role_idx'),
+        ),
+    ]
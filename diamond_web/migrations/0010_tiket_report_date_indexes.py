@@ -0,0 +1,25 @@
+# Generated by Django 5.2.14 on 2026-10-20 01:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diamond_web', '0009_query_plan_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tiket',
+            index=models.Index(fields=['tgl_kirim_pide'], name='tiket_kirim_pide_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiket',
+            index=models.Index(fields=['tgl_rekam_pide'], name='tiket_rekam_pide_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiket',
+            index=models.Index(fields=['tgl_transfer'], name='tiket_transfer_idx'),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.14 on 2026-10-20 01:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_latest_actions(apps, schema_editor):
+    TiketAction = apps.get_model('diamond_web', 'TiketAction')
+    TiketLatestAction = apps.get_model('diamond_web', 'TiketLatestAction')
+    latest = (
+        TiketAction.objects.exclude(action=None)
+        .values('id_tiket_id', 'action')
+        .annotate(latest=models.Max('timestamp'))
+        .order_by()
+    )
+    batch = []
+    for row in latest.iterator(chunk_size=5000):
+        batch.append(TiketLatestAction(id_tiket_id=row['id_tiket_id'], action=row['action'], timestamp=row['latest']))
+        if len(batch) == 5000:
+            TiketLatestAction.objects.bulk_create(batch)
+            batch = []
+    TiketLatestAction.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diamond_web', '0011_notification_digest'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TiketActionArchive',
+            fields=[
+                ('id', models.IntegerField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField(blank=True, null=True, verbose_name='Timestamp')),
+                ('action', models.IntegerField(blank=True, null=True, verbose_name='Action')),
+                ('catatan', models.CharField(blank=True, max_length=255, null=True, verbose_name='Catatan')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Diarsipkan')),
+                ('id_tiket', models.ForeignKey(db_column='id_tiket', on_delete=django.db.models.deletion.PROTECT, to='diamond_web.tiket', verbose_name='Tiket')),
+                ('id_user', models.ForeignKey(db_column='id_user', on_delete=django.db.models.deletion.PROTECT, to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Tiket Action Archive',
+                'verbose_name_plural': 'Tiket Action Archives',
+                'db_table': 'tiket_action_archive',
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['id_tiket', 'timestamp'], name='tiket_action_arch_ts_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TiketLatestAction',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.IntegerField(verbose_name='Action')),
+                ('timestamp', models.DateTimeField(blank=True, null=True, verbose_name='Timestamp')),
+                ('id_tiket', models.ForeignKey(db_column='id_tiket', on_delete=django.db.models.deletion.CASCADE, to='diamond_web.tiket', verbose_name='Tiket')),
+            ],
+            options={
+                'verbose_name': 'Tiket Latest Action',
+                'verbose_name_plural': 'Tiket Latest Actions',
+                'db_table': 'tiket_latest_action',
+                'constraints': [models.UniqueConstraint(fields=('id_tiket', 'action'), name='tiket_latest_action_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_latest_actions, migrations.RunPython.noop),
+    ]
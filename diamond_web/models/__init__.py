@@ -24,5 +24,8 @@ from .detil_tanda_terima import DetilTandaTerima
 from .sequence_tanda_terima import SequenceTandaTerima
 from .tiket import Tiket
 from .tiket_action import TiketAction
+from .tiket_action_archive import TiketActionArchive
+from .tiket_latest_action import TiketLatestAction
 from .tiket_pic import TiketPIC
-from .kirim_pide_temp import KirimPideTemp
\ No newline at end of file
+from .kirim_pide_temp import KirimPideTemp
+from .sync_run import SyncRun
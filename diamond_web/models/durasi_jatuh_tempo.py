@@ -26,6 +26,13 @@ class DurasiJatuhTempo(AuditTrailModel):
         verbose_name_plural = "Durasi Jatuh Tempo"
         db_table = "durasi_jatuh_tempo"
         ordering = ["id"]
+        indexes = [
+            # Durasi in force for a sub jenis data and seksi on a given date
+            models.Index(
+                fields=["id_sub_jenis_data", "seksi", "start_date", "end_date"],
+                name="durasi_sub_seksi_date_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.id_sub_jenis_data} - {self.seksi}"
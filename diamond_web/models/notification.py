@@ -7,6 +7,25 @@ class Notification(models.Model):
     message = models.TextField()
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Events merged into this row (see services/notifications.py) and their tikets
+    count = models.PositiveIntegerField(default=1)
+    tiket_ids = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        indexes = [
+            # Unread notifications of a user, newest first (navbar on every page)
+            models.Index(
+                fields=["recipient", "-created_at"],
+                condition=models.Q(is_read=False),
+                name="notification_unread_idx",
+            ),
+            # Read notifications past retention (cleanup_read_notifications_task)
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(is_read=True),
+                name="notification_read_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.recipient.username}"
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""Catalog of Oracle sync/check runs and the log files they produced."""
+
+import os
+
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class SyncRun(models.Model):
+    """One execution of a sync or check job.
+
+    Every run started from the web UI (Celery task) or from the management
+    commands used by the daily cron is recorded here, together with its
+    counts and the paths of its log / failed-rows files.  The sync status
+    page reads this table instead of scanning the ``sync_logs`` directory.
+    """
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCESS = 'success'
+    STATUS_FAILED = 'failed'
+    STATUS_STOPPED = 'stopped'
+    STATUS_CHOICES = [
+        (STATUS_RUNNING, 'Berjalan'),
+        (STATUS_SUCCESS, 'Berhasil'),
+        (STATUS_FAILED, 'Gagal'),
+        (STATUS_STOPPED, 'Dihentikan'),
+    ]
+
+    id = models.AutoField(primary_key=True, verbose_name="ID")
+    run_id = models.CharField(max_length=64, unique=True, verbose_name="Run ID")
+    sync_type = models.CharField(max_length=50, verbose_name="Tipe Sinkronisasi")
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_RUNNING,
+        verbose_name="Status"
+    )
+    started_at = models.DateTimeField(verbose_name="Mulai")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Selesai")
+    duration_seconds = models.FloatField(null=True, blank=True, verbose_name="Durasi (detik)")
+    source_rows = models.IntegerField(default=0, verbose_name="Source Rows")
+    inserts = models.IntegerField(default=0, verbose_name="Insert")
+    updates = models.IntegerField(default=0, verbose_name="Update")
+    error_count = models.IntegerField(default=0, verbose_name="Jumlah Error")
+    message = models.CharField(max_length=255, null=True, blank=True, verbose_name="Pesan")
+    log_path = models.CharField(max_length=500, null=True, blank=True, verbose_name="File Log")
+    error_file_path = models.CharField(max_length=500, null=True, blank=True, verbose_name="File Error")
+    compressed = models.BooleanField(default=False, verbose_name="Dikompresi")
+    triggered_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="Dijalankan Oleh"
+    )
+
+    class Meta:
+        verbose_name = "Sync Run"
+        verbose_name_plural = "Sync Runs"
+        db_table = "sync_run"
+        ordering = ["-started_at"]
+        indexes = [
+            models.Index(fields=["sync_type", "-started_at"], name="sync_run_type_start_idx"),
+            models.Index(fields=["-started_at"], name="sync_run_start_idx"),
+            models.Index(fields=["compressed", "finished_at"], name="sync_run_rotate_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.sync_type} {self.run_id} ({self.status})"
+
+    @property
+    def log_filename(self):
+        """Return the log file name (inside sync_logs), or None."""
+        return os.path.basename(self.log_path) if self.log_path else None
+
+    @property
+    def error_filename(self):
+        """Return the failed-rows file name (inside sync_logs), or None."""
+        return os.path.basename(self.error_file_path) if self.error_file_path else None
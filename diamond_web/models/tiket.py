@@ -119,6 +119,13 @@ class Tiket(models.Model):
     qc_v = models.IntegerField(null=True, blank=True, verbose_name="QC V")
     qc_r = models.IntegerField(null=True, blank=True, verbose_name="QC R")
     qc_d = models.IntegerField(null=True, blank=True, verbose_name="QC D")
+    # Derived SLA columns, maintained by diamond_web.utils.sla
+    deadline_identifikasi = models.DateField(null=True, blank=True, editable=False, verbose_name="Deadline Identifikasi")
+    deadline_pengendalian = models.DateField(null=True, blank=True, editable=False, verbose_name="Deadline Pengendalian Mutu")
+    is_prioritas = models.BooleanField(default=False, editable=False, verbose_name="Prioritas")
+
+    # Fields the SLA columns are computed from
+    SLA_SOURCE_FIELDS = ('id_periode_data_id', 'tgl_rekam_pide', 'tgl_transfer', 'tgl_terima_dip')
 
     class Meta:
         verbose_name = "Tiket"
@@ -132,7 +139,24 @@ class Tiket(models.Model):
             models.Index(fields=["id_periode_data", "periode", "tahun", "penyampaian"], name="tiket_lookup_idx"),
             models.Index(fields=["tgl_terima_dip"], name="tiket_terima_dip_idx"),
             models.Index(fields=["tgl_terima_vertikal"], name="tiket_terima_vert_idx"),
+            models.Index(fields=["deadline_identifikasi"], name="tiket_deadline_idf_idx"),
+            models.Index(fields=["deadline_pengendalian"], name="tiket_deadline_pmt_idx"),
+            models.Index(fields=["is_prioritas"], name="tiket_prioritas_idx"),
+            # Report period filters (utils/periode_range.py)
+            models.Index(fields=["tgl_kirim_pide"], name="tiket_kirim_pide_idx"),
+            models.Index(fields=["tgl_rekam_pide"], name="tiket_rekam_pide_idx"),
+            models.Index(fields=["tgl_transfer"], name="tiket_transfer_idx"),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._sla_source = instance.sla_source()
+        return instance
+
+    def sla_source(self):
+        """Snapshot of the loaded SLA source fields (deferred fields are not fetched)."""
+        return tuple(self.__dict__.get(name) for name in self.SLA_SOURCE_FIELDS)
+
     def __str__(self):
         return f"Tiket {self.id} - Periode {self.periode} Tahun {self.tahun}"
@@ -26,6 +26,10 @@ class TiketAction(models.Model):
         verbose_name_plural = "Tiket Actions"
         db_table = "tiket_action"
         ordering = ["-timestamp"]
+        indexes = [
+            # Timeline of one tiket, newest first, without a sort
+            models.Index(fields=["id_tiket", "timestamp"], name="tiket_action_tiket_ts_idx"),
+        ]
 
     def __str__(self):
         return f"Action {self.action} by {self.id_user} on {self.timestamp}"
@@ -0,0 +1,39 @@
+from django.db import models
+from django.contrib.auth.models import User
+from .tiket import Tiket
+
+
+class TiketActionArchive(models.Model):
+    """TiketAction of a closed tiket moved out of the live table.
+
+    Keeps the primary key of the live row; see utils/tiket_timeline.py.
+    """
+    id = models.IntegerField(primary_key=True, verbose_name="ID")
+    id_tiket = models.ForeignKey(
+        Tiket,
+        on_delete=models.PROTECT,
+        db_column="id_tiket",
+        verbose_name="Tiket"
+    )
+    id_user = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        db_column="id_user",
+        verbose_name="User"
+    )
+    timestamp = models.DateTimeField(null=True, blank=True, verbose_name="Timestamp")
+    action = models.IntegerField(null=True, blank=True, verbose_name="Action")
+    catatan = models.CharField(max_length=255, null=True, blank=True, verbose_name="Catatan")
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name="Diarsipkan")
+
+    class Meta:
+        verbose_name = "Tiket Action Archive"
+        verbose_name_plural = "Tiket Action Archives"
+        db_table = "tiket_action_archive"
+        ordering = ["-timestamp"]
+        indexes = [
+            models.Index(fields=["id_tiket", "timestamp"], name="tiket_action_arch_ts_idx"),
+        ]
+
+    def __str__(self):
+        return f"Action {self.action} by {self.id_user} on {self.timestamp}"
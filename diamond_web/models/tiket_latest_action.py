@@ -0,0 +1,32 @@
+from django.db import models
+from .tiket import Tiket
+
+
+class TiketLatestAction(models.Model):
+    """Timestamp of the latest TiketAction of each type per tiket.
+
+    Maintained on insert (utils/tiket_timeline.py) and kept when the actions
+    are archived, so "has this tiket ever been ..." checks never scan the
+    action history.
+    """
+    id = models.AutoField(primary_key=True, verbose_name="ID")
+    id_tiket = models.ForeignKey(
+        Tiket,
+        on_delete=models.CASCADE,
+        db_column="id_tiket",
+        verbose_name="Tiket"
+    )
+    action = models.IntegerField(verbose_name="Action")
+    timestamp = models.DateTimeField(null=True, blank=True, verbose_name="Timestamp")
+
+    class Meta:
+        verbose_name = "Tiket Latest Action"
+        verbose_name_plural = "Tiket Latest Actions"
+        db_table = "tiket_latest_action"
+        constraints = [
+            # Also the index of the per-tiket lookups (dashboards, archive cutoff)
+            models.UniqueConstraint(fields=["id_tiket", "action"], name="tiket_latest_action_uniq"),
+        ]
+
+    def __str__(self):
+        return f"Latest action {self.action} on tiket {self.id_tiket_id} at {self.timestamp}"
@@ -30,6 +30,10 @@ class TiketPIC(models.Model):
         verbose_name_plural = "Tiket PICs"
         db_table = "tiket_pic"
         ordering = ["id"]
+        indexes = [
+            # "Tikets where this user is the active PIC for role X"; covering
+            models.Index(fields=["id_user", "role", "active", "id_tiket"], name="tiket_pic_user_role_idx"),
+        ]
 
     def __str__(self):
         return f"Tiket {self.id_tiket} - PIC {self.id_user} (Role {self.role})"
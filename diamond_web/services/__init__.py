@@ -0,0 +1 @@
+"""Domain services of the diamond_web application (workflow rules shared by views and tasks)."""
@@ -0,0 +1,172 @@
+"""Notification fan-out: buffered per transaction, written in bulk, digested.
+
+:func:`notify` does not write anything itself.  The notifications are kept
+in a buffer of the current transaction and written by one flush when it
+commits (``transaction.on_commit``), so a workflow run or a sync touching
+hundreds of tikets ends with a fixed number of statements, and a rolled back
+transaction notifies nobody.  The buffer belongs to the savepoint level it
+was opened in: Django drops the flush of a rolled back savepoint together
+with its notifications.  The pending buffers are found in a registry keyed
+by connection and savepoint level that holds them weakly: a buffer leaves it
+when its flush runs or when Django drops that flush.
+
+The flush digests instead of inserting one row per event.  Events for the
+same recipient and title are merged into one row carrying the number of
+events (``count``) and the tikets concerned (``tiket_ids``); an unread row
+of that recipient and title created less than
+``NOTIFICATION_DIGEST_WINDOW_MINUTES`` ago absorbs them as well.  A row the
+recipient has read, or one older than the window, is never extended: the
+next event starts a new row.  The message of a digest is the one of its
+latest event.
+
+:func:`archive_read_notifications` deletes read notifications older than
+``NOTIFICATION_RETENTION_DAYS`` in chunks (``manage.py cleanup_read_notifications``,
+run daily by ``scripts/db_backup_daily.sh``, or ``cleanup_read_notifications_task``).
+"""
+import weakref
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import router, transaction
+from django.utils import timezone
+
+from ..models.notification import Notification
+
+BULK_BATCH_SIZE = 500
+ARCHIVE_CHUNK_SIZE = 1000
+
+# connection -> {savepoint ids: NotificationBuffer}; the flush callback owns the buffer
+_pending_buffers = weakref.WeakKeyDictionary()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _digest_window_minutes():
+    return _setting('NOTIFICATION_DIGEST_WINDOW_MINUTES', 60)
+
+
+def _retention_days():
+    return _setting('NOTIFICATION_RETENTION_DAYS', 90)
+
+
+@dataclass
+class _Digest:
+    """Events of one (recipient, title) pair collected by a flush."""
+    message: str
+    count: int = 0
+    tiket_ids: list = field(default_factory=list)
+
+    def add(self, message, count, tiket_ids):
+        self.message = message
+        self.count += count
+        self.tiket_ids.extend(pk for pk in tiket_ids if pk not in self.tiket_ids)
+
+
+class NotificationBuffer:
+    """Notifications waiting for the commit of one transaction (savepoint level)."""
+
+    def __init__(self, using, connection=None, savepoint_ids=()):
+        self.using = using
+        self.connection = connection
+        self.savepoint_ids = savepoint_ids
+        self.digests = {}
+
+    def add(self, recipient_id, title, message, tiket_id=None):
+        key = (recipient_id, title)
+        if key not in self.digests:
+            self.digests[key] = _Digest(message)
+        self.digests[key].add(message, 1, [] if tiket_id is None else [tiket_id])
+
+    def flush(self, now=None):
+        """Write the buffered digests: extend open digest rows, insert the rest."""
+        digests, self.digests = self.digests, {}
+        if self.connection is not None:
+            _pending_buffers.get(self.connection, {}).pop(self.savepoint_ids, None)
+        if not digests:
+            return
+        now = now or timezone.now()
+        with transaction.atomic(using=self.using):
+            open_rows = {}
+            for row in Notification.objects.using(self.using).filter(
+                recipient_id__in={recipient_id for recipient_id, _ in digests},
+                title__in={title for _, title in digests},
+                is_read=False,
+                created_at__gte=now - timedelta(minutes=_digest_window_minutes()),
+            ).order_by('created_at'):
+                # The latest open row of a pair wins
+                open_rows[(row.recipient_id, row.title)] = row
+
+            to_update, to_create = [], []
+            for (recipient_id, title), digest in digests.items():
+                row = open_rows.get((recipient_id, title))
+                if row is None:
+                    to_create.append(Notification(
+                        recipient_id=recipient_id, title=title, message=digest.message,
+                        count=digest.count, tiket_ids=digest.tiket_ids,
+                    ))
+                    continue
+                merged = _Digest(row.message, row.count, list(row.tiket_ids))
+                merged.add(digest.message, digest.count, digest.tiket_ids)
+                row.message, row.count, row.tiket_ids = merged.message, merged.count, merged.tiket_ids
+                to_update.append(row)
+
+            Notification.objects.using(self.using).bulk_update(
+                to_update, ['message', 'count', 'tiket_ids'], batch_size=BULK_BATCH_SIZE,
+            )
+            Notification.objects.using(self.using).bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+
+
+def notify(recipient_ids, title, message, tiket_id=None, using=None):
+    """Notify *recipient_ids* (user pks) once the current transaction commits.
+
+    Outside a transaction the notifications are written right away.
+
+    Args:
+        recipient_ids: Iterable of User primary keys.
+        title: Notification title; events are digested per recipient and title.
+        message: HTML message (rendered with ``|safe``).
+        tiket_id: Tiket the event is about, recorded in ``tiket_ids``.
+        using: Database alias; the router's write database when ``None``.
+    """
+    using = using or router.db_for_write(Notification)
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        buffer = NotificationBuffer(using)
+        for recipient_id in recipient_ids:
+            buffer.add(recipient_id, title, message, tiket_id)
+        buffer.flush()
+        return
+
+    savepoint_ids = tuple(connection.savepoint_ids)
+    buffers = _pending_buffers.setdefault(connection, weakref.WeakValueDictionary())
+    buffer = buffers.get(savepoint_ids)
+    if buffer is None:
+        buffer = buffers[savepoint_ids] = NotificationBuffer(using, connection, savepoint_ids)
+        # robust: a failed flush is logged and must not fail the committed work
+        transaction.on_commit(buffer.flush, using=using, robust=True)
+    for recipient_id in recipient_ids:
+        buffer.add(recipient_id, title, message, tiket_id)
+
+
+def archive_read_notifications(retention_days=None, chunk_size=ARCHIVE_CHUNK_SIZE, now=None):
+    """Delete read notifications created more than *retention_days* ago.
+
+    *retention_days* defaults to ``NOTIFICATION_RETENTION_DAYS``.
+
+    Deletes at most *chunk_size* rows per statement so the table is never
+    locked for long.
+
+    Returns:
+        int: Number of notifications deleted.
+    """
+    if retention_days is None:
+        retention_days = _retention_days()
+    cutoff = (now or timezone.now()) - timedelta(days=retention_days)
+    expired = Notification.objects.filter(is_read=True, created_at__lt=cutoff).order_by('pk')
+    deleted = 0
+    while chunk := list(expired.values_list('pk', flat=True)[:chunk_size]):
+        deleted += Notification.objects.filter(pk__in=chunk).delete()[0]
+    return deleted
@@ -0,0 +1,623 @@
+"""Tiket state machine: the declarative table of workflow transitions.
+
+Every status change of a tiket (kirim ke PIDE, identifikasi, transfer ke
+PMDE, selesaikan, dikembalikan, batalkan, rekam hasil penelitian) is a
+:class:`Transition` in :data:`TRANSITIONS`.  A transition declares the
+statuses it may start from, the statuses it may end in, the TiketPIC role
+the acting user must hold, the fields it writes and their validators, the
+TiketAction(s) it logs and the PIC role it notifies.
+
+:func:`run` applies one transition to one tiket or to many at once with a
+fixed number of statements: one conditional ``UPDATE`` per distinct
+(current status, written values) group, one bulk INSERT of the actions
+(and one upsert of the latest action per type) and one query for the PICs.  The notifications are buffered and written
+in bulk when the transaction commits (services/notifications.py).  The
+``UPDATE`` only matches rows still in the status they were read with
+(optimistic locking): if another request moved one of the tikets in the
+meantime the whole run is rolled back with :class:`StaleTiket`.
+:func:`partition` splits a selection of tikets (bulk actions on the tiket
+list) into the ones a user may move and the refused ones with a reason.
+
+``update()``/``bulk_create()`` bypass the post_save receivers, so the SLA
+columns, the latest actions and the cached dossiers are refreshed here.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.urls import reverse
+from django.utils.html import format_html
+
+from ..constants.tiket_action_types import TiketActionType
+from ..constants.tiket_status import (
+    STATUS_DIBATALKAN,
+    STATUS_DIKEMBALIKAN,
+    STATUS_DIKIRIM_KE_PIDE,
+    STATUS_DIREKAM,
+    STATUS_DITELITI,
+    STATUS_IDENTIFIKASI,
+    STATUS_LABELS,
+    STATUS_PENGENDALIAN_MUTU,
+    STATUS_SELESAI,
+)
+from ..models.status_penelitian import StatusPenelitian
+from ..models.tiket import Tiket
+from ..models.tiket_action import TiketAction
+from ..models.tiket_pic import TiketPIC
+from ..utils import normalize_server_datetime, sla, tiket_dossier, tiket_timeline
+from . import notifications
+
+BULK_BATCH_SIZE = 500
+
+KIRIM_KE_PIDE = 'kirim_ke_pide'
+IDENTIFIKASI = 'identifikasi'
+TRANSFER_KE_PMDE = 'transfer_ke_pmde'
+SELESAIKAN = 'selesaikan'
+DIKEMBALIKAN = 'dikembalikan'
+BATALKAN = 'batalkan'
+REKAM_HASIL_PENELITIAN = 'rekam_hasil_penelitian'
+
+# Groups whose first member is credited with an action when a tiket has no
+# active PIC of the credited role.
+ROLE_FALLBACK_GROUPS = {
+    TiketPIC.Role.P3DE: ['user_p3de', 'admin_p3de'],
+    TiketPIC.Role.PIDE: ['user_pide', 'admin_pide'],
+    TiketPIC.Role.PMDE: ['user_pmde', 'admin_pmde'],
+}
+
+
+class TransitionError(Exception):
+    """A transition was refused; ``str(error)`` is shown to the user."""
+
+
+class IllegalTransition(TransitionError):
+    """A tiket is not in a status the transition may start from."""
+
+
+class RoleRequired(TransitionError):
+    """The user is not an active PIC with the transition's role on every tiket."""
+
+
+class InvalidTransitionData(TransitionError):
+    """A required field is missing or a field validator failed."""
+
+
+class StaleTiket(TransitionError):
+    """A tiket changed status after it was read (optimistic lock lost)."""
+
+
+@dataclass(frozen=True)
+class FollowUpAction:
+    """An extra TiketAction logged after the transition's own action.
+
+    ``catatan`` is formatted with the tiket's fields and the main ``catatan``.
+    With ``credited_role`` the action is attributed to the tiket's first
+    active PIC of that role instead of the acting user; with ``when_status``
+    it is only logged for tikets ending in one of those statuses.
+    """
+    action: int
+    catatan: str
+    credited_role: int | None = None
+    when_status: frozenset | None = None
+
+
+@dataclass(frozen=True)
+class Transition:
+    """One edge group of the tiket state machine.
+
+    Attributes:
+        sources: Statuses the transition may start from.
+        targets: Statuses it may end in; the first is the default and
+            ``resolve`` may pick another one per tiket.
+        role: TiketPIC role the acting user must actively hold on each tiket.
+        action: TiketActionType logged for each tiket.
+        catatan: Default catatan of the action, formatted with the tiket's
+            (already written) fields.
+        fields: Tiket fields the caller supplies; all of them are required.
+        stamps: Tiket fields set to the run's timestamp unless supplied.
+        clears: Tiket fields reset to NULL.
+        validators: ``(tiket, values) -> message or None`` checks.
+        resolve: ``(tikets, values_of) -> {tiket_id: {field: value}}`` for
+            per-tiket values (e.g. the target status) derived from the input;
+            ``values_of(tiket)`` returns the input of one tiket.
+        follow_ups: Extra :class:`FollowUpAction` entries.
+        notify: TiketPIC role whose active PICs are notified.
+    """
+    name: str
+    label: str
+    sources: frozenset
+    targets: tuple
+    role: int
+    action: int
+    catatan: str = ''
+    fields: tuple = ()
+    stamps: tuple = ()
+    clears: tuple = ()
+    validators: tuple = ()
+    resolve: object = None
+    follow_ups: tuple = ()
+    notify: int | None = None
+    notification_title: str = ''
+    notification_message: str = ''
+
+    def allows(self, status):
+        """Whether a tiket in *status* may take this transition."""
+        return status in self.sources
+
+
+@dataclass(frozen=True)
+class Refusal:
+    """A tiket :func:`partition` left out, with the reason shown to the user."""
+    tiket_id: int
+    nomor_tiket: str | None
+    reason: str
+
+
+class _TiketFields(dict):
+    """``str.format_map`` mapping: explicit keys first, then the tiket's attributes."""
+
+    def __init__(self, tiket, **extra):
+        super().__init__(extra)
+        self.tiket = tiket
+
+    def __missing__(self, key):
+        return getattr(self.tiket, key)
+
+
+def _format_datetime(value):
+    return normalize_server_datetime(value).strftime('%d/%m/%Y %H:%M')
+
+
+def not_before(field, label, tiket_field, tiket_label):
+    """Validator: the supplied *field* may not be earlier than the tiket's *tiket_field*."""
+    def validate(tiket, values):
+        value, floor = values.get(field), getattr(tiket, tiket_field)
+        if value and floor and normalize_server_datetime(value) < normalize_server_datetime(floor):
+            return (
+                f'{label} tidak boleh sebelum {tiket_label} ({_format_datetime(floor)}) '
+                f'untuk tiket {tiket.nomor_tiket}.'
+            )
+        return None
+    return validate
+
+
+def sums_to(fields, tiket_field, tiket_label):
+    """Validator: the supplied row counts *fields* must add up to the tiket's *tiket_field*."""
+    def validate(tiket, values):
+        expected = getattr(tiket, tiket_field)
+        total = sum(values.get(name) or 0 for name in fields)
+        if expected is not None and total != expected:
+            return (
+                f'Jumlah {" + ".join(name.replace("_", " ").title() for name in fields)} ({total}) '
+                f'tidak sama dengan {tiket_label} ({expected}) untuk tiket {tiket.nomor_tiket}.'
+            )
+        return None
+    return validate
+
+
+def not_negative(fields):
+    """Validator: none of the supplied counts *fields* may be negative."""
+    def validate(tiket, values):
+        for name in fields:
+            if (values.get(name) or 0) < 0:
+                return f'{name.replace("_", " ").title()} tidak boleh negatif.'
+        return None
+    return validate
+
+
+def _hasil_penelitian(tikets, values_of):
+    """Status penelitian and target status follow from baris_lengkap vs baris_diterima.
+
+    All rows complete (or a partial count) keeps the tiket 'Diteliti'; no
+    complete row at all closes it as 'Selesai' with status 'Tidak Lengkap'.
+    Without the StatusPenelitian master rows the tiket is only marked Diteliti.
+    """
+    status_penelitian = {}
+    resolved = {}
+    for tiket in tikets:
+        baris_lengkap = values_of(tiket).get('baris_lengkap') or 0
+        if baris_lengkap == tiket.baris_diterima:
+            deskripsi, status = 'Lengkap', STATUS_DITELITI
+        elif baris_lengkap == 0:
+            deskripsi, status = 'Tidak Lengkap', STATUS_SELESAI
+        else:
+            deskripsi, status = 'Lengkap Sebagian', STATUS_DITELITI
+        if deskripsi not in status_penelitian:
+            try:
+                status_penelitian[deskripsi] = StatusPenelitian.objects.get(deskripsi=deskripsi)
+            except StatusPenelitian.DoesNotExist:
+                status_penelitian[deskripsi] = None
+        if status_penelitian[deskripsi] is None:
+            resolved[tiket.pk] = {'status_tiket': STATUS_DITELITI}
+        else:
+            resolved[tiket.pk] = {'status_tiket': status, 'id_status_penelitian': status_penelitian[deskripsi]}
+    return resolved
+
+
+TRANSITIONS = {transition.name: transition for transition in (
+    Transition(
+        name=REKAM_HASIL_PENELITIAN,
+        label='Rekam hasil penelitian',
+        sources=frozenset({STATUS_DIREKAM, STATUS_DITELITI}),
+        targets=(STATUS_DITELITI, STATUS_SELESAI),
+        role=TiketPIC.Role.P3DE,
+        action=TiketActionType.DITELITI,
+        catatan='Hasil penelitian direkam',
+        fields=('tgl_teliti', 'baris_lengkap', 'baris_tidak_lengkap'),
+        validators=(
+            not_negative(('baris_lengkap', 'baris_tidak_lengkap')),
+            sums_to(('baris_lengkap', 'baris_tidak_lengkap'), 'baris_diterima', 'Baris Diterima'),
+            not_before('tgl_teliti', 'Tanggal Teliti', 'tgl_terima_dip', 'Tanggal Terima DIP'),
+        ),
+        resolve=_hasil_penelitian,
+        follow_ups=(
+            FollowUpAction(TiketActionType.SELESAI, 'Tiket selesai diproses',
+                           when_status=frozenset({STATUS_SELESAI})),
+        ),
+    ),
+    Transition(
+        name=BATALKAN,
+        label='Pembatalan tiket',
+        sources=frozenset({STATUS_DIREKAM, STATUS_DITELITI, STATUS_DIKEMBALIKAN}),
+        targets=(STATUS_DIBATALKAN,),
+        role=TiketPIC.Role.P3DE,
+        action=TiketActionType.DIBATALKAN,
+        catatan='Tiket dibatalkan',
+        stamps=('tgl_dibatalkan',),
+    ),
+    Transition(
+        name=KIRIM_KE_PIDE,
+        label='Kirim ke PIDE',
+        sources=frozenset({STATUS_DITELITI, STATUS_DIKEMBALIKAN}),
+        targets=(STATUS_DIKIRIM_KE_PIDE,),
+        role=TiketPIC.Role.P3DE,
+        action=TiketActionType.DIKIRIM_KE_PIDE,
+        catatan='tiket dikirim ke PIDE',
+        fields=('tgl_nadine', 'nomor_nd_nadine', 'tgl_kirim_pide'),
+        validators=(
+            not_before('tgl_nadine', 'Tanggal Nadine', 'tgl_teliti', 'Tanggal Teliti'),
+            not_before('tgl_kirim_pide', 'Tanggal Kirim PIDE', 'tgl_teliti', 'Tanggal Teliti'),
+        ),
+        notify=TiketPIC.Role.PIDE,
+        notification_title='Tiket Dikirim ke PIDE',
+        notification_message='Tiket <a href="{url}">{nomor}</a> telah dikirim ke PIDE oleh {sender}.',
+    ),
+    Transition(
+        name=IDENTIFIKASI,
+        label='Identifikasi',
+        sources=frozenset({STATUS_DIKIRIM_KE_PIDE}),
+        targets=(STATUS_IDENTIFIKASI,),
+        role=TiketPIC.Role.PIDE,
+        action=TiketActionType.IDENTIFIKASI,
+        catatan='Mulai proses identifikasi',
+        stamps=('tgl_rekam_pide',),
+        validators=(
+            not_before('tgl_rekam_pide', 'Tanggal Rekam PIDE', 'tgl_kirim_pide', 'Tanggal Kirim PIDE'),
+        ),
+    ),
+    Transition(
+        name=DIKEMBALIKAN,
+        label='Pengembalian tiket',
+        sources=frozenset({STATUS_DIKIRIM_KE_PIDE, STATUS_IDENTIFIKASI}),
+        targets=(STATUS_DIBATALKAN,),
+        role=TiketPIC.Role.PIDE,
+        action=TiketActionType.DIKEMBALIKAN,
+        catatan='Tiket dikembalikan oleh PIDE',
+        stamps=('tgl_dikembalikan',),
+        clears=('tgl_rekam_pide',),
+        follow_ups=(
+            FollowUpAction(TiketActionType.DIBATALKAN, 'Tiket dibatalkan (dikembalikan oleh PIDE: {catatan})',
+                           credited_role=TiketPIC.Role.P3DE),
+        ),
+        notify=TiketPIC.Role.P3DE,
+        notification_title='Tiket Dikembalikan',
+        notification_message=(
+            'Tiket <a href="{url}">{nomor}</a> telah dikembalikan oleh {sender} dengan catatan: {catatan}'
+        ),
+    ),
+    Transition(
+        name=TRANSFER_KE_PMDE,
+        label='Transfer ke PMDE',
+        sources=frozenset({STATUS_IDENTIFIKASI}),
+        targets=(STATUS_PENGENDALIAN_MUTU,),
+        role=TiketPIC.Role.PIDE,
+        action=TiketActionType.DITRANSFER_KE_PMDE,
+        catatan='Transfer ke PMDE - I:{baris_i}, U:{baris_u}, Res:{baris_res}, CDE:{baris_cde}',
+        fields=('baris_i', 'baris_u', 'baris_res', 'baris_cde', 'tgl_transfer'),
+        validators=(
+            not_negative(('baris_i', 'baris_u', 'baris_res', 'baris_cde')),
+            sums_to(('baris_i', 'baris_u', 'baris_res', 'baris_cde'), 'baris_lengkap', 'Baris Lengkap'),
+            not_before('tgl_transfer', 'Tanggal Transfer', 'tgl_rekam_pide', 'Tanggal Rekam PIDE'),
+        ),
+        notify=TiketPIC.Role.PMDE,
+        notification_title='Tiket Ditransfer ke Pengendalian Mutu',
+        notification_message='Tiket <a href="{url}">{nomor}</a> telah ditransfer ke Pengendalian Mutu oleh {sender}',
+    ),
+    Transition(
+        name=SELESAIKAN,
+        label='Penyelesaian tiket',
+        sources=frozenset({STATUS_PENGENDALIAN_MUTU}),
+        targets=(STATUS_SELESAI,),
+        role=TiketPIC.Role.PMDE,
+        action=TiketActionType.PENGENDALIAN_MUTU,
+        catatan='Sudah QC:{sudah_qc}, Lolos QC:{lolos_qc}, Tidak Lolos QC:{tidak_lolos_qc}, QC C:{qc_c}',
+        fields=('sudah_qc', 'lolos_qc', 'tidak_lolos_qc', 'qc_c'),
+        follow_ups=(
+            FollowUpAction(TiketActionType.SELESAI, 'Tiket selesai diproses'),
+        ),
+    ),
+)}
+
+
+def can_run(name, status):
+    """Whether a tiket in *status* may take transition *name*."""
+    return TRANSITIONS[name].allows(status)
+
+
+def available_transitions(status, role=None):
+    """Names of the transitions a tiket in *status* may take (optionally only for *role*)."""
+    return [
+        name for name, transition in TRANSITIONS.items()
+        if transition.allows(status) and (role is None or transition.role == role)
+    ]
+
+
+def _status_error(transition, tiket):
+    if transition.allows(tiket.status_tiket):
+        return None
+    return (
+        f'{transition.label} tidak dapat dilakukan pada tiket {tiket.nomor_tiket} '
+        f'yang berstatus {STATUS_LABELS.get(tiket.status_tiket, tiket.status_tiket)}.'
+    )
+
+
+def _role_error(transition, nomor_tikets):
+    return (
+        f'Anda bukan PIC {TiketPIC.Role(transition.role).label} aktif untuk tiket {", ".join(nomor_tikets[:5])}'
+        f'{" dan lainnya" if len(nomor_tikets) > 5 else ""}.'
+    )
+
+
+def _data_error(transition, tiket, values):
+    """``(exception class, message)`` for the first problem of the input of *tiket*, or None."""
+    missing = [name for name in transition.fields if values.get(name) in (None, '')]
+    if missing:
+        return InvalidTransitionData, f'{transition.label}: field {", ".join(missing)} wajib diisi.'
+    for validator in transition.validators:
+        error = validator(tiket, values)
+        if error:
+            return InvalidTransitionData, error
+    return None
+
+
+def _check(transition, tikets, user, values_of):
+    """Raise the first reason *user* may not apply *transition* to *tikets*."""
+    for tiket in tikets:
+        error = _status_error(transition, tiket)
+        if error:
+            raise IllegalTransition(error)
+
+    pic_tiket_ids = set(TiketPIC.objects.filter(
+        id_tiket_id__in=[tiket.pk for tiket in tikets],
+        id_user=user,
+        active=True,
+        role=transition.role,
+    ).values_list('id_tiket_id', flat=True))
+    denied = [tiket.nomor_tiket for tiket in tikets if tiket.pk not in pic_tiket_ids]
+    if denied:
+        raise RoleRequired(_role_error(transition, denied))
+
+    for tiket in tikets:
+        error = _data_error(transition, tiket, values_of(tiket))
+        if error:
+            exception_class, message = error
+            raise exception_class(message)
+
+
+def _prepare_values(transition, values, values_by_tiket, now):
+    """Validate the input keys; return the shared values (stamps, clears) and ``values_of``."""
+    values = dict(values or {})
+    values_by_tiket = {tiket_id: dict(row) for tiket_id, row in (values_by_tiket or {}).items()}
+    supplied = set(values).union(*values_by_tiket.values())
+    unexpected = supplied - set(transition.fields) - set(transition.stamps)
+    if unexpected:
+        raise ValueError(f'{transition.name} does not write {", ".join(sorted(unexpected))}')
+    for stamp in transition.stamps:
+        if values.get(stamp) is None:
+            values[stamp] = now
+    values.update(dict.fromkeys(transition.clears))
+
+    def values_of(tiket):
+        return {**values, **values_by_tiket.get(tiket.pk, {})}
+
+    return values, supplied, values_of
+
+
+def partition(name, tiket_ids, user, values=None, values_by_tiket=None, now=None):
+    """Split *tiket_ids* into the tikets *user* may apply transition *name* to and the refused ones.
+
+    Status, active PIC role and the transition's validators are evaluated
+    for every tiket; the tikets and the user's PIC role on each of them are
+    read with a single query.  Takes the same input as :func:`run`.
+
+    Returns:
+        tuple: ``(eligible, refused)`` -- the eligible Tikets and a
+        :class:`Refusal` for each of the others (unknown ids included), both
+        in the order of *tiket_ids*.
+    """
+    transition = TRANSITIONS[name]
+    _, _, values_of = _prepare_values(transition, values, values_by_tiket, now or datetime.now())
+    tiket_ids = list(dict.fromkeys(tiket_ids))
+    tikets = Tiket.objects.filter(id__in=tiket_ids).annotate(
+        is_pic=Exists(TiketPIC.objects.filter(
+            id_tiket=OuterRef('pk'), id_user=user, active=True, role=transition.role,
+        )),
+    ).in_bulk()
+
+    eligible, refused = [], []
+    for tiket_id in tiket_ids:
+        tiket = tikets.get(tiket_id)
+        if tiket is None:
+            refused.append(Refusal(tiket_id, None, 'Tiket tidak ditemukan.'))
+            continue
+        error = _status_error(transition, tiket)
+        if error is None and not tiket.is_pic:
+            error = _role_error(transition, [tiket.nomor_tiket])
+        if error is None:
+            data_error = _data_error(transition, tiket, values_of(tiket))
+            error = data_error and data_error[1]
+        if error:
+            refused.append(Refusal(tiket_id, tiket.nomor_tiket, error))
+        else:
+            eligible.append(tiket)
+    return eligible, refused
+
+
+def _active_pics(transition, tiket_ids):
+    """``{(tiket_id, role): [user_id, ...]}`` for the roles the transition credits or notifies."""
+    roles = {follow_up.credited_role for follow_up in transition.follow_ups} | {transition.notify}
+    roles.discard(None)
+    pics = defaultdict(list)
+    if roles:
+        for tiket_id, role, user_id in TiketPIC.objects.filter(
+            id_tiket_id__in=tiket_ids,
+            active=True,
+            role__in=roles,
+        ).order_by('id').values_list('id_tiket_id', 'role', 'id_user_id'):
+            pics[(tiket_id, role)].append(user_id)
+    return pics
+
+
+def _log_actions(transition, tikets, user, notes, now, pics):
+    fallback = {}
+
+    def credited(tiket, role):
+        if role is None:
+            return user.pk
+        if pics[(tiket.pk, role)]:
+            return pics[(tiket.pk, role)][0]
+        if role not in fallback:
+            member = User.objects.filter(groups__name__in=ROLE_FALLBACK_GROUPS[role]).first()
+            fallback[role] = (member or user).pk
+        return fallback[role]
+
+    actions = []
+    for tiket in tikets:
+        actions.append(TiketAction(
+            id_tiket=tiket, id_user_id=user.pk, timestamp=now, action=transition.action, catatan=notes[tiket.pk],
+        ))
+        for follow_up in transition.follow_ups:
+            if follow_up.when_status is not None and tiket.status_tiket not in follow_up.when_status:
+                continue
+            actions.append(TiketAction(
+                id_tiket=tiket,
+                id_user_id=credited(tiket, follow_up.credited_role),
+                timestamp=now,
+                action=follow_up.action,
+                catatan=follow_up.catatan.format_map(_TiketFields(tiket, catatan=notes[tiket.pk])),
+            ))
+    TiketAction.objects.bulk_create(actions, batch_size=BULK_BATCH_SIZE)
+    tiket_timeline.record_latest_actions(actions)
+
+
+def _notify(transition, tikets, user, notes, pics):
+    if transition.notify is None:
+        return
+    sender_name = (user.get_full_name() or user.username).strip()
+    for tiket in tikets:
+        recipients = pics[(tiket.pk, transition.notify)]
+        if not recipients:
+            continue
+        message = format_html(
+            transition.notification_message,
+            url=reverse('tiket_detail', kwargs={'pk': tiket.pk}),
+            nomor=tiket.nomor_tiket or str(tiket.pk),
+            sender=sender_name,
+            catatan=notes[tiket.pk],
+        )
+        notifications.notify(recipients, transition.notification_title, message, tiket_id=tiket.pk)
+
+
+def _refresh_derived(tiket_ids, values):
+    """Redo what the bypassed post_save receivers would have done."""
+    if set(values) & set(Tiket.SLA_SOURCE_FIELDS):
+        sla.recompute_sla(Tiket.objects.filter(id__in=tiket_ids))
+    tiket_dossier.invalidate_tiket_dossiers(tiket_ids)
+    for group in Tiket.objects.filter(id__in=tiket_ids).values_list(
+        'id_periode_data__id_sub_jenis_data_ilap_id', 'periode', 'tahun',
+    ).distinct():
+        tiket_dossier.invalidate_tiket_group(*group)
+
+
+def run(name, tikets, user, values=None, catatan=None, now=None, values_by_tiket=None):
+    """Apply transition *name* to *tikets* on behalf of *user*.
+
+    Args:
+        name: Key of :data:`TRANSITIONS`.
+        tikets: One Tiket, an iterable of Tikets or a queryset.  The status
+            each tiket was read with is the one the UPDATE is conditioned on.
+        user: The acting user; must be an active PIC of the transition's
+            role on every tiket.
+        values (dict): The transition's ``fields`` (and optionally its
+            ``stamps``), e.g. a form's ``cleaned_data``.
+        catatan: Catatan of the logged action; defaults to the transition's.
+        now: Timestamp of the run (stamps and TiketActions).
+        values_by_tiket (dict): ``{tiket_id: values}`` overriding *values*
+            per tiket (e.g. the row counts of a bulk transfer).
+
+    Returns:
+        list: The tikets, with the written fields set on the instances.
+
+    Raises:
+        IllegalTransition, RoleRequired, InvalidTransitionData: Nothing was
+            written.
+        StaleTiket: A tiket left its status concurrently; nothing was written.
+    """
+    transition = TRANSITIONS[name]
+    now = now or datetime.now()
+    if isinstance(tikets, Tiket):
+        tikets = [tikets]
+    tikets = list({tiket.pk: tiket for tiket in tikets}.values())
+    if not tikets:
+        return []
+
+    values, supplied, values_of = _prepare_values(transition, values, values_by_tiket, now)
+
+    _check(transition, tikets, user, values_of)
+
+    resolved = transition.resolve(tikets, values_of) if transition.resolve else {}
+    groups = defaultdict(list)
+    for tiket in tikets:
+        changes = {'status_tiket': transition.targets[0], **values_of(tiket), **resolved.get(tiket.pk, {})}
+        if changes['status_tiket'] not in transition.targets:
+            raise ValueError(f'{name} cannot end in status {changes["status_tiket"]}')
+        groups[(tiket.status_tiket, tuple(sorted(changes.items())))].append(tiket)
+
+    tiket_ids = [tiket.pk for tiket in tikets]
+    with transaction.atomic():
+        updated = 0
+        for (status, changes), group in groups.items():
+            updated += Tiket.objects.filter(
+                id__in=[tiket.pk for tiket in group], status_tiket=status,
+            ).update(**dict(changes))
+        if updated != len(tikets):
+            raise StaleTiket(
+                'Status tiket telah diubah oleh pengguna lain. Muat ulang halaman lalu coba lagi.'
+            )
+        for (_, changes), group in groups.items():
+            for tiket in group:
+                for field_name, value in changes:
+                    setattr(tiket, field_name, value)
+
+        notes = {
+            tiket.pk: catatan if catatan is not None else transition.catatan.format_map(_TiketFields(tiket))
+            for tiket in tikets
+        }
+        pics = _active_pics(transition, tiket_ids)
+        _log_actions(transition, tikets, user, notes, now, pics)
+        _notify(transition, tikets, user, notes, pics)
+        _refresh_derived(tiket_ids, set(values) | supplied)
+    return tikets
@@ -1,7 +1,21 @@
 from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib import messages
 
+from .models import (
+    BackupData,
+    DetilTandaTerima,
+    DurasiJatuhTempo,
+    JenisPrioritasData,
+    KlasifikasiJenisData,
+    PIC,
+    Tiket,
+    TiketAction,
+    TiketPIC,
+)
+from .utils import filter_options, reference_data, sla, tiket_dossier, tiket_timeline
+
 @receiver(user_logged_in)
 def display_login_success_message(sender, request, user, **kwargs):
     # Only add message if messages middleware is installed
@@ -9,4 +23,119 @@ def display_login_success_message(sender, request, user, **kwargs):
     if hasattr(request, '_messages'):
         # Get user's full name or fall back to username
         full_name = user.get_full_name().strip() if user.get_full_name() else user.username
-        messages.success(request, f"Selamat datang, {full_name}!")
\ No newline at end of file
+        messages.success(request, f"Selamat datang, {full_name}!")
+
+
+# ---------------------------------------------------------------------------
+# Tiket dossier cache invalidation (see utils/tiket_dossier.py)
+# ---------------------------------------------------------------------------
+
+@receiver([post_save, post_delete], sender=TiketAction)
+@receiver([post_save, post_delete], sender=TiketPIC)
+@receiver([post_save, post_delete], sender=BackupData)
+@receiver([post_save, post_delete], sender=DetilTandaTerima)
+def invalidate_dossier_on_related_write(sender, instance, **kwargs):
+    """A related row of a tiket changed: drop that tiket's cached dossier."""
+    if instance.id_tiket_id:
+        tiket_dossier.invalidate_tiket_dossier(instance.id_tiket_id)
+
+
+@receiver([post_save, post_delete], sender=Tiket)
+def invalidate_dossier_on_tiket_write(sender, instance, **kwargs):
+    """A tiket changed: drop its dossier and the riwayat lists of its period."""
+    tiket_dossier.invalidate_tiket_dossier(instance.pk)
+    periode_data = instance.id_periode_data if instance.id_periode_data_id else None
+    if periode_data is not None:
+        tiket_dossier.invalidate_tiket_group(
+            periode_data.id_sub_jenis_data_ilap_id, instance.periode, instance.tahun
+        )
+
+
+@receiver([post_save, post_delete], sender=PIC)
+@receiver([post_save, post_delete], sender=KlasifikasiJenisData)
+def invalidate_dossiers_on_master_write(sender, instance, **kwargs):
+    """PIC validity and klasifikasi are shared by many tikets: drop all dossiers."""
+    tiket_dossier.invalidate_all_tiket_dossiers()
+
+
+# ---------------------------------------------------------------------------
+# Latest action per type (see utils/tiket_timeline.py)
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=TiketAction)
+def record_latest_action_on_create(sender, instance, created, raw=False, **kwargs):
+    """A new action may be the latest of its type on its tiket."""
+    if created and not raw:
+        tiket_timeline.record_latest_actions([instance])
+
+
+# ---------------------------------------------------------------------------
+# Reference data cache invalidation (see utils/reference_data.py)
+# ---------------------------------------------------------------------------
+
+def invalidate_reference_data_on_write(sender, instance, **kwargs):
+    """A master table changed: rebuild the cached option lists on next read."""
+    reference_data.invalidate_reference_data()
+
+
+for _model in reference_data.REFERENCE_MODELS:
+    post_save.connect(invalidate_reference_data_on_write, sender=_model,
+                      dispatch_uid=f'reference_data_save_{_model._meta.label}')
+    post_delete.connect(invalidate_reference_data_on_write, sender=_model,
+                        dispatch_uid=f'reference_data_delete_{_model._meta.label}')
+
+
+# ---------------------------------------------------------------------------
+# Laporan filter options derived from tikets (see utils/filter_options.py)
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=Tiket)
+def note_tiket_year_on_save(sender, instance, **kwargs):
+    """A tiket of a year not offered yet makes the cached year list stale."""
+    filter_options.note_tiket_year(instance.tahun)
+
+
+@receiver(post_delete, sender=Tiket)
+def invalidate_tiket_years_on_delete(sender, instance, **kwargs):
+    """The deleted tiket may have been the last one of its year."""
+    filter_options.invalidate_tiket_years()
+
+
+# ---------------------------------------------------------------------------
+# Persisted SLA columns (see utils/sla.py)
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=Tiket)
+def refresh_sla_on_tiket_save(sender, instance, raw=False, **kwargs):
+    """Recompute the tiket's deadlines/prioritas when one of their source dates changed."""
+    if not raw:
+        sla.refresh_tiket_sla(instance)
+
+
+def _rule_sub_jenis_field(model):
+    return 'id_sub_jenis_data_id' if model is DurasiJatuhTempo else 'id_sub_jenis_data_ilap_id'
+
+
+@receiver(pre_save, sender=DurasiJatuhTempo)
+@receiver(pre_save, sender=JenisPrioritasData)
+def remember_sla_rule_sub_jenis(sender, instance, raw=False, **kwargs):
+    """Keep the stored sub jenis data of an edited rule so its old tikets are recomputed too."""
+    instance._sla_previous_sub_jenis_id = None
+    if instance.pk and not raw:
+        instance._sla_previous_sub_jenis_id = sender.objects.filter(pk=instance.pk).values_list(
+            _rule_sub_jenis_field(sender), flat=True
+        ).first()
+
+
+@receiver([post_save, post_delete], sender=DurasiJatuhTempo)
+@receiver([post_save, post_delete], sender=JenisPrioritasData)
+def recompute_sla_on_rule_write(sender, instance, raw=False, **kwargs):
+    """A durasi jatuh tempo or prioritas range changed: recompute the tikets it covers."""
+    if raw:
+        return
+    sub_jenis_ids = {
+        getattr(instance, _rule_sub_jenis_field(sender)),
+        getattr(instance, '_sla_previous_sub_jenis_id', None),
+    }
+    for sub_jenis_id in sub_jenis_ids - {None}:
+        sla.recompute_sla_for_sub_jenis(sub_jenis_id)
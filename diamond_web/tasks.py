@@ -4,6 +4,13 @@ from django.core.cache import cache
 
 from celery import shared_task
 
+from .utils.job_state import (
+    JobState, CHECK_REFERENSI, SYNC_REFERENSI, CHECK_TIKET, SYNC_TIKET,
+)
+from .utils import sync_log
+from .utils.profiling import profiled_task
+from .utils.task_lock import SingletonLock
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,55 +25,81 @@ def _get_user(user_id):
         return None
 
 
+def _acquire_sync_lock(job, label):
+    """Take the singleton lock for *job*'s sync type; report busy on the job state.
+
+    Returns the held SingletonLock, or None when another sync of the same
+    type is still running (the job is then finished with an error).
+    """
+    lock = SingletonLock(job.kind, owner=job.job_id)
+    if lock.acquire():
+        return lock
+    message = f'Sinkronisasi {label} lain sedang berjalan (run {lock.holder()}).'
+    logger.warning(f'[TASK] {message} Skipping {job.kind} {job.job_id}')
+    job.finish(error=message)
+    return None
+
+
+def _make_progress_callback(job, stop_checker, stop_message):
+    """Build the service progress callback writing one state update per table.
+
+    The callback raises InterruptedError once *stop_checker* reports a stop,
+    which halts OracleDataSyncService between tables.
+    """
+    def _on_progress(current, total, table_name, inserts, updates, errors):
+        if stop_checker():
+            logger.info(f'[TASK] Stop requested for {job.kind} {job.job_id}, raising interrupt')
+            raise InterruptedError(stop_message)
+        pct = int(current / total * 100) if total else 0
+        job.set_progress(
+            current=current, total=total, percentage=pct,
+            table_name=table_name, inserts=inserts,
+            updates=updates, errors=errors,
+        )
+    return _on_progress
+
+
 @shared_task(bind=True, name='diamond_web.tasks.check_referensi_data_task')
 def check_referensi_data_task(self, check_id):
     """Run Oracle referensi check in a Celery worker."""
+    job = JobState(CHECK_REFERENSI, check_id)
+    run = sync_log.start_run(sync_log.REFERENSI_CHECK, check_id)
     try:
         logger.info(f'[TASK] Starting referensi check (check_id={check_id})...')
         from .utils.oracle_sync import OracleDataSyncService
         service = OracleDataSyncService()
 
-        def _on_progress(current, total, table_name, inserts, updates, errors):
-            # Check stop signal - if set, raise to halt service
-            if cache.get(f'check_referensi_stop_requested_{check_id}'):
-                logger.info(f'[TASK] Stop requested for check {check_id}, raising interrupt')
-                raise InterruptedError('Cek Data dihentikan oleh pengguna')
-            pct = int(current / total * 100) if total else 0
-            cache.set(f'check_referensi_progress_{check_id}', {
-                'current': current, 'total': total, 'percentage': pct,
-                'table_name': table_name, 'inserts': inserts,
-                'updates': updates, 'errors': errors,
-            }, timeout=3600)
-        
-        def _stop_checker():
-            """Check if stop was requested; called frequently during row iteration."""
-            return bool(cache.get(f'check_referensi_stop_requested_{check_id}'))
-
-        summary = service.check(progress_callback=_on_progress, stop_checker=_stop_checker)
+        stop_checker = job.stop_checker()
+        _on_progress = _make_progress_callback(job, stop_checker, 'Cek Data dihentikan oleh pengguna')
+
+        summary = service.check(progress_callback=_on_progress, stop_checker=stop_checker)
         summary_dict = summary.as_dict() if hasattr(summary, 'as_dict') else {}
 
-        cache.set(f'check_referensi_result_{check_id}', summary_dict, timeout=3600)
-        cache.set(f'check_referensi_done_{check_id}', True, timeout=3600)
-        cache.set(f'check_referensi_in_progress_{check_id}', False, timeout=3600)
-        cache.delete('check_referensi_active_check_id')
+        job.finish(result=summary_dict)
+        sync_log.finish_run(run, summary=summary_dict)
         logger.info(f'[TASK] Referensi check completed (check_id={check_id})')
     except InterruptedError as e:
         logger.info(f'[TASK] Referensi check interrupted: {str(e)}')
-        cache.set(f'check_referensi_error_{check_id}', str(e), timeout=3600)
-        cache.set(f'check_referensi_done_{check_id}', True, timeout=3600)
-        cache.set(f'check_referensi_in_progress_{check_id}', False, timeout=3600)
-        cache.delete('check_referensi_active_check_id')
+        job.finish(error=str(e))
+        sync_log.finish_run(run, error=str(e), stopped=True)
     except Exception as e:
         logger.error(f'[TASK] Exception in referensi check: {str(e)}', exc_info=True)
-        cache.set(f'check_referensi_error_{check_id}', str(e), timeout=3600)
-        cache.set(f'check_referensi_done_{check_id}', True, timeout=3600)
-        cache.set(f'check_referensi_in_progress_{check_id}', False, timeout=3600)
+        job.finish(error=str(e))
+        sync_log.finish_run(run, error=str(e))
+    finally:
         cache.delete('check_referensi_active_check_id')
 
 
 @shared_task(bind=True, name='diamond_web.tasks.sync_referensi_data_task')
+@profiled_task
 def sync_referensi_data_task(self, sync_id, user_id=None):
     """Run Oracle referensi sync in a Celery worker."""
+    job = JobState(SYNC_REFERENSI, sync_id)
+    lock = _acquire_sync_lock(job, 'referensi')
+    if lock is None:
+        return
+    run = sync_log.start_run(sync_log.REFERENSI_SYNC, sync_id, user=_get_user(user_id))
+    error_file = sync_log.failed_rows_path(sync_log.REFERENSI_FAILED_ROWS_PREFIX, sync_id)
     try:
         logger.info(f'[TASK] Starting referensi sync (sync_id={sync_id})...')
         from .utils.oracle_sync import OracleDataSyncService
@@ -75,19 +108,9 @@ def sync_referensi_data_task(self, sync_id, user_id=None):
         service = OracleDataSyncService()
         logger.info(f'[TASK] OracleDataSyncService initialized')
 
-        def _on_progress(current, total, table_name, inserts, updates, errors):
-            # Check stop signal — raise to halt the sync
-            if cache.get(f'sync_referensi_stop_requested_{sync_id}'):
-                logger.info(f'[TASK] Stop requested for referensi sync {sync_id}, raising interrupt')
-                raise InterruptedError('Sync dihentikan oleh pengguna')
-            pct = int(current / total * 100) if total else 0
-            cache.set(f'sync_referensi_progress_{sync_id}', {
-                'current': current, 'total': total, 'percentage': pct,
-                'table_name': table_name, 'inserts': inserts,
-                'updates': updates, 'errors': errors,
-            }, timeout=3600)
+        _on_progress = _make_progress_callback(job, job.stop_checker(), 'Sync dihentikan oleh pengguna')
 
-        user = _get_user(user_id)
+        user = run.triggered_by
 
         class FakeRequest:
             def __init__(self, u):
@@ -97,70 +120,68 @@ def sync_referensi_data_task(self, sync_id, user_id=None):
         sync_summary = _sync_referensi_data(service, sync_id=sync_id, request=fake_request, progress_callback=_on_progress)
         logger.info(f'[TASK] Referensi sync completed (sync_id={sync_id}): {sync_summary}')
 
-        cache.set(f'sync_referensi_result_{sync_id}', sync_summary, timeout=3600)
-        cache.set(f'sync_referensi_done_{sync_id}', True, timeout=3600)
-        cache.set(f'sync_referensi_in_progress_{sync_id}', False, timeout=3600)
-        cache.delete('sync_referensi_active_sync_id')
+        job.finish(result=sync_summary)
+        sync_log.finish_run(run, summary=sync_summary, error_file_path=error_file)
     except InterruptedError as e:
         logger.info(f'[TASK] Referensi sync interrupted: {str(e)}')
-        cache.set(f'sync_referensi_error_{sync_id}', str(e), timeout=3600)
-        cache.set(f'sync_referensi_done_{sync_id}', True, timeout=3600)
-        cache.set(f'sync_referensi_in_progress_{sync_id}', False, timeout=3600)
-        cache.delete('sync_referensi_active_sync_id')
+        job.finish(error=str(e))
+        sync_log.finish_run(run, error=str(e), stopped=True, error_file_path=error_file)
     except Exception as e:
         logger.error(f'[TASK] Exception in referensi sync: {str(e)}', exc_info=True)
-        cache.set(f'sync_referensi_error_{sync_id}', str(e), timeout=3600)
-        cache.set(f'sync_referensi_done_{sync_id}', True, timeout=3600)
-        cache.set(f'sync_referensi_in_progress_{sync_id}', False, timeout=3600)
+        job.finish(error=str(e))
+        sync_log.finish_run(run, error=str(e), error_file_path=error_file)
+    finally:
+        lock.release()
         cache.delete('sync_referensi_active_sync_id')
 
 
 @shared_task(bind=True, name='diamond_web.tasks.check_tiket_data_task')
 def check_tiket_data_task(self, check_id):
     """Run Oracle tiket check in a Celery worker."""
+    job = JobState(CHECK_TIKET, check_id)
+    run = sync_log.start_run(sync_log.TIKET_CHECK, check_id)
     try:
         logger.info(f'[TASK] Starting tiket check (check_id={check_id})...')
         from .utils.oracle_sync import OracleDataSyncService
         from .views.sync_tiket import _check_tiket_data
 
         # Check if stop was requested before task even starts
-        if cache.get(f'check_tiket_stop_requested_{check_id}'):
+        if job.stop_requested():
             logger.info(f'[TASK] Tiket check stop requested before start (check_id={check_id})')
-            cache.set(f'check_tiket_error_{check_id}', 'Cek Data dihentikan oleh pengguna', timeout=3600)
-            cache.set(f'check_tiket_done_{check_id}', True, timeout=3600)
-            cache.set(f'check_tiket_in_progress_{check_id}', False, timeout=3600)
+            job.finish(error='Cek Data dihentikan oleh pengguna')
+            sync_log.finish_run(run, error='Cek Data dihentikan oleh pengguna', stopped=True)
             return
 
         service = OracleDataSyncService(connection_only=True)
-        
-        def _stop_checker():
-            """Check if stop was requested; called frequently during row iteration."""
-            return bool(cache.get(f'check_tiket_stop_requested_{check_id}'))
-        
+
         # Wrap the check operation to handle stop requests
         try:
-            summary = _check_tiket_data(service, check_id=check_id, stop_checker=_stop_checker)
+            summary = _check_tiket_data(service, check_id=check_id, stop_checker=job.stop_checker())
         except InterruptedError as e:
             logger.info(f'[TASK] Tiket check interrupted: {str(e)}')
-            cache.set(f'check_tiket_error_{check_id}', str(e), timeout=3600)
-            cache.set(f'check_tiket_done_{check_id}', True, timeout=3600)
-            cache.set(f'check_tiket_in_progress_{check_id}', False, timeout=3600)
+            job.finish(error=str(e))
+            sync_log.finish_run(run, error=str(e), stopped=True)
             return
-            
-        cache.set(f'check_tiket_result_{check_id}', summary, timeout=3600)
-        cache.set(f'check_tiket_done_{check_id}', True, timeout=3600)
-        cache.set(f'check_tiket_in_progress_{check_id}', False, timeout=3600)
+
+        job.finish(result=summary)
+        sync_log.finish_run(run, summary=summary)
         logger.info(f'[TASK] Tiket check completed (check_id={check_id})')
     except Exception as e:
         logger.error(f'[TASK] Exception in tiket check: {str(e)}', exc_info=True)
-        cache.set(f'check_tiket_error_{check_id}', str(e), timeout=3600)
-        cache.set(f'check_tiket_done_{check_id}', True, timeout=3600)
-        cache.set(f'check_tiket_in_progress_{check_id}', False, timeout=3600)
+        job.finish(error=str(e))
+        sync_log.finish_run(run, error=str(e))
 
 
 @shared_task(bind=True, name='diamond_web.tasks.sync_tiket_data_task')
+@profiled_task
 def sync_tiket_data_task(self, sync_id, user_id=None):
     """Run Oracle tiket sync in a Celery worker."""
+    job = JobState(SYNC_TIKET, sync_id)
+    lock = _acquire_sync_lock(job, 'tiket')
+    if lock is None:
+        return
+    run = sync_log.start_run(sync_log.TIKET_SYNC, sync_id, user=_get_user(user_id))
+    error_file = sync_log.failed_rows_path(sync_log.TIKET_FAILED_ROWS_PREFIX, sync_id)
     try:
         logger.info(f'[TASK] Starting tiket sync (sync_id={sync_id})...')
         from .utils.oracle_sync import OracleDataSyncService
@@ -169,7 +190,7 @@ def sync_tiket_data_task(self, sync_id, user_id=None):
         service = OracleDataSyncService(connection_only=True)
         logger.info(f'[TASK] OracleDataSyncService initialized')
 
-        user = _get_user(user_id)
+        user = run.triggered_by
 
         class FakeRequest:
             def __init__(self, u):
@@ -179,14 +200,16 @@ def sync_tiket_data_task(self, sync_id, user_id=None):
         tiket_summary = _sync_tiket_data(service, sync_id=sync_id, request=fake_request)
         logger.info(f'[TASK] Tiket sync completed (sync_id={sync_id}): {tiket_summary}')
 
-        cache.set(f'sync_tiket_result_{sync_id}', tiket_summary, timeout=3600)
-        cache.set(f'sync_tiket_done_{sync_id}', True, timeout=3600)
-        cache.set(f'sync_tiket_in_progress_{sync_id}', False, timeout=3600)
+        job.finish(result=tiket_summary)
+        sync_log.finish_run(
+            run, summary=tiket_summary, stopped=job.stop_requested(), error_file_path=error_file,
+        )
     except Exception as e:
         logger.error(f'[TASK] Exception in tiket sync: {str(e)}', exc_info=True)
-        cache.set(f'sync_tiket_error_{sync_id}', str(e), timeout=3600)
-        cache.set(f'sync_tiket_done_{sync_id}', True, timeout=3600)
-        cache.set(f'sync_tiket_in_progress_{sync_id}', False, timeout=3600)
+        job.finish(error=str(e))
+        sync_log.finish_run(run, error=str(e), error_file_path=error_file)
+    finally:
+        lock.release()
 
 
 @shared_task(bind=True, name='diamond_web.tasks.cleanup_pre_production_task')
@@ -207,3 +230,12 @@ def cleanup_pre_production_task(self):
     except Exception as e:
         logger.error(f'[TASK] Pre-production cleanup failed: {str(e)}', exc_info=True)
         raise
+
+
+@shared_task(bind=True, name='diamond_web.tasks.cleanup_read_notifications_task')
+def cleanup_read_notifications_task(self, retention_days=None):
+    """Delete read notifications older than NOTIFICATION_RETENTION_DAYS, in chunks."""
+    from .services import notifications
+    deleted = notifications.archive_read_notifications(retention_days=retention_days)
+    logger.info(f'[TASK] Deleted {deleted} read notifications')
+    return deleted
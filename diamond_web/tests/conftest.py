@@ -21,6 +21,7 @@ from diamond_web.models import (
     JenisPrioritasData, PIC, TandaTerimaData, Tiket,
     DurasiJatuhTempo, Notification, TiketPIC
 )
+from diamond_web.utils import filter_options, reference_data, synthetic_data as synthetic
 
 # Import DocxTemplate directly if available
 try:
@@ -305,6 +306,39 @@ def reset_sequences():
     factory.Factory.reset_sequence(GroupFactory)
 
 
+@pytest.fixture(autouse=True)
+def reset_reference_data():
+    """Start each test with empty reference data and tiket year caches.
+
+    Rolled-back test transactions do not fire post_delete, so lists built in
+    a previous test would otherwise still be served.
+    """
+    reference_data.invalidate_reference_data()
+    filter_options.invalidate_tiket_years()
+
+
+@pytest.fixture(scope='module')
+def synthetic_data(django_db_setup, django_db_blocker):
+    """Seed a synthetic data set once per test module, rolled back afterwards.
+
+    The volume is ``PERF_SCALE`` (default 0.01) times the full size of
+    ``seed_synthetic``.  Tests using it still need the ``db`` fixture; their
+    transactions are nested inside the seeding one.
+    """
+    from django.db import transaction
+
+    scale = float(os.environ.get('PERF_SCALE', '0.01'))
+    with django_db_blocker.unblock():
+        atomic = transaction.atomic()
+        atomic.__enter__()
+        try:
+            counts = synthetic.seed_synthetic(synthetic.scaled_counts(scale))
+            yield {'scale': scale, 'counts': counts}
+        finally:
+            transaction.set_rollback(True)
+            atomic.__exit__(None, None, None)
+
+
 @pytest.fixture
 def user():
     """Create a test user."""
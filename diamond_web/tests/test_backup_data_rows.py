@@ -0,0 +1,95 @@
+"""Tests for the batched backup data rows (views/backup_data.py)."""
+from io import BytesIO
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from diamond_web.constants.tiket_status import STATUS_DIKIRIM_KE_PIDE, STATUS_DIREKAM
+from diamond_web.models import BackupData, TiketPIC
+from diamond_web.tests.conftest import MediaBackupFactory, TiketFactory, TiketPICFactory, UserFactory
+from diamond_web.views import backup_data
+
+DATATABLES = {'draw': '1', 'start': '0', 'length': '50'}
+
+
+def _backups(count, user, status=STATUS_DIREKAM):
+    """*count* backups of distinct tikets, each with *user* as active P3DE PIC."""
+    media = MediaBackupFactory()
+    first = TiketFactory(status_tiket=status)
+    backups = []
+    for number in range(count):
+        tiket = first if number == 0 else TiketFactory(status_tiket=status, id_periode_data=first.id_periode_data)
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=TiketPIC.Role.P3DE, active=True)
+        backups.append(BackupData.objects.create(
+            id_tiket=tiket, id_user=user, id_media_backup=media, lokasi_backup=f'/mnt/backup/{number}',
+        ))
+    return backups
+
+
+def _pic_queries(queries):
+    return [q for q in queries if 'FROM "tiket_pic"' in q['sql'] and '"tiket_pic"."role"' in q['sql']]
+
+
+@pytest.mark.django_db
+class TestBackupDataRows:
+    """backup_data_data builds its page from one TiketPIC query."""
+
+    def test_page_queries_do_not_grow_with_rows(self, client, authenticated_user):
+        client.force_login(authenticated_user)
+        _backups(2, authenticated_user)
+        with CaptureQueriesContext(connection) as small:
+            client.get(reverse('backup_data_data'), DATATABLES)
+        _backups(6, authenticated_user)
+        with CaptureQueriesContext(connection) as large:
+            response = client.get(reverse('backup_data_data'), DATATABLES)
+
+        assert len(response.json()['data']) == 8
+        assert len(large) == len(small)
+
+    def test_pic_names_and_actions(self, client, authenticated_user):
+        editable, = _backups(1, authenticated_user)
+        sent, = _backups(1, authenticated_user, status=STATUS_DIKIRIM_KE_PIDE)
+        tiket = editable.id_tiket
+        TiketPICFactory(id_tiket=tiket, id_user=UserFactory(first_name='Budi', last_name='Santoso'),
+                        role=TiketPIC.Role.P3DE, active=True)
+        TiketPICFactory(id_tiket=tiket, id_user=UserFactory(first_name='Lama', last_name=''),
+                        role=TiketPIC.Role.P3DE, active=False)
+        TiketPICFactory(id_tiket=tiket, id_user=UserFactory(first_name='Pide', last_name=''),
+                        role=TiketPIC.Role.PIDE, active=True)
+        client.force_login(authenticated_user)
+
+        rows = {row['id']: row for row in client.get(reverse('backup_data_data'), DATATABLES).json()['data']}
+
+        own_name = authenticated_user.get_full_name() or authenticated_user.username
+        assert rows[editable.pk]['pic_p3de'] == ', '.join(sorted({'Budi Santoso', own_name}))
+        assert 'data-action=\'edit\'' in rows[editable.pk]['actions']
+        assert rows[sent.pk]['actions'] == ''
+
+    def test_no_actions_for_a_user_who_is_not_pic(self, client, admin_user, authenticated_user):
+        _backups(1, authenticated_user)
+        client.force_login(admin_user)
+
+        row, = client.get(reverse('backup_data_data'), DATATABLES).json()['data']
+
+        assert row['actions'] == ''
+        assert row['pic_p3de'] != '-'
+
+
+@pytest.mark.django_db
+class TestBackupDataExport:
+    """Exports stream the backups in chunks with one TiketPIC query each."""
+
+    def test_one_pic_query_per_chunk(self, client, authenticated_user, monkeypatch):
+        monkeypatch.setattr(backup_data, 'EXPORT_CHUNK_SIZE', 2)
+        _backups(5, authenticated_user)
+        client.force_login(authenticated_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse('backup_data_export_excel'))
+
+        sheet = load_workbook(BytesIO(response.content)).active
+        assert sheet.max_row == 6
+        assert len(_pic_queries(queries)) == 3
@@ -0,0 +1,128 @@
+"""Database connection profile, Celery connection cleanup and the loadtest command."""
+import io
+import runpy
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from celery.signals import task_postrun, task_prerun
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from config.celery import close_stale_db_connections
+
+SETTINGS_PATH = Path(__file__).resolve().parents[2] / 'config' / 'settings.py'
+
+
+def _databases(monkeypatch, **env):
+    for name in ('DB_CONNECTION_PROFILE', 'DB_POOL_ENABLED', 'DB_REPORTING_HOST', 'DB_CONN_MAX_AGE'):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return runpy.run_path(str(SETTINGS_PATH))['DATABASES']
+
+
+class TestConnectionProfile:
+    """DB_CONNECTION_PROFILE and the per-engine options it adds."""
+
+    def test_persistent_sqlite(self, monkeypatch):
+        databases = _databases(monkeypatch, DB_ENGINE='sqlite3')
+
+        for alias in ('default', 'reporting'):
+            db = databases[alias]
+            assert db['CONN_MAX_AGE'] == 60
+            assert db['CONN_HEALTH_CHECKS'] is True
+            assert 'PRAGMA mmap_size=' in db['OPTIONS']['init_command']
+            assert 'PRAGMA busy_timeout=30000;' in db['OPTIONS']['init_command']
+        assert databases['default']['OPTIONS']['init_command'].startswith('PRAGMA journal_mode=WAL;')
+        assert databases['reporting']['OPTIONS']['init_command'].startswith('PRAGMA query_only=ON;')
+
+    def test_off_restores_one_connection_per_request(self, monkeypatch):
+        databases = _databases(monkeypatch, DB_ENGINE='sqlite3', DB_CONNECTION_PROFILE='off')
+
+        assert 'CONN_MAX_AGE' not in databases['default']
+        assert 'mmap_size' not in databases['default']['OPTIONS']['init_command']
+
+    def test_postgresql_pool(self, monkeypatch):
+        databases = _databases(
+            monkeypatch, DB_ENGINE='postgresql', DB_POOL_ENABLED='true', DB_POOL_MAX_SIZE='20',
+        )
+
+        db = databases['default']
+        assert db['CONN_MAX_AGE'] == 0
+        assert db['CONN_HEALTH_CHECKS'] is True
+        assert db['OPTIONS']['pool'] == {'min_size': 2, 'max_size': 20, 'timeout': 10}
+
+    def test_postgresql_without_pool_is_persistent(self, monkeypatch):
+        databases = _databases(monkeypatch, DB_ENGINE='postgresql', DB_CONN_MAX_AGE='300')
+
+        assert databases['default']['CONN_MAX_AGE'] == 300
+        assert 'OPTIONS' not in databases['default']
+
+
+class _Task:
+    def __init__(self, is_eager):
+        self.request = type('Request', (), {'is_eager': is_eager})()
+
+
+class TestCeleryConnectionCleanup:
+    """Workers drop stale connections around every task, eager calls do not."""
+
+    def test_connected_to_task_signals(self):
+        for signal in (task_prerun, task_postrun):
+            assert any(
+                receiver() is close_stale_db_connections for _, receiver in signal.receivers
+            )
+
+    @pytest.mark.parametrize('is_eager, expected', [(False, 1), (True, 0)])
+    def test_closes_old_connections(self, monkeypatch, is_eager, expected):
+        calls = []
+        monkeypatch.setattr('django.db.close_old_connections', lambda: calls.append(True))
+
+        close_stale_db_connections(task=_Task(is_eager))
+
+        assert len(calls) == expected
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = 404 if self.path == '/missing/' else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestLoadtestCommand:
+    """loadtest reports throughput and failed requests."""
+
+    def test_reports_requests_per_second(self, http_server):
+        out = io.StringIO()
+
+        call_command(
+            'loadtest', '/ok/', '/missing/', '--base-url', http_server,
+            '--requests', '20', '--concurrency', '4', '--warmup', '0', stdout=out,
+        )
+
+        output = out.getvalue()
+        assert '20 request, 4 thread' in output
+        assert '10 request gagal' in output
+        assert 'request/detik' in output
+
+    def test_unknown_user(self, db, http_server):
+        with pytest.raises(CommandError, match='tidak ditemukan'):
+            call_command('loadtest', '/ok/', '--base-url', http_server, '--user', 'nobody')
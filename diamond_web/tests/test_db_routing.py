@@ -0,0 +1,141 @@
+"""Report and DataTables reads go to the ``reporting`` alias, writes to ``default``."""
+import pytest
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.db import connections
+from django.test.testcases import _DatabaseFailure
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from diamond_web.models import BentukData, Tiket
+from diamond_web.utils import reference_data
+from diamond_web.utils.db_routing import (
+    PIN_SESSION_KEY,
+    ReportingRouter,
+    primary_reads,
+    reporting_reads,
+)
+
+DATATABLES = {'draw': '1', 'start': '0', 'length': '10'}
+
+
+
+@pytest.fixture(autouse=True)
+def reporting_enabled(settings):
+    settings.REPORTING_DB_ENABLED = True
+
+
+APP_TABLES = {model._meta.db_table for model in apps.get_app_config('diamond_web').get_models()}
+
+
+def _tables(ctx):
+    """diamond_web tables read by the captured queries."""
+    sql = ' '.join(query['sql'] for query in ctx.captured_queries)
+    return {table for table in APP_TABLES if f'"{table}"' in sql}
+
+
+class TestReportingRouter:
+    """Routing decisions, without touching a database."""
+
+    def test_reads_outside_reporting_views_are_not_routed(self):
+        assert ReportingRouter().db_for_read(Tiket) is None
+
+    def test_reads_inside_reporting_views_use_reporting(self):
+        router = ReportingRouter()
+        with reporting_reads():
+            assert router.db_for_read(Tiket) == 'reporting'
+            # Auth and session models always stay on default
+            assert router.db_for_read(User) is None
+            with primary_reads():
+                assert router.db_for_read(Tiket) is None
+
+    def test_write_moves_later_reads_to_default(self):
+        router = ReportingRouter()
+        with reporting_reads():
+            assert router.db_for_write(Tiket) == 'default'
+            assert router.db_for_read(Tiket) is None
+
+    def test_disabled(self, settings):
+        settings.REPORTING_DB_ENABLED = False
+        with reporting_reads():
+            assert ReportingRouter().db_for_read(Tiket) is None
+
+    def test_never_migrates_reporting(self):
+        assert ReportingRouter().allow_migrate('reporting', 'diamond_web') is False
+        assert ReportingRouter().allow_migrate('default', 'diamond_web') is None
+
+
+@pytest.mark.django_db(transaction=True, databases=['default', 'reporting'])
+class TestReportingViews:
+    """The mirrored test alias sees committed rows, hence transaction=True."""
+
+    @pytest.fixture(autouse=True)
+    def reporting_connection(self):
+        # A test that errors in teardown never runs tearDownClass, leaving the
+        # "connections not allowed" guards on every alias it did not request
+        connection = connections['reporting']
+        for name in ('connect', 'temporary_connection', 'cursor', 'chunked_cursor'):
+            if isinstance(vars(connection).get(name), _DatabaseFailure):
+                delattr(connection, name)
+        return connection
+
+    @pytest.fixture
+    def admin_client(self, client, admin_user):
+        client.force_login(admin_user)
+        return client
+
+    def _get(self, client, url_name, params=DATATABLES):
+        with CaptureQueriesContext(connections['default']) as primary, \
+                CaptureQueriesContext(connections['reporting']) as reporting:
+            response = client.get(reverse(url_name), params)
+        assert response.status_code == 200
+        return primary, reporting
+
+    @pytest.mark.parametrize('url_name', [
+        'tiket_data',
+        'bentuk_data_data',
+        'monitoring_penyampaian_data_data',
+        'laporan_rekap_himpun_olah_data_data',
+        'laporan_rekap_himpun_olah_data',
+    ])
+    def test_report_reads_use_reporting(self, admin_client, url_name):
+        primary, reporting = self._get(admin_client, url_name)
+
+        assert _tables(reporting)
+        assert not _tables(primary)
+
+    def test_datatables_post_does_not_pin(self, admin_client):
+        response = admin_client.post(reverse('laporan_rekap_himpun_olah_data_data'), DATATABLES)
+
+        assert response.status_code == 200
+        assert PIN_SESSION_KEY not in admin_client.session
+
+    def test_pages_after_a_write_read_from_primary(self, admin_client):
+        response = admin_client.post(
+            reverse('bentuk_data_create'),
+            {'deskripsi': 'Baru'},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+        assert response.json()['success'] is True
+        assert PIN_SESSION_KEY in admin_client.session
+
+        primary, reporting = self._get(admin_client, 'bentuk_data_data')
+
+        assert reporting.captured_queries == []
+        assert BentukData._meta.db_table in _tables(primary)
+
+    def test_writes_inside_reporting_views_stay_on_default(self):
+        with reporting_reads():
+            with CaptureQueriesContext(connections['reporting']) as reporting:
+                BentukData.objects.create(deskripsi='Tulis')
+                assert BentukData.objects.filter(deskripsi='Tulis').exists()
+
+        assert reporting.captured_queries == []
+
+    def test_reference_cache_is_built_from_primary(self):
+        reference_data.invalidate_reference_data()
+        with reporting_reads():
+            with CaptureQueriesContext(connections['reporting']) as reporting:
+                reference_data.get_reference('bentuk_data')
+
+        assert reporting.captured_queries == []
@@ -210,30 +210,30 @@ class TestDocumentsRemainingGaps:
 
     # -----------------------------------------------------------------------
     # Lines 291-300: status_penelitian branches inside lampiran row_data loop
-    # Strategy: patch get_object_or_404 to inject status_penelitian on the tiket
+    # Strategy: patch get_tiket_dossier to inject status_penelitian on the tiket
     # then request lampiran doc_type with an active template
     # (tiket_rows=[tiket] since no DetilTandaTerima exists)
     # -----------------------------------------------------------------------
     def _setup_lampiran_test(self, client, status_nilai):
-        """Helper: sets up user, tiket, lampiran template and patches get_object_or_404."""
+        """Helper: sets up user, tiket, lampiran template and patches get_tiket_dossier."""
         user = _make_superuser()
         client.force_login(user)
         tiket, jd = _make_tiket_with_tanda_terima_and_jenis_data()
         _make_template_for(tiket, 'lampiran')
 
-        from django.shortcuts import get_object_or_404 as real_g404
+        from diamond_web.utils.tiket_dossier import get_tiket_dossier as real_dossier
 
-        def mock_g404(qs, **kwargs):
-            obj = real_g404(qs, **kwargs)
-            obj.status_penelitian = status_nilai
-            return obj
+        def mock_g404(pk, **kwargs):
+            dossier = real_dossier(pk, **kwargs)
+            dossier.tiket.status_penelitian = status_nilai
+            return dossier
 
         return tiket, mock_g404
 
     def test_status_penelitian_lengkap_lines_291_293(self, client, db):
         """Lines 291-293: status_penelitian contains 'lengkap' (but not sebagian/tidak)."""
         tiket, mock_g404 = self._setup_lampiran_test(client, 'lengkap')
-        with patch('diamond_web.views.tiket.documents.get_object_or_404', side_effect=mock_g404):
+        with patch('diamond_web.views.tiket.documents.get_tiket_dossier', side_effect=mock_g404):
             resp = client.get(
                 reverse('tiket_documents_download', args=[tiket.pk]),
                 {'doc_type': 'lampiran'},
@@ -243,7 +243,7 @@ class TestDocumentsRemainingGaps:
     def test_status_penelitian_sebagian_lines_294_297(self, client, db):
         """Lines 294-297: status_penelitian contains 'sebagian' (but not 'lengkap')."""
         tiket, mock_g404 = self._setup_lampiran_test(client, 'sebagian saja')
-        with patch('diamond_web.views.tiket.documents.get_object_or_404', side_effect=mock_g404):
+        with patch('diamond_web.views.tiket.documents.get_tiket_dossier', side_effect=mock_g404):
             resp = client.get(
                 reverse('tiket_documents_download', args=[tiket.pk]),
                 {'doc_type': 'lampiran'},
@@ -253,7 +253,7 @@ class TestDocumentsRemainingGaps:
     def test_status_penelitian_tidak_lines_298_300(self, client, db):
         """Lines 298-300: status_penelitian contains 'tidak' (but not 'lengkap' or 'sebagian')."""
         tiket, mock_g404 = self._setup_lampiran_test(client, 'tidak tersedia')
-        with patch('diamond_web.views.tiket.documents.get_object_or_404', side_effect=mock_g404):
+        with patch('diamond_web.views.tiket.documents.get_tiket_dossier', side_effect=mock_g404):
             resp = client.get(
                 reverse('tiket_documents_download', args=[tiket.pk]),
                 {'doc_type': 'lampiran'},
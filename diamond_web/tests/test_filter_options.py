@@ -0,0 +1,111 @@
+"""Tests for the cached laporan filter options (utils/filter_options.py)."""
+from collections import Counter
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from django.db.models.signals import post_init
+from django.urls import reverse
+
+from diamond_web.models import ILAP, JenisDataILAP, Tiket
+from diamond_web.tests.conftest import TiketFactory
+from diamond_web.utils import filter_options
+from diamond_web.views.sync_tiket import _sync_tiket_data
+
+LAPORAN_INDEX_PAGES = (
+    'laporan_kelengkapan_data',
+    'laporan_pengendalian_mutu',
+    'laporan_hasil_pengolahan_data_prioritas',
+)
+
+
+@pytest.fixture
+def loaded_instances():
+    """Counter of model instances created (post_init) per model while the test runs."""
+    counts = Counter()
+
+    def count(sender, **kwargs):
+        counts[sender] += 1
+
+    post_init.connect(count, weak=False, dispatch_uid='test_filter_options_count')
+    yield counts
+    post_init.disconnect(dispatch_uid='test_filter_options_count')
+
+
+@pytest.mark.django_db
+class TestTiketYears:
+    """Distinct tiket years, read once and cached."""
+
+    def test_distinct_years_newest_first_with_one_query(self, django_assert_num_queries):
+        first = TiketFactory(tahun=2023)
+        for tahun in (2025, 2023, 2024):
+            TiketFactory(tahun=tahun, id_periode_data=first.id_periode_data)
+
+        with django_assert_num_queries(1):
+            assert filter_options.tiket_years() == [2025, 2024, 2023]
+        with django_assert_num_queries(0):
+            assert filter_options.tiket_years() == [2025, 2024, 2023]
+
+    def test_year_options_include_the_current_year(self):
+        TiketFactory(tahun=2020)
+
+        assert filter_options.year_options() == [datetime.now().year, 2020]
+
+    def test_saving_a_tiket_of_a_new_year_invalidates(self, django_assert_num_queries):
+        tiket = TiketFactory(tahun=2024)
+        filter_options.tiket_years()
+
+        tiket.save()
+        with django_assert_num_queries(0):
+            assert filter_options.tiket_years() == [2024]
+
+        TiketFactory(tahun=2019, id_periode_data=tiket.id_periode_data)
+        assert filter_options.tiket_years() == [2024, 2019]
+
+    def test_deleting_a_tiket_invalidates(self):
+        keep = TiketFactory(tahun=2024)
+        gone = TiketFactory(tahun=2018, id_periode_data=keep.id_periode_data)
+        assert filter_options.tiket_years() == [2024, 2018]
+
+        gone.delete()
+
+        assert filter_options.tiket_years() == [2024]
+
+    def test_tiket_sync_invalidates_even_when_it_fails(self):
+        TiketFactory(tahun=2024)
+        filter_options.tiket_years()
+        Tiket.objects.update(tahun=2017)  # bulk write, like the sync
+        service = mock.Mock(**{'_connect_oracle.side_effect': RuntimeError('Oracle tidak tersedia')})
+
+        assert _sync_tiket_data(service)['errors']
+
+        assert filter_options.tiket_years() == [2017]
+
+
+@pytest.mark.django_db
+class TestNoModelInstancesForOptions:
+    """Laporan pages build their options from values, never from model instances."""
+
+    @pytest.mark.parametrize('url_name', LAPORAN_INDEX_PAGES)
+    def test_index_page_years(self, client, admin_user, loaded_instances, url_name):
+        first = TiketFactory(tahun=2023)
+        TiketFactory(tahun=2024, id_periode_data=first.id_periode_data)
+        client.force_login(admin_user)
+        loaded_instances.clear()
+
+        response = client.get(reverse(url_name))
+
+        assert response.status_code == 200
+        assert {2023, 2024} <= set(response.context['years'])
+        assert loaded_instances[Tiket] == 0
+
+    def test_pide_filter_options(self, client, admin_user, loaded_instances):
+        tiket = TiketFactory()
+        jenis_data = tiket.id_periode_data.id_sub_jenis_data_ilap
+        client.force_login(admin_user)
+        loaded_instances.clear()
+
+        response = client.get(reverse('laporan_pide_filter_options'), {'id_ilap': str(jenis_data.id_ilap_id)})
+
+        assert [r['id'] for r in response.json()['jenis_data']] == [jenis_data.pk]
+        assert loaded_instances[Tiket] == loaded_instances[ILAP] == loaded_instances[JenisDataILAP] == 0
@@ -0,0 +1,175 @@
+"""Tests for consolidated sync/check job state and its progress endpoints."""
+import json
+import uuid
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from diamond_web.utils.job_state import (
+    JobState, ThrottledStopChecker, SYNC_TIKET, CHECK_TIKET, SYNC_REFERENSI,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestJobState:
+    """Tests for the JobState store."""
+
+    def test_read_missing_returns_none(self):
+        assert JobState(SYNC_TIKET, str(uuid.uuid4())).read() is None
+
+    def test_lifecycle_kept_in_one_key(self):
+        job = JobState(SYNC_TIKET, 'abc')
+        job.start()
+        job.update(celery_task_id='task-1')
+        job.set_progress(current=5, total=10)
+        job.finish(result={'inserts': 3})
+
+        state = job.read()
+        assert state == {
+            'in_progress': False, 'done': True, 'celery_task_id': 'task-1',
+            'progress': {'current': 5, 'total': 10}, 'result': {'inserts': 3},
+        }
+        assert cache.get('sync_tiket_state_abc') == state
+
+    def test_request_stop_marks_done_with_error(self):
+        job = JobState(CHECK_TIKET, 'abc')
+        job.start()
+        assert job.stop_requested() is False
+
+        job.request_stop('dihentikan')
+
+        state = job.read()
+        assert job.stop_requested() is True
+        assert state['done'] is True
+        assert state['error'] == 'dihentikan'
+
+    def test_listen_yields_once_when_done(self):
+        job = JobState(SYNC_TIKET, 'abc')
+        job.finish(result={'inserts': 1})
+        states = list(job.listen(timeout=1, poll_interval=0))
+        assert len(states) == 1
+        assert states[0]['done'] is True
+
+    def test_listen_unknown_job_yields_none(self):
+        assert list(JobState(SYNC_TIKET, 'missing').listen(timeout=1, poll_interval=0)) == [None]
+
+
+class _CountingState:
+    def __init__(self, stop_after):
+        self.calls = 0
+        self.stop_after = stop_after
+
+    def stop_requested(self):
+        self.calls += 1
+        return self.calls >= self.stop_after
+
+
+class TestThrottledStopChecker:
+    """Tests for rate-limited stop polling."""
+
+    def test_polls_every_n_calls(self):
+        state = _CountingState(stop_after=99)
+        checker = ThrottledStopChecker(state, every=100, interval=3600)
+        for _ in range(1000):
+            checker()
+        assert state.calls == 10
+
+    def test_latches_after_stop(self):
+        state = _CountingState(stop_after=1)
+        checker = ThrottledStopChecker(state, every=2, interval=3600)
+        assert checker() is False
+        assert checker() is True
+        assert checker() is True
+        assert state.calls == 1
+
+
+@pytest.mark.django_db
+class TestSyncTiketProgressEndpoints:
+    """Tests for the tiket progress (poll) and events (push) endpoints."""
+
+    def test_progress_reports_running_state(self, client):
+        sync_id = str(uuid.uuid4())
+        job = JobState(SYNC_TIKET, sync_id)
+        job.start()
+        job.set_progress(current=50, total=100, percentage=50, inserts=1, updates=2, errors=0)
+
+        response = client.get(reverse('sync_tiket_progress'), {'sync_id': sync_id})
+
+        data = response.json()
+        assert data['success'] is True
+        assert data['done'] is False
+        assert data['progress']['current'] == 50
+
+    def test_progress_reports_stop_as_error(self, client):
+        sync_id = str(uuid.uuid4())
+        JobState(SYNC_TIKET, sync_id).start()
+
+        client.post(reverse('sync_tiket_stop'), data=json.dumps({'sync_id': sync_id}),
+                    content_type='application/json')
+        data = client.get(reverse('sync_tiket_progress'), {'sync_id': sync_id}).json()
+
+        assert data['done'] is True
+        assert data['success'] is False
+        assert data['message'] == 'Sync dihentikan oleh pengguna'
+        assert JobState(SYNC_TIKET, sync_id).stop_requested() is True
+
+    def test_progress_expired_session(self, client):
+        data = client.get(reverse('sync_tiket_progress'),
+                          {'mode': 'check', 'check_id': str(uuid.uuid4())}).json()
+        assert data['success'] is False
+        assert data['done'] is True
+
+    def test_events_stream_pushes_final_state(self, client):
+        check_id = str(uuid.uuid4())
+        JobState(CHECK_TIKET, check_id).finish(result={'inserts': 4, 'updates': 1})
+
+        response = client.get(reverse('sync_tiket_events'), {'mode': 'check', 'check_id': check_id})
+
+        assert response['Content-Type'] == 'text/event-stream'
+        body = b''.join(response.streaming_content).decode()
+        events = [json.loads(line[len('data: '):]) for line in body.splitlines() if line.startswith('data: ')]
+        assert len(events) == 1
+        assert events[0]['done'] is True
+        assert events[0]['summary']['inserts'] == 4
+
+    def test_events_rejects_invalid_id(self, client):
+        response = client.get(reverse('sync_tiket_events'), {'sync_id': 'not-a-uuid'})
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestOracleSyncProgressEndpoints:
+    """Tests for the referensi progress and events endpoints."""
+
+    def test_active_probe_ignores_finished_sync(self, client):
+        sync_id = str(uuid.uuid4())
+        cache.set('sync_referensi_active_sync_id', sync_id)
+        job = JobState(SYNC_REFERENSI, sync_id)
+        job.start()
+        assert client.get(reverse('oracle_sync_progress'), {'mode': 'active'}).json()['active'] is True
+
+        job.finish(result={})
+        assert client.get(reverse('oracle_sync_progress'), {'mode': 'active'}).json()['active'] is False
+
+    def test_events_stream_pushes_error(self, client):
+        sync_id = str(uuid.uuid4())
+        JobState(SYNC_REFERENSI, sync_id).finish(error='gagal')
+
+        response = client.get(reverse('oracle_sync_events'), {'sync_id': sync_id})
+
+        body = b''.join(response.streaming_content).decode()
+        assert 'retry: 2000' in body
+        assert '"message": "gagal"' in body
+
+    def test_clear_session_deletes_state(self, client):
+        sync_id = str(uuid.uuid4())
+        JobState(SYNC_REFERENSI, sync_id).start()
+        client.post(reverse('oracle_sync_clear_session'), {'sync_id': sync_id})
+        assert JobState(SYNC_REFERENSI, sync_id).read() is None
@@ -0,0 +1,146 @@
+"""Tests for the set-based Kirim ke PIDE dispatch (KirimKePIDEView.post)."""
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from diamond_web.constants.tiket_action_types import TiketActionType
+from diamond_web.constants.tiket_status import STATUS_DIKIRIM_KE_PIDE, STATUS_DITELITI
+from diamond_web.models import KirimPideTemp, Notification, Tiket, TiketAction, TiketPIC
+from diamond_web.tests.conftest import TiketFactory
+from diamond_web.utils import tiket_dossier
+
+PIDE_PICS_PER_TIKET = 2
+
+
+def _batch(p3de_user, size, id_temp=1):
+    """*size* Diteliti tikets of *p3de_user* in one KirimPideTemp group, each with active PIDE PICs."""
+    template = TiketFactory(status_tiket=STATUS_DITELITI, tgl_teliti=datetime(2025, 1, 1))
+    tikets = Tiket.objects.bulk_create([
+        Tiket(
+            nomor_tiket=f'KIRIM{id_temp:03d}{i:09d}',
+            status_tiket=STATUS_DITELITI,
+            id_periode_data_id=template.id_periode_data_id,
+            periode=template.periode,
+            tahun=template.tahun,
+            id_bentuk_data_id=template.id_bentuk_data_id,
+            id_cara_penyampaian_id=template.id_cara_penyampaian_id,
+            baris_diterima=1,
+            tgl_terima_dip=datetime(2024, 12, 1),
+            tgl_teliti=datetime(2025, 1, 1),
+        )
+        for i in range(size)
+    ])
+    pide_users = User.objects.bulk_create([
+        User(username=f'pide_{id_temp}_{i}') for i in range(PIDE_PICS_PER_TIKET)
+    ])
+    TiketPIC.objects.bulk_create([
+        TiketPIC(id_tiket=tiket, id_user=user, timestamp=datetime(2025, 1, 1), role=TiketPIC.Role.PIDE, active=True)
+        for tiket in tikets
+        for user in pide_users
+    ] + [
+        TiketPIC(id_tiket=tiket, id_user=pide_users[0], timestamp=datetime(2025, 1, 1), role=TiketPIC.Role.PIDE,
+                 active=False)
+        for tiket in tikets[:1]
+    ] + [
+        TiketPIC(id_tiket=tiket, id_user=p3de_user, timestamp=datetime(2025, 1, 1), role=TiketPIC.Role.P3DE,
+                 active=True)
+        for tiket in tikets
+    ])
+    KirimPideTemp.objects.bulk_create([
+        KirimPideTemp(id_temp=id_temp, id_tiket=tiket, id_user=p3de_user) for tiket in tikets
+    ])
+    return tikets
+
+
+def _post(client, id_temp=1):
+    sent = datetime.now() - timedelta(hours=1)
+    return client.post(reverse('kirim_ke_pide', kwargs={'id_temp': id_temp}), {
+        'tgl_nadine': sent.strftime('%Y-%m-%dT%H:%M'),
+        'nomor_nd_nadine': 'ND-123/PJ/2025',
+        'tgl_kirim_pide': sent.strftime('%Y-%m-%dT%H:%M'),
+    })
+
+
+@pytest.mark.django_db
+class TestKirimKePideDispatch:
+    """The whole batch is sent with a fixed number of statements."""
+
+    def test_sends_batch(self, client, authenticated_user, django_capture_on_commit_callbacks):
+        tikets = _batch(authenticated_user, 3)
+        client.force_login(authenticated_user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = _post(client)
+
+        assert response.json() == {'success': True, 'message': '3 tiket berhasil dikirim ke PIDE.'}
+        for tiket in Tiket.objects.filter(pk__in=[t.pk for t in tikets]):
+            assert tiket.status_tiket == STATUS_DIKIRIM_KE_PIDE
+            assert tiket.nomor_nd_nadine == 'ND-123/PJ/2025'
+            assert tiket.tgl_nadine and tiket.tgl_kirim_pide
+        actions = TiketAction.objects.filter(action=TiketActionType.DIKIRIM_KE_PIDE)
+        assert sorted(actions.values_list('id_tiket_id', flat=True)) == sorted(t.pk for t in tikets)
+        assert set(actions.values_list('id_user_id', flat=True)) == {authenticated_user.pk}
+        # One digest per PIDE PIC covering the whole batch
+        notifications = Notification.objects.filter(title='Tiket Dikirim ke PIDE')
+        assert notifications.count() == PIDE_PICS_PER_TIKET
+        for notification in notifications:
+            assert notification.count == 3
+            assert sorted(notification.tiket_ids) == sorted(t.pk for t in tikets)
+        assert not KirimPideTemp.objects.exists()
+
+    def test_invalidates_cached_dossiers(self, client, authenticated_user):
+        tikets = _batch(authenticated_user, 2)
+        before = tiket_dossier.get_tiket_dossier(tikets[0].pk)
+        assert before.tiket.status_tiket == STATUS_DITELITI
+        client.force_login(authenticated_user)
+
+        _post(client)
+
+        assert tiket_dossier.get_tiket_dossier(tikets[0].pk).tiket.status_tiket == STATUS_DIKIRIM_KE_PIDE
+
+    def test_query_count_does_not_grow_with_batch_size(self, client, authenticated_user):
+        client.force_login(authenticated_user)
+        counts = []
+        for id_temp, size in ((1, 5), (2, 50)):
+            _batch(authenticated_user, size, id_temp=id_temp)
+            with CaptureQueriesContext(connection) as ctx:
+                assert _post(client, id_temp).json()['success']
+            counts.append(len(ctx.captured_queries))
+
+        assert counts[0] == counts[1]
+
+    def test_other_users_batch_is_refused(self, client, authenticated_user, django_user_model):
+        _batch(authenticated_user, 2)
+        other = django_user_model.objects.create(username='p3de_lain')
+        other.groups.set(authenticated_user.groups.all())
+        client.force_login(other)
+
+        response = _post(client)
+
+        assert response.status_code == 403
+        assert not Tiket.objects.filter(status_tiket=STATUS_DIKIRIM_KE_PIDE).exists()
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='set RUN_BENCHMARKS=1 to run benchmarks')
+def test_benchmark_kirim_ke_pide_1k_tikets(client, authenticated_user, django_capture_on_commit_callbacks):
+    """Send one 1000-tiket batch (prints timing and statement count)."""
+    _batch(authenticated_user, 1000)
+    client.force_login(authenticated_user)
+
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as ctx, django_capture_on_commit_callbacks(execute=True):
+        response = _post(client)
+    seconds = time.perf_counter() - started
+
+    print(f'\nKirim ke PIDE: 1000 tiket in {seconds * 1000:.0f}ms, {len(ctx.captured_queries)} queries')
+    assert response.json()['success']
+    assert Notification.objects.count() == PIDE_PICS_PER_TIKET
+    assert sum(Notification.objects.values_list('count', flat=True)) == 1000 * PIDE_PICS_PER_TIKET
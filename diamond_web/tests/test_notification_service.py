@@ -0,0 +1,217 @@
+"""Tests for the buffered, digesting notification service (services/notifications.py)."""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from diamond_web import tasks
+from diamond_web.models import Notification
+from diamond_web.services import notifications
+from diamond_web.tests.conftest import NotificationFactory, UserFactory
+
+TITLE = 'Tiket Dikirim ke PIDE'
+
+
+def _age(notification, **delta):
+    Notification.objects.filter(pk=notification.pk).update(created_at=timezone.now() - timedelta(**delta))
+
+
+@pytest.mark.django_db
+class TestBuffering:
+    """Nothing is written before the transaction commits."""
+
+    def test_written_on_commit(self, django_capture_on_commit_callbacks):
+        user = UserFactory()
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            notifications.notify([user.pk], TITLE, 'pesan', tiket_id=1)
+            notifications.notify([user.pk], TITLE, 'pesan', tiket_id=2)
+            assert not Notification.objects.exists()
+
+        assert len(callbacks) == 1
+        assert Notification.objects.get().count == 2
+
+    def test_rolled_back_transaction_notifies_nobody(self, django_capture_on_commit_callbacks):
+        user = UserFactory()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with pytest.raises(RuntimeError), transaction.atomic():
+                notifications.notify([user.pk], TITLE, 'pesan')
+                raise RuntimeError
+
+        assert not Notification.objects.exists()
+
+    def test_next_transaction_after_a_rollback_is_written(self, django_capture_on_commit_callbacks):
+        user = UserFactory()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with pytest.raises(RuntimeError), transaction.atomic():
+                notifications.notify([user.pk], 'Batal', 'pesan')
+                raise RuntimeError
+            with transaction.atomic():
+                notifications.notify([user.pk], TITLE, 'pesan')
+
+        assert list(Notification.objects.values_list('title', flat=True)) == [TITLE]
+
+    def test_rolled_back_savepoint_keeps_the_outer_events(self, django_capture_on_commit_callbacks):
+        user = UserFactory()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                notifications.notify([user.pk], 'Luar', 'pesan')
+                with pytest.raises(RuntimeError), transaction.atomic():
+                    notifications.notify([user.pk], 'Dalam', 'pesan')
+                    notifications.notify([user.pk], 'Luar', 'pesan', tiket_id=9)
+                    raise RuntimeError
+
+        notification, = Notification.objects.all()
+        assert (notification.title, notification.count, notification.tiket_ids) == ('Luar', 1, [])
+
+    def test_flush_statements_do_not_grow_with_events(self, django_capture_on_commit_callbacks):
+        users = [UserFactory() for _ in range(3)]
+        counts = []
+        for events in (1, 20):
+            with CaptureQueriesContext(connection) as ctx, django_capture_on_commit_callbacks(execute=True):
+                for tiket_id in range(events):
+                    notifications.notify([user.pk for user in users], f'Judul {events}', 'pesan', tiket_id)
+            counts.append(len(ctx.captured_queries))
+
+        assert counts[0] == counts[1]
+        assert Notification.objects.filter(title='Judul 20', count=20).count() == 3
+
+
+@pytest.mark.django_db
+class TestDigestRules:
+    """Which events end up in the same row."""
+
+    def _notify(self, django_capture_on_commit_callbacks, recipients, title=TITLE, message='pesan', tiket_id=None):
+        with django_capture_on_commit_callbacks(execute=True):
+            notifications.notify([user.pk for user in recipients], title, message, tiket_id=tiket_id)
+
+    def test_one_row_per_recipient_and_title(self, django_capture_on_commit_callbacks):
+        budi, ani = UserFactory(), UserFactory()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            for tiket_id in (10, 11, 12):
+                notifications.notify([budi.pk, ani.pk], TITLE, f'tiket {tiket_id}', tiket_id=tiket_id)
+            notifications.notify([budi.pk], 'Tiket Dikembalikan', 'kembali', tiket_id=10)
+
+        rows = {(n.recipient_id, n.title): n for n in Notification.objects.all()}
+        assert len(rows) == 3
+        assert rows[(budi.pk, TITLE)].count == 3
+        assert rows[(budi.pk, TITLE)].tiket_ids == [10, 11, 12]
+        assert rows[(budi.pk, TITLE)].message == 'tiket 12'
+        assert rows[(ani.pk, TITLE)].tiket_ids == [10, 11, 12]
+        assert rows[(budi.pk, 'Tiket Dikembalikan')].count == 1
+
+    def test_later_events_extend_an_open_digest(self, django_capture_on_commit_callbacks, settings):
+        settings.NOTIFICATION_DIGEST_WINDOW_MINUTES = 30
+        user = UserFactory()
+        self._notify(django_capture_on_commit_callbacks, [user], tiket_id=1)
+        first = Notification.objects.get()
+        _age(first, minutes=29)
+
+        self._notify(django_capture_on_commit_callbacks, [user], message='terbaru', tiket_id=2)
+
+        notification = Notification.objects.get()
+        assert notification.pk == first.pk
+        assert (notification.count, notification.tiket_ids, notification.message) == (2, [1, 2], 'terbaru')
+
+    def test_same_tiket_counts_twice_but_is_listed_once(self, django_capture_on_commit_callbacks):
+        user = UserFactory()
+        self._notify(django_capture_on_commit_callbacks, [user], tiket_id=5)
+        self._notify(django_capture_on_commit_callbacks, [user], tiket_id=5)
+
+        notification = Notification.objects.get()
+        assert (notification.count, notification.tiket_ids) == (2, [5])
+
+    def test_read_notification_is_not_extended(self, django_capture_on_commit_callbacks):
+        user = UserFactory()
+        self._notify(django_capture_on_commit_callbacks, [user], tiket_id=1)
+        Notification.objects.update(is_read=True)
+
+        self._notify(django_capture_on_commit_callbacks, [user], tiket_id=2)
+
+        assert sorted(Notification.objects.values_list('is_read', 'tiket_ids')) == [(False, [2]), (True, [1])]
+
+    def test_digest_older_than_the_window_is_not_extended(self, django_capture_on_commit_callbacks, settings):
+        settings.NOTIFICATION_DIGEST_WINDOW_MINUTES = 30
+        user = UserFactory()
+        self._notify(django_capture_on_commit_callbacks, [user], tiket_id=1)
+        _age(Notification.objects.get(), minutes=31)
+
+        self._notify(django_capture_on_commit_callbacks, [user], tiket_id=2)
+
+        assert Notification.objects.count() == 2
+        assert Notification.objects.latest('created_at').tiket_ids == [2]
+
+    def test_other_titles_and_recipients_are_not_extended(self, django_capture_on_commit_callbacks):
+        budi, ani = UserFactory(), UserFactory()
+        self._notify(django_capture_on_commit_callbacks, [budi], tiket_id=1)
+
+        self._notify(django_capture_on_commit_callbacks, [ani], tiket_id=2)
+        self._notify(django_capture_on_commit_callbacks, [budi], title='Tiket Dikembalikan', tiket_id=3)
+
+        assert Notification.objects.filter(count=1).count() == 3
+
+
+@pytest.mark.django_db
+class TestArchive:
+    def test_deletes_old_read_notifications_in_chunks(self):
+        user = UserFactory()
+        old_read = [NotificationFactory(recipient=user, is_read=True) for _ in range(5)]
+        old_unread = NotificationFactory(recipient=user, is_read=False)
+        recent_read = NotificationFactory(recipient=user, is_read=True)
+        for notification in old_read + [old_unread]:
+            _age(notification, days=31)
+
+        with CaptureQueriesContext(connection) as ctx:
+            deleted = notifications.archive_read_notifications(retention_days=30, chunk_size=2)
+
+        assert deleted == 5
+        assert set(Notification.objects.values_list('pk', flat=True)) == {old_unread.pk, recent_read.pk}
+        chunk_deletes = [q for q in ctx.captured_queries if q['sql'].startswith('DELETE FROM "diamond_web_notification"')]
+        assert len(chunk_deletes) == 3
+
+    def test_task(self, settings):
+        settings.NOTIFICATION_RETENTION_DAYS = 10
+        notification = NotificationFactory(is_read=True)
+        _age(notification, days=11)
+
+        assert tasks.cleanup_read_notifications_task.run() == 1
+        assert not Notification.objects.exists()
+
+    def test_command(self, settings):
+        settings.NOTIFICATION_RETENTION_DAYS = 10
+        old, recent = NotificationFactory(is_read=True), NotificationFactory(is_read=True)
+        _age(old, days=6)
+        out = StringIO()
+
+        call_command('cleanup_read_notifications', stdout=out)
+        assert 'Notifikasi dihapus : 0' in out.getvalue()
+
+        call_command('cleanup_read_notifications', '--retention-days=5', '--batch-size=1', stdout=out)
+        assert 'Notifikasi dihapus : 1' in out.getvalue()
+        assert list(Notification.objects.values_list('pk', flat=True)) == [recent.pk]
+
+
+@pytest.mark.django_db
+class TestDigestViews:
+    """The unread counter and the list show a digest as one notification."""
+
+    def test_unread_count_and_list(self, client, authenticated_user, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            for tiket_id in range(4):
+                notifications.notify([authenticated_user.pk], TITLE, f'tiket {tiket_id}', tiket_id=tiket_id)
+        client.force_login(authenticated_user)
+
+        response = client.get(reverse('notification_list'))
+
+        assert response.context['unread_count'] == 1
+        assert response.context['page_obj'].paginator.count == 1
+        assert 'title="4 notifikasi digabung"' in response.content.decode()
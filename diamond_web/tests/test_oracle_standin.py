@@ -0,0 +1,213 @@
+"""End-to-end reference and tiket sync against the SQLite Oracle stand-in."""
+from datetime import datetime
+
+import pytest
+from django.contrib.auth.models import Group, User
+
+from diamond_web.models import (
+    ILAP,
+    PIC,
+    BentukData,
+    CaraPenyampaian,
+    DurasiJatuhTempo,
+    JenisDataILAP,
+    JenisPrioritasData,
+    JenisTabel,
+    KategoriWilayah,
+    KlasifikasiJenisData,
+    PeriodeJenisData,
+    PeriodePengiriman,
+    StatusData,
+    StatusPenelitian,
+    Tiket,
+)
+from diamond_web.utils.oracle_standin import SourceScenario, SqliteStandInAdapter, translate_sql
+from diamond_web.utils.oracle_sync import (
+    DEFAULT_ILAP_CODES,
+    OracleDataSyncService,
+    OracleSourceAdapter,
+    OracleSyncConfigError,
+    get_source_adapter,
+)
+from diamond_web.views.sync_tiket import _check_tiket_data, _sync_tiket_data
+
+MASTERS = {
+    KategoriWilayah: [{'deskripsi': name} for name in ('Nasional', 'Regional', 'Internasional')],
+    JenisTabel: [{'deskripsi': name} for name in ('Diidentifikasi', 'Tidak Diidentifikasi', 'Tidak Terstruktur')],
+    StatusData: [{'deskripsi': 'Data Utama'}],
+    PeriodePengiriman: [
+        {'periode_penyampaian': name, 'periode_penerimaan': name} for name in ('Bulanan', 'Triwulanan', 'Tahunan')
+    ],
+    BentukData: [{'deskripsi': name} for name in ('Softcopy', 'Hardcopy')],
+    CaraPenyampaian: [{'deskripsi': name} for name in ('Online', 'Langsung')],
+    StatusPenelitian: [{'deskripsi': name} for name in ('Lengkap', 'Lengkap Sebagian', 'Tidak Lengkap')],
+}
+
+
+@pytest.fixture
+def masters(db):
+    for model, rows in MASTERS.items():
+        for row in rows:
+            model.objects.get_or_create(**row)
+    for role in ('p3de', 'pide', 'pmde'):
+        Group.objects.get_or_create(name=f'user_{role}')
+
+
+@pytest.fixture
+def standin(tmp_path, masters):
+    """A small scenario written to a stand-in directory, with its PIC users."""
+    scenario = SourceScenario(ilap=6, jenis_data_per_ilap=2, tiket_per_jenis_data=2, seed=3)
+    for role, nips in scenario.nips.items():
+        group = Group.objects.get(name=f'user_{role}')
+        group.user_set.add(*User.objects.bulk_create([User(username=nip) for nip in nips]))
+
+    def service():
+        scenario.write(tmp_path)
+        return OracleDataSyncService(source_adapter=SqliteStandInAdapter(tmp_path))
+
+    return scenario, service
+
+
+def _table(summary, name):
+    return next(table for table in summary.table_summaries if table.table_name == name)
+
+
+class TestStandInAdapter:
+    """The stand-in translates the Oracle syntax the sync queries use."""
+
+    def test_translate_date_literals(self):
+        sql = "SELECT DATE '2015-01-01' AS start_date, END_DATE FROM t"
+        assert translate_sql(sql) == "SELECT '2015-01-01' AS start_date, END_DATE FROM t"
+
+    def test_oracle_functions_and_dates(self, tmp_path):
+        SourceScenario(ilap=0).write(tmp_path)
+        service = OracleDataSyncService(connection_only=True, source_adapter=SqliteStandInAdapter(tmp_path))
+
+        with service._connect_oracle('primary') as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1, NVL(NULL, 'x'), TO_DATE('250131', 'YYMMDD'), DATE '2015-01-01' FROM DUAL")
+                assert cursor.fetchall() == [(1, 'x', datetime(2025, 1, 31), datetime(2015, 1, 1))]
+
+    def test_discovers_prioritas_years(self, tmp_path, masters):
+        SourceScenario(ilap=1, years=(2023, 2024, 2025)).write(tmp_path)
+        service = OracleDataSyncService(source_adapter=SqliteStandInAdapter(tmp_path))
+        assert service._pmde_discovered_years == [2023, 2024, 2025]
+
+    def test_adapter_selection(self, monkeypatch, tmp_path):
+        monkeypatch.delenv('ORACLE_SOURCE_ADAPTER', raising=False)
+        assert isinstance(get_source_adapter(), OracleSourceAdapter)
+
+        monkeypatch.setenv('ORACLE_SOURCE_ADAPTER', 'sqlite')
+        monkeypatch.setenv('ORACLE_STANDIN_PATH', str(tmp_path))
+        assert get_source_adapter().path == tmp_path
+
+        with pytest.raises(OracleSyncConfigError):
+            get_source_adapter('mysql')
+
+
+@pytest.mark.django_db
+class TestReferenceSyncEndToEnd:
+    """check()/sync() over every HARD_CODED_SYNC_TABLES config and post-process."""
+
+    def test_check_reports_inserts_and_rolls_back(self, standin):
+        scenario, service = standin
+
+        summary = service().check()
+
+        assert summary.errors == []
+        assert _table(summary, 'ilap').inserts == len(scenario.tables['PROD.APP_ILAP']) + len(
+            {row['ID_ILAP'] for row in scenario.tables['PROD.REF_ILAP']} - set(scenario.ilaps)
+        )
+        assert ILAP.objects.count() == 0
+
+    def test_sync_loads_everything_and_resync_is_unchanged(self, standin):
+        scenario, service = standin
+
+        sync_service = service()
+        summary = sync_service.sync()
+
+        assert summary.errors == []
+        assert ILAP.objects.filter(id_ilap__in=scenario.ilaps).count() == len(scenario.ilaps)
+        assert set(DEFAULT_ILAP_CODES) <= set(ILAP.objects.values_list('id_ilap', flat=True))
+        assert JenisDataILAP.objects.filter(id_sub_jenis_data='EI9500102').exists()
+        generated = JenisDataILAP.objects.filter(id_ilap__id_ilap__in=scenario.ilaps)
+        assert generated.count() == 12
+        assert KlasifikasiJenisData.objects.filter(id_sub_jenis_data__in=generated).count() == 12
+        assert PeriodeJenisData.objects.filter(id_sub_jenis_data_ilap__in=generated).count() == 12
+        assert set(PIC.objects.values_list('tipe', flat=True)) == {'P3DE', 'PIDE', 'PMDE'}
+        assert JenisPrioritasData.objects.exists()
+        assert DurasiJatuhTempo.objects.filter(id_sub_jenis_data__in=generated).count() == 12 * len(scenario.years)
+
+        again = sync_service.sync()
+
+        assert again.errors == []
+        assert again.inserts == 0
+        assert again.updates == 0
+
+    def test_updates_inserts_and_deletes(self, standin):
+        scenario, service = standin
+        service().sync()
+        updated = scenario.update(2)
+        deleted = scenario.delete(1)
+        inserted = scenario.insert(1)
+
+        summary = service().sync()
+
+        assert summary.errors == []
+        assert sorted(_table(summary, 'ilap').updated_keys) == sorted(updated)
+        assert ILAP.objects.get(id_ilap=updated[0]).alamat_ilap.endswith('(pindah)')
+        assert _table(summary, 'periode_jenis_data').updates == 4
+        assert ILAP.objects.filter(id_ilap__in=inserted).count() == 1
+        # The sync never deletes: rows gone from the source stay in the target
+        assert ILAP.objects.filter(id_ilap__in=deleted).count() == 1
+
+    def test_jenis_data_orphans_fail_the_sync(self, standin):
+        scenario, service = standin
+        orphans = scenario.orphan(2, kind='jenis_data')
+
+        summary = service().sync()
+
+        errors = _table(summary, 'jenis_data_ilap').errors
+        assert len(errors) == 2
+        assert all('referensi' in error for error in errors)
+        # Any error rolls the whole sync back
+        assert not ILAP.objects.exists()
+        assert not JenisDataILAP.objects.filter(id_sub_jenis_data__in=orphans).exists()
+
+    def test_pic_orphans_are_skipped(self, standin):
+        scenario, service = standin
+        orphans = scenario.orphan(3, kind='pic')
+
+        summary = service().sync()
+
+        assert summary.errors == []
+        skipped = _table(summary, 'pic_pmde_ref').skipped_rows_detail
+        assert {row['key'] for row in skipped} >= set(orphans)
+
+
+@pytest.mark.django_db
+class TestTiketSyncEndToEnd:
+    """_check_tiket_data/_sync_tiket_data read _TIKET_ORACLE_SQL from the stand-in."""
+
+    def test_check_and_sync_tikets(self, standin):
+        scenario, service = standin
+        reference = service()
+        assert reference.sync().errors == []
+        orphans = scenario.orphan(2, kind='tiket')
+        reference = service()
+
+        check = _check_tiket_data(reference)
+        assert check['source_rows'] == len(scenario.tiket_numbers)
+        assert check['inserts'] == len(scenario.tiket_numbers) - 2
+        assert len(check['errors']) == 2
+
+        result = _sync_tiket_data(reference)
+
+        assert len(result['errors']) == 2
+        assert all(orphan in ' '.join(result['errors']) for orphan in orphans)
+        assert Tiket.objects.count() == len(scenario.tiket_numbers) - 2
+        selesai = Tiket.objects.filter(status_tiket=8)
+        assert selesai.exists()
+        assert not Tiket.objects.filter(tgl_terima_dip__isnull=True).exists()
+
+        assert _check_tiket_data(service())['updates'] == len(scenario.tiket_numbers) - 2
@@ -0,0 +1,246 @@
+"""Tests for the streaming PDF table writer (utils/pdf_table.py).
+
+The documents are checked with ``read_pdf``, a minimal reader that walks
+them the way a viewer does: trailer, cross-reference table, catalog, page
+tree, content streams.
+"""
+import os
+import re
+import time
+import tracemalloc
+import zlib
+from collections import namedtuple
+
+import pytest
+from django.urls import reverse
+
+from diamond_web.models import BackupData, TiketPIC
+from diamond_web.tests.conftest import MediaBackupFactory, TiketFactory, TiketPICFactory
+from diamond_web.utils.pdf_table import (
+    PAGE_A4,
+    PAGE_A4_LANDSCAPE,
+    build_pdf_table,
+    fit_column_widths,
+    stream_pdf_table,
+    text_width,
+    wrap_text,
+)
+
+Text = namedtuple('Text', 'font size x y text')
+
+_OBJ_RE = re.compile(rb'(\d+) 0 obj\n')
+_TEXT_RE = re.compile(rb'BT (/F\d) ([\d.]+) Tf ([\d.]+) ([\d.]+) Td \(((?:\\.|[^\\)])*)\) Tj ET')
+
+
+def _ref(dictionary, key):
+    return int(re.search(rb'/' + key + rb' (\d+) 0 R', dictionary).group(1))
+
+
+def _read_object(data, number, offset):
+    match = _OBJ_RE.match(data, offset)
+    assert match and int(match.group(1)) == number, f'xref offset of object {number} is wrong'
+    start = match.end()
+    stream_at = data.find(b'\nstream\n', start)
+    end = data.find(b'\nendobj\n', start)
+    if stream_at == -1 or stream_at > end:
+        return data[start:end], None
+    dictionary = data[start:stream_at]
+    length = int(re.search(rb'/Length (\d+)', dictionary).group(1))
+    content = data[stream_at + 8:stream_at + 8 + length]
+    assert data[stream_at + 8 + length:].startswith(b'\nendstream\nendobj\n'), 'wrong /Length'
+    if b'/FlateDecode' in dictionary:
+        content = zlib.decompress(content)
+    return dictionary, content
+
+
+def read_pdf(data):
+    """Pages of the PDF *data*, each a list of the ``Text`` it shows.
+
+    Fails on a malformed header or trailer, a cross-reference entry not
+    pointing at its object, a wrong stream length or a broken page tree.
+    """
+    assert data.startswith(b'%PDF-1.')
+    startxref = int(re.search(rb'startxref\n(\d+)\n%%EOF\n$', data).group(1))
+    header = re.compile(rb'xref\n0 (\d+)\n').match(data, startxref)
+    assert header, 'startxref does not point at the xref table'
+    size = int(header.group(1))
+    entries = [data[header.end() + 20 * i:header.end() + 20 * (i + 1)] for i in range(size)]
+    assert entries[0] == b'0000000000 65535 f \n'
+    assert all(re.fullmatch(rb'\d{10} 00000 n \n', entry) for entry in entries[1:])
+    objects = {number: _read_object(data, number, int(entries[number][:10])) for number in range(1, size)}
+
+    trailer = data[header.end() + 20 * size:]
+    assert re.match(rb'trailer\n<< /Size %d /Root \d+ 0 R >>' % size, trailer)
+    catalog, _ = objects[_ref(trailer, b'Root')]
+    assert b'/Type /Catalog' in catalog
+    pages_id = _ref(catalog, b'Pages')
+    pages, _ = objects[pages_id]
+    kids = [int(kid) for kid in re.findall(rb'(\d+) 0 R', re.search(rb'/Kids \[(.*?)\]', pages).group(1))]
+    assert int(re.search(rb'/Count (\d+)', pages).group(1)) == len(kids)
+
+    result = []
+    for kid in kids:
+        page, _ = objects[kid]
+        assert b'/Type /Page ' in page and _ref(page, b'Parent') == pages_id
+        _, content = objects[_ref(page, b'Contents')]
+        result.append([
+            Text(font.decode(), float(size), float(x), float(y),
+                 re.sub(rb'\\(.)', rb'\1', text).decode('cp1252'))
+            for font, size, x, y, text in _TEXT_RE.findall(content)
+        ])
+    return result
+
+
+def _cells(page):
+    """Body (regular font) texts of *page* in reading order."""
+    return [text for text in sorted(page, key=lambda t: (-t.y, t.x)) if text.font == '/F1']
+
+
+def _column(page, x):
+    return [text.text for text in _cells(page) if text.x == x]
+
+
+class TestPdfTable:
+    """Structure and layout of the written documents."""
+
+    def test_round_trip(self):
+        pages = read_pdf(build_pdf_table('Laporan (Uji)', ['No', 'Nama'], [[1, 'Budi \\ Ani'], [2, None]]))
+
+        assert len(pages) == 1
+        texts = [text.text for text in pages[0]]
+        assert texts[0] == 'Laporan (Uji) - Halaman 1'
+        assert texts[1:] == ['No', 'Nama', '1', 'Budi \\ Ani', '2']
+
+    def test_header_repeats_and_rows_continue_across_pages(self):
+        rows = [[number, f'Baris {number}'] for number in range(1, 301)]
+
+        pages = read_pdf(build_pdf_table('Laporan', ['No', 'Keterangan'], rows, page_size=PAGE_A4))
+
+        assert len(pages) > 1
+        first_x = min(text.x for text in _cells(pages[0]))
+        numbers = []
+        for page in pages:
+            assert [t.text for t in page if t.font == '/F2'][1:] == ['No', 'Keterangan']
+            numbers.extend(int(text) for text in _column(page, first_x))
+        assert numbers == list(range(1, 301))
+
+    def test_compressed_streams_show_the_same_text(self):
+        rows = [[number, 'Data ILAP ' * 3] for number in range(200)]
+
+        plain = build_pdf_table('Laporan', ['No', 'Isi'], rows)
+        compressed = build_pdf_table('Laporan', ['No', 'Isi'], rows, compress=True)
+
+        assert b'/FlateDecode' in compressed
+        assert len(compressed) < len(plain) / 3
+        assert read_pdf(compressed) == read_pdf(plain)
+
+    def test_long_text_wraps_inside_its_column(self):
+        long_text = ' '.join(f'lokasi{number}' for number in range(60))
+        rows = [['A', long_text, 'B']]
+
+        page, = read_pdf(build_pdf_table('Laporan', ['Kode', 'Lokasi', 'Akhir'], rows, sample_rows=1))
+
+        body = _cells(page)
+        lefts = sorted({text.x for text in body})
+        wrapped = [text for text in body if text.x == lefts[1]]
+        assert len(wrapped) > 1
+        assert ' '.join(text.text for text in wrapped) == long_text
+        assert all(text.x + text_width(text.text, text.size) <= lefts[2] for text in wrapped)
+        assert max(text.x + text_width(text.text, text.size) for text in body) <= PAGE_A4_LANDSCAPE[0] - 36
+
+    def test_row_taller_than_a_page_is_clipped(self):
+        rows = [['x ' * 20000], ['berikutnya']]
+
+        pages = read_pdf(build_pdf_table('Laporan', ['Isi'], rows, page_size=PAGE_A4))
+
+        assert len(pages) == 2
+        assert _cells(pages[0])[-1].text.endswith(' ...')
+        assert [text.text for text in _cells(pages[1])] == ['berikutnya']
+
+    def test_text_outside_cp1252_prints_as_question_mark(self):
+        page, = read_pdf(build_pdf_table('Laporan', ['Nama'], [['Čolić € 5']]))
+
+        assert [text.text for text in _cells(page)] == ['?oli? € 5']
+
+    def test_rows_are_read_lazily(self):
+        consumed = []
+
+        def rows():
+            for number in range(10000):
+                consumed.append(number)
+                yield [number]
+
+        chunks = stream_pdf_table('Laporan', ['No'], rows(), sample_rows=10)
+        for _ in range(4):  # file header, two fonts, first page
+            next(chunks)
+
+        assert 10 < len(consumed) < 100
+
+
+class TestLayoutHelpers:
+    def test_wrap_text_cuts_words_longer_than_a_line(self):
+        lines = wrap_text('a ' + 'W' * 40 + ' b', 60, 8)
+
+        assert lines[0] == 'a'
+        assert ''.join(lines[1:-1]) + lines[-1].removesuffix(' b') == 'W' * 40
+        assert all(text_width(line, 8) <= 60 for line in lines)
+
+    def test_column_widths_fill_the_page(self):
+        headers = ['No', 'Keterangan']
+        sample = [['1', 'teks yang panjang sekali ' * 10]]
+
+        widths = fit_column_widths(headers, sample, 500, 8, 2)
+
+        assert sum(widths) == pytest.approx(500)
+        assert widths[0] < 40 < widths[1]
+
+    def test_narrow_content_is_stretched(self):
+        widths = fit_column_widths(['A', 'BB'], [['1', '22']], 300, 8, 2)
+
+        assert sum(widths) == pytest.approx(300)
+        assert widths[0] < widths[1]
+
+
+@pytest.mark.django_db
+def test_backup_data_export_pdf_streams_every_backup(client, authenticated_user):
+    media = MediaBackupFactory()
+    first = TiketFactory()
+    tikets = [first] + [TiketFactory(id_periode_data=first.id_periode_data) for _ in range(2)]
+    for tiket in tikets:
+        TiketPICFactory(id_tiket=tiket, id_user=authenticated_user, role=TiketPIC.Role.P3DE, active=True)
+        BackupData.objects.create(id_tiket=tiket, id_user=authenticated_user, id_media_backup=media,
+                                  lokasi_backup='/mnt/backup')
+    client.force_login(authenticated_user)
+
+    response = client.get(reverse('backup_data_export_pdf'))
+
+    assert response.streaming
+    assert response['Content-Type'] == 'application/pdf'
+    page, = read_pdf(b''.join(response.streaming_content))
+    texts = [text.text for text in page]
+    assert all(tiket.nomor_tiket in texts for tiket in tikets)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='set RUN_BENCHMARKS=1 to run benchmarks')
+@pytest.mark.parametrize('compress', [False, True])
+def test_benchmark_pdf_table_100k_rows(compress):
+    """Stream 100k backup-like rows (prints time, size and peak memory)."""
+    headers = ['No', 'Kategori ILAP', 'Nama ILAP', 'Jenis Data', 'Subjenis Data', 'Periode Data',
+               'Nomor Tiket', 'Media Backup', 'Lokasi', 'PIC P3DE', 'Jumlah Data']
+    rows = (
+        [number, 'Kementerian', f'ILAP {number % 500}', 'Data Transaksi', f'Sub Jenis {number % 37}',
+         'Januari 2025', f'T{number:016d}', 'Hard Disk', f'/mnt/backup/rak-{number % 90}', 'Budi Santoso', number * 3]
+        for number in range(100_000)
+    )
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = sum(len(chunk) for chunk in stream_pdf_table('Laporan Backup Data', headers, rows, compress=compress))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'\nPDF table 100k rows (compress={compress}): {elapsed:.1f}s, '
+          f'{size / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB')
+    assert peak < 20e6
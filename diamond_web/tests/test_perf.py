@@ -0,0 +1,149 @@
+"""Synthetic data generator and performance regression tests of the hot endpoints.
+
+The endpoint timings run only with ``RUN_PERF=1`` (``pytest -m perf``).  Each
+endpoint is requested once to warm up, then ``PERF_REPEAT`` times; the median
+wall time and the query count are compared with ``perf_baselines.json``.  A
+test fails when the median exceeds ``baseline * PERF_TOLERANCE + PERF_SLACK_MS``
+or when the endpoint runs more queries than recorded.
+
+Baselines depend on the machine and on ``PERF_SCALE``; regenerate them on the
+reference machine with ``RUN_PERF=1 PERF_UPDATE_BASELINES=1 pytest -m perf``.
+"""
+import io
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from diamond_web.models import ILAP, PIC, Tiket, TiketAction, TiketPIC
+from diamond_web.utils import sla
+from diamond_web.utils.synthetic_data import scaled_counts, seed_synthetic
+
+BASELINE_PATH = Path(__file__).with_name('perf_baselines.json')
+TOLERANCE = float(os.environ.get('PERF_TOLERANCE', '1.5'))
+SLACK_MS = float(os.environ.get('PERF_SLACK_MS', '25'))
+REPEAT = int(os.environ.get('PERF_REPEAT', '5'))
+UPDATE_BASELINES = bool(os.environ.get('PERF_UPDATE_BASELINES'))
+
+DATATABLES = {'draw': '1', 'start': '0', 'length': '25'}
+
+# name -> (url name, user kind, GET parameters)
+ENDPOINTS = {
+    'tiket_data': ('tiket_data', 'p3de', DATATABLES),
+    'tiket_data_admin': ('tiket_data', 'admin', DATATABLES),
+    'quality_control_data': ('quality_control_data', 'pmde', DATATABLES),
+    'monitoring_penyampaian_data_data': ('monitoring_penyampaian_data_data', 'admin', DATATABLES),
+    'laporan_rekap_himpun_olah_data_data': ('laporan_rekap_himpun_olah_data_data', 'admin', DATATABLES),
+    'home_p3de': ('home', 'p3de', {}),
+    'home_pmde': ('home', 'pmde', {}),
+}
+
+_measured = {}
+
+
+@pytest.mark.django_db
+class TestSeedSynthetic:
+    """seed_synthetic builds a consistent data set with bulk inserts."""
+
+    def test_counts_and_relations(self):
+        counts = scaled_counts(0.001, tiket_action=1000)
+
+        created = seed_synthetic(counts, seed=1)
+
+        assert created['ilap'] == counts['ilap'] == ILAP.objects.count()
+        assert created['tiket'] == 200 == Tiket.objects.count()
+        assert created['tiket_action'] == 1000 == TiketAction.objects.count()
+        assert created['tiket_pic'] == counts['tiket_pic'] == TiketPIC.objects.count()
+        assert PIC.objects.count() == counts['jenis_data'] * 3
+        assert not any(drift for drift in sla.iter_sla_diffs())
+        assert Tiket.objects.filter(deadline_pengendalian__isnull=False).exists()
+
+    def test_seed_is_reproducible(self):
+        runs = []
+        for _ in range(2):
+            with transaction.atomic():
+                seed_synthetic(scaled_counts(0.0005), seed=7)
+                runs.append(list(Tiket.objects.order_by('nomor_tiket').values_list(
+                    'status_tiket', 'tahun', 'periode', 'tgl_terima_dip',
+                )))
+                transaction.set_rollback(True)
+
+        assert len(runs[0]) == 100
+        assert runs[0] == runs[1]
+
+    def test_command_refuses_to_seed_twice(self):
+        call_command('seed_synthetic', '--scale', '0.0005', stdout=io.StringIO())
+        with pytest.raises(CommandError, match='sudah ada'):
+            call_command('seed_synthetic', '--scale', '0.0005')
+
+
+def _load_baselines():
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+@pytest.fixture(scope='module')
+def baselines():
+    data = _load_baselines()
+    yield data
+    if UPDATE_BASELINES and _measured:
+        data = {'scale': float(os.environ.get('PERF_SCALE', '0.01')), 'endpoints': {
+            **data.get('endpoints', {}), **_measured,
+        }}
+        BASELINE_PATH.write_text(json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+
+def _perf_user(kind):
+    if kind == 'admin':
+        user = User.objects.create_user('perf_admin', password='x', is_superuser=True, is_staff=True)
+        user.groups.add(Group.objects.get_or_create(name='admin')[0])
+        return user
+    return User.objects.filter(groups__name=f'user_{kind}', username__startswith='syn_').order_by('pk').first()
+
+
+@pytest.mark.perf
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.skipif(not os.environ.get('RUN_PERF'), reason='set RUN_PERF=1 to run performance regression tests')
+@pytest.mark.parametrize('name', list(ENDPOINTS))
+def test_endpoint_performance(name, synthetic_data, baselines, client, record_property):
+    url_name, user_kind, params = ENDPOINTS[name]
+    client.force_login(_perf_user(user_kind))
+    url = reverse(url_name)
+
+    assert client.get(url, params).status_code == 200  # warm-up
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        client.get(url, params)
+        timings.append((time.perf_counter() - started) * 1000)
+    median_ms = statistics.median(timings)
+    with CaptureQueriesContext(connection) as ctx:
+        client.get(url, params)
+    queries = len(ctx.captured_queries)
+
+    record_property('median_ms', round(median_ms, 1))
+    record_property('queries', queries)
+    _measured[name] = {'ms': round(median_ms, 1), 'queries': queries}
+    if UPDATE_BASELINES:
+        return
+
+    if baselines.get('scale') != synthetic_data['scale']:
+        pytest.skip(f'baselines recorded at scale {baselines.get("scale")}, running at {synthetic_data["scale"]}')
+    baseline = baselines.get('endpoints', {}).get(name)
+    if baseline is None:
+        pytest.skip(f'no baseline for {name}; run with PERF_UPDATE_BASELINES=1')
+
+    limit_ms = baseline['ms'] * TOLERANCE + SLACK_MS
+    assert median_ms <= limit_ms, f'{name} regressed: {median_ms:.1f}ms > {limit_ms:.1f}ms (baseline {baseline["ms"]}ms)'
+    assert queries <= baseline['queries'], f'{name} runs {queries} queries (baseline {baseline["queries"]})'
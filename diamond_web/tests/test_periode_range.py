@@ -0,0 +1,148 @@
+"""Tests for the half-open report period ranges (utils/periode_range.py)."""
+from datetime import date, datetime
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from diamond_web.tests.conftest import TiketFactory
+from diamond_web.utils.periode_range import (
+    PeriodeError,
+    PeriodeRange,
+    datetime_range,
+    month_start,
+    parse_periode,
+    periode_range,
+)
+
+
+class TestPeriodeRange:
+    """Bulanan, triwulanan, semester and tahunan periods of a year."""
+
+    @pytest.mark.parametrize('periode_type, periode, start, end', [
+        ('bulanan', '2', datetime(2024, 2, 1), datetime(2024, 3, 1)),
+        ('bulanan', 12, datetime(2024, 12, 1), datetime(2025, 1, 1)),
+        ('triwulanan', '1', datetime(2024, 1, 1), datetime(2024, 4, 1)),
+        ('triwulanan', '4', datetime(2024, 10, 1), datetime(2025, 1, 1)),
+        ('semester', '1', datetime(2024, 1, 1), datetime(2024, 7, 1)),
+        ('semester', '2', datetime(2024, 7, 1), datetime(2025, 1, 1)),
+        ('tahunan', 'apa saja', datetime(2024, 1, 1), datetime(2025, 1, 1)),
+    ])
+    def test_start_of_the_period_to_start_of_the_next(self, periode_type, periode, start, end):
+        rentang = periode_range(periode_type, periode, '2024')
+
+        assert (rentang.start, rentang.end) == (start, end)
+
+    def test_december_rolls_over_to_the_next_year(self):
+        rentang = periode_range('bulanan', '12', '2023')
+
+        assert rentang.filter_kwargs('tgl_transfer') == {
+            'tgl_transfer__gte': datetime(2023, 12, 1),
+            'tgl_transfer__lt': datetime(2024, 1, 1),
+        }
+        assert rentang.last_day == date(2023, 12, 31)
+        assert month_start(2023, 13) == datetime(2024, 1, 1)
+
+    def test_leap_february(self):
+        assert periode_range('bulanan', 2, 2024).last_day == date(2024, 2, 29)
+        assert periode_range('bulanan', 2, 2023).last_day == date(2023, 2, 28)
+
+    @pytest.mark.parametrize('periode_type, periode, tahun, field', [
+        ('bulanan', '13', '2024', 'periode'),
+        ('bulanan', '0', '2024', 'periode'),
+        ('bulanan', 'maret', '2024', 'periode'),
+        ('triwulanan', '5', '2024', 'periode'),
+        ('semester', '3', '2024', 'periode'),
+        ('semester', None, '2024', 'periode'),
+        ('mingguan', '1', '2024', 'periode_type'),
+        (None, '1', '2024', 'periode_type'),
+        ('bulanan', '1', 'abc', 'tahun'),
+        ('bulanan', '1', None, 'tahun'),
+        ('bulanan', '1', '0', 'tahun'),
+        ('tahunan', '1', '9999', 'tahun'),
+    ])
+    def test_invalid_parameters(self, periode_type, periode, tahun, field):
+        with pytest.raises(PeriodeError) as excinfo:
+            periode_range(periode_type, periode, tahun)
+
+        assert excinfo.value.field == field
+
+    def test_labels(self):
+        assert periode_range('bulanan', 3, 2024).label == 'Maret 2024'
+        assert periode_range('triwulanan', 2, 2024).label == 'Triwulan 2 2024'
+        assert periode_range('semester', 2, 2024).label == 'Semester 2 2024'
+        assert periode_range('tahunan', None, 2024).label == '2024'
+
+    def test_parse_periode_reads_the_request_parameters(self):
+        params = {'periode_type': 'triwulanan', 'periode': '3', 'tahun': '2025'}
+
+        assert parse_periode(params) == PeriodeRange(
+            datetime(2025, 7, 1), datetime(2025, 10, 1), periode_type='triwulanan', periode=3, tahun=2025,
+        )
+
+    def test_aware_in_the_project_timezone(self, settings):
+        settings.USE_TZ = True
+        settings.TIME_ZONE = 'Asia/Jakarta'
+
+        rentang = periode_range('bulanan', 1, 2024)
+
+        assert timezone.is_aware(rentang.start)
+        assert rentang.start.utcoffset().total_seconds() == 7 * 60 * 60
+
+
+class TestDatetimeRange:
+    """Tanggal Mulai / Tanggal Akhir filters of the SLA reports."""
+
+    def test_akhir_covers_its_whole_minute(self):
+        rentang = datetime_range('2024-03-01T08:00', '2024-03-31T23:59')
+
+        assert rentang.filter_kwargs('tgl_rekam_pide') == {
+            'tgl_rekam_pide__gte': datetime(2024, 3, 1, 8, 0),
+            'tgl_rekam_pide__lt': datetime(2024, 4, 1, 0, 0),
+        }
+
+    @pytest.mark.parametrize('tgl_mulai, tgl_akhir, lookups', [
+        ('', None, []),
+        ('kemarin', '2024-03-31T23:59', ['tgl_transfer__lt']),
+        ('2024-03-01T00:00', '31/03/2024', ['tgl_transfer__gte']),
+    ])
+    def test_missing_or_invalid_bounds_stay_open(self, tgl_mulai, tgl_akhir, lookups):
+        assert list(datetime_range(tgl_mulai, tgl_akhir).filter_kwargs('tgl_transfer')) == lookups
+
+
+@pytest.mark.django_db
+class TestReportsUseHalfOpenRanges:
+    """The boundaries seen through the report endpoints."""
+
+    def test_last_minute_of_december_in_first_instant_of_january_out(self, client, admin_user):
+        inside = TiketFactory(tgl_transfer=datetime(2023, 12, 31, 23, 59, 30))
+        TiketFactory(tgl_transfer=datetime(2024, 1, 1), id_periode_data=inside.id_periode_data)
+        TiketFactory(tgl_transfer=datetime(2023, 11, 30, 23, 59, 59), id_periode_data=inside.id_periode_data)
+        client.force_login(admin_user)
+
+        response = client.get(reverse('laporan_pengendalian_mutu_data'), {
+            'periode_type': 'bulanan', 'periode': '12', 'tahun': '2023',
+        })
+
+        assert [row['nomor_tiket'] for row in response.json()['data']] == [inside.nomor_tiket]
+
+    def test_sla_report_includes_the_seconds_of_tanggal_akhir(self, client, admin_user):
+        tiket = TiketFactory(tgl_rekam_pide=datetime(2024, 3, 31, 23, 59, 45))
+        client.force_login(admin_user)
+
+        response = client.get(reverse('laporan_sla_identifikasi_data'), {
+            'tgl_mulai': '2024-03-01T00:00', 'tgl_akhir': '2024-03-31T23:59',
+        })
+
+        assert response.json()['recordsFiltered'] == 1
+        assert tiket.nomor_tiket in response.content.decode()
+
+    def test_invalid_month_is_rejected_by_the_export(self, client, admin_user):
+        client.force_login(admin_user)
+
+        response = client.get(reverse('laporan_kelengkapan_data_export'), {
+            'periode_type': 'bulanan', 'periode': '13', 'tahun': '2024',
+        })
+
+        assert response.status_code == 400
+        assert response.json() == {'error': 'Bulan tidak valid.'}
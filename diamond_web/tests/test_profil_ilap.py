@@ -0,0 +1,143 @@
+"""Tests for the Profil ILAP detail tiket matrix."""
+import os
+import time
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from diamond_web.models import KlasifikasiJenisData, PeriodePengiriman, Tiket
+from diamond_web.tests.conftest import (
+    DasarHukumFactory,
+    ILAPFactory,
+    JenisDataILAPFactory,
+    PeriodeJenisDataFactory,
+    TiketFactory,
+    UserFactory,
+)
+from diamond_web.utils.profil_ilap_matrix import build_profil_ilap_matrix, periode_total
+
+TODAY = date(2025, 5, 20)
+
+
+def _periode_pengiriman(name):
+    return PeriodePengiriman.objects.get_or_create(
+        periode_penyampaian=name, defaults={'periode_penerimaan': name}
+    )[0]
+
+
+def _jenis_data(ilap, periode_name, klasifikasi=1):
+    jenis_data = JenisDataILAPFactory(id_ilap=ilap)
+    periode_data = PeriodeJenisDataFactory(
+        id_sub_jenis_data_ilap=jenis_data, id_periode_pengiriman=_periode_pengiriman(periode_name),
+    )
+    for _ in range(klasifikasi):
+        KlasifikasiJenisData.objects.create(id_sub_jenis_data=jenis_data, id_klasifikasi_tabel=DasarHukumFactory())
+    return jenis_data, periode_data
+
+
+def _bulk_tikets(template, periode_data, year, periodes):
+    Tiket.objects.bulk_create([
+        Tiket(
+            nomor_tiket=f'P{periode_data.pk:05d}{year}{periode:02d}{i}',
+            status_tiket=1,
+            id_periode_data=periode_data,
+            periode=periode,
+            tahun=year,
+            id_bentuk_data_id=template.id_bentuk_data_id,
+            id_cara_penyampaian_id=template.id_cara_penyampaian_id,
+            baris_diterima=1,
+            tgl_terima_dip=template.tgl_terima_dip,
+        )
+        for i, periode in enumerate(periodes)
+    ])
+
+
+class TestPeriodeTotal:
+    """Periods due per periode penyampaian."""
+
+    @pytest.mark.parametrize('periode, year, expected', [
+        ('Bulanan', 2024, 12),
+        ('Bulanan', 2025, 5),
+        ('Triwulan', 2025, 2),
+        ('Semester', 2025, 1),
+        ('Tahunan', 2025, 1),
+        ('Harian', 2026, 12),
+    ])
+    def test_strategy_table(self, periode, year, expected):
+        assert periode_total(periode, year, TODAY) == expected
+
+
+@pytest.mark.django_db
+class TestProfilILAPMatrix:
+    """build_profil_ilap_matrix and the detail view."""
+
+    def test_counts_only_periods_due(self):
+        ilap = ILAPFactory()
+        jenis_data, periode_data = _jenis_data(ilap, 'Triwulan', klasifikasi=2)
+        JenisDataILAPFactory(id_ilap=ilap)  # no PeriodeJenisData: skipped
+        template = TiketFactory(id_periode_data=periode_data, tahun=2020, periode=1)
+        _bulk_tikets(template, periode_data, 2025, [1, 2, 2, 3])
+        _bulk_tikets(template, periode_data, 2024, [4])
+
+        details, years = build_profil_ilap_matrix(ilap, today=TODAY)
+
+        assert years == [2023, 2024, 2025, 2026]
+        assert len(details) == 1
+        assert details[0]['jenis_data'] == jenis_data
+        assert details[0]['year_data'] == {2023: '0/4', 2024: '1/4', 2025: '3/2', 2026: '0/4'}
+        assert len(details[0]['dasar_hukum'].split(', ')) == 2
+
+    def test_query_count_independent_of_jenis_data(self):
+        small, large = ILAPFactory(), ILAPFactory()
+        _jenis_data(small, 'Bulanan')
+        for name in ('Bulanan', 'Triwulan', 'Semester', 'Tahunan') * 3:
+            _jenis_data(large, name, klasifikasi=2)
+
+        with CaptureQueriesContext(connection) as small_ctx:
+            build_profil_ilap_matrix(small, today=TODAY)
+        with CaptureQueriesContext(connection) as large_ctx:
+            details, _ = build_profil_ilap_matrix(large, today=TODAY)
+
+        assert len(details) == 12
+        assert len(small_ctx.captured_queries) == len(large_ctx.captured_queries) == 4
+
+    def test_detail_view(self, client):
+        user = UserFactory()
+        user.groups.add(Group.objects.get_or_create(name='user_p3de')[0])
+        ilap = ILAPFactory()
+        for name in ('Bulanan', 'Semester'):
+            _jenis_data(ilap, name)
+        client.force_login(user)
+
+        response = client.get(reverse('profil_ilap_detail', args=[ilap.pk]))
+
+        assert response.status_code == 200
+        assert len(response.context['jenis_data_details']) == 2
+        assert len(response.context['years']) == 4
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='set RUN_BENCHMARKS=1 to run benchmarks')
+def test_benchmark_profil_ilap_50_jenis_data():
+    """Matrix build for an ILAP with 50 jenis data and ~2,400 tikets (prints timing)."""
+    ilap = ILAPFactory()
+    template = None
+    for _ in range(50):
+        _, periode_data = _jenis_data(ilap, 'Bulanan', klasifikasi=2)
+        template = template or TiketFactory(id_periode_data=periode_data, tahun=2000, periode=1)
+        for year in (2023, 2024, 2025, 2026):
+            _bulk_tikets(template, periode_data, year, range(1, 13))
+
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as ctx:
+        details, _ = build_profil_ilap_matrix(ilap, today=TODAY)
+    elapsed = time.perf_counter() - started
+
+    print(f'\nProfil ILAP matrix: {len(details)} jenis data, {len(ctx.captured_queries)} queries, {elapsed * 1000:.1f}ms')
+    assert len(details) == 50
+    assert len(ctx.captured_queries) == 4
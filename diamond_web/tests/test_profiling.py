@@ -0,0 +1,187 @@
+"""Tests for the request/task profiler and the profile diagnostics pages."""
+import cProfile
+import os
+import pstats
+
+import pytest
+from django.urls import reverse
+
+from diamond_web import tasks
+from diamond_web.models import SyncRun
+from diamond_web.utils import profiling
+
+
+@pytest.fixture(autouse=True)
+def profiler_settings(settings, tmp_path):
+    settings.PROFILER_ENABLED = True
+    settings.PROFILER_SAMPLE_RATE = 0.0
+    settings.PROFILER_TASKS = ()
+    settings.PROFILER_DIR = str(tmp_path / 'profiles')
+    settings.PROFILER_MAX_PROFILES = 50
+    return settings
+
+
+def _work():
+    return sum(i * i for i in range(1000))
+
+
+def _stats():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _work()
+    profiler.disable()
+    return profiler
+
+
+@pytest.mark.django_db
+class TestProfilerMiddleware:
+    """Superusers opt in per request; everyone else is only sampled."""
+
+    def test_superuser_query_flag(self, client, admin_user):
+        client.force_login(admin_user)
+
+        response = client.get(reverse('home'), {'_profile': '1'})
+
+        [profile] = profiling.list_profiles()
+        assert response.status_code == 200
+        assert profile['kind'] == 'request'
+        assert profile['name'].startswith(reverse('home'))
+        assert profile['method'] == 'GET'
+        assert profile['status'] == 200
+        assert profile['queries'] > 0
+        assert profile['duration_ms'] > 0
+        stats = pstats.Stats(profiling.profile_path(profile['id'], '.prof'))
+        assert any(name == 'home' for _, _, name in stats.stats)
+
+    def test_superuser_header(self, client, admin_user):
+        client.force_login(admin_user)
+
+        client.get(reverse('home'), HTTP_X_PROFILE='1')
+
+        assert len(profiling.list_profiles()) == 1
+
+    def test_flag_ignored_for_other_users(self, client, django_user_model):
+        client.force_login(django_user_model.objects.create(username='biasa'))
+
+        client.get(reverse('home'), {'_profile': '1'}, HTTP_X_PROFILE='1')
+
+        assert profiling.list_profiles() == []
+
+    def test_not_profiled_without_flag(self, client, admin_user):
+        client.force_login(admin_user)
+
+        client.get(reverse('home'))
+
+        assert profiling.list_profiles() == []
+
+    def test_sample_rate(self, client, profiler_settings):
+        profiler_settings.PROFILER_SAMPLE_RATE = 1.0
+
+        client.get(reverse('login'))
+
+        [profile] = profiling.list_profiles()
+        assert profile['name'] == reverse('login')
+
+
+class TestProfileRing:
+    """Only the newest PROFILER_MAX_PROFILES profiles are kept."""
+
+    def test_oldest_profiles_are_deleted(self, profiler_settings):
+        profiler_settings.PROFILER_MAX_PROFILES = 3
+
+        ids = [profiling.save_profile(_stats(), 'task', f'task-{i}', 1.0, 0) for i in range(5)]
+
+        assert [profile['id'] for profile in profiling.list_profiles()] == ids[:1:-1]
+        assert sorted(os.listdir(profiling.profiles_dir())) == sorted(
+            profile_id + ext for profile_id in ids[2:] for ext in ('.html', '.json', '.prof')
+        )
+
+    def test_call_tree_lists_profiled_functions(self):
+        html = profiling.render_call_tree(pstats.Stats(_stats()))
+
+        assert '<code>_work (diamond_web/tests/test_profiling.py:' in html
+        assert '<code>&lt;genexpr&gt;' in html
+
+    def test_nested_profile_is_skipped(self):
+        with profiling.profile('task', 'outer'):
+            with profiling.profile('task', 'inner'):
+                _work()
+
+        assert [profile['name'] for profile in profiling.list_profiles()] == ['outer']
+
+
+@pytest.mark.django_db
+class TestProfiledTask:
+    """Sync tasks are profiled when listed in PROFILER_TASKS."""
+
+    @pytest.fixture
+    def fake_sync(self, monkeypatch):
+        monkeypatch.setattr('diamond_web.utils.oracle_sync.OracleDataSyncService.__init__', lambda self, **k: None)
+        monkeypatch.setattr(
+            'diamond_web.views.sync_tiket._sync_tiket_data',
+            lambda *a, **k: {'source_rows': 1, 'inserts': 1, 'updates': 0, 'errors': []},
+        )
+
+    def test_listed_task_is_profiled(self, fake_sync, profiler_settings):
+        profiler_settings.PROFILER_TASKS = ('diamond_web.tasks.sync_tiket_data_task',)
+
+        tasks.sync_tiket_data_task.run('sync-1')
+
+        [profile] = profiling.list_profiles()
+        assert profile['kind'] == 'task'
+        assert profile['name'] == 'diamond_web.tasks.sync_tiket_data_task'
+        assert profile['args'] == ['sync-1']
+        assert SyncRun.objects.get(run_id='sync-1').status == SyncRun.STATUS_SUCCESS
+
+    def test_unlisted_task_is_not_profiled(self, fake_sync):
+        tasks.sync_tiket_data_task.run('sync-1')
+
+        assert profiling.list_profiles() == []
+
+
+@pytest.mark.django_db
+class TestProfileDiagnosticsPages:
+    """The list, call tree and download pages are superuser-only."""
+
+    @pytest.fixture
+    def stored(self):
+        return profiling.save_profile(_stats(), 'request', '/tiket/?x=1', 12.5, 7, method='GET', status=200)
+
+    def test_list(self, client, admin_user, stored):
+        client.force_login(admin_user)
+
+        response = client.get(reverse('profile_diagnostics'))
+
+        assert response.status_code == 200
+        assert '/tiket/?x=1' in response.content.decode()
+        assert reverse('profile_detail', args=[stored]) in response.content.decode()
+
+    def test_detail_and_download(self, client, admin_user, stored):
+        client.force_login(admin_user)
+
+        detail = client.get(reverse('profile_detail', args=[stored]))
+        download = client.get(reverse('profile_download', args=[stored]))
+
+        assert '<details' in detail.content.decode()
+        assert download['Content-Disposition'] == f'attachment; filename="{stored}.prof"'
+        assert b''.join(download.streaming_content)
+
+    def test_unknown_profile(self, client, admin_user):
+        client.force_login(admin_user)
+
+        assert client.get(reverse('profile_detail', args=['..'])).status_code == 404
+        assert client.get(reverse('profile_download', args=['nope'])).status_code == 404
+
+    def test_clear(self, client, admin_user, stored):
+        client.force_login(admin_user)
+
+        client.post(reverse('profile_diagnostics'))
+
+        assert profiling.list_profiles() == []
+
+    def test_forbidden_for_other_users(self, client, django_user_model, stored):
+        client.force_login(django_user_model.objects.create(username='biasa'))
+
+        response = client.get(reverse('profile_diagnostics'))
+
+        assert response.status_code == 302
@@ -0,0 +1,90 @@
+"""Tests for the Quality Control DataTables endpoint."""
+from datetime import date, datetime
+
+import pytest
+from django.contrib.auth.models import Group
+from django.urls import reverse
+
+from diamond_web.constants.tiket_status import STATUS_PENGENDALIAN_MUTU
+from diamond_web.models import KlasifikasiJenisData, Tiket, TiketPIC
+from diamond_web.tests.conftest import (
+    DasarHukumFactory,
+    PeriodeJenisDataFactory,
+    TiketFactory,
+    TiketPICFactory,
+    UserFactory,
+)
+from diamond_web.views.quality_control import _format_row
+
+
+@pytest.fixture
+def pmde_user():
+    user = UserFactory(first_name='Pmde', last_name='User')
+    user.groups.add(Group.objects.get_or_create(name='user_pmde')[0])
+    return user
+
+
+def _make_page(user, count, extra_pics, klasifikasi):
+    periode_data = PeriodeJenisDataFactory()
+    for _ in range(klasifikasi):
+        KlasifikasiJenisData.objects.create(
+            id_sub_jenis_data=periode_data.id_sub_jenis_data_ilap,
+            id_klasifikasi_tabel=DasarHukumFactory(),
+        )
+    tikets = []
+    for _ in range(count):
+        tiket = TiketFactory(
+            status_tiket=STATUS_PENGENDALIAN_MUTU, id_periode_data=periode_data, id_jenis_prioritas_data=None,
+            tgl_transfer=datetime(2025, 3, 1),
+        )
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=TiketPIC.Role.PMDE, active=True)
+        for _ in range(extra_pics):
+            TiketPICFactory(id_tiket=tiket, role=TiketPIC.Role.PIDE)
+        tikets.append(tiket)
+    return tikets
+
+
+@pytest.mark.django_db
+class TestQualityControlData:
+    """quality_control_data resolves related rows per page, not per row."""
+
+    # session, user, group check, count, page, TiketPIC names, klasifikasi
+    PAGE_QUERIES = 7
+
+    @pytest.mark.parametrize('extra_pics, klasifikasi', [(0, 0), (3, 2)])
+    def test_100_row_page_query_count_is_fixed(self, client, pmde_user, django_assert_num_queries,
+                                               extra_pics, klasifikasi):
+        _make_page(pmde_user, 100, extra_pics, klasifikasi)
+        client.force_login(pmde_user)
+
+        with django_assert_num_queries(self.PAGE_QUERIES):
+            response = client.get(reverse('quality_control_data'), {'length': '100'})
+
+        data = response.json()['data']
+        assert len(data) == 100
+        assert {row['pic_pmde'] for row in data} == {'Pmde User'}
+        assert all(len(row['klasifikasi'].split(', ')) == max(klasifikasi, 1) for row in data)
+
+    def test_first_active_pmde_pic_is_shown(self, client, pmde_user):
+        tiket = _make_page(pmde_user, 1, 0, 0)[0]
+        TiketPICFactory(id_tiket=tiket, id_user=UserFactory(username='later'), role=TiketPIC.Role.PMDE)
+        client.force_login(pmde_user)
+
+        row = client.get(reverse('quality_control_data')).json()['data'][0]
+        assert row['pic_pmde'] == 'Pmde User'
+        assert row['klasifikasi'] == '-'
+
+
+@pytest.mark.django_db
+def test_format_row_uses_persisted_deadline():
+    tiket = TiketFactory(tgl_transfer=datetime(2025, 3, 1))
+    Tiket.objects.filter(pk=tiket.pk).update(deadline_pengendalian=date(2025, 3, 11), is_prioritas=True)
+    tiket.refresh_from_db()
+
+    row = _format_row(tiket, 'PIC', ['A', 'B'], today=date(2025, 3, 8))
+
+    assert row['deadline'] == {'display': '11/03/2025', 'sort': '2025-03-11'}
+    assert row['jatuh_tempo'] == {'display': '3 hari', 'sort': '3'}
+    assert row['sisa_hari'] == 3
+    assert row['klasifikasi'] == 'A, B'
+    assert row['prioritas'] == 'Ya'
@@ -0,0 +1,158 @@
+"""Tests for the query budget middleware and the query diagnostics page."""
+import json
+import logging
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.urls import include, path, reverse
+
+from diamond_web.models import Kanwil
+from diamond_web.utils.query_stats import QueryRecorder, fingerprint, get_view_stats
+
+
+def n_plus_one_view(request):
+    names = [Kanwil.objects.get(pk=pk).nama_kanwil for pk in Kanwil.objects.values_list('pk', flat=True)]
+    return HttpResponse(', '.join(names))
+
+
+def batched_view(request):
+    return HttpResponse(', '.join(Kanwil.objects.values_list('nama_kanwil', flat=True)))
+
+
+urlpatterns = [
+    path('n-plus-one/', n_plus_one_view, name='test_n_plus_one'),
+    path('batched/', batched_view, name='test_batched'),
+    path('', include('config.urls')),
+]
+
+
+@pytest.fixture(autouse=True)
+def budget_settings(settings):
+    cache.clear()
+    settings.QUERY_BUDGET_ENABLED = True
+    settings.QUERY_BUDGET_DUPLICATE_THRESHOLD = 5
+    settings.QUERY_BUDGET_MAX_QUERIES = 50
+    settings.ROOT_URLCONF = __name__
+    yield settings
+    cache.clear()
+
+
+def _kanwils(count):
+    Kanwil.objects.bulk_create([Kanwil(kode_kanwil=f'{i:03d}', nama_kanwil=f'Kanwil {i}') for i in range(count)])
+
+
+def _logged(caplog):
+    return [
+        json.loads(record.getMessage().split(': ', 1)[1])
+        for record in caplog.records if record.name == 'diamond_web.query_budget'
+    ]
+
+
+def _stats(view_name):
+    return next(stats for stats in get_view_stats() if stats['view_name'] == view_name)
+
+
+class TestFingerprint:
+    """Query shapes ignore literals and IN list length."""
+
+    def test_literals_and_in_lists_collapse(self):
+        a = fingerprint('SELECT * FROM "kanwil" WHERE "id" = 1 AND "nama" = \'A\'')
+        b = fingerprint('SELECT * FROM "kanwil" WHERE "id" = 22 AND "nama" = \'B\'')
+        assert a == b
+        assert fingerprint('SELECT 1 FROM t WHERE id IN (%s, %s)')[0] == fingerprint('SELECT 1 FROM t WHERE id IN (%s)')[0]
+
+
+@pytest.mark.django_db
+class TestQueryBudgetMiddleware:
+    """Requests are measured per URL name and N+1 patterns are flagged."""
+
+    def test_n_plus_one_is_detected_and_logged(self, client, admin_user, caplog):
+        _kanwils(8)
+        client.force_login(admin_user)
+
+        with caplog.at_level(logging.WARNING, logger='diamond_web.query_budget'):
+            assert client.get('/n-plus-one/').status_code == 200
+
+        stats = _stats('test_n_plus_one')
+        assert stats['requests'] == 1
+        assert stats['n_plus_one'] == 1
+        assert stats['max_queries'] >= 9
+        (_key, entry), = stats['duplicate_list']
+        assert entry['max_repeats'] == 8
+        assert '"kanwil"' in entry['sql']
+
+        payload = _logged(caplog)[-1]
+        assert payload['event'] == 'query_duplicates'
+        assert payload['view'] == 'test_n_plus_one'
+        assert payload['duplicates'][0]['count'] == 8
+
+    def test_batched_view_is_clean(self, client, admin_user, caplog):
+        _kanwils(8)
+        client.force_login(admin_user)
+
+        with caplog.at_level(logging.WARNING, logger='diamond_web.query_budget'):
+            client.get('/batched/')
+            client.get('/batched/')
+
+        stats = _stats('test_batched')
+        assert stats['requests'] == 2
+        assert stats['n_plus_one'] == 0
+        assert stats['duplicate_list'] == []
+        assert sum(stats['wall_ms_hist']) == 2
+        assert _logged(caplog) == []
+
+    def test_over_budget_is_logged(self, client, admin_user, settings, caplog):
+        settings.QUERY_BUDGET_OVERRIDES = {'test_batched': {'queries': 0}}
+        client.force_login(admin_user)
+
+        with caplog.at_level(logging.WARNING, logger='diamond_web.query_budget'):
+            client.get('/batched/')
+
+        assert _stats('test_batched')['over_budget'] == 1
+        payload = _logged(caplog)[-1]
+        assert payload['event'] == 'query_budget_exceeded'
+        assert payload['budget']['queries'] == 0
+
+    def test_disabled_middleware_records_nothing(self, client, settings):
+        settings.QUERY_BUDGET_ENABLED = False
+        client.get('/batched/')
+        assert get_view_stats() == []
+
+
+@pytest.mark.django_db
+class TestQueryDiagnosticsPage:
+    """The diagnostics page is superuser-only."""
+
+    def test_superuser_sees_recorded_views(self, client, admin_user):
+        _kanwils(6)
+        client.force_login(admin_user)
+        client.get('/n-plus-one/')
+
+        response = client.get(reverse('query_diagnostics'))
+
+        assert response.status_code == 200
+        assert [stats['view_name'] for stats in response.context['view_stats']] == ['test_n_plus_one']
+        assert 'test_n_plus_one' in response.content.decode()
+
+        client.post(reverse('query_diagnostics'))
+        assert get_view_stats() == []
+
+    def test_staff_user_is_rejected(self, client, django_user_model):
+        user = django_user_model.objects.create_user('staff', password='x', is_staff=True)
+        client.force_login(user)
+        assert client.get(reverse('query_diagnostics')).status_code == 302
+
+
+def test_recorder_counts_wrapped_queries():
+    recorder = QueryRecorder()
+
+    def execute(sql, params, many, context):
+        return 'ok'
+
+    for pk in range(3):
+        assert recorder(execute, 'SELECT * FROM "kanwil" WHERE "id" = %s', [pk], False, {}) == 'ok'
+
+    assert recorder.count == 3
+    assert recorder.duplicates(threshold=3)[0][1] == 3
+    assert recorder.duplicates(threshold=4) == []
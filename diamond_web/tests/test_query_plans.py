@@ -0,0 +1,182 @@
+"""Query plan regression tests on the synthetic data set.
+
+Every SELECT the major views run is explained; none may read a table of
+``PLAN_MIN_ROWS`` rows or more with a full scan.  The hot lookups must use the
+composite indexes designed for them (migration 0009).
+"""
+import os
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.db.models import Q
+from django.urls import reverse
+
+from diamond_web.models import DurasiJatuhTempo, Notification, Tiket, TiketAction, TiketPIC
+from diamond_web.utils.periode_range import periode_range
+from diamond_web.utils.query_plans import analyze, capture_selects, find_full_scans, indexes_used, needs_sort
+from diamond_web.utils.synthetic_data import YEARS
+
+MIN_ROWS = int(os.environ.get('PLAN_MIN_ROWS', '200'))
+DATATABLES = {'draw': '1', 'start': '0', 'length': '25'}
+
+# name -> (url name, user kind, GET parameters, tables an unfiltered view may scan)
+ENDPOINTS = {
+    'tiket_data_p3de': ('tiket_data', 'p3de', DATATABLES, set()),
+    'tiket_data_pide': ('tiket_data', 'pide', DATATABLES, set()),
+    'tiket_data_pmde': ('tiket_data', 'pmde', DATATABLES, set()),
+    # Admins list every tiket: counting them is a full scan by definition
+    'tiket_data_admin': ('tiket_data', 'admin', DATATABLES, {'tiket'}),
+    'quality_control_data': ('quality_control_data', 'pmde', DATATABLES, set()),
+    'backup_data_data': ('backup_data_data', 'p3de', DATATABLES, set()),
+    'monitoring_penyampaian_data_data': ('monitoring_penyampaian_data_data', 'admin', DATATABLES, set()),
+    'laporan_rekap_himpun_olah_data_data': ('laporan_rekap_himpun_olah_data_data', 'admin', DATATABLES, set()),
+    'home_p3de': ('home', 'p3de', {}, set()),
+    'home_pmde': ('home', 'pmde', {}, set()),
+    'notification_list': ('notification_list', 'p3de', {}, set()),
+    'tiket_detail': ('tiket_detail', 'admin', {}, set()),
+}
+
+# report data endpoint -> (date column filtered, GET parameters of one month)
+PERIODE_PARAMS = {'periode_type': 'bulanan', 'periode': '3', 'tahun': str(YEARS[0])}
+DATE_RANGE_PARAMS = {'tgl_mulai': f'{YEARS[0]}-03-01T00:00', 'tgl_akhir': f'{YEARS[0]}-03-31T23:59'}
+REPORTS = {
+    'laporan_kelengkapan_data_data': ('tgl_transfer', PERIODE_PARAMS),
+    'laporan_pengendalian_mutu_data': ('tgl_transfer', PERIODE_PARAMS),
+    'laporan_hasil_pengolahan_data_prioritas_data': ('tgl_kirim_pide', PERIODE_PARAMS),
+    'register_penerimaan_data_data': ('tgl_terima_dip', {'bulan': '3', 'tahun': str(YEARS[0])}),
+    'laporan_sla_identifikasi_data': ('tgl_rekam_pide', DATE_RANGE_PARAMS),
+    'laporan_sla_perekaman_data': ('tgl_kirim_pide', DATE_RANGE_PARAMS),
+    'laporan_transfer_data': ('tgl_transfer', DATE_RANGE_PARAMS),
+    'laporan_metrik_data_eksternal_data': ('tgl_transfer', DATE_RANGE_PARAMS),
+}
+DATE_INDEXES = {
+    'tgl_terima_dip': 'tiket_terima_dip_idx',
+    'tgl_kirim_pide': 'tiket_kirim_pide_idx',
+    'tgl_rekam_pide': 'tiket_rekam_pide_idx',
+    'tgl_transfer': 'tiket_transfer_idx',
+}
+
+
+def _plan_user(kind):
+    if kind == 'admin':
+        user = User.objects.create(username='plan_admin', is_superuser=True, is_staff=True)
+        user.groups.add(Group.objects.get_or_create(name='admin')[0])
+        return user
+    return User.objects.filter(groups__name=f'user_{kind}', username__startswith='syn_').order_by('pk').first()
+
+
+@pytest.fixture
+def notifications(synthetic_data, db):
+    users = list(User.objects.filter(username__startswith='syn_'))
+    Notification.objects.bulk_create([
+        Notification(recipient=user, title='Tiket', message='Pesan', is_read=i % 4 != 0)
+        for user in users
+        for i in range(20)
+    ])
+    return users
+
+
+@pytest.fixture
+def analyzed(notifications):
+    """Planner statistics for the seeded rows.  The view scan check runs
+    without them: at this scale they make a scan of a few hundred rows the
+    cheaper plan, which hides the missing indexes the check looks for."""
+    analyze()
+    return notifications
+
+
+def _single_plan(run):
+    """Run *run* and return the ``(sql, params)`` of the one SELECT it executes."""
+    with capture_selects() as queries:
+        run()
+    assert len(queries) == 1
+    return queries[0]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('name', list(ENDPOINTS))
+def test_views_do_not_scan_large_tables(name, notifications, client):
+    url_name, user_kind, params, allowed = ENDPOINTS[name]
+    client.force_login(_plan_user(user_kind))
+    args = (Tiket.objects.order_by('pk').values_list('pk', flat=True)[100],) if url_name == 'tiket_detail' else ()
+
+    with capture_selects() as queries:
+        response = client.get(reverse(url_name, args=args), params)
+
+    assert response.status_code == 200
+    scans = [scan for scan in find_full_scans(queries, MIN_ROWS) if scan.table not in allowed]
+    assert not scans, '\n'.join(str(scan) for scan in scans)
+
+
+@pytest.mark.django_db
+class TestHotLookupIndexes:
+    """The lookups behind the PIC checks, timelines, navbar and SLA deadlines."""
+
+    def test_active_tikets_of_a_pic(self, analyzed):
+        user = _plan_user('pmde')
+        pic_tikets = TiketPIC.objects.filter(id_user=user, role=TiketPIC.Role.PMDE, active=True)
+        sql, params = _single_plan(lambda: Tiket.objects.filter(id__in=pic_tikets.values('id_tiket')).count())
+
+        assert 'tiket_pic_user_role_idx' in indexes_used(sql, params)
+
+    def test_pic_access_check(self, analyzed):
+        pic = TiketPIC.objects.filter(active=True).order_by('pk').first()
+        sql, params = _single_plan(lambda: TiketPIC.objects.filter(
+            id_tiket=pic.id_tiket_id, id_user=pic.id_user_id, role=pic.role, active=True,
+        ).exists())
+
+        assert not needs_sort(sql, params)
+
+    def test_tiket_timeline(self, analyzed):
+        tiket = Tiket.objects.order_by('pk')[100]
+        sql, params = _single_plan(lambda: list(TiketAction.objects.filter(id_tiket=tiket).order_by('-timestamp')))
+
+        assert 'tiket_action_tiket_ts_idx' in indexes_used(sql, params)
+        assert not needs_sort(sql, params)
+
+    def test_unread_notifications(self, analyzed):
+        user = analyzed[0]
+        sql, params = _single_plan(lambda: list(
+            Notification.objects.filter(recipient=user, is_read=False).order_by('-created_at')
+        ))
+
+        assert 'notification_unread_idx' in indexes_used(sql, params)
+        assert not needs_sort(sql, params)
+
+    def test_durasi_in_force(self, analyzed):
+        durasi = DurasiJatuhTempo.objects.order_by('pk').first()
+        today = date.today()
+        sql, params = _single_plan(lambda: DurasiJatuhTempo.objects.filter(
+            id_sub_jenis_data=durasi.id_sub_jenis_data_id, seksi=durasi.seksi_id,
+        ).filter(
+            Q(end_date__isnull=True) | Q(start_date__lte=today, end_date__gte=today)
+        ).first())
+
+        assert 'durasi_sub_seksi_date_idx' in indexes_used(sql, params)
+
+
+@pytest.mark.django_db
+class TestReportPeriodIndexes:
+    """Report periods filter the bare date column, so its index serves them."""
+
+    @pytest.mark.parametrize('field', list(DATE_INDEXES))
+    def test_period_filter_uses_the_date_index(self, analyzed, field):
+        rentang = periode_range('bulanan', 3, YEARS[0])
+        sql, params = _single_plan(lambda: Tiket.objects.filter(**rentang.filter_kwargs(field)).count())
+
+        assert DATE_INDEXES[field] in indexes_used(sql, params)
+
+    @pytest.mark.parametrize('url_name', list(REPORTS))
+    def test_report_filters_by_its_date_index(self, analyzed, client, url_name):
+        field, params = REPORTS[url_name]
+        client.force_login(_plan_user('admin'))
+
+        with capture_selects() as queries:
+            response = client.get(reverse(url_name), {**DATATABLES, **params})
+
+        assert response.status_code == 200
+        assert response.json()['recordsFiltered'] > 0
+        filtered = [(sql, sql_params) for sql, sql_params in queries if f'"{field}" >= ' in sql and f'"{field}" < ' in sql]
+        assert filtered
+        assert all(DATE_INDEXES[field] in indexes_used(sql, sql_params) for sql, sql_params in filtered)
@@ -0,0 +1,126 @@
+"""Tests for the versioned reference data cache and the endpoints using it."""
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from diamond_web.models import Kanwil, MediaBackup
+from diamond_web.tests.conftest import JenisDataILAPFactory, KanwilFactory, MediaBackupFactory
+from diamond_web.utils import reference_data
+from diamond_web.utils.reference_data import get_reference, reference_etag
+
+
+@pytest.mark.django_db
+class TestReferenceCache:
+    """Tests for get_reference and its invalidation."""
+
+    def test_second_read_hits_no_database(self):
+        KanwilFactory()
+        first = get_reference('kanwil')
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = get_reference('kanwil')
+
+        assert len(ctx.captured_queries) == 0
+        assert second == first
+
+    def test_shared_tier_survives_process_restart(self):
+        KanwilFactory()
+        get_reference('kanwil')
+        reference_data._local_state['values'] = {}
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert len(get_reference('kanwil')) == 1
+        assert len(ctx.captured_queries) == 0
+
+    def test_save_and_delete_invalidate(self):
+        kanwil = KanwilFactory()
+        assert [k['id'] for k in get_reference('kanwil')] == [kanwil.pk]
+        etag = reference_etag('x')
+
+        other = KanwilFactory()
+        assert {k['id'] for k in get_reference('kanwil')} == {kanwil.pk, other.pk}
+        assert reference_etag('x') != etag
+
+        other.delete()
+        assert [k['id'] for k in get_reference('kanwil')] == [kanwil.pk]
+
+    def test_bulk_write_needs_explicit_invalidation(self):
+        get_reference('kanwil')
+        Kanwil.objects.bulk_create([Kanwil(kode_kanwil='999', nama_kanwil='Bulk')])
+        assert get_reference('kanwil') == []
+
+        reference_data.invalidate_reference_data()
+        assert [k['nama_kanwil'] for k in get_reference('kanwil')] == ['Bulk']
+
+    def test_referensi_sync_invalidates(self, monkeypatch):
+        from diamond_web.utils.oracle_sync import OracleDataSyncService, OracleSyncBatchSummary
+
+        get_reference('media_backup')
+        MediaBackup.objects.bulk_create([MediaBackup(deskripsi='Synced')])
+        monkeypatch.setattr(OracleDataSyncService, '__init__', lambda self, **kwargs: None)
+        monkeypatch.setattr(
+            OracleDataSyncService, '_run_sequential',
+            lambda self, **kwargs: OracleSyncBatchSummary(0, 0, 0, 0, [], [], [], []),
+        )
+
+        OracleDataSyncService().sync()
+
+        assert [m['deskripsi'] for m in get_reference('media_backup')] == ['Synced']
+
+
+@pytest.mark.django_db
+class TestReferenceEndpoints:
+    """Dropdown endpoints serve cached options with ETags."""
+
+    def test_laporan_pide_filter_options_etag(self, client, admin_user):
+        jenis = JenisDataILAPFactory()
+        client.force_login(admin_user)
+        url = reverse('laporan_pide_filter_options')
+
+        response = client.get(url, {'id_ilap': str(jenis.id_ilap_id)})
+        assert response.status_code == 200
+        data = json.loads(response.content)
+        assert [i['id'] for i in data['ilaps']] == [jenis.id_ilap_id]
+        assert data['sub_jenis'] == [jenis.nama_sub_jenis_data]
+
+        cached = client.get(url, {'id_ilap': str(jenis.id_ilap_id)}, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert cached.status_code == 304
+
+        JenisDataILAPFactory(id_ilap=jenis.id_ilap)
+        refreshed = client.get(url, {'id_ilap': str(jenis.id_ilap_id)}, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert refreshed.status_code == 200
+        assert len(json.loads(refreshed.content)['jenis_data']) == 2
+
+    def test_monitoring_filter_options_cached(self, client, admin_user):
+        KanwilFactory()
+        client.force_login(admin_user)
+        url = reverse('monitoring_penyampaian_data_data')
+
+        first = client.get(url, {'get_filter_options': '1'})
+        assert first.status_code == 200
+        assert 'ETag' in first
+        assert len(json.loads(first.content)['filter_options']['kanwil']) == 1
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = client.get(url, {'get_filter_options': '1'})
+        assert second.json() == first.json()
+        master_tables = ('"kanwil"', '"kpp"', '"ilap"', '"media_backup"', '"dasar_hukum"')
+        assert not [q for q in ctx.captured_queries if any(t in q['sql'] for t in master_tables)]
+
+        assert client.get(url, {'get_filter_options': '1'}, HTTP_IF_NONE_MATCH=first['ETag']).status_code == 304
+
+    def test_monitoring_data_request_has_no_etag(self, client, admin_user):
+        client.force_login(admin_user)
+        response = client.get(reverse('monitoring_penyampaian_data_data'), {'draw': '1'})
+        assert response.status_code == 200
+        assert 'ETag' not in response
+
+    def test_rekam_form_media_backup_options(self, client, admin_user):
+        media = MediaBackupFactory()
+        client.force_login(admin_user)
+        response = client.get(reverse('tiket_rekam_create'))
+        assert response.status_code == 200
+        assert f'<option value="{media.id}">{media.deskripsi}</option>' in response.content.decode()
@@ -0,0 +1,177 @@
+"""Tests for the Register Penerimaan Data report (views/laporan_register_penerimaan.py)."""
+import os
+import time
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from diamond_web.models import DetilTandaTerima, KlasifikasiJenisData, TandaTerimaData, Tiket
+from diamond_web.tests.conftest import DasarHukumFactory, TiketFactory, UserFactory
+from diamond_web.views import laporan_register_penerimaan
+
+MARET_2024 = {'bulan': '3', 'tahun': '2024'}
+DATATABLES = {**MARET_2024, 'draw': '1', 'start': '0'}
+
+
+def _tikets(count, template):
+    """*count* tikets received in March 2024 sharing the references of *template*."""
+    return Tiket.objects.bulk_create([
+        Tiket(
+            nomor_tiket=f'REG{i:014d}',
+            status_tiket=1,
+            id_periode_data_id=template.id_periode_data_id,
+            periode=3,
+            tahun=2024,
+            id_bentuk_data_id=template.id_bentuk_data_id,
+            id_cara_penyampaian_id=template.id_cara_penyampaian_id,
+            baris_diterima=i,
+            tgl_terima_dip=datetime(2024, 3, 1 + i % 28, 9, 0),
+        )
+        for i in range(count)
+    ])
+
+
+def _tanda_terima(tiket, nomor, tanggal, active=True):
+    tanda_terima = TandaTerimaData.objects.create(
+        nomor_tanda_terima=nomor, tahun_terima=tanggal.year, tanggal_tanda_terima=tanggal,
+        id_ilap=tiket.id_periode_data.id_sub_jenis_data_ilap.id_ilap, id_perekam=UserFactory(), active=active,
+    )
+    DetilTandaTerima.objects.create(id_tanda_terima=tanda_terima, id_tiket=tiket)
+
+
+@pytest.fixture
+def template(db):
+    """A March 2024 tiket whose sub jenis data has two dasar hukum."""
+    tiket = TiketFactory(tgl_terima_dip=datetime(2024, 3, 31, 23, 0), baris_diterima=7,
+                         nomor_surat_pengantar='S-1/2024', tanggal_surat_pengantar=datetime(2024, 3, 30))
+    sub_jenis = tiket.id_periode_data.id_sub_jenis_data_ilap
+    for deskripsi in ('UU 28/2007', 'PP 31/2012'):
+        KlasifikasiJenisData.objects.create(
+            id_sub_jenis_data=sub_jenis, id_klasifikasi_tabel=DasarHukumFactory(deskripsi=deskripsi),
+        )
+    return tiket
+
+
+def _page(client, length):
+    return client.get(reverse('register_penerimaan_data_data'), {**DATATABLES, 'length': str(length)})
+
+
+@pytest.mark.django_db
+class TestRegisterRows:
+    def test_row_columns(self, client, admin_user, template):
+        _tanda_terima(template, 12, datetime(2024, 4, 2, 8, 0))
+        TiketFactory(tgl_terima_dip=datetime(2024, 4, 1), id_periode_data=template.id_periode_data)
+        client.force_login(admin_user)
+
+        response = _page(client, 10).json()
+
+        assert response['recordsTotal'] == 1
+        row, = response['data']
+        sub_jenis = template.id_periode_data.id_sub_jenis_data_ilap
+        assert row == {
+            'no': 1,
+            'nama_ilap': sub_jenis.id_ilap.nama_ilap,
+            'dasar_hukum': 'UU 28/2007, PP 31/2012',
+            'jenis_data_ilap': sub_jenis.nama_jenis_data,
+            'bentuk_data': template.id_bentuk_data.deskripsi,
+            'periode_tahun_data': row['periode_tahun_data'],
+            'jumlah_data_diterima': 7,
+            'nomor_surat_pengantar': 'S-1/2024',
+            'tanggal_surat_pengantar': '30/03/2024',
+            'nomor_tanda_terima': '00012.TTD/PJ.1031/2024',
+            'tanggal_tanda_terima': '02/04/2024',
+        }
+
+    def test_earliest_tanda_terima_is_shown(self, client, admin_user, template):
+        _tanda_terima(template, 2, datetime(2024, 4, 5))
+        _tanda_terima(template, 1, datetime(2024, 4, 1))
+        _tanda_terima(template, 3, datetime(2024, 4, 9))
+        client.force_login(admin_user)
+
+        row, = _page(client, 10).json()['data']
+
+        assert (row['nomor_tanda_terima'], row['tanggal_tanda_terima']) == ('00001.TTD/PJ.1031/2024', '01/04/2024')
+
+    def test_earliest_tanda_terima_is_shown_even_if_inactive(self, client, admin_user, template):
+        _tanda_terima(template, 2, datetime(2024, 4, 5))
+        _tanda_terima(template, 1, datetime(2024, 4, 1), active=False)
+        client.force_login(admin_user)
+
+        row, = _page(client, 10).json()['data']
+
+        assert (row['nomor_tanda_terima'], row['tanggal_tanda_terima']) == ('00001.TTD/PJ.1031/2024', '01/04/2024')
+
+    def test_without_tanda_terima_or_dasar_hukum(self, client, admin_user):
+        TiketFactory(tgl_terima_dip=datetime(2024, 3, 5))
+        client.force_login(admin_user)
+
+        row, = _page(client, 10).json()['data']
+
+        assert (row['dasar_hukum'], row['nomor_tanda_terima'], row['tanggal_tanda_terima']) == ('-', '-', '-')
+
+
+@pytest.mark.django_db
+class TestRegisterQueryCount:
+    """The page and the export run a fixed number of queries."""
+
+    def test_1k_row_page(self, client, admin_user, template):
+        client.force_login(admin_user)
+        with CaptureQueriesContext(connection) as overhead:
+            client.get(reverse('register_penerimaan_data_data'))
+        _tikets(999, template)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = _page(client, 1000).json()
+
+        assert len(response['data']) == 1000
+        # count, page, dasar hukum prefetch
+        assert len(ctx) == len(overhead) + 3
+
+    def test_export_queries_per_chunk(self, client, admin_user, template, monkeypatch):
+        monkeypatch.setattr(laporan_register_penerimaan, 'EXPORT_CHUNK_SIZE', 2)
+        _tanda_terima(template, 4, datetime(2024, 4, 2))
+        _tikets(4, template)
+        client.force_login(admin_user)
+        with CaptureQueriesContext(connection) as overhead:
+            client.get(reverse('register_penerimaan_data_data'))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(reverse('register_penerimaan_export'), MARET_2024)
+            content = b''.join(response.streaming_content)
+
+        # one query for the tikets, one dasar hukum prefetch per chunk of 2
+        assert len(ctx) == len(overhead) + 1 + 3
+        sheet = load_workbook(BytesIO(content)).active
+        assert sheet['A1'].value == 'Register Penerimaan Data - Maret 2024'
+        assert [cell.value for cell in sheet[2]] == laporan_register_penerimaan.REGISTER_HEADERS
+        assert sheet.max_row == 2 + 5
+        last = [cell.value for cell in sheet[7]]
+        assert last[0] == 5 and last[2] == 'UU 28/2007, PP 31/2012'
+        assert last[9:] == ['00004.TTD/PJ.1031/2024', '02/04/2024']
+        assert 'Register_Penerimaan_Data_Maret_2024.xlsx' in response['Content-Disposition']
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='set RUN_BENCHMARKS=1 to run benchmarks')
+def test_benchmark_register_export_50k(client, admin_user, template):
+    """Export 50k tikets (prints timing; the query count is pinned)."""
+    _tikets(49_999, template)
+    client.force_login(admin_user)
+    with CaptureQueriesContext(connection) as overhead:
+        client.get(reverse('register_penerimaan_data_data'))
+
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse('register_penerimaan_export'), MARET_2024)
+        size = sum(len(chunk) for chunk in response.streaming_content)
+    seconds = time.perf_counter() - started
+
+    print(f'\nRegister penerimaan export: 50k tiket in {seconds:.1f}s, {size / 1e6:.1f} MB, {len(ctx)} queries')
+    chunks = -(-50_000 // laporan_register_penerimaan.EXPORT_CHUNK_SIZE)
+    assert len(ctx) == len(overhead) + 1 + chunks
@@ -0,0 +1,198 @@
+"""Tests for the persisted SLA columns (deadlines and prioritas) of Tiket."""
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from django.contrib.auth.models import Group
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from diamond_web.constants.tiket_status import STATUS_PENGENDALIAN_MUTU
+from diamond_web.models import Tiket, TiketPIC
+from diamond_web.tests.conftest import (
+    DurasiJatuhTempoFactory,
+    JenisPrioritasDataFactory,
+    PeriodeJenisDataFactory,
+    TiketFactory,
+    TiketPICFactory,
+    UserFactory,
+)
+from diamond_web.utils.sla import SlaRules, compute_sla, recompute_sla
+
+
+def _group(name):
+    return Group.objects.get_or_create(name=name)[0]
+
+
+def _durasi(sub_jenis, seksi, durasi, start, end=None):
+    return DurasiJatuhTempoFactory(
+        id_sub_jenis_data=sub_jenis, seksi=_group(seksi), durasi=durasi, start_date=start, end_date=end,
+    )
+
+
+class TestSlaRules:
+    """Pure computation, no database."""
+
+    rules = SlaRules(
+        durasi={
+            (1, 'user_pmde'): [
+                (date(2025, 6, 1), None, 10),
+                (date(2025, 1, 1), date(2025, 5, 31), 5),
+            ],
+            (1, 'user_pide'): [(date(2025, 1, 1), None, 0)],
+        },
+        prioritas={1: [(date(2025, 3, 1), date(2025, 3, 31)), (date(2025, 7, 1), None)]},
+    )
+
+    def test_durasi_valid_on_base_date(self):
+        assert self.rules.deadline(1, 'user_pmde', datetime(2025, 2, 10, 15, 0)) == date(2025, 2, 15)
+        assert self.rules.deadline(1, 'user_pmde', datetime(2025, 6, 1)) == date(2025, 6, 11)
+        assert self.rules.deadline(1, 'user_pmde', date(2024, 12, 31)) is None
+
+    def test_missing_date_or_zero_durasi_has_no_deadline(self):
+        assert self.rules.deadline(1, 'user_pmde', None) is None
+        assert self.rules.deadline(1, 'user_pide', datetime(2025, 2, 1)) is None
+        assert self.rules.deadline(2, 'user_pmde', datetime(2025, 2, 1)) is None
+
+    def test_prioritas_needs_closed_range(self):
+        values = compute_sla(self.rules, 1, None, None, datetime(2025, 3, 15))
+        assert values == {'deadline_identifikasi': None, 'deadline_pengendalian': None, 'is_prioritas': True}
+        assert not self.rules.is_prioritas(1, datetime(2025, 8, 1))
+
+
+@pytest.mark.django_db
+class TestSlaMaintenance:
+    """The stored columns follow tiket dates and rule changes."""
+
+    def test_tiket_dates_drive_deadlines(self):
+        tiket = TiketFactory(tgl_terima_dip=datetime(2025, 3, 1))
+        sub_jenis = tiket.id_periode_data.id_sub_jenis_data_ilap
+        _durasi(sub_jenis, 'user_pmde', 7, date(2025, 1, 1))
+        _durasi(sub_jenis, 'user_pide', 3, date(2025, 1, 1))
+
+        tiket = Tiket.objects.get(pk=tiket.pk)
+        tiket.tgl_rekam_pide = datetime(2025, 3, 2, 9, 0)
+        tiket.tgl_transfer = datetime(2025, 3, 10, 9, 0)
+        tiket.save()
+
+        stored = Tiket.objects.values('deadline_identifikasi', 'deadline_pengendalian').get(pk=tiket.pk)
+        assert stored == {'deadline_identifikasi': date(2025, 3, 5), 'deadline_pengendalian': date(2025, 3, 17)}
+        assert tiket.deadline_pengendalian == date(2025, 3, 17)
+
+    def test_save_without_date_change_costs_no_sla_query(self):
+        tiket = Tiket.objects.get(pk=TiketFactory().pk)
+        tiket.nama_pengirim = 'Lain'
+        with CaptureQueriesContext(connection) as ctx:
+            tiket.save()
+        assert not [q for q in ctx.captured_queries if 'FROM "durasi_jatuh_tempo"' in q['sql']]
+
+    def test_rule_changes_recompute_existing_tikets(self):
+        tiket = TiketFactory(tgl_transfer=datetime(2025, 3, 10), tgl_terima_dip=datetime(2025, 3, 1))
+        sub_jenis = tiket.id_periode_data.id_sub_jenis_data_ilap
+
+        durasi = _durasi(sub_jenis, 'user_pmde', 7, date(2025, 1, 1))
+        assert Tiket.objects.get(pk=tiket.pk).deadline_pengendalian == date(2025, 3, 17)
+
+        durasi.durasi = 14
+        durasi.save()
+        assert Tiket.objects.get(pk=tiket.pk).deadline_pengendalian == date(2025, 3, 24)
+
+        durasi.delete()
+        assert Tiket.objects.get(pk=tiket.pk).deadline_pengendalian is None
+
+        prioritas = JenisPrioritasDataFactory(
+            id_sub_jenis_data_ilap=sub_jenis, start_date=date(2025, 2, 1), end_date=date(2025, 4, 1),
+        )
+        assert Tiket.objects.get(pk=tiket.pk).is_prioritas is True
+        prioritas.end_date = date(2025, 2, 15)
+        prioritas.save()
+        assert Tiket.objects.get(pk=tiket.pk).is_prioritas is False
+
+    def test_check_command_reports_and_fixes_drift(self):
+        tiket = TiketFactory(tgl_transfer=datetime(2025, 3, 10))
+        _durasi(tiket.id_periode_data.id_sub_jenis_data_ilap, 'user_pmde', 7, date(2025, 1, 1))
+        call_command('check_sla_deadlines')
+
+        Tiket.objects.filter(pk=tiket.pk).update(deadline_pengendalian=None)
+        with pytest.raises(CommandError, match='1 tiket'):
+            call_command('check_sla_deadlines')
+
+        call_command('check_sla_deadlines', '--fix')
+        assert Tiket.objects.get(pk=tiket.pk).deadline_pengendalian == date(2025, 3, 17)
+        assert recompute_sla() == 0
+
+
+@pytest.mark.django_db
+class TestQualityControlUsesSlaColumns:
+    """quality_control_data sorts and filters on the stored columns."""
+
+    def _pmde_tiket(self, user, periode_data, transfer):
+        tiket = TiketFactory(
+            status_tiket=STATUS_PENGENDALIAN_MUTU, id_periode_data=periode_data,
+            id_jenis_prioritas_data=None, tgl_transfer=transfer,
+        )
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=TiketPIC.Role.PMDE, active=True)
+        return tiket
+
+    def test_sort_and_prioritas_filter(self, client):
+        user = UserFactory()
+        user.groups.add(_group('user_pmde'))
+        periode_data = PeriodeJenisDataFactory()
+        _durasi(periode_data.id_sub_jenis_data_ilap, 'user_pmde', 2, date(2000, 1, 1))
+        late = self._pmde_tiket(user, periode_data, datetime(2025, 3, 20))
+        early = self._pmde_tiket(user, periode_data, datetime(2025, 3, 5))
+        Tiket.objects.filter(pk=late.pk).update(is_prioritas=True)
+        client.force_login(user)
+        url = reverse('quality_control_data')
+
+        data = client.get(url, {'order[0][column]': '9', 'order[0][dir]': 'asc'}).json()['data']
+        assert [row['nomor_tiket'] for row in data] == [early.nomor_tiket, late.nomor_tiket]
+        assert data[0]['deadline'] == {'display': '07/03/2025', 'sort': '2025-03-07'}
+
+        data = client.get(url, {'columns_search[]': [''] * 10 + ['ya']}).json()['data']
+        assert [(row['nomor_tiket'], row['prioritas']) for row in data] == [(late.nomor_tiket, 'Ya')]
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='set RUN_BENCHMARKS=1 to run benchmarks')
+def test_benchmark_sla_100k_tikets():
+    """Recompute and deadline-sorted page on 100k synthetic tikets (prints timings)."""
+    template = TiketFactory(tgl_transfer=datetime(2025, 1, 1))
+    sub_jenis = template.id_periode_data.id_sub_jenis_data_ilap
+    _durasi(sub_jenis, 'user_pmde', 7, date(2024, 1, 1), date(2025, 6, 30))
+    _durasi(sub_jenis, 'user_pmde', 10, date(2025, 7, 1))
+
+    base = datetime(2025, 1, 1)
+    Tiket.objects.bulk_create([
+        Tiket(
+            nomor_tiket=f'BENCH{i:012d}',
+            status_tiket=STATUS_PENGENDALIAN_MUTU,
+            id_periode_data_id=template.id_periode_data_id,
+            periode=1,
+            tahun=2025,
+            id_bentuk_data_id=template.id_bentuk_data_id,
+            id_cara_penyampaian_id=template.id_cara_penyampaian_id,
+            baris_diterima=1,
+            tgl_terima_dip=base,
+            tgl_transfer=base + timedelta(minutes=7 * i),
+        )
+        for i in range(100_000)
+    ], batch_size=5000)
+
+    started = time.perf_counter()
+    updated = recompute_sla()
+    recompute_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    page = list(Tiket.objects.filter(
+        status_tiket=STATUS_PENGENDALIAN_MUTU, is_prioritas=False
+    ).order_by('deadline_pengendalian').values_list('id', flat=True)[:100])
+    page_seconds = time.perf_counter() - started
+
+    print(f'\nSLA recompute: {updated} tiket in {recompute_seconds:.2f}s; sorted page in {page_seconds * 1000:.1f}ms')
+    assert updated >= 100_000
+    assert len(page) == 100
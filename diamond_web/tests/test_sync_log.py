@@ -0,0 +1,302 @@
+"""Tests for the SyncRun catalog, buffered failed-row writer and log rotation."""
+import builtins
+import csv
+import gzip
+import importlib
+import os
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from diamond_web.models import SyncRun
+from diamond_web.utils import sync_log
+from diamond_web.views.sync_data_referensi import _sync_referensi_data
+
+
+@pytest.fixture
+def logs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync_log, 'SYNC_LOGS_DIR', str(tmp_path))
+    status_module = importlib.import_module('diamond_web.views.sync_log_status')
+    monkeypatch.setattr(status_module, 'SYNC_LOGS_DIR', str(tmp_path))
+    return tmp_path
+
+
+class TestFailedRowWriter:
+    """Tests for FailedRowWriter."""
+
+    def test_rows_are_flushed_in_batches(self, logs_dir, monkeypatch):
+        path = str(logs_dir / 'failed.csv')
+        opens = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            if file == path:
+                opens.append(file)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, 'open', counting_open)
+        with sync_log.FailedRowWriter(path, ['Row', 'Error'], flush_every=10) as writer:
+            for i in range(25):
+                writer.writerow([i, f'error {i}'])
+
+        monkeypatch.setattr(builtins, 'open', real_open)
+        assert len(opens) == 3
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ['Timestamp', 'Row', 'Error']
+        assert len(rows) == 26
+        assert rows[-1][1:] == ['24', 'error 24']
+        assert writer.rows_written == 25
+
+    def test_no_file_without_rows(self, logs_dir):
+        path = str(logs_dir / 'failed.csv')
+        with sync_log.FailedRowWriter(path, ['Row']):
+            pass
+        assert not os.path.exists(path)
+
+    def test_referensi_sync_writes_failed_rows(self, logs_dir):
+        class Summary:
+            errors = ['boom']
+            table_summaries = []
+
+            def as_dict(self):
+                return {'errors': self.errors}
+
+        class Service:
+            def sync(self, progress_callback=None):
+                return Summary()
+
+        result = _sync_referensi_data(Service(), sync_id='abc')
+
+        assert result['has_error_log'] is True
+        path = sync_log.failed_rows_path(sync_log.REFERENSI_FAILED_ROWS_PREFIX, 'abc')
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[1][1:] == ['1', 'Error 1', 'Sync Error', 'boom']
+
+
+@pytest.mark.django_db
+class TestSyncRunCatalog:
+    """Tests for start_run/finish_run and rotation."""
+
+    def test_finish_run_records_counts_and_error_file(self, logs_dir, admin_user):
+        run = sync_log.start_run(sync_log.TIKET_SYNC, 'run-1', user=admin_user)
+        error_file = sync_log.failed_rows_path(sync_log.TIKET_FAILED_ROWS_PREFIX, 'run-1')
+        with open(error_file, 'w') as f:
+            f.write('x')
+
+        sync_log.finish_run(
+            run,
+            summary={'source_rows': 10, 'inserts': 4, 'updates': 3, 'errors': ['a', 'b']},
+            error_file_path=error_file,
+        )
+
+        run.refresh_from_db()
+        assert run.status == SyncRun.STATUS_SUCCESS
+        assert (run.source_rows, run.inserts, run.updates, run.error_count) == (10, 4, 3, 2)
+        assert run.error_file_path == error_file
+        assert run.triggered_by == admin_user
+        assert run.duration_seconds is not None
+
+    def test_finish_run_failed_and_stopped(self, logs_dir):
+        failed = sync_log.finish_run(sync_log.start_run(sync_log.TIKET_SYNC, 'f'), error='boom')
+        stopped = sync_log.finish_run(sync_log.start_run(sync_log.TIKET_CHECK, 's'), error='stop', stopped=True)
+        assert failed.status == SyncRun.STATUS_FAILED
+        assert failed.error_file_path is None
+        assert stopped.status == SyncRun.STATUS_STOPPED
+
+    def test_rotate_compresses_then_expires(self, logs_dir):
+        log_path = str(logs_dir / 'tiket_sync_2026-01-01_09-00-00.log')
+        with open(log_path, 'w') as f:
+            f.write('hello')
+        now = timezone.now()
+        run = SyncRun.objects.create(
+            run_id='old', sync_type=sync_log.TIKET_SYNC, status=SyncRun.STATUS_SUCCESS,
+            started_at=now - timedelta(days=10), finished_at=now - timedelta(days=10),
+            log_path=log_path,
+        )
+
+        assert sync_log.rotate_sync_logs(now=now, compress_after_days=7, retention_days=90) == (1, 0)
+        run.refresh_from_db()
+        assert run.compressed
+        assert run.log_path == log_path + '.gz'
+        assert not os.path.exists(log_path)
+        with gzip.open(run.log_path, 'rt') as f:
+            assert f.read() == 'hello'
+
+        assert sync_log.rotate_sync_logs(now=now, compress_after_days=7, retention_days=5) == (0, 1)
+        run.refresh_from_db()
+        assert run.log_path is None
+        assert not os.path.exists(log_path + '.gz')
+
+    def test_failed_compression_is_retried(self, logs_dir, monkeypatch):
+        log_path = str(logs_dir / 'tiket_sync_2026-01-01_09-00-00.log')
+        with open(log_path, 'w') as f:
+            f.write('hello')
+        now = timezone.now()
+        run = SyncRun.objects.create(
+            run_id='old', sync_type=sync_log.TIKET_SYNC, status=SyncRun.STATUS_SUCCESS,
+            started_at=now - timedelta(days=10), finished_at=now - timedelta(days=10),
+            log_path=log_path,
+        )
+
+        def disk_full(src, dst):
+            dst.write(b'hel')
+            raise OSError('No space left on device')
+
+        with monkeypatch.context() as patched:
+            patched.setattr(sync_log.shutil, 'copyfileobj', disk_full)
+            assert sync_log.rotate_sync_logs(now=now, compress_after_days=7, retention_days=90) == (0, 0)
+        run.refresh_from_db()
+        assert (run.compressed, run.log_path) == (False, log_path)
+        assert os.path.exists(log_path)
+        assert not os.path.exists(log_path + '.gz')
+
+        assert sync_log.rotate_sync_logs(now=now, compress_after_days=7, retention_days=90) == (1, 0)
+        run.refresh_from_db()
+        assert (run.compressed, run.log_path) == (True, log_path + '.gz')
+
+    def test_import_existing_registers_files_once(self, logs_dir):
+        (logs_dir / 'daily_sync_2026-03-01_09-00-00.log').write_text('x')
+        (logs_dir / 'sync_failed_rows_0a1b2c3d-0000-0000-0000-000000000000.csv').write_text('x')
+        (logs_dir / 'cleanup_pre_production_error.log').write_text('x')
+        (logs_dir / 'unrelated.txt').write_text('x')
+
+        call_command('rotate_sync_logs', '--import-existing', stdout=open(os.devnull, 'w'))
+        call_command('rotate_sync_logs', '--import-existing', stdout=open(os.devnull, 'w'))
+
+        assert SyncRun.objects.count() == 3
+        assert SyncRun.objects.filter(sync_type='cleanup_pre_production_error').exists()
+        daily = SyncRun.objects.get(sync_type='daily_sync')
+        assert daily.started_at.date().isoformat() == '2026-03-01'
+        assert SyncRun.objects.get(sync_type=sync_log.TIKET_SYNC).error_file_path.endswith('.csv')
+
+
+@pytest.mark.django_db
+class TestCatalogSyncLogCommand:
+    """Cron scripts record their runs through catalog_sync_log."""
+
+    def _catalog(self, *args):
+        call_command('catalog_sync_log', *args, stdout=open(os.devnull, 'w'))
+
+    def test_daily_sync_run_shows_on_status_page(self, client, admin_user, logs_dir):
+        log_path = str(logs_dir / 'daily_sync_2026-10-19_09-00-00.log')
+        self._catalog('start', log_path, '--type', 'daily_sync')
+        assert SyncRun.objects.get().status == SyncRun.STATUS_RUNNING
+        with open(log_path, 'w') as f:
+            f.write('Daily Oracle sync selesai')
+        self._catalog('finish', log_path, '--type', 'daily_sync', '--exit-code', '0')
+        client.force_login(admin_user)
+
+        response = client.get(reverse('sync_log_status'))
+
+        latest, = response.context['latest_logs']
+        assert (latest.sync_type_display, latest.status, latest.log_path) == (
+            'Daily Sync', SyncRun.STATUS_SUCCESS, log_path,
+        )
+        assert latest.run_id == sync_log.file_run_id(log_path)
+        assert 'daily_sync_2026-10-19_09-00-00.log' in response.content.decode()
+
+    def test_failed_run_and_one_shot_error_log(self, logs_dir):
+        log_path = str(logs_dir / 'cleanup_exec_2026-07-01_00-00-00.log')
+        self._catalog('start', log_path, '--type', 'cleanup_exec')
+        self._catalog('finish', log_path, '--exit-code', '2')
+        error_log = str(logs_dir / 'cleanup_pre_production_error_2026-07-01_00-00-00.log')
+        self._catalog('finish', error_log, '--type', 'cleanup_pre_production_error', '--exit-code', '1',
+                      '--message', 'Cleanup already running')
+
+        runs = {run.sync_type: run for run in SyncRun.objects.all()}
+        assert (runs['cleanup_exec'].status, runs['cleanup_exec'].message) == (SyncRun.STATUS_FAILED, 'Exit code 2')
+        assert runs['cleanup_pre_production_error'].message == 'Cleanup already running'
+        assert runs['cleanup_pre_production_error'].finished_at is not None
+
+    def test_finish_without_start_needs_a_type(self, logs_dir):
+        with pytest.raises(CommandError):
+            self._catalog('finish', str(logs_dir / 'daily_sync_2026-10-19_09-00-00.log'))
+
+
+@pytest.mark.django_db
+class TestFailedRowsDownload:
+    """The failed-rows downloads follow the catalog path through rotation."""
+
+    @pytest.mark.parametrize('prefix, url_name', [
+        (sync_log.TIKET_FAILED_ROWS_PREFIX, 'sync_tiket_download_errors'),
+        (sync_log.REFERENSI_FAILED_ROWS_PREFIX, 'oracle_sync_download_errors'),
+    ])
+    def test_download_after_rotation(self, client, admin_user, logs_dir, prefix, url_name):
+        run_id = '6f1c2a9e-0d3b-4c55-9a8e-2b7f4d1e0c11'
+        path = sync_log.failed_rows_path(prefix, run_id)
+        with sync_log.FailedRowWriter(path, ['Row Number', 'Error Reason']) as writer:
+            writer.writerow([7, 'NPWP kosong'])
+        with open(path, 'rb') as f:
+            content = f.read()
+        run = sync_log.finish_run(sync_log.start_run(sync_log.TIKET_SYNC, run_id), error_file_path=path)
+        sync_log.rotate_sync_logs(now=run.finished_at + timedelta(days=8), compress_after_days=7)
+        run.refresh_from_db()
+        assert run.error_file_path == path + '.gz' and not os.path.exists(path)
+        client.force_login(admin_user)
+        url = reverse(url_name, kwargs={'sync_id': run_id})
+
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'text/csv'
+        assert b''.join(response.streaming_content) == content
+
+        sync_log.rotate_sync_logs(now=run.finished_at + timedelta(days=91), retention_days=90)
+        assert client.get(url).status_code == 404
+
+
+@pytest.mark.django_db
+class TestSyncLogStatusView:
+    """Tests for the catalog-backed sync status page."""
+
+    def _make_runs(self, sync_type, count):
+        now = timezone.now()
+        SyncRun.objects.bulk_create([
+            SyncRun(run_id=f'{sync_type}-{i}', sync_type=sync_type, status=SyncRun.STATUS_SUCCESS,
+                    started_at=now - timedelta(hours=i), finished_at=now - timedelta(hours=i))
+            for i in range(count)
+        ])
+
+    def test_latest_per_type_and_pagination(self, client, admin_user, logs_dir):
+        self._make_runs(sync_log.TIKET_SYNC, 30)
+        self._make_runs(sync_log.REFERENSI_SYNC, 3)
+        client.force_login(admin_user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(reverse('sync_log_status'))
+
+        assert response.status_code == 200
+        # count + history page + latest-per-type, independent of the number of runs
+        assert len([q for q in ctx.captured_queries if '"sync_run"' in q['sql']]) == 3
+        latest = response.context['latest_logs']
+        assert [run.run_id for run in latest] == [f'{sync_log.REFERENSI_SYNC}-0', f'{sync_log.TIKET_SYNC}-0']
+        page = response.context['page_obj']
+        assert page.paginator.count == 33
+        assert len(page.object_list) == 25
+
+        response = client.get(reverse('sync_log_status'), {'type': sync_log.REFERENSI_SYNC})
+        assert response.context['page_obj'].paginator.count == 3
+
+    def test_does_not_list_directory(self, client, admin_user, logs_dir, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError('sync_logs directory must not be listed')
+
+        monkeypatch.setattr(os, 'listdir', fail)
+        monkeypatch.setattr(os, 'scandir', fail)
+        client.force_login(admin_user)
+        assert client.get(reverse('sync_log_status')).status_code == 200
+
+    def test_download_compressed_log(self, client, admin_user, logs_dir):
+        (logs_dir / 'tiket_sync_2026-01-01_09-00-00.log.gz').write_bytes(gzip.compress(b'x'))
+        client.force_login(admin_user)
+        response = client.get(reverse('sync_log_download', kwargs={'filename': 'tiket_sync_2026-01-01_09-00-00.log.gz'}))
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/gzip'
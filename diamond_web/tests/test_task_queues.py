@@ -0,0 +1,150 @@
+"""Tests for Celery queue routing/limits and the singleton sync lock."""
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from config.celery import app, configure_queue_worker, queue_for_task
+from diamond_web import tasks
+from diamond_web.models import SyncRun
+from diamond_web.utils.job_state import JobState, SYNC_TIKET, SYNC_REFERENSI
+from diamond_web.utils.task_lock import LockBusyError, SingletonLock
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestQueueTopology:
+    """Routing, per-queue time limits and worker concurrency."""
+
+    @pytest.mark.parametrize('task_name, queue', [
+        ('diamond_web.tasks.sync_tiket_data_task', 'sync'),
+        ('diamond_web.tasks.sync_referensi_data_task', 'sync'),
+        ('diamond_web.tasks.check_tiket_data_task', 'check'),
+        ('diamond_web.tasks.check_referensi_data_task', 'check'),
+        ('diamond_web.tasks.cleanup_pre_production_task', 'cleanup'),
+        ('diamond_web.tasks.generate_documents_task', 'documents'),
+        ('diamond_web.tasks.something_else', 'default'),
+    ])
+    def test_routes(self, task_name, queue):
+        assert queue_for_task(task_name) == queue
+        assert app.amqp.router.route({}, task_name)['queue'].name == queue
+
+    def test_time_limits_follow_queue(self):
+        app.finalize()
+        sync_task = app.tasks['diamond_web.tasks.sync_tiket_data_task']
+        check_task = app.tasks['diamond_web.tasks.check_tiket_data_task']
+        assert sync_task.time_limit == settings.TASK_QUEUE_CONFIG['sync']['time_limit']
+        assert sync_task.soft_time_limit == settings.TASK_QUEUE_CONFIG['sync']['soft_time_limit']
+        assert check_task.time_limit == settings.TASK_QUEUE_CONFIG['check']['time_limit']
+
+    def test_single_queue_worker_uses_queue_concurrency(self):
+        class Conf:
+            worker_concurrency = None
+
+        conf = Conf()
+        configure_queue_worker(conf=conf, options={'queues': 'cleanup'})
+        assert conf.worker_concurrency == settings.TASK_QUEUE_CONFIG['cleanup']['concurrency']
+
+        conf = Conf()
+        configure_queue_worker(conf=conf, options={'queues': 'sync,check'})
+        assert conf.worker_concurrency is None
+
+        conf = Conf()
+        configure_queue_worker(conf=conf, options={'queues': ['sync'], 'concurrency': 8})
+        assert conf.worker_concurrency is None
+
+
+class TestSingletonLock:
+    """Tests for SingletonLock."""
+
+    def test_second_owner_is_rejected_until_release(self):
+        first = SingletonLock(SYNC_TIKET, owner='a')
+        second = SingletonLock(SYNC_TIKET, owner='b')
+        assert first.acquire()
+        assert not second.acquire()
+        assert second.holder() == 'a'
+
+        second.release()  # not the owner: no effect
+        assert first.holder() == 'a'
+
+        first.release()
+        assert second.acquire()
+
+    def test_context_manager_raises_when_busy(self):
+        with SingletonLock(SYNC_TIKET, owner='a'):
+            with pytest.raises(LockBusyError):
+                with SingletonLock(SYNC_TIKET, owner='b'):
+                    pass
+        assert SingletonLock(SYNC_TIKET).holder() is None
+
+    def test_types_do_not_block_each_other(self):
+        assert SingletonLock(SYNC_TIKET, owner='a').acquire()
+        assert SingletonLock(SYNC_REFERENSI, owner='b').acquire()
+
+
+@pytest.mark.django_db
+class TestSyncTasksUseLock:
+    """Sync tasks, views and commands refuse to overlap a running sync."""
+
+    def test_task_skips_when_same_type_running(self, monkeypatch):
+        SingletonLock(SYNC_TIKET, owner='running').acquire()
+        called = []
+        monkeypatch.setattr('diamond_web.views.sync_tiket._sync_tiket_data', lambda *a, **k: called.append(1))
+
+        tasks.sync_tiket_data_task.run('new-sync')
+
+        state = JobState(SYNC_TIKET, 'new-sync').read()
+        assert state['done'] is True
+        assert 'running' in state['error']
+        assert not called
+        assert not SyncRun.objects.filter(run_id='new-sync').exists()
+        assert SingletonLock(SYNC_TIKET).holder() == 'running'
+
+    def test_task_releases_lock_after_run(self, monkeypatch):
+        monkeypatch.setattr('diamond_web.utils.oracle_sync.OracleDataSyncService.__init__', lambda self, **k: None)
+        monkeypatch.setattr(
+            'diamond_web.views.sync_tiket._sync_tiket_data',
+            lambda *a, **k: {'source_rows': 1, 'inserts': 1, 'updates': 0, 'errors': []},
+        )
+
+        tasks.sync_tiket_data_task.run('sync-1')
+
+        assert SingletonLock(SYNC_TIKET).holder() is None
+        assert SyncRun.objects.get(run_id='sync-1').status == SyncRun.STATUS_SUCCESS
+
+    def test_run_view_returns_409_while_locked(self, client, admin_user):
+        SingletonLock(SYNC_TIKET, owner='running').acquire()
+        client.force_login(admin_user)
+        response = client.post(reverse('sync_tiket_run'))
+        assert response.status_code == 409
+        assert response.json()['active_sync_id'] == 'running'
+
+    @pytest.mark.parametrize('command, target', [
+        ('sync_tiket_data', 'diamond_web.management.commands.sync_tiket_data._sync_tiket_data'),
+        ('sync_oracle_data', 'diamond_web.utils.oracle_sync.OracleDataSyncService.sync'),
+    ])
+    def test_command_closes_its_run_on_unexpected_errors(self, monkeypatch, command, target):
+        monkeypatch.setattr('diamond_web.utils.oracle_sync.OracleDataSyncService.__init__', lambda self, **k: None)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError('koneksi terputus')
+
+        monkeypatch.setattr(target, fail)
+
+        with pytest.raises(RuntimeError):
+            call_command(command)
+
+        run = SyncRun.objects.get()
+        assert (run.status, run.message) == (SyncRun.STATUS_FAILED, 'koneksi terputus')
+        assert run.finished_at is not None
+
+    def test_command_fails_while_locked(self):
+        SingletonLock(SYNC_REFERENSI, owner='running').acquire()
+        with pytest.raises(CommandError, match='sedang berjalan'):
+            call_command('sync_oracle_data')
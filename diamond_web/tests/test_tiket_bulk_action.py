@@ -0,0 +1,245 @@
+"""Tests for the bulk workflow actions on the tiket list (views/tiket/bulk_action.py)."""
+import json
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+
+from diamond_web.constants.tiket_action_types import TiketActionType
+from diamond_web.constants.tiket_status import (
+    STATUS_DIBATALKAN,
+    STATUS_DIKIRIM_KE_PIDE,
+    STATUS_DITELITI,
+    STATUS_IDENTIFIKASI,
+    STATUS_PENGENDALIAN_MUTU,
+    STATUS_SELESAI,
+)
+from diamond_web.models import Tiket, TiketAction, TiketPIC
+from diamond_web.services import tiket_workflow
+from diamond_web.tests.conftest import TiketFactory, TiketPICFactory
+
+
+def _tiket(status, user=None, role=TiketPIC.Role.PIDE, **kwargs):
+    """A tiket in *status*; *user* (if given) is its active PIC of *role*.
+
+    Tikets of one test share their reference rows: the factories draw random
+    words for unique names, which collide now and then.
+    """
+    kwargs.setdefault('baris_lengkap', 10)
+    first = Tiket.objects.select_related('id_periode_data', 'id_jenis_prioritas_data').first()
+    if first is not None:
+        kwargs.setdefault('id_periode_data', first.id_periode_data)
+        kwargs.setdefault('id_jenis_prioritas_data', first.id_jenis_prioritas_data)
+    tiket = TiketFactory(
+        status_tiket=status,
+        baris_diterima=10,
+        tgl_terima_dip=datetime(2024, 1, 1),
+        tgl_teliti=datetime(2024, 1, 15),
+        tgl_kirim_pide=datetime(2024, 1, 20),
+        tgl_rekam_pide=datetime(2024, 1, 25),
+        **kwargs,
+    )
+    if user is not None:
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=role, active=True)
+    return tiket
+
+
+def _post(client, action, tiket_ids, values=None, rows=None):
+    return client.post(
+        reverse('tiket_bulk_action', kwargs={'action': action}),
+        data=json.dumps({'tiket_ids': tiket_ids, 'values': values or {}, 'rows': rows or {}}),
+        content_type='application/json',
+    )
+
+
+def _statuses(tikets):
+    return dict(Tiket.objects.filter(pk__in=[t.pk for t in tikets]).values_list('pk', 'status_tiket'))
+
+
+@pytest.mark.django_db
+class TestPartition:
+    """Eligibility of a selection, evaluated with one query."""
+
+    def test_splits_by_status_role_and_existence(self, pide_user, django_assert_num_queries):
+        ok = _tiket(STATUS_DIKIRIM_KE_PIDE, pide_user)
+        wrong_status = _tiket(STATUS_IDENTIFIKASI, pide_user)
+        not_pic = _tiket(STATUS_DIKIRIM_KE_PIDE)
+        inactive = _tiket(STATUS_DIKIRIM_KE_PIDE)
+        TiketPICFactory(id_tiket=inactive, id_user=pide_user, role=TiketPIC.Role.PIDE, active=False)
+
+        with django_assert_num_queries(1):
+            eligible, refused = tiket_workflow.partition(
+                tiket_workflow.IDENTIFIKASI,
+                [ok.pk, wrong_status.pk, not_pic.pk, inactive.pk, 999999],
+                pide_user,
+                values={'tgl_rekam_pide': datetime(2024, 2, 1)},
+            )
+
+        assert eligible == [ok]
+        assert [refusal.tiket_id for refusal in refused] == [wrong_status.pk, not_pic.pk, inactive.pk, 999999]
+        assert 'berstatus Identifikasi' in refused[0].reason
+        assert 'bukan PIC PIDE aktif' in refused[1].reason
+        assert refused[3].nomor_tiket is None
+
+    def test_validators_use_the_values_of_each_tiket(self, pide_user):
+        first = _tiket(STATUS_IDENTIFIKASI, pide_user)
+        second = _tiket(STATUS_IDENTIFIKASI, pide_user, baris_lengkap=20)
+
+        eligible, refused = tiket_workflow.partition(
+            tiket_workflow.TRANSFER_KE_PMDE,
+            [first.pk, second.pk],
+            pide_user,
+            values={'tgl_transfer': datetime(2024, 2, 1)},
+            values_by_tiket={
+                first.pk: {'baris_i': 10, 'baris_u': 0, 'baris_res': 0, 'baris_cde': 0},
+                second.pk: {'baris_i': 10, 'baris_u': 0, 'baris_res': 0, 'baris_cde': 0},
+            },
+        )
+
+        assert eligible == [first]
+        assert 'Baris Lengkap (20)' in refused[0].reason
+
+
+@pytest.mark.django_db
+class TestBulkActionView:
+    """POST tiket/bulk/<action>/."""
+
+    def test_partial_eligibility_processes_the_eligible_tikets(self, client, pide_user):
+        eligible = [_tiket(STATUS_DIKIRIM_KE_PIDE, pide_user) for _ in range(2)]
+        wrong_status = _tiket(STATUS_IDENTIFIKASI, pide_user)
+        other_pic = _tiket(STATUS_DIKIRIM_KE_PIDE)
+        client.force_login(pide_user)
+        selection = [eligible[0].pk, wrong_status.pk, eligible[1].pk, other_pic.pk]
+
+        response = _post(client, tiket_workflow.IDENTIFIKASI, selection, values={'tgl_rekam_pide': '2024-02-01T08:00'})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body['success'] and body['processed'] == 2
+        assert [(r['id'], r['success']) for r in body['results']] == [
+            (eligible[0].pk, True), (wrong_status.pk, False), (eligible[1].pk, True), (other_pic.pk, False),
+        ]
+        assert body['results'][1]['nomor_tiket'] == wrong_status.nomor_tiket
+        assert _statuses(eligible + [other_pic]) == {
+            eligible[0].pk: STATUS_IDENTIFIKASI, eligible[1].pk: STATUS_IDENTIFIKASI,
+            other_pic.pk: STATUS_DIKIRIM_KE_PIDE,
+        }
+        assert TiketAction.objects.filter(action=TiketActionType.IDENTIFIKASI).count() == 2
+
+    def test_concurrent_change_writes_nothing(self, client, pide_user):
+        tikets = [_tiket(STATUS_DIKIRIM_KE_PIDE, pide_user) for _ in range(3)]
+        client.force_login(pide_user)
+        partition = tiket_workflow.partition
+
+        def partition_then_concurrent_change(*args, **kwargs):
+            result = partition(*args, **kwargs)
+            Tiket.objects.filter(pk=tikets[1].pk).update(status_tiket=STATUS_DIBATALKAN)
+            return result
+
+        with mock.patch.object(tiket_workflow, 'partition', side_effect=partition_then_concurrent_change):
+            response = _post(client, tiket_workflow.IDENTIFIKASI, [t.pk for t in tikets],
+                             values={'tgl_rekam_pide': '2024-02-01T08:00'})
+
+        body = response.json()
+        assert not body['success'] and body['processed'] == 0
+        assert all(not r['success'] and 'diubah oleh pengguna lain' in r['message'] for r in body['results'])
+        assert _statuses(tikets) == {
+            tikets[0].pk: STATUS_DIKIRIM_KE_PIDE, tikets[1].pk: STATUS_DIBATALKAN, tikets[2].pk: STATUS_DIKIRIM_KE_PIDE,
+        }
+        assert not TiketAction.objects.exists()
+
+    def test_transfer_takes_row_counts_per_tiket(self, client, pide_user):
+        small = _tiket(STATUS_IDENTIFIKASI, pide_user, baris_lengkap=4)
+        large = _tiket(STATUS_IDENTIFIKASI, pide_user, baris_lengkap=40)
+        mismatch = _tiket(STATUS_IDENTIFIKASI, pide_user)
+        missing = _tiket(STATUS_IDENTIFIKASI, pide_user)
+        client.force_login(pide_user)
+
+        response = _post(
+            client, tiket_workflow.TRANSFER_KE_PMDE, [small.pk, large.pk, mismatch.pk, missing.pk],
+            values={'tgl_transfer': '2024-02-01T08:00'},
+            rows={
+                str(small.pk): {'baris_i': 1, 'baris_u': 1, 'baris_res': 1, 'baris_cde': 1},
+                str(large.pk): {'baris_i': 10, 'baris_u': 10, 'baris_res': 10, 'baris_cde': 10},
+                str(mismatch.pk): {'baris_i': 1, 'baris_u': 0, 'baris_res': 0, 'baris_cde': 0},
+            },
+        )
+
+        results = {r['id']: r for r in response.json()['results']}
+        assert results[small.pk]['success'] and results[large.pk]['success']
+        assert 'tidak sama dengan Baris Lengkap' in results[mismatch.pk]['message']
+        assert not results[missing.pk]['success']
+        large.refresh_from_db()
+        assert (large.status_tiket, large.baris_i, large.baris_cde) == (STATUS_PENGENDALIAN_MUTU, 10, 10)
+        assert TiketAction.objects.get(id_tiket=small).catatan == 'Transfer ke PMDE - I:1, U:1, Res:1, CDE:1'
+        assert _statuses([mismatch, missing]) == {mismatch.pk: STATUS_IDENTIFIKASI, missing.pk: STATUS_IDENTIFIKASI}
+
+    def test_selesaikan_and_batalkan(self, client, pmde_user, authenticated_user):
+        qc = _tiket(STATUS_PENGENDALIAN_MUTU, pmde_user, role=TiketPIC.Role.PMDE)
+        client.force_login(pmde_user)
+        response = _post(client, tiket_workflow.SELESAIKAN, [qc.pk], rows={
+            str(qc.pk): {'sudah_qc': 10, 'lolos_qc': 9, 'tidak_lolos_qc': 1, 'qc_c': 0},
+        })
+        assert response.json()['processed'] == 1
+        assert _statuses([qc]) == {qc.pk: STATUS_SELESAI}
+
+        diteliti = _tiket(STATUS_DITELITI, authenticated_user, role=TiketPIC.Role.P3DE)
+        client.force_login(authenticated_user)
+        response = _post(client, tiket_workflow.BATALKAN, [diteliti.pk], values={'catatan': 'Data ganda'})
+        assert response.json()['processed'] == 1
+        assert TiketAction.objects.get(id_tiket=diteliti, action=TiketActionType.DIBATALKAN).catatan == 'Data ganda'
+
+    def test_invalid_shared_values_are_rejected(self, client, pide_user):
+        tiket = _tiket(STATUS_DIKIRIM_KE_PIDE, pide_user)
+        client.force_login(pide_user)
+
+        response = _post(client, tiket_workflow.IDENTIFIKASI, [tiket.pk], values={'tgl_rekam_pide': 'kemarin'})
+
+        assert response.status_code == 400
+        assert 'tgl_rekam_pide' in response.json()['errors']
+        assert _statuses([tiket]) == {tiket.pk: STATUS_DIKIRIM_KE_PIDE}
+
+    @pytest.mark.parametrize('payload', [
+        lambda pk: {'tiket_ids': [pk], 'values': ['catatan']},
+        lambda pk: {'tiket_ids': [pk], 'rows': 'baris'},
+        lambda pk: {'tiket_ids': [pk], 'rows': [1, 2]},
+        lambda pk: {'tiket_ids': [pk], 'rows': {str(pk): [10, 9, 1, 0]}},
+        lambda pk: ['tiket_ids', pk],
+    ])
+    def test_malformed_payload_is_rejected(self, client, pmde_user, payload):
+        qc = _tiket(STATUS_PENGENDALIAN_MUTU, pmde_user, role=TiketPIC.Role.PMDE)
+        client.force_login(pmde_user)
+
+        response = client.post(reverse('tiket_bulk_action', kwargs={'action': tiket_workflow.SELESAIKAN}),
+                               data=json.dumps(payload(qc.pk)), content_type='application/json')
+
+        assert response.status_code == 400
+        assert response.json()['message'] == 'Data permintaan tidak valid.'
+        assert _statuses([qc]) == {qc.pk: STATUS_PENGENDALIAN_MUTU}
+
+    def test_selection_above_the_limit_is_rejected(self, client, pide_user, settings):
+        settings.TIKET_BULK_ACTION_MAX = 2
+        tikets = [_tiket(STATUS_DIKIRIM_KE_PIDE, pide_user) for _ in range(3)]
+        client.force_login(pide_user)
+
+        response = _post(client, tiket_workflow.IDENTIFIKASI, [t.pk for t in tikets],
+                         values={'tgl_rekam_pide': '2024-02-01T08:00'})
+
+        assert response.status_code == 400
+        assert 'Maksimal 2 tiket' in response.json()['message']
+        assert not TiketAction.objects.exists()
+
+    def test_action_outside_the_users_groups_is_forbidden(self, client, authenticated_user):
+        client.force_login(authenticated_user)
+        assert _post(client, tiket_workflow.IDENTIFIKASI, [1]).status_code == 403
+        assert _post(client, tiket_workflow.KIRIM_KE_PIDE, [1]).status_code == 404
+
+    def test_list_offers_the_users_bulk_actions(self, client, pide_user):
+        client.force_login(pide_user)
+
+        response = client.get(reverse('tiket_list'))
+
+        names = [action['name'] for action in response.context['bulk_actions']]
+        assert names == [tiket_workflow.IDENTIFIKASI, tiket_workflow.TRANSFER_KE_PMDE]
+        assert b'bulkActionModal' in response.content
@@ -0,0 +1,136 @@
+"""Tests for the tiket dossier loader used by the detail view and documents."""
+import pytest
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from diamond_web.models import PIC, TiketAction, TiketPIC
+from diamond_web.tests.conftest import PICFactory, TiketFactory, TiketPICFactory, UserFactory
+from diamond_web.utils.tiket_dossier import get_tiket_dossier, invalidate_all_tiket_dossiers
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _add_history(tiket, count):
+    for i in range(count):
+        user = UserFactory()
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=TiketPIC.Role.PIDE)
+        TiketAction.objects.create(id_tiket=tiket, id_user=user, timestamp=timezone.now(), action=1)
+
+
+@pytest.mark.django_db
+class TestTiketDossier:
+    """Tests for get_tiket_dossier."""
+
+    def test_query_count_does_not_grow_with_related_rows(self):
+        small = TiketFactory()
+        large = TiketFactory()
+        _add_history(small, 1)
+        _add_history(large, 15)
+
+        with CaptureQueriesContext(connection) as small_ctx:
+            get_tiket_dossier(small.pk, use_cache=False)
+        with CaptureQueriesContext(connection) as large_ctx:
+            dossier = get_tiket_dossier(large.pk, use_cache=False)
+
+        assert len(small_ctx.captured_queries) == len(large_ctx.captured_queries) == 7
+        assert len(dossier.actions) == 15
+        assert len(dossier.pics) == 15
+        assert all(action.user_display for action in dossier.actions)
+
+    def test_is_pic_active_matches_pic_tipe(self):
+        tiket = TiketFactory()
+        user = UserFactory()
+        sub_jenis_data = tiket.id_periode_data.id_sub_jenis_data_ilap
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=TiketPIC.Role.P3DE)
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=TiketPIC.Role.PIDE)
+        PICFactory(tipe=PIC.TipePIC.P3DE, id_user=user, id_sub_jenis_data_ilap=sub_jenis_data, end_date=None)
+
+        dossier = get_tiket_dossier(tiket.pk)
+
+        assert {pic.role: pic.is_pic_active for pic in dossier.pics} == {
+            TiketPIC.Role.P3DE: True,
+            TiketPIC.Role.PIDE: False,
+        }
+        assert dossier.user_is_active_pic(user, TiketPIC.Role.P3DE)
+        assert not dossier.user_is_active_pic(user, TiketPIC.Role.PIDE)
+
+    def test_cached_dossier_costs_one_query(self):
+        tiket = TiketFactory()
+        _add_history(tiket, 3)
+        get_tiket_dossier(tiket.pk)
+
+        with CaptureQueriesContext(connection) as ctx:
+            dossier = get_tiket_dossier(tiket.pk)
+
+        assert len(ctx.captured_queries) == 1
+        assert len(dossier.actions) == 3
+
+    def test_tiket_action_write_invalidates(self):
+        tiket = TiketFactory()
+        user = UserFactory()
+        assert get_tiket_dossier(tiket.pk).actions == []
+
+        action = TiketAction.objects.create(id_tiket=tiket, id_user=user, timestamp=timezone.now(), action=1)
+        assert [a.pk for a in get_tiket_dossier(tiket.pk).actions] == [action.pk]
+
+        action.delete()
+        assert get_tiket_dossier(tiket.pk).actions == []
+
+    def test_riwayat_follows_new_tiket_in_same_period(self):
+        tiket = TiketFactory()
+        assert len(get_tiket_dossier(tiket.pk).riwayat_tikets) == 1
+
+        TiketFactory(id_periode_data=tiket.id_periode_data, periode=tiket.periode, tahun=tiket.tahun)
+        assert len(get_tiket_dossier(tiket.pk).riwayat_tikets) == 2
+
+    def test_bulk_update_needs_global_invalidation(self):
+        tiket = TiketFactory()
+        other = TiketFactory(id_periode_data=tiket.id_periode_data, periode=tiket.periode, tahun=tiket.tahun)
+        get_tiket_dossier(tiket.pk)
+
+        type(tiket).objects.filter(pk=other.pk).update(status_tiket=8)
+        invalidate_all_tiket_dossiers()
+
+        riwayat = {rt.pk: rt.status_tiket for rt in get_tiket_dossier(tiket.pk).riwayat_tikets}
+        assert riwayat[other.pk] == 8
+
+
+@pytest.mark.django_db
+class TestTiketDetailUsesDossier:
+    """The detail view renders from the dossier in a fixed number of queries."""
+
+    def test_detail_query_count_is_constant(self, client, admin_user):
+        small = TiketFactory()
+        large = TiketFactory()
+        _add_history(small, 1)
+        _add_history(large, 15)
+        client.force_login(admin_user)
+
+        with CaptureQueriesContext(connection) as small_ctx:
+            assert client.get(reverse('tiket_detail', args=[small.pk])).status_code == 200
+        with CaptureQueriesContext(connection) as large_ctx:
+            response = client.get(reverse('tiket_detail', args=[large.pk]))
+
+        assert response.status_code == 200
+        assert len(small_ctx.captured_queries) == len(large_ctx.captured_queries)
+        assert len(response.context['tiket_actions']) == 15
+
+    def test_inactive_pic_can_view_but_not_download(self, client):
+        tiket = TiketFactory()
+        user = UserFactory()
+        TiketPICFactory(id_tiket=tiket, id_user=user, active=False)
+        user.groups.add(Group.objects.get_or_create(name='user_p3de')[0])
+        client.force_login(user)
+
+        assert client.get(reverse('tiket_detail', args=[tiket.pk])).status_code == 200
+        response = client.get(reverse('tiket_documents_download', args=[tiket.pk]))
+        assert response.status_code == 403
@@ -0,0 +1,232 @@
+"""Tests for the tiket activity timeline (utils/tiket_timeline.py)."""
+import os
+import time
+from datetime import datetime, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Exists, OuterRef
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from diamond_web.constants.tiket_action_types import TiketActionType
+from diamond_web.constants.tiket_status import STATUS_DIBATALKAN, STATUS_DITELITI, STATUS_SELESAI
+from diamond_web.models import Tiket, TiketAction, TiketActionArchive, TiketLatestAction, TiketPIC
+from diamond_web.services import tiket_workflow
+from diamond_web.tests.conftest import TiketFactory, TiketPICFactory, UserFactory
+from diamond_web.utils import tiket_timeline
+from diamond_web.utils.tiket_dossier import get_tiket_dossier
+from diamond_web.views.home import _build_tiket_base_qs
+
+NOW = datetime(2026, 10, 1, 12, 0)
+LAMA = NOW - timedelta(days=400)
+
+
+def _action(tiket, user, action, timestamp, catatan=''):
+    return TiketAction.objects.create(id_tiket=tiket, id_user=user, action=action, timestamp=timestamp,
+                                      catatan=catatan)
+
+
+def _latest(tiket):
+    return dict(TiketLatestAction.objects.filter(id_tiket=tiket).values_list('action', 'timestamp'))
+
+
+@pytest.mark.django_db
+class TestLatestActions:
+    """TiketLatestAction follows every insert."""
+
+    def test_single_creates_keep_the_latest_per_type(self):
+        tiket, user = TiketFactory(), UserFactory()
+        _action(tiket, user, TiketActionType.DIREKAM, NOW)
+        _action(tiket, user, TiketActionType.DIKEMBALIKAN, NOW - timedelta(days=2))
+        _action(tiket, user, TiketActionType.DIKEMBALIKAN, NOW)
+        _action(tiket, user, TiketActionType.DIKEMBALIKAN, NOW - timedelta(days=1))
+        _action(tiket, user, TiketActionType.DITELITI, None)
+
+        assert _latest(tiket) == {
+            TiketActionType.DIREKAM: NOW,
+            TiketActionType.DIKEMBALIKAN: NOW,
+            TiketActionType.DITELITI: None,
+        }
+
+    def test_bulk_inserts_cost_two_queries(self):
+        first = TiketFactory()
+        tikets = [first] + [TiketFactory(id_periode_data=first.id_periode_data) for _ in range(3)]
+        user = UserFactory()
+        _action(first, user, TiketActionType.DIREKAM, NOW + timedelta(days=1))
+        actions = TiketAction.objects.bulk_create([
+            TiketAction(id_tiket=tiket, id_user=user, action=action, timestamp=NOW)
+            for tiket in tikets for action in (TiketActionType.DIREKAM, TiketActionType.DITELITI, None)
+        ])
+
+        with CaptureQueriesContext(connection) as ctx:
+            tiket_timeline.record_latest_actions(actions)
+
+        assert len(ctx) == 2
+        assert _latest(first) == {TiketActionType.DIREKAM: NOW + timedelta(days=1), TiketActionType.DITELITI: NOW}
+        assert TiketLatestAction.objects.count() == 2 * len(tikets)
+
+    def test_workflow_run_records_its_actions(self):
+        tiket, user = TiketFactory(status_tiket=STATUS_DITELITI), UserFactory()
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=TiketPIC.Role.P3DE, active=True)
+
+        tiket_workflow.run(tiket_workflow.BATALKAN, tiket, user, catatan='batal', now=NOW)
+
+        assert _latest(tiket)[TiketActionType.DIBATALKAN] == NOW
+
+    def test_rebuild_reads_live_and_archived_actions(self):
+        tiket, user = TiketFactory(), UserFactory()
+        _action(tiket, user, TiketActionType.DIREKAM, NOW)
+        TiketActionArchive.objects.create(id=999_999, id_tiket=tiket, id_user=user,
+                                          action=TiketActionType.DIKEMBALIKAN, timestamp=LAMA)
+        TiketLatestAction.objects.all().delete()
+
+        assert tiket_timeline.rebuild_latest_actions() == 2
+        assert _latest(tiket) == {TiketActionType.DIREKAM: NOW, TiketActionType.DIKEMBALIKAN: LAMA}
+
+
+@pytest.fixture
+def closed_tikets(db):
+    """An old Selesai tiket, a recent Dibatalkan one and an old open one, three actions each."""
+    user = UserFactory()
+    old = TiketFactory(status_tiket=STATUS_SELESAI)
+    recent = TiketFactory(status_tiket=STATUS_DIBATALKAN, id_periode_data=old.id_periode_data)
+    open_ = TiketFactory(status_tiket=STATUS_DITELITI, id_periode_data=old.id_periode_data)
+    history = ((2, TiketActionType.DIREKAM), (1, TiketActionType.DIKEMBALIKAN), (0, TiketActionType.SELESAI))
+    for tiket, last in ((old, LAMA), (recent, NOW - timedelta(days=10)), (open_, LAMA)):
+        for days, action in history:
+            _action(tiket, user, action, last - timedelta(days=days), catatan=f'aksi {action}')
+    return old, recent, open_
+
+
+@pytest.mark.django_db
+class TestArchive:
+    """archive_closed_tiket_actions moves closed, idle tikets only."""
+
+    def test_moves_old_closed_tikets_in_chunks(self, closed_tikets):
+        old, recent, open_ = closed_tikets
+        live_before = {row[0]: row for row in TiketAction.objects.filter(id_tiket=old).values_list(
+            *tiket_timeline.ACTION_FIELDS)}
+        latest_before = _latest(old)
+
+        with CaptureQueriesContext(connection) as ctx:
+            archived = tiket_timeline.archive_closed_tiket_actions(older_than_days=365, chunk_size=2, now=NOW)
+
+        assert archived == 3
+        assert not TiketAction.objects.filter(id_tiket=old).exists()
+        assert TiketAction.objects.filter(id_tiket__in=[recent, open_]).count() == 6
+        archived_rows = TiketActionArchive.objects.values_list(*tiket_timeline.ACTION_FIELDS)
+        assert {row[0]: row for row in archived_rows} == live_before
+        assert _latest(old) == latest_before
+        inserts = [q for q in ctx.captured_queries if q['sql'].startswith('INSERT INTO "tiket_action_archive"')]
+        assert len(inserts) == 2
+
+    def test_default_age_follows_the_setting(self, closed_tikets, settings):
+        settings.TIKET_ACTION_ARCHIVE_AFTER_DAYS = 5
+
+        assert tiket_timeline.archive_closed_tiket_actions(now=NOW) == 6
+
+    def test_second_run_finds_nothing(self, closed_tikets):
+        tiket_timeline.archive_closed_tiket_actions(older_than_days=365, now=NOW)
+
+        assert not tiket_timeline.archivable_tikets(365, now=NOW).exists()
+        assert tiket_timeline.archive_closed_tiket_actions(older_than_days=365, now=NOW) == 0
+
+    def test_command(self, closed_tikets):
+        out = StringIO()
+        call_command('archive_tiket_actions', '--older-than-days=30', '--dry-run', stdout=out)
+        assert 'Tiket yang diarsipkan: 1' in out.getvalue()
+        assert not TiketActionArchive.objects.exists()
+
+        call_command('archive_tiket_actions', '--older-than-days=30', '--batch-size=1', stdout=out)
+
+        assert 'Aksi dipindahkan    : 3' in out.getvalue()
+        assert TiketActionArchive.objects.count() == 3
+
+    def test_truncate_tiket_after_archiving(self, client, admin_user, closed_tikets):
+        tiket_timeline.archive_closed_tiket_actions(older_than_days=365, now=NOW)
+        client.force_login(admin_user)
+
+        response = client.post(reverse('sync_tiket_truncate'))
+
+        assert response.status_code == 200, response.json()
+        assert response.json()['deleted_count'] == 3
+        assert not Tiket.objects.exists()
+        assert not TiketActionArchive.objects.exists()
+        assert not TiketLatestAction.objects.exists()
+
+
+@pytest.mark.django_db
+class TestReaders:
+    """Archived actions stay visible on the detail page and the dashboards."""
+
+    def test_dossier_merges_live_and_archived_actions(self, closed_tikets):
+        old = closed_tikets[0]
+        tiket_timeline.archive_closed_tiket_actions(older_than_days=365, now=NOW)
+        late = _action(old, UserFactory(), TiketActionType.DIKEMBALIKAN, NOW, catatan='aksi baru')
+
+        dossier = get_tiket_dossier(old.pk, use_cache=False)
+
+        assert [action.catatan for action in dossier.actions] == [
+            late.catatan, f'aksi {TiketActionType.SELESAI}', f'aksi {TiketActionType.DIKEMBALIKAN}',
+            f'aksi {TiketActionType.DIREKAM}',
+        ]
+        assert all(action.badge_label and action.user_display for action in dossier.actions)
+
+    def test_open_tiket_does_not_read_the_archive(self, closed_tikets):
+        open_ = closed_tikets[2]
+
+        with CaptureQueriesContext(connection) as ctx:
+            actions = tiket_timeline.tiket_actions(open_)
+
+        assert len(actions) == 3
+        assert not any('tiket_action_archive' in q['sql'] for q in ctx.captured_queries)
+
+    def test_dikembalikan_category_survives_archiving(self, closed_tikets):
+        old = closed_tikets[0]
+        user = UserFactory()
+        TiketPICFactory(id_tiket=old, id_user=user, role=TiketPIC.Role.P3DE, active=True)
+        tiket_timeline.archive_closed_tiket_actions(older_than_days=365, now=NOW)
+
+        assert list(_build_tiket_base_qs('pengembalian_seluruhnya_dari_pide', user)) == [old]
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='set RUN_BENCHMARKS=1 to run benchmarks')
+def test_benchmark_dikembalikan_count_500k_actions():
+    """Count the tikets ever dikembalikan over 500k actions: history scan vs latest table (prints timing)."""
+    user = UserFactory()
+    first = TiketFactory()
+    Tiket.objects.bulk_create([
+        Tiket(nomor_tiket=f'TL{i:015d}', status_tiket=STATUS_SELESAI, id_periode_data_id=first.id_periode_data_id,
+              periode=1, tahun=2024, id_bentuk_data_id=first.id_bentuk_data_id,
+              id_cara_penyampaian_id=first.id_cara_penyampaian_id, baris_diterima=i, tgl_terima_dip=LAMA)
+        for i in range(20_000)
+    ], batch_size=5000)
+    tiket_ids = list(Tiket.objects.values_list('pk', flat=True))
+    types = [TiketActionType.DIREKAM, TiketActionType.DITELITI, TiketActionType.DIKIRIM_KE_PIDE,
+             TiketActionType.IDENTIFIKASI, TiketActionType.SELESAI]
+    for start in range(0, len(tiket_ids), 2000):
+        actions = TiketAction.objects.bulk_create([
+            TiketAction(id_tiket_id=tiket_id, id_user=user, timestamp=NOW - timedelta(minutes=n),
+                        action=TiketActionType.DIKEMBALIKAN if tiket_id % 7 == 0 and n == 3 else types[n % 5])
+            for tiket_id in tiket_ids[start:start + 2000] for n in range(25)
+        ], batch_size=5000)
+        tiket_timeline.record_latest_actions(actions)
+
+    def count(model):
+        started = time.perf_counter()
+        total = Tiket.objects.filter(
+            Exists(model.objects.filter(id_tiket=OuterRef('pk'), action=TiketActionType.DIKEMBALIKAN)),
+        ).count()
+        return total, time.perf_counter() - started
+
+    history, history_seconds = count(TiketAction)
+    latest, latest_seconds = count(TiketLatestAction)
+
+    print(f'\nDikembalikan over {TiketAction.objects.count()} actions: history {history_seconds * 1000:.0f} ms, '
+          f'latest table {latest_seconds * 1000:.0f} ms ({TiketLatestAction.objects.count()} rows)')
+    assert history == latest
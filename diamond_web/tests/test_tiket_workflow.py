@@ -4,6 +4,7 @@ Covers: batalkan_tiket, dikembalikan_tiket, selesaikan_tiket,
         transfer_ke_pmde, rekam_hasil_penelitian, kirim_tiket
 """
 import json
+from datetime import datetime
 import pytest
 from django.urls import reverse
 from django.contrib.auth.models import Group
@@ -346,7 +347,9 @@ class TestRekamHasilPenelitianView:
     """
 
     def _setup(self, user):
-        tiket = TiketFactory(status_tiket=1, baris_diterima=100)
+        # tgl_teliti posted below (2024-01-01) must not precede tgl_terima_dip
+        tiket = TiketFactory(status_tiket=1, baris_diterima=100,
+                             tgl_terima_dip=datetime(2023, 12, 1))
         TiketPICFactory(id_tiket=tiket, id_user=user,
                         role=TiketPIC.Role.P3DE, active=True)
         StatusPenelitian.objects.get_or_create(deskripsi='Lengkap')
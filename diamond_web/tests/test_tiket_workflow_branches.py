@@ -107,7 +107,7 @@ class TestDikembalikanTiketViewBranches:
         """Exception in form_valid returns error JSON for AJAX (lines 135-136)."""
         tiket = self._setup(pide_user)
         client.force_login(pide_user)
-        with patch('diamond_web.views.tiket.dikembalikan_tiket.TiketAction.objects.create') as mock_create:
+        with patch('diamond_web.services.tiket_workflow.TiketAction.objects.bulk_create') as mock_create:
             mock_create.side_effect = Exception("DB error")
             resp = client.post(
                 reverse('dikembalikan_tiket', kwargs={'pk': tiket.pk}),
@@ -143,7 +143,7 @@ class TestSelesaikanTiketViewBranches:
         """Exception in form_valid returns error JSON for AJAX (lines 144-153)."""
         tiket = self._setup(pmde_user)
         client.force_login(pmde_user)
-        with patch('diamond_web.views.tiket.selesaikan_tiket.TiketAction.objects.create') as mock_create:
+        with patch('diamond_web.services.tiket_workflow.TiketAction.objects.bulk_create') as mock_create:
             mock_create.side_effect = Exception("DB failure")
             resp = client.post(
                 reverse('selesaikan_tiket', args=[tiket.pk]),
@@ -158,7 +158,7 @@ class TestSelesaikanTiketViewBranches:
         """Exception in form_valid shows error message for non-AJAX (lines 144-153)."""
         tiket = self._setup(pmde_user)
         client.force_login(pmde_user)
-        with patch('diamond_web.views.tiket.selesaikan_tiket.TiketAction.objects.create') as mock_create:
+        with patch('diamond_web.services.tiket_workflow.TiketAction.objects.bulk_create') as mock_create:
             mock_create.side_effect = Exception("DB failure")
             resp = client.post(
                 reverse('selesaikan_tiket', args=[tiket.pk]),
@@ -240,7 +240,7 @@ class TestTransferKePMDEViewBranches:
         """Exception in form_valid returns error JSON (lines 136-137)."""
         tiket = self._setup(pide_user)
         client.force_login(pide_user)
-        with patch('diamond_web.views.tiket.transfer_ke_pmde.TiketAction.objects.create') as mock_create:
+        with patch('diamond_web.services.tiket_workflow.TiketAction.objects.bulk_create') as mock_create:
             mock_create.side_effect = Exception("Transfer error")
             resp = client.post(
                 reverse('transfer_ke_pmde', args=[tiket.pk]),
@@ -472,7 +472,7 @@ class TestKirimTiketViewBranches:
         tiket = TiketFactory(status_tiket=1)
         TiketPICFactory(id_tiket=tiket, id_user=authenticated_user, role=TiketPIC.Role.P3DE, active=True)
         client.force_login(authenticated_user)
-        with patch('diamond_web.views.tiket.kirim_tiket.TiketAction.objects.create') as mock_create:
+        with patch('diamond_web.models.tiket_action.TiketAction.objects.create') as mock_create:
             mock_create.side_effect = Exception("DB error kirim")
             resp = client.post(
                 reverse('kirim_tiket'),
@@ -493,7 +493,7 @@ class TestKirimTiketViewBranches:
         tiket = TiketFactory(status_tiket=1)
         TiketPICFactory(id_tiket=tiket, id_user=authenticated_user, role=TiketPIC.Role.P3DE, active=True)
         client.force_login(authenticated_user)
-        with patch('diamond_web.views.tiket.kirim_tiket.TiketAction.objects.create') as mock_create:
+        with patch('diamond_web.models.tiket_action.TiketAction.objects.create') as mock_create:
             mock_create.side_effect = Exception("DB error kirim")
             resp = client.post(
                 reverse('kirim_tiket'),
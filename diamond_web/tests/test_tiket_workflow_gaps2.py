@@ -80,7 +80,7 @@ class TestDikembalikanTiketNonAjaxPaths:
 
         # Patch TiketAction.objects.create to raise an exception
         with patch(
-            'diamond_web.views.tiket.dikembalikan_tiket.TiketAction.objects.create',
+            'diamond_web.services.tiket_workflow.TiketAction.objects.bulk_create',
             side_effect=Exception('Forced DB error')
         ):
             resp = client.post(
@@ -162,7 +162,7 @@ class TestTransferKePMDENonAjaxPaths:
         client.force_login(pide_user)
 
         with patch(
-            'diamond_web.views.tiket.transfer_ke_pmde.TiketAction.objects.create',
+            'diamond_web.services.tiket_workflow.TiketAction.objects.bulk_create',
             side_effect=Exception('Forced DB error')
         ):
             resp = client.post(
@@ -246,7 +246,7 @@ class TestKirimTiketNonAjaxPaths:
         client.force_login(p3de_user)
 
         with patch(
-            'diamond_web.views.tiket.kirim_tiket.TiketAction.objects.create',
+            'diamond_web.models.tiket_action.TiketAction.objects.create',
             side_effect=Exception('Forced error')
         ):
             resp = client.post(
@@ -315,7 +315,7 @@ class TestRekamHasilPenelitianNonAjax:
 
         client.force_login(p3de_user)
         with patch.object(RekamHasilPenelitianView, 'get_success_url', return_value='/'), \
-            patch('diamond_web.views.tiket.rekam_hasil_penelitian.StatusPenelitian.objects.get', side_effect=StatusPenelitian.DoesNotExist):
+            patch('diamond_web.services.tiket_workflow.StatusPenelitian.objects.get', side_effect=StatusPenelitian.DoesNotExist):
             resp = client.post(
                 reverse('rekam_hasil_penelitian', args=[tiket.pk]),
                 {
@@ -390,7 +390,7 @@ class TestTiketDetailFormatPeriode:
 
         client.force_login(admin)
         with patch(
-            'diamond_web.views.tiket.detail.KlasifikasiJenisData.objects.filter',
+            'diamond_web.utils.tiket_dossier.KlasifikasiJenisData.objects.filter',
             side_effect=Exception('DB error')
         ):
             resp = client.get(reverse('tiket_detail', args=[tiket.pk]))
@@ -0,0 +1,253 @@
+"""Tests for the declarative tiket state machine (services/tiket_workflow.py)."""
+import random
+from datetime import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from diamond_web.constants.tiket_action_types import TiketActionType
+from diamond_web.constants.tiket_status import (
+    STATUS_DIBATALKAN,
+    STATUS_DIKEMBALIKAN,
+    STATUS_DIKIRIM_KE_PIDE,
+    STATUS_DIREKAM,
+    STATUS_DITELITI,
+    STATUS_IDENTIFIKASI,
+    STATUS_LABELS,
+    STATUS_SELESAI,
+)
+from diamond_web.models import Notification, StatusPenelitian, Tiket, TiketAction, TiketPIC
+from diamond_web.services import tiket_workflow
+from diamond_web.tests.conftest import TiketFactory, TiketPICFactory, UserFactory
+
+ALL_STATUSES = sorted(STATUS_LABELS)
+
+# Input that satisfies every validator of each transition for a tiket built by _tiket().
+VALUES = {
+    tiket_workflow.REKAM_HASIL_PENELITIAN: {
+        'tgl_teliti': datetime(2024, 2, 1), 'baris_lengkap': 10, 'baris_tidak_lengkap': 0,
+    },
+    tiket_workflow.BATALKAN: {},
+    tiket_workflow.KIRIM_KE_PIDE: {
+        'tgl_nadine': datetime(2024, 3, 1), 'nomor_nd_nadine': 'ND-1/PJ/2024', 'tgl_kirim_pide': datetime(2024, 3, 1),
+    },
+    tiket_workflow.IDENTIFIKASI: {'tgl_rekam_pide': datetime(2024, 4, 1)},
+    tiket_workflow.DIKEMBALIKAN: {},
+    tiket_workflow.TRANSFER_KE_PMDE: {
+        'baris_i': 4, 'baris_u': 3, 'baris_res': 2, 'baris_cde': 1, 'tgl_transfer': datetime(2024, 5, 1),
+    },
+    tiket_workflow.SELESAIKAN: {'sudah_qc': 10, 'lolos_qc': 9, 'tidak_lolos_qc': 1, 'qc_c': 0},
+}
+
+
+def _reachable(start):
+    """Statuses reachable from *start* according to the transition table."""
+    seen, todo = {start}, [start]
+    while todo:
+        status = todo.pop()
+        for name in tiket_workflow.available_transitions(status):
+            for target in tiket_workflow.TRANSITIONS[name].targets:
+                if target not in seen:
+                    seen.add(target)
+                    todo.append(target)
+    return seen
+
+
+def _tiket(status, user, **kwargs):
+    """A tiket in *status* on which *user* is the active P3DE, PIDE and PMDE PIC."""
+    tiket = TiketFactory(
+        status_tiket=status,
+        baris_diterima=10,
+        baris_lengkap=10,
+        tgl_terima_dip=datetime(2024, 1, 1),
+        tgl_teliti=datetime(2024, 1, 15),
+        tgl_kirim_pide=datetime(2024, 1, 20),
+        tgl_rekam_pide=datetime(2024, 1, 25),
+        **kwargs,
+    )
+    for role in TiketPIC.Role:
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=role, active=True)
+    return tiket
+
+
+class TestTransitionTable:
+    """The declared graph itself."""
+
+    def test_every_status_is_known(self):
+        for transition in tiket_workflow.TRANSITIONS.values():
+            assert transition.sources <= set(STATUS_LABELS)
+            assert set(transition.targets) <= set(STATUS_LABELS)
+
+    def test_final_statuses_have_no_way_out(self):
+        assert tiket_workflow.available_transitions(STATUS_SELESAI) == []
+        assert tiket_workflow.available_transitions(STATUS_DIBATALKAN) == []
+
+    def test_dikembalikan_status_is_never_entered(self):
+        assert STATUS_DIKEMBALIKAN not in _reachable(STATUS_DIREKAM)
+
+    def test_every_other_status_is_reachable_from_direkam(self):
+        assert _reachable(STATUS_DIREKAM) == set(STATUS_LABELS) - {STATUS_DIKEMBALIKAN}
+
+    def test_available_transitions_by_role(self):
+        assert tiket_workflow.available_transitions(STATUS_DIKIRIM_KE_PIDE, TiketPIC.Role.PIDE) == [
+            tiket_workflow.IDENTIFIKASI, tiket_workflow.DIKEMBALIKAN,
+        ]
+        assert tiket_workflow.available_transitions(STATUS_DIKIRIM_KE_PIDE, TiketPIC.Role.P3DE) == []
+
+
+@pytest.mark.django_db
+class TestEveryStatusTransitionPair:
+    """Each transition runs from its declared sources and is refused from every other status."""
+
+    @pytest.mark.parametrize('status', ALL_STATUSES)
+    @pytest.mark.parametrize('name', sorted(tiket_workflow.TRANSITIONS))
+    def test_pair(self, name, status):
+        user = UserFactory()
+        tiket = _tiket(status, user)
+        transition = tiket_workflow.TRANSITIONS[name]
+
+        if transition.allows(status):
+            tiket_workflow.run(name, tiket, user, values=VALUES[name])
+            tiket.refresh_from_db()
+            assert tiket.status_tiket in transition.targets
+            assert TiketAction.objects.filter(id_tiket=tiket, action=transition.action).count() == 1
+        else:
+            with pytest.raises(tiket_workflow.IllegalTransition):
+                tiket_workflow.run(name, tiket, user, values=VALUES[name])
+            tiket.refresh_from_db()
+            assert tiket.status_tiket == status
+            assert not TiketAction.objects.filter(id_tiket=tiket).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('seed', range(8))
+def test_random_walks_stay_on_the_declared_graph(seed):
+    """Random transition attempts only ever move a tiket along declared edges."""
+    rng = random.Random(seed)
+    user = UserFactory()
+    tiket = _tiket(STATUS_DIREKAM, user)
+    status = STATUS_DIREKAM
+    names = sorted(tiket_workflow.TRANSITIONS)
+
+    for _ in range(12):
+        name = rng.choice(names)
+        transition = tiket_workflow.TRANSITIONS[name]
+        if transition.allows(status):
+            tiket_workflow.run(name, tiket, user, values=VALUES[name])
+            assert tiket.status_tiket in transition.targets
+            status = tiket.status_tiket
+        else:
+            with pytest.raises(tiket_workflow.IllegalTransition):
+                tiket_workflow.run(name, tiket, user, values=VALUES[name])
+        assert Tiket.objects.get(pk=tiket.pk).status_tiket == status
+        assert status in _reachable(STATUS_DIREKAM)
+
+
+@pytest.mark.django_db
+class TestRun:
+    """Role, validation, optimistic locking and the set-based writes."""
+
+    def test_requires_the_transition_role(self):
+        user = UserFactory()
+        tiket = TiketFactory(status_tiket=STATUS_DIKIRIM_KE_PIDE, tgl_kirim_pide=datetime(2024, 1, 1))
+        TiketPICFactory(id_tiket=tiket, id_user=user, role=TiketPIC.Role.P3DE, active=True)
+
+        with pytest.raises(tiket_workflow.RoleRequired):
+            tiket_workflow.run(tiket_workflow.IDENTIFIKASI, tiket, user)
+
+        assert Tiket.objects.get(pk=tiket.pk).status_tiket == STATUS_DIKIRIM_KE_PIDE
+
+    def test_validators_refuse_inconsistent_rows(self):
+        user = UserFactory()
+        tiket = _tiket(STATUS_DIREKAM, user)
+        values = dict(VALUES[tiket_workflow.REKAM_HASIL_PENELITIAN], baris_tidak_lengkap=5)
+
+        with pytest.raises(tiket_workflow.InvalidTransitionData, match='Baris Diterima'):
+            tiket_workflow.run(tiket_workflow.REKAM_HASIL_PENELITIAN, tiket, user, values=values)
+
+    def test_missing_field_is_refused(self):
+        user = UserFactory()
+        tiket = _tiket(STATUS_DITELITI, user)
+
+        with pytest.raises(tiket_workflow.InvalidTransitionData, match='nomor_nd_nadine'):
+            tiket_workflow.run(tiket_workflow.KIRIM_KE_PIDE, tiket, user, values=dict(
+                VALUES[tiket_workflow.KIRIM_KE_PIDE], nomor_nd_nadine='',
+            ))
+
+    def test_stale_status_rolls_back_the_whole_batch(self):
+        user = UserFactory()
+        tikets = [_tiket(STATUS_DIKIRIM_KE_PIDE, user) for _ in range(3)]
+        Tiket.objects.filter(pk=tikets[1].pk).update(status_tiket=STATUS_DIBATALKAN)
+
+        with pytest.raises(tiket_workflow.StaleTiket):
+            tiket_workflow.run(tiket_workflow.IDENTIFIKASI, tikets, user)
+
+        assert list(
+            Tiket.objects.filter(pk__in=[t.pk for t in tikets]).order_by('pk').values_list('status_tiket', flat=True)
+        ) == [STATUS_DIKIRIM_KE_PIDE, STATUS_DIBATALKAN, STATUS_DIKIRIM_KE_PIDE]
+        assert not TiketAction.objects.exists()
+
+    def test_queryset_runs_with_a_fixed_number_of_queries(self):
+        user = UserFactory()
+        periode_data = _tiket(STATUS_SELESAI, user).id_periode_data
+        counts = []
+        for size in (2, 12):
+            ids = [_tiket(STATUS_DIKIRIM_KE_PIDE, user, id_periode_data=periode_data).pk for _ in range(size)]
+            with CaptureQueriesContext(connection) as ctx:
+                tiket_workflow.run(tiket_workflow.IDENTIFIKASI, Tiket.objects.filter(pk__in=ids), user)
+            counts.append(len(ctx.captured_queries))
+            assert set(Tiket.objects.filter(pk__in=ids).values_list('status_tiket', flat=True)) == {
+                STATUS_IDENTIFIKASI
+            }
+
+        assert counts[0] == counts[1]
+
+    def test_dikembalikan_credits_and_notifies_the_p3de_pic(self, django_capture_on_commit_callbacks):
+        pide = UserFactory()
+        p3de = UserFactory()
+        tiket = TiketFactory(status_tiket=STATUS_IDENTIFIKASI, tgl_rekam_pide=datetime(2024, 1, 1))
+        TiketPICFactory(id_tiket=tiket, id_user=pide, role=TiketPIC.Role.PIDE, active=True)
+        TiketPICFactory(id_tiket=tiket, id_user=p3de, role=TiketPIC.Role.P3DE, active=True)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            tiket_workflow.run(tiket_workflow.DIKEMBALIKAN, tiket, pide, catatan='Data {rusak}')
+
+        tiket.refresh_from_db()
+        assert tiket.status_tiket == STATUS_DIBATALKAN
+        assert tiket.tgl_rekam_pide is None and tiket.tgl_dikembalikan
+        assert TiketAction.objects.get(id_tiket=tiket, action=TiketActionType.DIKEMBALIKAN).id_user == pide
+        batal = TiketAction.objects.get(id_tiket=tiket, action=TiketActionType.DIBATALKAN)
+        assert batal.id_user == p3de
+        assert batal.catatan == 'Tiket dibatalkan (dikembalikan oleh PIDE: Data {rusak})'
+        notification = Notification.objects.get(recipient=p3de)
+        assert notification.title == 'Tiket Dikembalikan'
+        assert reverse('tiket_detail', kwargs={'pk': tiket.pk}) in notification.message
+
+    def test_rekam_without_complete_rows_closes_the_tiket(self):
+        user = UserFactory()
+        tiket = _tiket(STATUS_DIREKAM, user)
+        tidak_lengkap = StatusPenelitian.objects.create(deskripsi='Tidak Lengkap')
+        values = dict(VALUES[tiket_workflow.REKAM_HASIL_PENELITIAN], baris_lengkap=0, baris_tidak_lengkap=10)
+
+        tiket_workflow.run(tiket_workflow.REKAM_HASIL_PENELITIAN, tiket, user, values=values)
+
+        tiket.refresh_from_db()
+        assert tiket.status_tiket == STATUS_SELESAI
+        assert tiket.id_status_penelitian == tidak_lengkap
+        assert set(TiketAction.objects.filter(id_tiket=tiket).values_list('action', flat=True)) == {
+            TiketActionType.DITELITI, TiketActionType.SELESAI,
+        }
+
+
+@pytest.mark.django_db
+def test_views_refuse_statuses_outside_the_transition(client, authenticated_user):
+    """A P3DE PIC cannot open the cancel form once the tiket is with PIDE."""
+    tiket = TiketFactory(status_tiket=STATUS_DIKIRIM_KE_PIDE)
+    TiketPICFactory(id_tiket=tiket, id_user=authenticated_user, role=TiketPIC.Role.P3DE, active=True)
+    client.force_login(authenticated_user)
+
+    assert client.get(reverse('batalkan_tiket', kwargs={'pk': tiket.pk})).status_code == 403
+    assert client.post(reverse('batalkan_tiket', kwargs={'pk': tiket.pk}), {'catatan': 'x'}).status_code == 403
+    assert Tiket.objects.get(pk=tiket.pk).status_tiket == STATUS_DIKIRIM_KE_PIDE
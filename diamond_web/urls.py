@@ -29,6 +29,7 @@ urlpatterns = [
     path('sync-data-referensi/stop/', views.oracle_sync_stop, name='oracle_sync_stop'),
     path('sync-data-referensi/clear-session/', views.oracle_sync_clear_session, name='oracle_sync_clear_session'),
     path('sync-data-referensi/progress/', views.oracle_sync_progress, name='oracle_sync_progress'),
+    path('sync-data-referensi/events/', views.oracle_sync_events, name='oracle_sync_events'),
     path('sync-data-referensi/truncate/', views.oracle_sync_truncate, name='oracle_sync_truncate'),
     path('sync-data-referensi/download-errors/<str:sync_id>/', views.oracle_sync_download_errors, name='oracle_sync_download_errors'),
     path('sync-data-referensi/stop-check/', views.oracle_sync_stop_check, name='oracle_sync_stop_check'),
@@ -40,6 +41,7 @@ urlpatterns = [
     path('sync-tiket/stop/', views.sync_tiket_stop, name='sync_tiket_stop'),
     path('sync-tiket/stop-check/', views.sync_tiket_stop_check, name='sync_tiket_stop_check'),
     path('sync-tiket/progress/', views.sync_tiket_progress, name='sync_tiket_progress'),
+    path('sync-tiket/events/', views.sync_tiket_events, name='sync_tiket_events'),
     path('sync-tiket/truncate/', views.sync_tiket_truncate, name='sync_tiket_truncate'),
     path('sync-tiket/download-errors/<str:sync_id>/', views.sync_tiket_download_errors, name='sync_tiket_download_errors'),
 
@@ -47,6 +49,12 @@ urlpatterns = [
     path('sync-log-status/', views.sync_log_status, name='sync_log_status'),
     path('sync-log-status/download/<str:filename>/', views.sync_log_download, name='sync_log_download'),
 
+    # Diagnostics
+    path('diagnostics/queries/', views.query_diagnostics, name='query_diagnostics'),
+    path('diagnostics/profiles/', views.profile_diagnostics, name='profile_diagnostics'),
+    path('diagnostics/profiles/<str:profile_id>/', views.profile_detail, name='profile_detail'),
+    path('diagnostics/profiles/<str:profile_id>/download/', views.profile_download, name='profile_download'),
+
     # === Dashboard Section ===
     path('dashboard/', views.DashboardMonitoringView.as_view(), name='dashboard_monitoring'),
     # path('dashboard/', views.index, name='dashboard_index'),
@@ -298,6 +306,7 @@ urlpatterns = [
     # List view (shared across all workflow steps)
     path('tiket/', views.TiketListView.as_view(), name='tiket_list'),
     path('tiket/data/', views.tiket_data, name='tiket_data'),
+    path('tiket/bulk/<str:action>/', views.tiket_bulk_action, name='tiket_bulk_action'),
     path('tiket/<int:pk>/documents/download/', views.tiket_documents_download, name='tiket_documents_download'),
     # Tiket Identifikasi URLs
     path('tiket/identifikasi/', views.TiketListView.as_view(), name='tiket_identifikasi_list'),
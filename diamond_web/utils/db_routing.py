@@ -0,0 +1,155 @@
+"""Route read-only report queries to the ``reporting`` database alias.
+
+The ``reporting`` alias (see ``DATABASES`` in config/settings.py) is a
+read-only connection: on SQLite a second connection to the same WAL file with
+``PRAGMA query_only``, on PostgreSQL a replica.  Long sync transactions on
+``default`` then no longer slow down the report and DataTables reads.
+
+Nothing is routed by default.  Views opt in with ``use_reporting_db`` (function
+views) or ``ReportingDatabaseMixin`` (views/mixins.py); inside them reads of
+``diamond_web`` models go to the reporting alias while every write stays on
+``default``.  Reads go back to ``default``:
+
+- for the rest of the view once it has written anything;
+- inside ``primary_reads()``, e.g. while building shared caches, so replica
+  lag is never cached;
+- for ``REPORTING_DB_PIN_SECONDS`` after a request of the same session wrote
+  to the database (``ReportingPinMiddleware``), so a list reloaded right after
+  a save shows the saved row even when the replica lags.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPORTING_ALIAS = 'reporting'
+ROUTED_APP_LABELS = {'diamond_web'}
+PIN_SESSION_KEY = '_reporting_db_pinned_until'
+
+# None outside reporting views; otherwise {'wrote': bool}
+_reporting_state: ContextVar = ContextVar('reporting_state', default=None)
+_primary_only: ContextVar = ContextVar('primary_only', default=False)
+# None outside ReportingPinMiddleware; otherwise {'wrote': bool}
+_request_writes: ContextVar = ContextVar('request_writes', default=None)
+
+
+def reporting_available():
+    return getattr(settings, 'REPORTING_DB_ENABLED', False) and REPORTING_ALIAS in connections
+
+
+@contextmanager
+def reporting_reads():
+    """Send reads of ``diamond_web`` models to the reporting alias inside the block."""
+    token = _reporting_state.set({'wrote': False})
+    try:
+        yield
+    finally:
+        _reporting_state.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Keep every read on ``default`` inside the block, even in reporting views."""
+    token = _primary_only.set(True)
+    try:
+        yield
+    finally:
+        _primary_only.reset(token)
+
+
+@contextmanager
+def track_writes():
+    """Yield a dict whose ``wrote`` flag is set once anything is written."""
+    state = {'wrote': False}
+    token = _request_writes.set(state)
+    try:
+        yield state
+    finally:
+        _request_writes.reset(token)
+
+
+def current_read_alias(model):
+    """Alias the router would pick for a read of *model* right now."""
+    state = _reporting_state.get()
+    if (
+        state is None
+        or state['wrote']
+        or _primary_only.get()
+        or model._meta.app_label not in ROUTED_APP_LABELS
+        or not reporting_available()
+    ):
+        return DEFAULT_DB_ALIAS
+    return REPORTING_ALIAS
+
+
+class ReportingRouter:
+    """Database router for the ``reporting`` alias; writes always go to ``default``."""
+
+    def db_for_read(self, model, **hints):
+        alias = current_read_alias(model)
+        if alias == REPORTING_ALIAS:
+            return alias
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db == REPORTING_ALIAS:
+            # Related objects of rows read in a reporting view, loaded later
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        for state in (_reporting_state.get(), _request_writes.get()):
+            if state is not None:
+                state['wrote'] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, REPORTING_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPORTING_ALIAS:
+            return False
+        return None
+
+
+def pin_primary(request, seconds=None):
+    """Keep the reads of *request*'s session on ``default`` for a while."""
+    if seconds is None:
+        seconds = getattr(settings, 'REPORTING_DB_PIN_SECONDS', 5)
+    if seconds > 0 and hasattr(request, 'session'):
+        request.session[PIN_SESSION_KEY] = time.time() + seconds
+
+
+def primary_pinned(request):
+    session = getattr(request, 'session', None)
+    if session is None:
+        return False
+    return session.get(PIN_SESSION_KEY, 0) > time.time()
+
+
+@contextmanager
+def reporting_reads_for(request):
+    """``reporting_reads()`` unless *request*'s session is pinned to the primary."""
+    if primary_pinned(request) or not reporting_available():
+        yield
+        return
+    with reporting_reads():
+        yield
+
+
+def use_reporting_db(view_func):
+    """Decorator: run a read-only function view against the reporting alias.
+
+    Apply it below the authentication decorators so the permission checks
+    read users and groups from ``default``.
+    """
+    @wraps(view_func)
+    def _wrapped(request, *args, **kwargs):
+        with reporting_reads_for(request):
+            return view_func(request, *args, **kwargs)
+    return _wrapped
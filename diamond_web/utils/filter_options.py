@@ -0,0 +1,99 @@
+"""Cached option lists for the laporan filter dropdowns.
+
+Options built from master tables come from ``utils/reference_data.py``.
+This module adds the ones derived from Tiket rows -- the years tikets
+exist for -- which must not ride on the reference data version: tikets
+are written all day, master tables a few times a year.
+
+The year list is read with one ``SELECT DISTINCT tahun`` and kept in the
+shared cache.  A saved tiket only drops it when its year is not listed yet
+(see ``diamond_web.signals``); a deleted tiket or a tiket sync (bulk
+writes bypass the signals) always drops it.
+"""
+
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..models import Tiket
+from .db_routing import primary_reads
+from .reference_data import get_reference
+
+_TIKET_YEARS_KEY = 'filter_options_tiket_years'
+
+
+def _cache_timeout():
+    return getattr(settings, 'REFERENCE_DATA_CACHE_TIMEOUT', 24 * 60 * 60)
+
+
+def tiket_years():
+    """Distinct ``Tiket.tahun`` values, newest first."""
+    years = cache.get(_TIKET_YEARS_KEY)
+    if years is None:
+        # Never cache years read from a lagging reporting replica
+        with primary_reads():
+            years = sorted(
+                Tiket.objects.order_by().values_list('tahun', flat=True).distinct(),
+                reverse=True,
+            )
+        cache.set(_TIKET_YEARS_KEY, years, _cache_timeout())
+    return years
+
+
+def year_options():
+    """Years for a laporan 'Tahun' dropdown: the tiket years plus the current year, newest first."""
+    years = list(tiket_years())
+    current_year = datetime.now().year
+    if current_year not in years:
+        years.insert(0, current_year)
+    return years
+
+
+def invalidate_tiket_years():
+    """Drop the cached year list (rebuilt on next read)."""
+    cache.delete(_TIKET_YEARS_KEY)
+
+
+def note_tiket_year(tahun):
+    """A tiket of *tahun* was saved: drop the cached list only if it lacks that year."""
+    years = cache.get(_TIKET_YEARS_KEY)
+    if years is not None and tahun not in years:
+        invalidate_tiket_years()
+
+
+def pide_filter_options(id_ilap=None, id_jenis_data=None, nama_sub_jenis_data=None, nama_tabel_I=None):
+    """Cascading ILAP / Jenis Data / Sub Jenis / Tabel I options of the PIDE laporan.
+
+    Each argument narrows the cached sub jenis data rows; ``'all'`` or an
+    empty value leaves that level open.
+
+    Returns:
+        dict: ``ilaps`` ({'id', 'nama_ilap'}), ``jenis_data`` ({'id',
+        'nama_sub_jenis_data', 'id_sub_jenis_data'}), ``sub_jenis`` and
+        ``tabel_i`` (distinct names).
+    """
+    rows = get_reference('jenis_data_ilap')
+    if id_ilap and id_ilap != 'all':
+        rows = [r for r in rows if str(r['id_ilap_id']) == id_ilap]
+    if id_jenis_data and id_jenis_data != 'all':
+        rows = [r for r in rows if str(r['id']) == id_jenis_data]
+    if nama_sub_jenis_data and nama_sub_jenis_data != 'all':
+        rows = [r for r in rows if r['nama_sub_jenis_data'] == nama_sub_jenis_data]
+    if nama_tabel_I and nama_tabel_I != 'all':
+        rows = [r for r in rows if r['nama_tabel_I'] == nama_tabel_I]
+
+    ilap_ids = {r['id_ilap_id'] for r in rows}
+    return {
+        'ilaps': sorted(
+            ({'id': i['id'], 'nama_ilap': i['nama_ilap']} for i in get_reference('ilap') if i['id'] in ilap_ids),
+            key=lambda i: i['nama_ilap'],
+        ),
+        'jenis_data': sorted(
+            ({'id': r['id'], 'nama_sub_jenis_data': r['nama_sub_jenis_data'], 'id_sub_jenis_data': r['id_sub_jenis_data']}
+             for r in rows),
+            key=lambda r: r['nama_sub_jenis_data'],
+        ),
+        'sub_jenis': sorted({r['nama_sub_jenis_data'] for r in rows}),
+        'tabel_i': sorted({r['nama_tabel_I'] for r in rows}),
+    }
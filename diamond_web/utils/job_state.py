@@ -0,0 +1,201 @@
+"""Consolidated progress state for background sync/check jobs.
+
+Every Celery sync/check job keeps its whole state (flags, progress, result,
+error, Celery task id, stop request) in **one Redis hash** so the progress
+endpoints read it with a single ``HGETALL`` instead of 4–6 ``cache.get``
+round trips.  Each write is also published on a per-job channel, which lets
+the Server-Sent Events endpoints push updates to the browser instead of
+being polled.
+
+When the cache backend is not django-redis (e.g. ``REDIS_CACHE_URL=locmem``
+in development/tests) the state falls back to a single dict stored under one
+cache key and the event stream re-reads it on a short interval.
+"""
+
+import json
+import logging
+import time
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+logger = logging.getLogger(__name__)
+
+# Job kinds (also used as cache-key prefixes).
+CHECK_REFERENSI = 'check_referensi'
+SYNC_REFERENSI = 'sync_referensi'
+CHECK_TIKET = 'check_tiket'
+SYNC_TIKET = 'sync_tiket'
+
+STATE_TIMEOUT = 3600  # seconds a job's state is kept after its last write
+
+# Stop-flag polling in hot loops: hit the cache at most every N rows or T seconds.
+STOP_CHECK_EVERY = 500
+STOP_CHECK_INTERVAL = 1.0
+
+# Server-Sent Events: close the stream after this many seconds (the browser's
+# EventSource reconnects automatically) and re-read state at least this often.
+STREAM_TIMEOUT = 55
+STREAM_POLL_INTERVAL = 1.0
+
+EMPTY_PROGRESS = {
+    'current': 0, 'total': 0, 'percentage': 0,
+    'inserts': 0, 'updates': 0, 'errors': 0,
+}
+
+
+def _redis_client():
+    """Return the raw Redis client behind the default cache, or None."""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except (ImportError, NotImplementedError):
+        return None
+
+
+class JobState:
+    """Single-hash state store for one background job.
+
+    Fields used by the sync views and tasks:
+        ``in_progress``, ``done``, ``progress``, ``result``, ``error``,
+        ``celery_task_id``, ``started_at``, ``stop_requested``.
+
+    Args:
+        kind: Job kind, one of the module-level constants (e.g. ``SYNC_TIKET``).
+        job_id: The sync_id / check_id of the run.
+    """
+
+    def __init__(self, kind, job_id):
+        self.kind = kind
+        self.job_id = job_id
+        self.key = f'{kind}_state_{job_id}'
+        self.channel = f'{kind}_events_{job_id}'
+        self._client = _redis_client()
+
+    # -- writes ------------------------------------------------------------
+
+    def update(self, **fields):
+        """Write *fields* into the job hash and notify event-stream listeners."""
+        if self._client is not None:
+            key = cache.make_key(self.key)
+            mapping = {name: json.dumps(value, cls=DjangoJSONEncoder) for name, value in fields.items()}
+            pipe = self._client.pipeline()
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, STATE_TIMEOUT)
+            pipe.publish(cache.make_key(self.channel), '1')
+            pipe.execute()
+            return
+        state = cache.get(self.key) or {}
+        state.update(fields)
+        cache.set(self.key, state, timeout=STATE_TIMEOUT)
+
+    def start(self, **fields):
+        """Initialise the state for a freshly dispatched job."""
+        self.update(in_progress=True, done=False, **fields)
+
+    def set_progress(self, **progress):
+        """Replace the progress snapshot."""
+        self.update(progress=progress)
+
+    def finish(self, result=None, error=None):
+        """Mark the job done with its *result* or *error*."""
+        fields = {'done': True, 'in_progress': False}
+        if result is not None:
+            fields['result'] = result
+        if error is not None:
+            fields['error'] = error
+        self.update(**fields)
+
+    def request_stop(self, message):
+        """Flag the job for stopping and report it as finished with *message*."""
+        self.update(stop_requested=True, done=True, error=message)
+
+    def clear(self):
+        """Delete all state for this job."""
+        if self._client is not None:
+            self._client.delete(cache.make_key(self.key))
+            return
+        cache.delete(self.key)
+
+    # -- reads -------------------------------------------------------------
+
+    def read(self):
+        """Return the job state dict, or None when no state exists (expired/unknown)."""
+        if self._client is not None:
+            raw = self._client.hgetall(cache.make_key(self.key))
+            if not raw:
+                return None
+            return {
+                (name.decode() if isinstance(name, bytes) else name): json.loads(value)
+                for name, value in raw.items()
+            }
+        return cache.get(self.key)
+
+    def stop_requested(self):
+        """Return True if a stop was requested for this job."""
+        if self._client is not None:
+            value = self._client.hget(cache.make_key(self.key), 'stop_requested')
+            return bool(value and json.loads(value))
+        return bool((cache.get(self.key) or {}).get('stop_requested'))
+
+    def stop_checker(self, every=STOP_CHECK_EVERY, interval=STOP_CHECK_INTERVAL):
+        """Return a rate-limited stop checker for use inside row loops."""
+        return ThrottledStopChecker(self, every=every, interval=interval)
+
+    def listen(self, timeout=STREAM_TIMEOUT, poll_interval=STREAM_POLL_INTERVAL):
+        """Yield the job state each time it changes, until done or *timeout*.
+
+        Uses Redis pub/sub to wake up immediately on writes; without Redis it
+        re-reads the state every *poll_interval* seconds.  The first state is
+        always yielded (``None`` if the job is unknown), then the generator
+        ends once the job is done.
+        """
+        deadline = time.monotonic() + timeout
+        pubsub = None
+        if self._client is not None:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(cache.make_key(self.channel))
+        try:
+            last = object()
+            while True:
+                state = self.read()
+                if state != last:
+                    yield state
+                    last = state
+                if state is None or state.get('done') or time.monotonic() >= deadline:
+                    return
+                if pubsub is not None:
+                    pubsub.get_message(timeout=poll_interval)
+                else:
+                    time.sleep(poll_interval)
+        finally:
+            if pubsub is not None:
+                pubsub.close()
+
+
+class ThrottledStopChecker:
+    """Callable returning True once a stop was requested, polling the cache sparingly.
+
+    The cache is consulted on the first call after *every* calls or *interval*
+    seconds have passed since the previous lookup, whichever comes first.  Once
+    a stop is seen the result latches to True without further lookups.
+    """
+
+    def __init__(self, state, every=STOP_CHECK_EVERY, interval=STOP_CHECK_INTERVAL):
+        self.state = state
+        self.every = every
+        self.interval = interval
+        self._calls = 0
+        self._last_check = time.monotonic()
+        self._stopped = False
+
+    def __call__(self):
+        if self._stopped:
+            return True
+        self._calls += 1
+        now = time.monotonic()
+        if self._calls >= self.every or now - self._last_check >= self.interval:
+            self._calls = 0
+            self._last_check = now
+            self._stopped = self.state.stop_requested()
+        return self._stopped
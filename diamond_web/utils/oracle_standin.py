@@ -0,0 +1,546 @@
+"""SQLite stand-in for the Oracle source databases of the reference/tiket sync.
+
+``SqliteStandInAdapter`` is a source adapter for ``OracleDataSyncService``
+(see ``OracleSourceAdapter`` in utils/oracle_sync.py).  It serves the source
+tables read by ``HARD_CODED_SYNC_TABLES``, the ``_post_process_*`` steps and
+``_TIKET_ORACLE_SQL`` from SQLite files, so complete check/sync runs work
+without an Oracle client or network access (CI, local development).
+
+A stand-in directory holds one file per connection (``primary.sqlite3``,
+``secondary.sqlite3``) for the unqualified tables and one file per Oracle
+schema (``PROD``, ``P3DE``, ``PVPTD``) that is ATTACHed to every connection,
+so ``PROD.APP_ILAP`` resolves as in Oracle.  The few Oracle-only constructs
+used by the queries are translated: ``DATE 'yyyy-mm-dd'`` literals, ``NVL``,
+``TO_DATE`` and the ``DUAL`` table.  Like Oracle ``DATE`` columns, date
+values are returned as ``datetime``.
+
+``SourceScenario`` generates the table contents: a deterministic data set of
+configurable size plus inserts, updates, deletes and FK orphans on top of it.
+Build a directory with ``manage.py oracle_standin`` and select it with
+``ORACLE_SOURCE_ADAPTER=sqlite`` and ``ORACLE_STANDIN_PATH``.
+"""
+
+import random
+import re
+import shutil
+import sqlite3
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from .oracle_sync import (
+    ADDITIONAL_JENIS_DATA_ILAP_RECORDS,
+    ADDITIONAL_PERIODE_JENIS_DATA_RECORDS,
+    DEFAULT_ILAP_CODES,
+    OracleSyncConfigError,
+)
+
+SCHEMAS = ('PROD', 'P3DE', 'PVPTD')
+CONNECTIONS = ('primary', 'secondary')
+
+# Source tables and their columns, in Oracle column order (``app.*`` in the
+# ilap query relies on the order of PROD.APP_ILAP).  Unqualified tables live
+# in the secondary database.  REF_TABEL_PMDE also gets one PRIORITAS_<year>
+# column per scenario year.
+SOURCE_TABLES = {
+    'PROD.APP_KATEGORI_ILAP': ('ID_KATEGORI_ILAP', 'NAMA_KATEGORI', 'CREATE_DATE', 'CREATE_BY'),
+    'PROD.APP_ILAP': (
+        'ID_ILAP', 'ID_KATEGORI_ILAP', 'NAMA_ILAP', 'ALAMAT_ILAP', 'KOTA_ILAP', 'NAMAPIC_ILAP',
+        'TELP_KANTOR', 'FAX_ILAP', 'EMAIL_PICILAP', 'CREATE_DATE', 'CREATE_BY', 'JABATAN_PICILAP',
+        'TELP_PIC', 'TUJUAN_SURAT', 'TEMBUSAN', 'UPDATE_DATE', 'UPDATE_BY',
+    ),
+    'PROD.REF_ILAP': ('ID_ILAP', 'ID_KATEGORI', 'NAMA_ILAP'),
+    'PROD.APP_JENIS_DATA_ILAP': (
+        'ID_ILAP', 'ID_JENIS_DATA', 'NAMA_JENIS_DATA', 'PERIODE_PENGIRIMAN',
+        'TGL_PENYAMPAIAN_PERTAMA', 'JADWAL_PENYAMPAIAN', 'PIC_PDDO',
+    ),
+    'PROD.APP_TABEL_DATA_ILAP': ('ID_JENIS_DATA', 'ID_TABEL_DATA', 'NAMA_TABEL_TIP', 'JENIS_TABEL'),
+    'PROD.APP_PENERIMAANBACKUP': (
+        'ID_TIKET', 'NO_SURATPENGANTAR', 'TGL_SURATPENGANTAR', 'NAMA_PENGIRIM', 'BENTUK_DATA',
+        'CARA_PENYAMPAIAN',
+    ),
+    'P3DE.REF_DTL_DSR_HUKUM': ('ID_DSR_HUKUM', 'KET_DSR_HUKUM'),
+    'P3DE.REF_DATA_ILAP': ('ID_ILAP', 'ID_JENIS_DATA', 'ID_TABEL', 'JENIS_DATA', 'NAMA_TABEL'),
+    'P3DE.REF_DSR_HUKUM': ('ID_TABEL', 'ID_DSR_HUKUM'),
+    'PVPTD.ZA_REKAP_PEMBAGIAN_PIC_PIDE': ('ID_TABEL', 'NM_TABEL', 'PIC'),
+    'PVPTD.ZA_REKAP_PIC_PIDE': ('NAMA_MATCH', 'NIP_MATCH'),
+    'PVPTD.ZA_DDE_TABEL_FACT': (
+        'ID_TIKET', 'NAMA_TABEL_DBBD', 'JENIS_TABEL', 'STATUS_TIKET', 'JML_ROW_P3DE',
+        'JML_DATA_TELITI', 'PERIODE_PENGIRIMAN', 'PERIODE_DATA', 'TAHUN_DATA', 'TGL_TERIMA',
+        'TGL_TELITI', 'TGL_NADINE', 'NO_NADINE',
+    ),
+    'PVPTD.ZA_REKAP_TARIKAN': (
+        'NO_TIKET', 'TGL_TRANSFER', 'TGL_REMATCH', 'JML_LOG', 'JML_LOG_U', 'JML_RES', 'JML_CDE',
+        'SUDAH_QC', 'BELUM_QC', 'LOLOS_QC', 'TIDAK_LOLOS_QC', 'QC_P', 'QC_X', 'QC_W', 'QC_F',
+        'QC_A', 'QC_C', 'QC_N', 'QC_Y', 'QC_Z', 'QC_U', 'QC_E', 'QC_V', 'QC_R', 'QC_D',
+    ),
+    'PVPTD.ZA_REKAP_TIKET': ('NO_TIKET', 'TGL_TIKET'),
+    'REF_TABEL_PMDE': ('ID_TABEL_S', 'DURASI', 'TABEL_I', 'NIP_PIC'),
+    'REF_PIC_ILAP_PMDE': ('ID_ILAP', 'NIP_PIC'),
+}
+
+# Column of each table whose value starts with the owning ILAP code; used to
+# delete an ILAP together with its jenis data, PIC and tiket rows.
+ILAP_COLUMNS = {
+    'PROD.APP_ILAP': 'ID_ILAP',
+    'PROD.REF_ILAP': 'ID_ILAP',
+    'PROD.APP_JENIS_DATA_ILAP': 'ID_ILAP',
+    'PROD.APP_TABEL_DATA_ILAP': 'ID_JENIS_DATA',
+    'PROD.APP_PENERIMAANBACKUP': 'ID_TIKET',
+    'P3DE.REF_DATA_ILAP': 'ID_ILAP',
+    'P3DE.REF_DSR_HUKUM': 'ID_TABEL',
+    'PVPTD.ZA_REKAP_PEMBAGIAN_PIC_PIDE': 'ID_TABEL',
+    'PVPTD.ZA_DDE_TABEL_FACT': 'ID_TIKET',
+    'PVPTD.ZA_REKAP_TARIKAN': 'NO_TIKET',
+    'PVPTD.ZA_REKAP_TIKET': 'NO_TIKET',
+    'REF_TABEL_PMDE': 'ID_TABEL_S',
+    'REF_PIC_ILAP_PMDE': 'ID_ILAP',
+}
+
+_DATE_LITERAL = re.compile(r"\bDATE\s+'(\d{4}-\d{2}-\d{2})'", re.IGNORECASE)
+_ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?)?$')
+_ORACLE_DATE_FORMAT = (
+    ('YYYY', '%Y'), ('YY', '%y'), ('MM', '%m'), ('DD', '%d'),
+    ('HH24', '%H'), ('MI', '%M'), ('SS', '%S'),
+)
+
+
+def translate_sql(sql: str) -> str:
+    """Rewrite the Oracle-only syntax used by the sync queries for SQLite."""
+    return _DATE_LITERAL.sub(r"'\1'", sql)
+
+
+def _nvl(value, default):
+    return default if value is None else value
+
+
+def _to_date(value, fmt='YYYY-MM-DD HH24:MI:SS'):
+    if value is None:
+        return None
+    pattern = fmt.upper()
+    for oracle_token, strftime_token in _ORACLE_DATE_FORMAT:
+        pattern = pattern.replace(oracle_token, strftime_token)
+    return datetime.strptime(str(value), pattern).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _from_sqlite(value):
+    if isinstance(value, str) and _ISO_DATE.match(value):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _to_sqlite(value):
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _table_file(directory: Path, table: str) -> tuple[Path, str]:
+    schema, _, name = table.rpartition('.')
+    if schema:
+        return directory / f'{schema}.sqlite3', name
+    return directory / 'secondary.sqlite3', name
+
+
+class StandInCursor:
+    """DB-API cursor with the parts of the oracledb cursor the sync uses."""
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, sql, parameters=None):
+        self._cursor.execute(translate_sql(sql), parameters or ())
+        return self
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        return None if row is None else tuple(_from_sqlite(value) for value in row)
+
+    def fetchall(self):
+        return [tuple(_from_sqlite(value) for value in row) for row in self._cursor.fetchall()]
+
+    def close(self):
+        self._cursor.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class StandInConnection:
+    """Connection to one stand-in database with the Oracle schemas attached."""
+
+    def __init__(self, directory: Path, connection_name: str):
+        self._connection = sqlite3.connect(directory / f'{connection_name}.sqlite3')
+        for schema in SCHEMAS:
+            self._connection.execute('ATTACH DATABASE ? AS ' + schema, (str(directory / f'{schema}.sqlite3'),))
+        # Oracle LIKE is case sensitive
+        self._connection.execute('PRAGMA case_sensitive_like = ON')
+        self._connection.create_function('NVL', 2, _nvl, deterministic=True)
+        self._connection.create_function('TO_DATE', 1, _to_date, deterministic=True)
+        self._connection.create_function('TO_DATE', 2, _to_date, deterministic=True)
+
+    def cursor(self):
+        return StandInCursor(self._connection.cursor())
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SqliteStandInAdapter:
+    """Source adapter reading the stand-in databases in *path*."""
+
+    name = 'sqlite'
+    requires_credentials = False
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def prepare(self):
+        pass
+
+    def connect(self, conn_cfg):
+        if not (self.path / f'{conn_cfg.name}.sqlite3').exists():
+            raise OracleSyncConfigError(
+                f'Database stand-in untuk connection {conn_cfg.name} tidak ditemukan di {self.path}'
+            )
+        return StandInConnection(self.path, conn_cfg.name)
+
+    def discover_pmde_prioritas_years(self, conn_cfg) -> list[int]:
+        with self.connect(conn_cfg) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('PRAGMA table_info(REF_TABEL_PMDE)')
+                columns = [row[1] for row in cursor.fetchall()]
+        years = []
+        for column in columns:
+            match = re.fullmatch(r'PRIORITAS_(\d{4})', column.upper())
+            if match:
+                years.append(int(match.group(1)))
+        # Same fallback as the Oracle discovery when no PRIORITAS column exists
+        return sorted(years) or list(range(2022, date.today().year + 1))
+
+
+def write_standin(path, tables: dict[str, list[dict]], prioritas_years=()) -> Path:
+    """Create the stand-in databases in *path* with the given table rows.
+
+    Any previous stand-in files in *path* are replaced.  Every table of
+    ``SOURCE_TABLES`` is created, missing ones empty.
+    """
+    directory = Path(path)
+    if directory.exists():
+        for file in directory.glob('*.sqlite3'):
+            file.unlink()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    for connection_name in CONNECTIONS:
+        with sqlite3.connect(directory / f'{connection_name}.sqlite3') as conn:
+            conn.execute('CREATE TABLE DUAL (DUMMY TEXT)')
+            conn.execute("INSERT INTO DUAL VALUES ('X')")
+        conn.close()
+
+    for table, columns in SOURCE_TABLES.items():
+        if table == 'REF_TABEL_PMDE':
+            columns = (*columns, *(f'PRIORITAS_{year}' for year in sorted(prioritas_years)))
+        file, name = _table_file(directory, table)
+        rows = tables.get(table, [])
+        with sqlite3.connect(file) as conn:
+            conn.execute(f'CREATE TABLE {name} ({", ".join(columns)})')
+            conn.executemany(
+                f'INSERT INTO {name} VALUES ({", ".join("?" * len(columns))})',
+                [tuple(_to_sqlite(row.get(column)) for column in columns) for row in rows],
+            )
+        conn.close()
+    return directory
+
+
+def remove_standin(path):
+    shutil.rmtree(path, ignore_errors=True)
+
+
+# Oracle STATUS_TIKET values and how often they occur in generated tikets
+STATUS_TIKET_WEIGHTS = {
+    '[P3DE]-Proses Penelitian': 3,
+    '[P3DE]-Proses Nadine': 2,
+    '[PIDE]-Proses Identifikasi': 3,
+    '[PMDE]-Proses QC': 2,
+    '[P3DE]-Close Tiket': 1,
+    '[SELESAI]-Sudah QC': 4,
+    '[SELESAI]-Tiket 0 Row': 1,
+}
+PERIODE = {
+    'Bulanan': ('Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni'),
+    'Triwulan': ('Triwulan I', 'Triwulan II', 'Triwulan III', 'Triwulan IV'),
+    'Tahunan': ('Tahun',),
+}
+JENIS_TABEL = {
+    'Referensi': 'Diidentifikasi',
+    'Transaksi': 'Tidak Diidentifikasi',
+}
+DASAR_HUKUM = (('PMK-228', 'PMK 228 TAHUN 2017'), ('KMK-001', 'KMK 1 TAHUN 2020'), ('PKS-010', 'PKS DJP 2021'))
+BENTUK_DATA = ('Softcopy', 'Hardcopy')
+CARA_PENYAMPAIAN = ('Online', 'Langsung')
+
+
+class SourceScenario:
+    """Deterministic contents of the Oracle source tables.
+
+    The base rows cover what the sync's hard-coded post-processes expect:
+    the kategori of every ILAP code they use, the ILAPs and jenis data named
+    by ``ADDITIONAL_*`` that are not default ILAPs, and the EI95001 AEOI
+    jenis data.  A clean scenario therefore syncs without errors once the
+    master tables (KategoriWilayah, JenisTabel, StatusData, PeriodePengiriman
+    and the ``user_pmde`` group) and the users in ``nips`` exist.
+
+    On top of that ``ilap`` generated ILAPs get ``jenis_data_per_ilap`` jenis
+    data each, with PIC, klasifikasi and PMDE prioritas rows and
+    ``tiket_per_jenis_data`` tikets.  ``insert``, ``update``, ``delete`` and
+    ``orphan`` change the data set and return the affected keys.
+    """
+
+    def __init__(self, ilap=20, jenis_data_per_ilap=2, tiket_per_jenis_data=2, years=(2024, 2025), seed=0):
+        self.jenis_data_per_ilap = jenis_data_per_ilap
+        self.tiket_per_jenis_data = tiket_per_jenis_data
+        self.years = tuple(sorted(years))
+        self.rng = random.Random(seed)
+        self.tables: dict[str, list[dict]] = {table: [] for table in SOURCE_TABLES}
+        self.ilaps: list[str] = []
+        self.nips = {'p3de': [], 'pide': [], 'pmde': []}
+        self._next_ilap = 0
+        self._next_orphan = 0
+        self._pide_names: set[str] = set()
+        self._base()
+        self.insert(ilap)
+
+    # --- generation -------------------------------------------------------
+
+    def _add(self, table, **row):
+        self.tables[table].append(row)
+
+    def _kategori(self, code):
+        existing = {row['ID_KATEGORI_ILAP'] for row in self.tables['PROD.APP_KATEGORI_ILAP']}
+        if code not in existing and code != 'KW':
+            self._add(
+                'PROD.APP_KATEGORI_ILAP',
+                ID_KATEGORI_ILAP=code, NAMA_KATEGORI=f'KATEGORI {code}',
+                CREATE_DATE=datetime(2015, 1, 1), CREATE_BY='SYSTEM',
+            )
+
+    def _nip(self, role):
+        pool = self.nips[role]
+        if len(pool) < 3 or self.rng.random() < 0.1:
+            offset = {'p3de': 100000, 'pide': 200000, 'pmde': 300000}[role]
+            pool.append(f'{900000000 + offset + len(pool)}')
+        return self.rng.choice(pool)
+
+    def _base(self):
+        for id_dsr_hukum, keterangan in DASAR_HUKUM:
+            self._add('P3DE.REF_DTL_DSR_HUKUM', ID_DSR_HUKUM=id_dsr_hukum, KET_DSR_HUKUM=keterangan)
+
+        default_codes = set(DEFAULT_ILAP_CODES)
+        ilap_codes = sorted(
+            {record[0] for record in ADDITIONAL_JENIS_DATA_ILAP_RECORDS}
+            | {sub[:5] for sub, _ in ADDITIONAL_PERIODE_JENIS_DATA_RECORDS}
+        )
+        for code in sorted({code[:2] for code in (*default_codes, *ilap_codes)}):
+            self._kategori(code)
+        for code in ilap_codes:
+            if code not in default_codes:
+                self._add('PROD.REF_ILAP', ID_ILAP=code, ID_KATEGORI=code[:2], NAMA_ILAP=code)
+
+        additional_subs = {record[2] for record in ADDITIONAL_JENIS_DATA_ILAP_RECORDS}
+        referenced_subs = ['EI9500101'] + sorted(
+            sub for sub, _ in ADDITIONAL_PERIODE_JENIS_DATA_RECORDS if sub not in additional_subs
+        )
+        for sub in referenced_subs:
+            self._jenis_data(sub[:5], sub[:7], sub, periode='Tahunan', tiket=0)
+
+    def _jenis_data(self, id_ilap, id_jenis_data, sub, periode, tiket):
+        nama_tabel = f'KPDE_{sub}'
+        jenis_tabel = self.rng.choice(tuple(JENIS_TABEL))
+        self._add(
+            'PROD.APP_JENIS_DATA_ILAP',
+            ID_ILAP=id_ilap, ID_JENIS_DATA=id_jenis_data, NAMA_JENIS_DATA=f'JENIS DATA {id_jenis_data}',
+            PERIODE_PENGIRIMAN=periode, TGL_PENYAMPAIAN_PERTAMA=datetime(2020, 1, 1),
+            JADWAL_PENYAMPAIAN=self.rng.choice((15, 30, 60)), PIC_PDDO=self._nip('p3de'),
+        )
+        self._add(
+            'PROD.APP_TABEL_DATA_ILAP',
+            ID_JENIS_DATA=id_jenis_data, ID_TABEL_DATA=sub, NAMA_TABEL_TIP=nama_tabel, JENIS_TABEL=jenis_tabel,
+        )
+        self._add('P3DE.REF_DSR_HUKUM', ID_TABEL=sub, ID_DSR_HUKUM=self.rng.choice(DASAR_HUKUM)[0])
+
+        nama_pide = f'PIDE {self._nip("pide")}'
+        self._add('PVPTD.ZA_REKAP_PEMBAGIAN_PIC_PIDE', ID_TABEL=sub, NM_TABEL=nama_tabel, PIC=nama_pide)
+        if nama_pide not in self._pide_names:
+            self._pide_names.add(nama_pide)
+            self._add('PVPTD.ZA_REKAP_PIC_PIDE', NAMA_MATCH=nama_pide, NIP_MATCH=nama_pide[5:])
+
+        prioritas = {f'PRIORITAS_{year}': int(self.rng.random() < 0.5) for year in self.years}
+        self._add(
+            'REF_TABEL_PMDE',
+            ID_TABEL_S=sub, DURASI=self.rng.choice((30, 45, 60)), TABEL_I=nama_tabel,
+            NIP_PIC=self._nip('pmde'), **prioritas,
+        )
+
+        for number in range(1, tiket + 1):
+            self._tiket(sub, nama_tabel, JENIS_TABEL[jenis_tabel], periode, number)
+
+    def _tiket(self, sub, nama_tabel, jenis_tabel, periode, number):
+        rng = self.rng
+        tahun = rng.choice(self.years)
+        terima = datetime(tahun, rng.randint(1, 12), rng.randint(1, 28), 9, 0)
+        id_tiket = f'{sub}{terima:%y%m%d}{number:02d}'
+        status = rng.choices(tuple(STATUS_TIKET_WEIGHTS), weights=tuple(STATUS_TIKET_WEIGHTS.values()))[0]
+        diterima = rng.randint(0, 5000) if status != '[SELESAI]-Tiket 0 Row' else 0
+        diteliti = rng.choice((diterima, diterima, max(diterima - rng.randint(1, 50), 0), None))
+        self._add(
+            'PVPTD.ZA_DDE_TABEL_FACT',
+            ID_TIKET=id_tiket, NAMA_TABEL_DBBD=nama_tabel, JENIS_TABEL=jenis_tabel, STATUS_TIKET=status,
+            JML_ROW_P3DE=diterima, JML_DATA_TELITI=diteliti,
+            PERIODE_PENGIRIMAN=rng.choice((periode if periode != 'Triwulan' else 'Triwulanan', None)),
+            PERIODE_DATA=rng.choice(PERIODE[periode]), TAHUN_DATA=tahun, TGL_TERIMA=terima,
+            TGL_TELITI=terima + timedelta(days=3) if diteliti is not None else None,
+            TGL_NADINE=terima + timedelta(days=5) if status != '[P3DE]-Proses Penelitian' else None,
+            NO_NADINE=f'ND-{number:04d}/PJ.1/{tahun}',
+        )
+        if status in ('[PIDE]-Proses Identifikasi', '[PMDE]-Proses QC', '[SELESAI]-Sudah QC'):
+            self._add('PVPTD.ZA_REKAP_TIKET', NO_TIKET=id_tiket, TGL_TIKET=terima + timedelta(days=7))
+        if status in ('[PMDE]-Proses QC', '[SELESAI]-Sudah QC'):
+            for transfer in range(rng.randint(1, 2)):
+                counts = {column: rng.randint(0, 50) for column in SOURCE_TABLES['PVPTD.ZA_REKAP_TARIKAN'][3:]}
+                self._add(
+                    'PVPTD.ZA_REKAP_TARIKAN',
+                    NO_TIKET=id_tiket, TGL_TRANSFER=terima + timedelta(days=10 + transfer),
+                    TGL_REMATCH=terima + timedelta(days=12 + transfer), **counts,
+                )
+        if rng.random() < 0.5:
+            self._add(
+                'PROD.APP_PENERIMAANBACKUP',
+                ID_TIKET=id_tiket, NO_SURATPENGANTAR=f'S-{number:03d}/{tahun}',
+                TGL_SURATPENGANTAR=terima - timedelta(days=2), NAMA_PENGIRIM=f'PENGIRIM {sub[:5]}',
+                BENTUK_DATA=rng.choice(BENTUK_DATA), CARA_PENYAMPAIAN=rng.choice(CARA_PENYAMPAIAN),
+            )
+
+    # --- mutations --------------------------------------------------------
+
+    def insert(self, count) -> list[str]:
+        """Add *count* ILAPs with their jenis data and tikets; returns the ILAP codes."""
+        codes = []
+        for _ in range(count):
+            index = self._next_ilap
+            self._next_ilap += 1
+            code = f'S{chr(ord("A") + index // 1000)}{index % 1000:03d}'
+            self._kategori(code[:2])
+            self._add(
+                'PROD.APP_ILAP',
+                ID_ILAP=code, ID_KATEGORI_ILAP=code[:2], NAMA_ILAP=f'ILAP {code}',
+                ALAMAT_ILAP=f'Jl. Sintetis No. {index}', KOTA_ILAP='Jakarta', NAMAPIC_ILAP=f'PIC {code}',
+                TELP_KANTOR='021-000000', EMAIL_PICILAP=f'{code.lower()}@example.com',
+                CREATE_DATE=datetime(2020, 1, 1), CREATE_BY='SYSTEM',
+            )
+            if index % 3 == 0:
+                # Also present in the legacy table: PROD.APP_ILAP takes priority
+                self._add('PROD.REF_ILAP', ID_ILAP=code, ID_KATEGORI=code[:2], NAMA_ILAP=f'LEGACY {code}')
+            self._add('REF_PIC_ILAP_PMDE', ID_ILAP=code, NIP_PIC=self._nip('pmde'))
+            for number in range(1, self.jenis_data_per_ilap + 1):
+                id_jenis_data = f'{code}{number:02d}'
+                self._jenis_data(
+                    code, id_jenis_data, f'{id_jenis_data}01',
+                    periode=self.rng.choice(tuple(PERIODE)), tiket=self.tiket_per_jenis_data,
+                )
+            self.ilaps.append(code)
+            codes.append(code)
+        return codes
+
+    def update(self, count) -> list[str]:
+        """Change address and delivery schedule of the first *count* ILAPs."""
+        codes = self.ilaps[:count]
+        for row in self.tables['PROD.APP_ILAP']:
+            if row['ID_ILAP'] in codes:
+                row['ALAMAT_ILAP'] = f'{row["ALAMAT_ILAP"]} (pindah)'
+                row['UPDATE_DATE'] = datetime(2025, 6, 1)
+        for row in self.tables['PROD.APP_JENIS_DATA_ILAP']:
+            if row['ID_ILAP'] in codes:
+                row['JADWAL_PENYAMPAIAN'] += 1
+        for row in self.tables['PVPTD.ZA_DDE_TABEL_FACT']:
+            if row['ID_TIKET'][:5] in codes:
+                row['JML_ROW_P3DE'] += 1
+        return codes
+
+    def delete(self, count) -> list[str]:
+        """Remove the last *count* ILAPs and every row that belongs to them."""
+        if count <= 0:
+            return []
+        codes = self.ilaps[-count:]
+        del self.ilaps[-count:]
+        prefixes = tuple(codes)
+        for table, column in ILAP_COLUMNS.items():
+            self.tables[table] = [
+                row for row in self.tables[table] if not str(row.get(column) or '').startswith(prefixes)
+            ]
+        return codes
+
+    def orphan(self, count, kind='jenis_data') -> list[str]:
+        """Add *count* rows whose reference does not exist in the source.
+
+        ``jenis_data`` rows point to unknown ILAPs (sync errors), ``pic``
+        rows to unknown ILAPs in REF_PIC_ILAP_PMDE (skipped rows) and
+        ``tiket`` rows to unknown sub jenis data (tiket sync errors).
+        """
+        keys = []
+        for _ in range(count):
+            index = self._next_orphan
+            self._next_orphan += 1
+            code = f'ZZ{index:03d}'
+            if kind == 'jenis_data':
+                sub = f'{code}0101'
+                self._add(
+                    'PROD.APP_JENIS_DATA_ILAP',
+                    ID_ILAP=code, ID_JENIS_DATA=sub[:7], NAMA_JENIS_DATA='YATIM', PERIODE_PENGIRIMAN='Bulanan',
+                    TGL_PENYAMPAIAN_PERTAMA=datetime(2020, 1, 1), JADWAL_PENYAMPAIAN=15,
+                )
+                self._add(
+                    'PROD.APP_TABEL_DATA_ILAP',
+                    ID_JENIS_DATA=sub[:7], ID_TABEL_DATA=sub, NAMA_TABEL_TIP=f'KPDE_{sub}', JENIS_TABEL='Referensi',
+                )
+                keys.append(sub)
+            elif kind == 'pic':
+                self._add('REF_PIC_ILAP_PMDE', ID_ILAP=code, NIP_PIC=self._nip('pmde'))
+                keys.append(code)
+            elif kind == 'tiket':
+                id_tiket = f'{code}0101{self.years[-1] % 100:02d}010101'
+                self._add(
+                    'PVPTD.ZA_DDE_TABEL_FACT',
+                    ID_TIKET=id_tiket, NAMA_TABEL_DBBD=None, JENIS_TABEL=None, STATUS_TIKET='[P3DE]-Proses Penelitian',
+                    JML_ROW_P3DE=10, PERIODE_DATA='Januari', TAHUN_DATA=self.years[-1],
+                    TGL_TERIMA=datetime(self.years[-1], 1, 1, 9, 0),
+                )
+                keys.append(id_tiket)
+            else:
+                raise ValueError(f'Jenis orphan tidak dikenali: {kind}')
+        return keys
+
+    # --- output -----------------------------------------------------------
+
+    @property
+    def tiket_numbers(self) -> list[str]:
+        return [row['ID_TIKET'] for row in self.tables['PVPTD.ZA_DDE_TABEL_FACT']]
+
+    def counts(self) -> dict[str, int]:
+        return {table: len(rows) for table, rows in self.tables.items()}
+
+    def write(self, path) -> Path:
+        return write_standin(path, self.tables, prioritas_years=self.years)
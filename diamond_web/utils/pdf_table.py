@@ -0,0 +1,334 @@
+"""Streaming PDF table writer without external libraries.
+
+``stream_pdf_table(title, headers, rows)`` yields the bytes of a PDF
+document page by page, so a ``StreamingHttpResponse`` can send an export of
+any size while only one page is held in memory:
+
+- every page is written out as soon as it is full; the byte offset of each
+  object is kept for the cross-reference table written at the end;
+- column widths are fitted to the headers and the first ``sample_rows``
+  rows (the later rows are not read yet when the first page goes out);
+  longer cell text wraps inside its column;
+- the header row is repeated at the top of every page;
+- ``compress=True`` deflates the page content streams (FlateDecode).
+
+Text is set in the standard Helvetica fonts with WinAnsiEncoding and
+measured with their AFM metrics; characters outside cp1252 print as '?'.
+"""
+
+import zlib
+from itertools import islice
+
+PAGE_A4 = (595, 842)
+PAGE_A4_LANDSCAPE = (842, 595)
+
+# AFM widths (1/1000 em) of the printable ASCII characters 32-126
+_HELVETICA = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_HELVETICA_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+# Other cp1252 characters (accented letters, symbols) are close to this width
+_OTHER_WIDTH = 556
+
+
+def _byte_widths(ascii_widths):
+    widths = [_OTHER_WIDTH] * 256
+    widths[32:127] = ascii_widths
+    return widths
+
+
+_WIDTHS = {False: _byte_widths(_HELVETICA), True: _byte_widths(_HELVETICA_BOLD)}
+_FONTS = {False: b'/F1', True: b'/F2'}
+
+# Fixed object numbers; pages take the numbers from _FIRST_PAGE_OBJECT on
+_CATALOG, _PAGES, _FONT, _FONT_BOLD = 1, 2, 3, 4
+_FIRST_PAGE_OBJECT = 5
+
+
+def _encode(text):
+    return text.encode('cp1252', errors='replace')
+
+
+def text_width(text, size, bold=False):
+    """Width of *text* in points when set at *size* in Helvetica (bold)."""
+    widths = _WIDTHS[bold]
+    return sum(map(widths.__getitem__, _encode(text))) * size / 1000
+
+
+def _clean(value):
+    """Cell text on one line: ``None`` is empty, runs of whitespace become one space."""
+    return '' if value is None else ' '.join(str(value).split())
+
+
+def _cells(row, count):
+    """The *count* cleaned cells of *row*, padded with empty cells."""
+    cells = [_clean(cell) for cell in islice(row, count)]
+    return cells + [''] * (count - len(cells))
+
+
+def _split_word(word, width, size, bold):
+    """Cut *word* into pieces no wider than *width* (at least one character each)."""
+    widths = _WIDTHS[bold]
+    pieces, start, used = [], 0, 0
+    for index, byte in enumerate(_encode(word)):
+        char_width = widths[byte] * size / 1000
+        if used + char_width > width and index > start:
+            pieces.append(word[start:index])
+            start, used = index, 0
+        used += char_width
+    pieces.append(word[start:])
+    return pieces
+
+
+def wrap_text(text, width, size, bold=False):
+    """Lines of *text* (already cleaned) that fit *width*; words longer than a line are cut."""
+    if text_width(text, size, bold) <= width:
+        return [text]
+    space = text_width(' ', size, bold)
+    lines, line, used = [], [], 0
+    for word in text.split(' '):
+        word_width = text_width(word, size, bold)
+        if line and used + space + word_width <= width:
+            line.append(word)
+            used += space + word_width
+            continue
+        if line:
+            lines.append(' '.join(line))
+        if word_width <= width:
+            line, used = [word], word_width
+        else:
+            *full, rest = _split_word(word, width, size, bold)
+            lines.extend(full)
+            line, used = [rest], text_width(rest, size, bold)
+    lines.append(' '.join(line))
+    return lines
+
+
+def fit_column_widths(headers, sample, available, size, padding):
+    """Column widths filling *available* points, fitted to *headers* and *sample* rows.
+
+    Like an automatic HTML table layout: each column wants the width of its
+    widest cell on one line and needs at least its longest word.  When the
+    wanted widths fit they are stretched to the full width, otherwise the
+    room above the minimums is shared in proportion to what each column
+    lacks.
+    """
+    columns = [[(header, True)] + [(row[i], False) for row in sample] for i, header in enumerate(headers)]
+    wanted, needed = [], []
+    for cells in columns:
+        wanted.append(max(text_width(text, size, bold) for text, bold in cells) + 2 * padding)
+        needed.append(max(
+            (text_width(word, size, bold) for text, bold in cells for word in text.split(' ')), default=0,
+        ) + 2 * padding)
+    # A single long word may not take more than an even share of the page
+    needed = [min(width, max(available / len(headers), 2 * padding + size)) for width in needed]
+
+    total_wanted, total_needed = sum(wanted), sum(needed)
+    if total_wanted <= available:
+        return [width * available / total_wanted for width in wanted]
+    if total_needed >= available:
+        return [width * available / total_needed for width in needed]
+    share = (available - total_needed) / (total_wanted - total_needed)
+    return [low + (high - low) * share for low, high in zip(needed, wanted)]
+
+
+def _escape(text):
+    return _encode(text).replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def _num(value):
+    return f'{value:.2f}'.rstrip('0').rstrip('.').encode('ascii')
+
+
+class _Layout:
+    """Geometry of the table and the content stream operators of one page."""
+
+    def __init__(self, title, headers, widths, page_size, font_size, margin, padding):
+        self.title = title
+        self.headers = headers
+        self.widths = widths
+        self.page_width, self.page_height = page_size
+        self.font_size = font_size
+        self.margin = margin
+        self.padding = padding
+        self.leading = font_size * 1.2
+        self.title_size = font_size + 3
+        self.lefts = [margin + sum(widths[:i]) for i in range(len(widths))]
+        self.table_top = self.page_height - margin - self.title_size * 2
+        self.header_lines = self.wrap(headers, bold=True)
+        self.header_height = self.height(self.header_lines)
+        # Lines of the tallest row that still fits on a page below the header
+        usable = self.table_top - self.header_height - margin - 2 * padding
+        self.max_lines = max(1, int(usable // self.leading))
+        # Operator fragments that are the same on every row
+        self._margin = _num(margin)
+        self._table_width = _num(sum(widths))
+        self._borders = [(_num(left), _num(width)) for left, width in zip(self.lefts, widths)]
+        self._text_xs = [_num(left + padding) for left in self.lefts]
+        self._fonts = {bold: b'BT ' + _FONTS[bold] + b' ' + _num(font_size) + b' Tf ' for bold in (False, True)}
+
+    def wrap(self, cells, bold=False):
+        return [
+            wrap_text(text, width - 2 * self.padding, self.font_size, bold)
+            for text, width in zip(cells, self.widths)
+        ]
+
+    def height(self, lines):
+        return max(len(cell_lines) for cell_lines in lines) * self.leading + 2 * self.padding
+
+    def clip(self, lines):
+        """Cut the cells of a row taller than a page, marking the cut with '...'."""
+        return [
+            cell_lines if len(cell_lines) <= self.max_lines
+            else cell_lines[:self.max_lines - 1] + [cell_lines[self.max_lines - 1] + ' ...']
+            for cell_lines in lines
+        ]
+
+    def begin_page(self, page_no):
+        """Operators of the page title and the header row; returns ``(ops, y)``."""
+        ops = [
+            b'BT ' + _FONTS[True] + b' ' + _num(self.title_size) + b' Tf '
+            + _num(self.margin) + b' ' + _num(self.page_height - self.margin - self.title_size) + b' Td ('
+            + _escape(f'{self.title} - Halaman {page_no}') + b') Tj ET',
+            b'0.5 w',
+        ]
+        y = self.row(ops, self.table_top, self.header_lines, self.header_height, bold=True)
+        return ops, y
+
+    def row(self, ops, top, lines, height, bold=False):
+        """Append the operators of one row whose top edge is at *top*; return its bottom edge."""
+        bottom = top - height
+        span = b' ' + _num(bottom) + b' '
+        tail = b' ' + _num(height) + b' re S'
+        if bold:
+            ops.append(b'0.9 g ' + self._margin + span + self._table_width + b' ' + _num(height) + b' re f 0 g')
+        ops.extend(left + span + width + tail for left, width in self._borders)
+        baselines = [
+            b' ' + _num(top - self.padding - self.font_size - index * self.leading) + b' Td ('
+            for index in range(max(len(cell_lines) for cell_lines in lines))
+        ]
+        font = self._fonts[bold]
+        for text_x, cell_lines in zip(self._text_xs, lines):
+            for baseline, line in zip(baselines, cell_lines):
+                if line:
+                    ops.append(font + text_x + baseline + _escape(line) + b') Tj ET')
+        return bottom
+
+
+class _ObjectWriter:
+    """Serializes numbered objects and remembers the byte offset of each."""
+
+    def __init__(self):
+        self.position = 0
+        self.offsets = {}
+
+    def raw(self, data):
+        self.position += len(data)
+        return data
+
+    def obj(self, number, body):
+        self.offsets[number] = self.position
+        return self.raw(f'{number} 0 obj\n'.encode('ascii') + body + b'\nendobj\n')
+
+    def stream(self, number, data, compress):
+        if compress:
+            data = zlib.compress(data)
+            head = b'<< /Length %d /Filter /FlateDecode >>' % len(data)
+        else:
+            head = b'<< /Length %d >>' % len(data)
+        return self.obj(number, head + b'\nstream\n' + data + b'\nendstream')
+
+    def xref(self, root):
+        """Cross-reference table and trailer of the objects written so far."""
+        start = self.position
+        size = max(self.offsets) + 1
+        parts = [b'xref\n0 %d\n' % size, b'0000000000 65535 f \n']
+        parts.extend(b'%010d 00000 n \n' % self.offsets[number] for number in range(1, size))
+        parts.append(b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (size, root, start))
+        return self.raw(b''.join(parts))
+
+
+def stream_pdf_table(title, headers, rows, *, page_size=PAGE_A4_LANDSCAPE, font_size=8, margin=36,
+                     padding=2, compress=False, sample_rows=200):
+    """Yield a PDF of *rows* as a table, one chunk of bytes per page.
+
+    Args:
+        title: Printed above the table on every page, with the page number.
+        headers: Column labels; repeated at the top of every page.
+        rows: Iterable of row sequences (same length as *headers*); read
+            lazily, ``None`` cells print empty.
+        page_size: ``(width, height)`` in points; A4 landscape by default.
+        font_size: Size of the table text; the title is 3 points larger.
+        margin: Page margin in points.
+        padding: Space between cell borders and text.
+        compress: Deflate the page content streams.
+        sample_rows: Rows read ahead to fit the column widths.
+
+    Yields:
+        bytes: The document, in order.
+    """
+    headers = [_clean(header) for header in headers]
+    rows = iter(rows)
+    sample = [_cells(row, len(headers)) for row in islice(rows, sample_rows)]
+    available = page_size[0] - 2 * margin
+    widths = fit_column_widths(headers, sample, available, font_size, padding)
+    layout = _Layout(title, headers, widths, page_size, font_size, margin, padding)
+
+    writer = _ObjectWriter()
+    yield writer.raw(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    yield writer.obj(_FONT, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+    yield writer.obj(
+        _FONT_BOLD, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>',
+    )
+
+    page_ids = []
+    media_box = b'[0 0 ' + _num(page_size[0]) + b' ' + _num(page_size[1]) + b']'
+
+    def finish_page(ops):
+        content_id = _FIRST_PAGE_OBJECT + 2 * len(page_ids)
+        page_ids.append(content_id + 1)
+        chunk = writer.stream(content_id, b'\n'.join(ops), compress)
+        return chunk + writer.obj(
+            content_id + 1,
+            b'<< /Type /Page /Parent %d 0 R /MediaBox ' % _PAGES + media_box
+            + b' /Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> /Contents %d 0 R >>'
+            % (_FONT, _FONT_BOLD, content_id),
+        )
+
+    ops, y = layout.begin_page(1)
+    for row in _chain_rows(sample, rows, len(headers)):
+        lines = layout.clip(layout.wrap(row))
+        height = layout.height(lines)
+        if y - height < margin:
+            yield finish_page(ops)
+            ops, y = layout.begin_page(len(page_ids) + 1)
+        y = layout.row(ops, y, lines, height)
+    yield finish_page(ops)
+
+    kids = b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+    yield writer.obj(_PAGES, b'<< /Type /Pages /Kids [' + kids + b'] /Count %d >>' % len(page_ids))
+    yield writer.obj(_CATALOG, b'<< /Type /Catalog /Pages %d 0 R >>' % _PAGES)
+    yield writer.xref(_CATALOG)
+
+
+def _chain_rows(sample, rows, count):
+    yield from sample
+    for row in rows:
+        yield _cells(row, count)
+
+
+def build_pdf_table(title, headers, rows, **options):
+    """The whole document of :func:`stream_pdf_table` as bytes."""
+    return b''.join(stream_pdf_table(title, headers, rows, **options))
@@ -0,0 +1,160 @@
+"""Half-open date ranges for the laporan period filters.
+
+The laporan pages filter tikets on a report period (bulanan, triwulanan,
+semester or tahunan of a year) or on a Tanggal Mulai / Tanggal Akhir pair.
+Both are turned into a :class:`PeriodeRange` ``[start, end)`` of datetimes
+in the project timezone and applied as ``field__gte=start, field__lt=end``.
+
+Comparing the bare column keeps the filter sargable: the former
+``field__date__gte/lte`` wrapped the column in a date cast on every row,
+which no index on the column can serve.  The ``end`` of a period is the
+first instant of the next one (1 January of the next year for December),
+so the last day is covered whole without a 23:59:59 bound.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+BULAN_NAMES = {
+    1: 'Januari', 2: 'Februari', 3: 'Maret', 4: 'April', 5: 'Mei', 6: 'Juni',
+    7: 'Juli', 8: 'Agustus', 9: 'September', 10: 'Oktober', 11: 'November', 12: 'Desember',
+}
+
+# periode_type -> {periode number: (first month, last month)}
+PERIODE_MONTHS = {
+    'bulanan': {bulan: (bulan, bulan) for bulan in range(1, 13)},
+    'triwulanan': {1: (1, 3), 2: (4, 6), 3: (7, 9), 4: (10, 12)},
+    'semester': {1: (1, 6), 2: (7, 12)},
+    'tahunan': {None: (1, 12)},
+}
+
+# Resolution of the datetime-local inputs of the date range filters
+DATETIME_INPUT_FORMAT = '%Y-%m-%dT%H:%M'
+
+
+class PeriodeError(ValueError):
+    """Invalid period parameters.
+
+    ``field`` names the offending parameter: ``'tahun'``, ``'periode'`` or
+    ``'periode_type'``.
+    """
+
+    def __init__(self, field, message):
+        super().__init__(message)
+        self.field = field
+
+
+@dataclass(frozen=True)
+class PeriodeRange:
+    """``[start, end)``; either bound may be ``None`` (open) for date range filters."""
+    start: datetime | None
+    end: datetime | None
+    periode_type: str | None = None
+    periode: int | None = None
+    tahun: int | None = None
+
+    def filter_kwargs(self, field):
+        """Lookups restricting *field* to the range, e.g. ``{'tgl_transfer__gte': ..., 'tgl_transfer__lt': ...}``."""
+        kwargs = {}
+        if self.start is not None:
+            kwargs[f'{field}__gte'] = self.start
+        if self.end is not None:
+            kwargs[f'{field}__lt'] = self.end
+        return kwargs
+
+    @property
+    def last_day(self):
+        """Last calendar day inside the range."""
+        return (self.end - timedelta(days=1)).date() if self.end is not None else None
+
+    @property
+    def label(self):
+        """'Januari 2024', 'Triwulan 1 2024', 'Semester 2 2024' or '2024'."""
+        if self.periode_type == 'bulanan':
+            return f'{BULAN_NAMES[self.periode]} {self.tahun}'
+        if self.periode_type == 'triwulanan':
+            return f'Triwulan {self.periode} {self.tahun}'
+        if self.periode_type == 'semester':
+            return f'Semester {self.periode} {self.tahun}'
+        return f'{self.tahun}'
+
+
+def _local(value):
+    """*value* (naive) as a datetime of the project timezone."""
+    if settings.USE_TZ:
+        return timezone.make_aware(value)
+    return value
+
+
+def month_start(tahun, bulan):
+    """First instant of month *bulan* of *tahun*; month 13 rolls over to January of the next year."""
+    tahun, bulan = tahun + (bulan - 1) // 12, (bulan - 1) % 12 + 1
+    return _local(datetime(tahun, bulan, 1))
+
+
+def periode_range(periode_type, periode, tahun):
+    """Range of a report period.
+
+    Args:
+        periode_type: ``'bulanan'``, ``'triwulanan'``, ``'semester'`` or ``'tahunan'``.
+        periode: Month 1-12, quarter 1-4 or semester 1-2 (str or int);
+            ignored for ``'tahunan'``.
+        tahun: Year (str or int).
+
+    Returns:
+        PeriodeRange: From the first day of the period to the first day of
+        the next period.
+
+    Raises:
+        PeriodeError: When a parameter is missing or out of range.
+    """
+    try:
+        tahun = int(tahun)
+    except (TypeError, ValueError):
+        raise PeriodeError('tahun', 'Tahun tidak valid.')
+    months = PERIODE_MONTHS.get(periode_type)
+    if months is None:
+        raise PeriodeError('periode_type', 'Jenis periode tidak valid.')
+    if periode_type == 'tahunan':
+        periode = None
+    else:
+        try:
+            periode = int(periode)
+        except (TypeError, ValueError):
+            raise PeriodeError('periode', 'Periode tidak valid.')
+        if periode not in months:
+            raise PeriodeError('periode', 'Periode tidak valid.')
+
+    first_month, last_month = months[periode]
+    try:
+        start, end = month_start(tahun, first_month), month_start(tahun, last_month + 1)
+    except (ValueError, OverflowError):
+        raise PeriodeError('tahun', 'Tahun tidak valid.')
+    return PeriodeRange(start, end, periode_type=periode_type, periode=periode, tahun=tahun)
+
+
+def parse_periode(params):
+    """:func:`periode_range` of the ``periode_type``, ``periode`` and ``tahun`` request parameters."""
+    return periode_range(params.get('periode_type'), params.get('periode'), params.get('tahun'))
+
+
+def datetime_range(tgl_mulai, tgl_akhir, input_format=DATETIME_INPUT_FORMAT):
+    """Range of a Tanggal Mulai / Tanggal Akhir filter.
+
+    Both bounds are inclusive on the form; ``tgl_akhir`` covers its whole
+    minute, so the exclusive end is one minute later.  A missing or
+    unparsable bound leaves that side open.
+    """
+    def parse(value):
+        if not value:
+            return None
+        try:
+            return _local(datetime.strptime(value, input_format))
+        except ValueError:
+            return None
+
+    start, akhir = parse(tgl_mulai), parse(tgl_akhir)
+    return PeriodeRange(start, akhir + timedelta(minutes=1) if akhir is not None else None)
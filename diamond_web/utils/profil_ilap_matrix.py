@@ -0,0 +1,116 @@
+"""Tiket submission matrix of an ILAP (Profil ILAP detail page).
+
+For every JenisDataILAP of an ILAP that has a PeriodeJenisData, the page
+shows, per year, ``"<tikets received>/<periods due>"``.  The matrix is built
+from four queries whatever the number of jenis data, years or periods:
+
+1. the ILAP's JenisDataILAP rows;
+2. their PeriodeJenisData (first per jenis data, with PeriodePengiriman);
+3. their KlasifikasiJenisData (dasar hukum);
+4. one grouped ``COUNT`` of Tiket by (sub jenis data, tahun, periode).
+
+The number of periods due per year depends on the periode penyampaian and,
+for the current year, on the current month (see ``PERIODE_STRATEGIES``).
+"""
+
+from collections import defaultdict
+from datetime import date
+
+from django.db.models import Count
+
+from ..models.jenis_data_ilap import JenisDataILAP
+from ..models.klasifikasi_jenis_data import KlasifikasiJenisData
+from ..models.periode_jenis_data import PeriodeJenisData
+from ..models.tiket import Tiket
+
+# periode_penyampaian (lowercase) -> (periods per year, periods due so far given the month)
+PERIODE_STRATEGIES = {
+    'bulanan': (12, lambda month: month),
+    'triwulan': (4, lambda month: (month - 1) // 3 + 1),
+    'semester': (2, lambda month: 1 if month < 7 else 2),
+    'tahunan': (1, lambda month: 1),
+}
+DEFAULT_PERIODE_STRATEGY = PERIODE_STRATEGIES['bulanan']
+
+
+def matrix_years(today):
+    """Years shown as columns: two past years, the current one and the next."""
+    return [today.year - 2, today.year - 1, today.year, today.year + 1]
+
+
+def periode_total(periode_penyampaian, year, today):
+    """Return the number of periods due in *year* for this periode penyampaian."""
+    per_year, due_so_far = PERIODE_STRATEGIES.get(
+        (periode_penyampaian or '').lower(), DEFAULT_PERIODE_STRATEGY
+    )
+    return due_so_far(today.month) if year == today.year else per_year
+
+
+def _tiket_counts(jenis_data_ids, years):
+    """{(sub_jenis_data_id, tahun, periode): tiket count} in one grouped query."""
+    rows = Tiket.objects.filter(
+        id_periode_data__id_sub_jenis_data_ilap_id__in=jenis_data_ids,
+        tahun__in=years,
+    ).values(
+        'id_periode_data__id_sub_jenis_data_ilap', 'tahun', 'periode'
+    ).annotate(total=Count('id')).order_by()
+    return {
+        (row['id_periode_data__id_sub_jenis_data_ilap'], row['tahun'], row['periode']): row['total']
+        for row in rows
+    }
+
+
+def build_profil_ilap_matrix(ilap, today=None):
+    """Return ``(jenis_data_details, years)`` for the Profil ILAP detail page.
+
+    Each detail is a dict with ``jenis_data``, ``dasar_hukum``,
+    ``periode_penyampaian``, ``periode_penerimaan`` and ``year_data``
+    (``{year: "sum/total"}``).  Jenis data without PeriodeJenisData are
+    skipped.
+    """
+    today = today or date.today()
+    years = matrix_years(today)
+
+    jenis_data_list = list(JenisDataILAP.objects.filter(
+        id_ilap=ilap
+    ).select_related('id_jenis_tabel', 'id_status_data'))
+    jenis_data_ids = [jenis_data.id for jenis_data in jenis_data_list]
+    if not jenis_data_ids:
+        return [], years
+
+    first_periode = {}
+    for pjd in PeriodeJenisData.objects.filter(
+        id_sub_jenis_data_ilap_id__in=jenis_data_ids
+    ).select_related('id_periode_pengiriman').order_by('id'):
+        first_periode.setdefault(pjd.id_sub_jenis_data_ilap_id, pjd)
+
+    dasar_hukum = defaultdict(list)
+    for sub_jenis_id, deskripsi in KlasifikasiJenisData.objects.filter(
+        id_sub_jenis_data_id__in=jenis_data_ids
+    ).order_by('id').values_list('id_sub_jenis_data_id', 'id_klasifikasi_tabel__deskripsi'):
+        dasar_hukum[sub_jenis_id].append(deskripsi)
+
+    counts = _tiket_counts(list(first_periode), years)
+
+    jenis_data_details = []
+    for jenis_data in jenis_data_list:
+        pjd = first_periode.get(jenis_data.id)
+        if pjd is None:
+            continue
+        periode_pengiriman = pjd.id_periode_pengiriman
+
+        year_data = {}
+        for year in years:
+            total = periode_total(periode_pengiriman.periode_penyampaian, year, today)
+            received = sum(counts.get((jenis_data.id, year, periode), 0) for periode in range(1, total + 1))
+            year_data[year] = f"{received}/{total}"
+
+        jenis_data_details.append({
+            'jenis_data': jenis_data,
+            'dasar_hukum': ', '.join(dasar_hukum.get(jenis_data.id, [])),
+            'periode_penyampaian': periode_pengiriman.periode_penyampaian,
+            'periode_penerimaan': periode_pengiriman.periode_penerimaan,
+            'year_data': year_data,
+        })
+
+    return jenis_data_details, years
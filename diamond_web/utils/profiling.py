@@ -0,0 +1,250 @@
+"""On-demand cProfile profiles of requests and Celery tasks.
+
+``ProfilerMiddleware`` (diamond_web/middleware.py) profiles a request when a
+superuser asks for it with the ``X-Profile: 1`` header or the ``_profile=1``
+query parameter, or for a random ``PROFILER_SAMPLE_RATE`` fraction of all
+requests.  ``profiled_task`` does the same for a Celery task whose name is in
+``PROFILER_TASKS`` (or always, with ``PROFILER_TASKS = ('*',)``).
+
+Each profile is stored under ``PROFILER_DIR`` as three files sharing a random
+id: the raw ``pstats`` dump (``.prof``, for snakeviz/``python -m pstats``),
+the call tree rendered as HTML (``.html``) and the metadata (``.json``: URL or
+task name, duration, query count).  The directory is a ring: after each save
+only the newest ``PROFILER_MAX_PROFILES`` profiles are kept.  The profiles are
+listed on ``/diagnostics/profiles/``.
+
+cProfile hooks the current thread only, so a profile shows the request or task
+it was started for even under a threaded server; a profile started while
+another one is active on the same thread is skipped.
+"""
+
+import cProfile
+import functools
+import html
+import json
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+import uuid
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_PARAM = '_profile'
+
+# Call tree rendering limits
+TREE_MAX_DEPTH = 40
+TREE_MIN_FRACTION = 0.005
+
+_active = threading.local()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def profiles_dir():
+    return str(_setting('PROFILER_DIR', os.path.join(settings.MEDIA_ROOT, 'profiles')))
+
+
+def should_profile(request):
+    """Whether *request* is profiled: superuser opt-in, or sampled."""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated and user.is_superuser:
+        if request.META.get(PROFILE_HEADER) == '1' or request.GET.get(PROFILE_PARAM) == '1':
+            return True
+    rate = _setting('PROFILER_SAMPLE_RATE', 0.0)
+    return rate > 0 and random.random() < rate
+
+
+def task_is_profiled(name):
+    tasks = _setting('PROFILER_TASKS', ())
+    return '*' in tasks or name in tasks
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def profile(kind, name, **meta):
+    """Profile the block and save it to the ring.
+
+    *kind* is ``'request'`` or ``'task'``; *name* the URL or task name.  Yields
+    a dict to which the caller may add metadata (e.g. the response status).
+    """
+    if getattr(_active, 'profiling', False):
+        yield meta
+        return
+
+    profiler = cProfile.Profile()
+    counter = _QueryCounter()
+    _active.profiling = True
+    started = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            profiler.enable()
+            try:
+                yield meta
+            finally:
+                profiler.disable()
+    finally:
+        _active.profiling = False
+        duration_ms = (time.perf_counter() - started) * 1000
+        try:
+            save_profile(profiler, kind, name, duration_ms, counter.count, **meta)
+        except Exception:
+            logger.exception('Could not save profile of %s', name)
+
+
+def save_profile(profiler, kind, name, duration_ms, queries, **meta):
+    """Write the ``.prof``/``.html``/``.json`` files of *profiler*; return the id."""
+    directory = profiles_dir()
+    os.makedirs(directory, exist_ok=True)
+    profile_id = f'{timezone.now():%Y%m%d%H%M%S%f}_{uuid.uuid4().hex[:16]}'
+    base = os.path.join(directory, profile_id)
+
+    profiler.dump_stats(base + '.prof')
+    stats = pstats.Stats(profiler)
+    with open(base + '.html', 'w', encoding='utf-8') as fh:
+        fh.write(render_call_tree(stats))
+    with open(base + '.json', 'w', encoding='utf-8') as fh:
+        json.dump({
+            'id': profile_id,
+            'kind': kind,
+            'name': name,
+            'duration_ms': round(duration_ms, 1),
+            'queries': queries,
+            'created': timezone.now().isoformat(timespec='seconds'),
+            **meta,
+        }, fh)
+
+    prune_profiles()
+    return profile_id
+
+
+def prune_profiles(keep=None):
+    """Delete all but the newest *keep* (``PROFILER_MAX_PROFILES``) profiles."""
+    keep = _setting('PROFILER_MAX_PROFILES', 50) if keep is None else keep
+    ids = sorted(_profile_ids(), reverse=True)
+    for profile_id in ids[keep:]:
+        for ext in ('.prof', '.html', '.json'):
+            try:
+                os.remove(os.path.join(profiles_dir(), profile_id + ext))
+            except FileNotFoundError:
+                pass
+
+
+def _profile_ids():
+    try:
+        names = os.listdir(profiles_dir())
+    except FileNotFoundError:
+        return []
+    return [name[:-5] for name in names if name.endswith('.json')]
+
+
+def list_profiles():
+    """Metadata of the stored profiles, newest first."""
+    profiles = []
+    for profile_id in sorted(_profile_ids(), reverse=True):
+        try:
+            with open(os.path.join(profiles_dir(), profile_id + '.json'), encoding='utf-8') as fh:
+                profiles.append(json.load(fh))
+        except (OSError, ValueError):
+            continue
+    return profiles
+
+
+def profile_path(profile_id, ext):
+    """Path of a stored profile file, or ``None`` if *profile_id* is unknown."""
+    if profile_id not in _profile_ids():
+        return None
+    path = os.path.join(profiles_dir(), profile_id + ext)
+    return path if os.path.exists(path) else None
+
+
+def clear_profiles():
+    prune_profiles(keep=0)
+
+
+def _label(func):
+    filename, line, name = func
+    if filename == '~':
+        return name
+    base = str(settings.BASE_DIR)
+    if filename.startswith(base):
+        filename = os.path.relpath(filename, base)
+    return f'{name} ({filename}:{line})'
+
+
+def render_call_tree(stats):
+    """Render *stats* as nested ``<details>`` from the root calls down.
+
+    Children are ordered by cumulative time; calls under ``TREE_MIN_FRACTION``
+    of the total and recursion back into a function already on the path are
+    not expanded.
+    """
+    entries = stats.stats
+    children = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, caller_stats in callers.items():
+            children.setdefault(caller, []).append((func, caller_stats[3]))
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    total = sum(entries[func][3] for func in roots) or stats.total_tt or 1.0
+
+    parts = []
+
+    def node(func, cumulative, depth, path):
+        calls = entries[func][1]
+        label = html.escape(_label(func))
+        line = (
+            f'<span class="pct">{cumulative / total * 100:5.1f}%</span> '
+            f'<span class="ms">{cumulative * 1000:.1f} ms</span> '
+            f'<span class="calls">{calls}x</span> <code>{label}</code>'
+        )
+        kids = [
+            (child, child_cumulative) for child, child_cumulative in children.get(func, ())
+            if child not in path and child_cumulative / total >= TREE_MIN_FRACTION
+        ]
+        if not kids or depth >= TREE_MAX_DEPTH:
+            parts.append(f'<div class="leaf">{line}</div>')
+            return
+        parts.append(f'<details{" open" if depth < 3 else ""}><summary>{line}</summary>')
+        for child, child_cumulative in sorted(kids, key=lambda item: -item[1]):
+            node(child, child_cumulative, depth + 1, path | {child})
+        parts.append('</details>')
+
+    for func in sorted(roots, key=lambda func: -entries[func][3]):
+        node(func, entries[func][3], 0, {func})
+    return '<div class="call-tree">' + ''.join(parts) + '</div>'
+
+
+def profiled_task(func):
+    """Profile a Celery task body when its name is in ``PROFILER_TASKS``.
+
+    Apply below ``@shared_task(bind=True, ...)``: the bound task's ``name``
+    decides whether the run is profiled.
+    """
+    @functools.wraps(func)
+    def wrapper(task, *args, **kwargs):
+        if not task_is_profiled(task.name):
+            return func(task, *args, **kwargs)
+        with profile('task', task.name, args=[str(arg) for arg in args]):
+            return func(task, *args, **kwargs)
+
+    return wrapper
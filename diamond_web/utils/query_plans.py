@@ -0,0 +1,150 @@
+"""Query plan inspection: find full table scans in the queries a view runs.
+
+``capture_selects`` records the SELECT statements (with their parameters)
+executed on a connection; ``find_full_scans`` explains each distinct one with
+``EXPLAIN QUERY PLAN`` (SQLite) or ``EXPLAIN (FORMAT JSON)`` (PostgreSQL)
+and reports the tables read with a full scan that hold at least ``min_rows``
+rows.  ``indexes_used`` and ``needs_sort`` check a single hot lookup against
+the index designed for it.  Used by diamond_web/tests/test_query_plans.py.
+
+A scan of the rows in index order (SQLite ``SCAN t USING INDEX``, PostgreSQL
+``Index Scan`` without a condition) is not a full table scan: paginated lists
+read it only up to their LIMIT.
+"""
+
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from django.db import connections
+
+from .query_stats import fingerprint
+
+_SQLITE_SCAN_RE = re.compile(r'^SCAN (\S+)(?: AS (\S+))?$')
+_SQLITE_INDEX_RE = re.compile(r'USING (?:COVERING )?INDEX (\w+)')
+_SQL_TABLE_RE = re.compile(r'(?:FROM|JOIN)\s+"(\w+)"(?:\s+(?:AS\s+)?"?(\w+)"?)?', re.IGNORECASE)
+_SQL_KEYWORDS = {'ON', 'WHERE', 'INNER', 'LEFT', 'RIGHT', 'OUTER', 'JOIN', 'GROUP', 'ORDER', 'LIMIT', 'USING'}
+
+
+@dataclass(frozen=True)
+class FullScan:
+    table: str
+    rows: int
+    sql: str
+
+    def __str__(self):
+        return f'full scan of {self.table} ({self.rows} rows): {self.sql[:300]}'
+
+
+@contextmanager
+def capture_selects(using='default'):
+    """Collect ``(sql, params)`` of every SELECT executed on *using* in the block."""
+    queries = []
+
+    def record(execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith('SELECT'):
+            queries.append((sql, tuple(params or ())))
+        return execute(sql, params, many, context)
+
+    with connections[using].execute_wrapper(record):
+        yield queries
+
+
+def analyze(using='default'):
+    """Refresh the planner statistics, as autovacuum (PostgreSQL) or
+    ``PRAGMA optimize`` (SQLite) would on a long-running database."""
+    with connections[using].cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def explain(sql, params=(), using='default'):
+    """Return the plan of *sql*: detail lines on SQLite, the JSON plan on PostgreSQL."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            return cursor.fetchone()[0]
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def _aliases(sql):
+    """Map the table aliases Django uses in *sql* (``"tiket" T3``) to table names."""
+    aliases = {}
+    for table, alias in _SQL_TABLE_RE.findall(sql):
+        aliases[table] = table
+        if alias and alias.upper() not in _SQL_KEYWORDS:
+            aliases[alias] = table
+    return aliases
+
+
+def _pg_nodes(node):
+    yield node
+    for child in node.get('Plans', ()):
+        yield from _pg_nodes(child)
+
+
+def _pg_plan_nodes(plan):
+    for entry in plan:
+        yield from _pg_nodes(entry['Plan'])
+
+
+def scanned_tables(sql, params=(), using='default'):
+    """Tables *sql* reads with a full table scan."""
+    plan = explain(sql, params, using)
+    if connections[using].vendor == 'postgresql':
+        return {node['Relation Name'] for node in _pg_plan_nodes(plan) if node['Node Type'] == 'Seq Scan'}
+
+    aliases = _aliases(sql)
+    tables = set()
+    for detail in plan:
+        match = _SQLITE_SCAN_RE.match(detail)
+        if match:
+            name = match.group(1)
+            tables.add(aliases.get(name, name))
+    return tables
+
+
+def indexes_used(sql, params=(), using='default'):
+    """Names of the indexes the plan of *sql* reads."""
+    plan = explain(sql, params, using)
+    if connections[using].vendor == 'postgresql':
+        return {node['Index Name'] for node in _pg_plan_nodes(plan) if 'Index Name' in node}
+    return {match for detail in plan for match in _SQLITE_INDEX_RE.findall(detail)}
+
+
+def needs_sort(sql, params=(), using='default'):
+    """Whether *sql* sorts its rows instead of reading them in index order."""
+    plan = explain(sql, params, using)
+    if connections[using].vendor == 'postgresql':
+        return any(node['Node Type'] in ('Sort', 'Incremental Sort') for node in _pg_plan_nodes(plan))
+    return any(detail.startswith('USE TEMP B-TREE FOR') and 'ORDER BY' in detail for detail in plan)
+
+
+def table_rows(table, using='default'):
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM {connection.ops.quote_name(table)}')
+        return cursor.fetchone()[0]
+
+
+def find_full_scans(queries, min_rows, using='default'):
+    """Full scans of tables with at least *min_rows* rows among *queries*.
+
+    Each query shape (see ``query_stats.fingerprint``) is explained once.
+    """
+    existing = set(connections[using].introspection.table_names())
+    seen = set()
+    sizes = {}
+    scans = []
+    for sql, params in queries:
+        key = fingerprint(sql)[0]
+        if key in seen:
+            continue
+        seen.add(key)
+        for table in sorted(scanned_tables(sql, params, using) & existing):
+            if table not in sizes:
+                sizes[table] = table_rows(table, using)
+            if sizes[table] >= min_rows:
+                scans.append(FullScan(table, sizes[table], sql))
+    return scans
@@ -0,0 +1,251 @@
+"""Per-view SQL query statistics (query budget instrumentation).
+
+``QueryBudgetMiddleware`` (diamond_web/middleware.py) attaches a
+``QueryRecorder`` to every database connection with
+``connection.execute_wrapper`` and, once the response is built, hands the
+measurement to ``record_request``.  Measurements are aggregated per resolved
+URL name into fixed-bucket histograms stored in the Django cache, one entry
+per time slot of ``QUERY_STATS_SLOT_SECONDS``; ``get_view_stats`` merges the
+slots of the last ``QUERY_STATS_WINDOW_SECONDS`` into a rolling view.
+
+Each query is reduced to a fingerprint (literals and ``IN`` lists
+collapsed).  A fingerprint executed ``QUERY_BUDGET_DUPLICATE_THRESHOLD``
+times or more in one request is reported as a likely N+1 pattern.
+
+Cache updates are read-modify-write without a lock: concurrent requests may
+occasionally lose a sample, which is acceptable for diagnostics.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from bisect import bisect_left
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger('diamond_web.query_budget')
+
+# Upper bounds of the histogram buckets (the last bucket is open-ended)
+MS_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+MAX_DUPLICATE_SAMPLES = 10
+
+_VIEWS_KEY = 'query_stats_views'
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST_RE = re.compile(r'\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)', re.IGNORECASE)
+_SPACE_RE = re.compile(r'\s+')
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def fingerprint(sql):
+    """Return ``(hash, normalized_sql)`` identifying the shape of *sql*."""
+    normalized = _STRING_RE.sub('?', sql)
+    normalized = _NUMBER_RE.sub('?', normalized)
+    normalized = normalized.replace('%s', '?')
+    normalized = _IN_LIST_RE.sub('IN (...)', normalized)
+    normalized = _SPACE_RE.sub(' ', normalized).strip()
+    return hashlib.md5(normalized.encode('utf-8')).hexdigest()[:12], normalized
+
+
+class QueryRecorder:
+    """``execute_wrapper`` callable counting queries, SQL time and fingerprints."""
+
+    def __init__(self):
+        self.count = 0
+        self.sql_seconds = 0.0
+        self.fingerprints = Counter()
+        self.samples = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_seconds += time.perf_counter() - started
+            self.count += 1
+            key, normalized = fingerprint(sql)
+            self.fingerprints[key] += 1
+            self.samples.setdefault(key, normalized)
+
+    def duplicates(self, threshold=None):
+        """Return ``[(hash, count, sql)]`` of fingerprints repeated >= *threshold* times."""
+        threshold = threshold or _setting('QUERY_BUDGET_DUPLICATE_THRESHOLD', 5)
+        return [
+            (key, count, self.samples[key])
+            for key, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+
+def budget_for(view_name):
+    """Return ``{'queries': int, 'sql_ms': float}`` for *view_name*."""
+    budget = {
+        'queries': _setting('QUERY_BUDGET_MAX_QUERIES', 50),
+        'sql_ms': _setting('QUERY_BUDGET_MAX_SQL_MS', 500),
+    }
+    budget.update(_setting('QUERY_BUDGET_OVERRIDES', {}).get(view_name, {}))
+    return budget
+
+
+def _bucket(bounds, value):
+    return bisect_left(bounds, value)
+
+
+def _empty_slot():
+    return {
+        'requests': 0,
+        'queries_total': 0,
+        'sql_ms_total': 0.0,
+        'wall_ms_total': 0.0,
+        'max_queries': 0,
+        'max_wall_ms': 0.0,
+        'n_plus_one': 0,
+        'over_budget': 0,
+        'queries_hist': [0] * (len(QUERY_BUCKETS) + 1),
+        'sql_ms_hist': [0] * (len(MS_BUCKETS) + 1),
+        'wall_ms_hist': [0] * (len(MS_BUCKETS) + 1),
+        'duplicates': {},
+    }
+
+
+def _slot_key(view_name, slot):
+    return f'query_stats_{view_name}_{slot}'
+
+
+def _slot_seconds():
+    return _setting('QUERY_STATS_SLOT_SECONDS', 300)
+
+
+def _window_seconds():
+    return _setting('QUERY_STATS_WINDOW_SECONDS', 24 * 60 * 60)
+
+
+def record_request(view_name, recorder, wall_seconds, path=''):
+    """Add one request's measurement to the current slot of *view_name*.
+
+    Logs a structured warning (JSON) when the request exceeded the view's
+    budget or executed a duplicated query pattern.  Returns the list of
+    duplicated fingerprints.
+    """
+    sql_ms = recorder.sql_seconds * 1000
+    wall_ms = wall_seconds * 1000
+    duplicates = recorder.duplicates()
+    budget = budget_for(view_name)
+    over_budget = recorder.count > budget['queries'] or sql_ms > budget['sql_ms']
+
+    slot = int(time.time() // _slot_seconds())
+    key = _slot_key(view_name, slot)
+    stats = cache.get(key) or _empty_slot()
+    stats['requests'] += 1
+    stats['queries_total'] += recorder.count
+    stats['sql_ms_total'] += sql_ms
+    stats['wall_ms_total'] += wall_ms
+    stats['max_queries'] = max(stats['max_queries'], recorder.count)
+    stats['max_wall_ms'] = max(stats['max_wall_ms'], wall_ms)
+    stats['queries_hist'][_bucket(QUERY_BUCKETS, recorder.count)] += 1
+    stats['sql_ms_hist'][_bucket(MS_BUCKETS, sql_ms)] += 1
+    stats['wall_ms_hist'][_bucket(MS_BUCKETS, wall_ms)] += 1
+    if duplicates:
+        stats['n_plus_one'] += 1
+        for dup_key, count, sql in duplicates:
+            entry = stats['duplicates'].get(dup_key)
+            if entry is None and len(stats['duplicates']) >= MAX_DUPLICATE_SAMPLES:
+                continue
+            entry = entry or {'sql': sql[:500], 'max_repeats': 0, 'requests': 0}
+            entry['max_repeats'] = max(entry['max_repeats'], count)
+            entry['requests'] += 1
+            stats['duplicates'][dup_key] = entry
+    if over_budget:
+        stats['over_budget'] += 1
+    cache.set(key, stats, _window_seconds() + _slot_seconds())
+
+    views = cache.get(_VIEWS_KEY) or set()
+    if view_name not in views:
+        views.add(view_name)
+        cache.set(_VIEWS_KEY, views, None)
+
+    if over_budget or duplicates:
+        logger.warning('query budget: %s', json.dumps({
+            'event': 'query_budget_exceeded' if over_budget else 'query_duplicates',
+            'view': view_name,
+            'path': path,
+            'queries': recorder.count,
+            'sql_ms': round(sql_ms, 2),
+            'wall_ms': round(wall_ms, 2),
+            'budget': budget,
+            'duplicates': [{'fingerprint': k, 'count': c} for k, c, _ in duplicates],
+        }))
+    return duplicates
+
+
+def _merge(total, stats):
+    for name in ('requests', 'queries_total', 'sql_ms_total', 'wall_ms_total', 'n_plus_one', 'over_budget'):
+        total[name] += stats[name]
+    total['max_queries'] = max(total['max_queries'], stats['max_queries'])
+    total['max_wall_ms'] = max(total['max_wall_ms'], stats['max_wall_ms'])
+    for name in ('queries_hist', 'sql_ms_hist', 'wall_ms_hist'):
+        total[name] = [a + b for a, b in zip(total[name], stats[name])]
+    for dup_key, entry in stats['duplicates'].items():
+        merged = total['duplicates'].setdefault(dup_key, {'sql': entry['sql'], 'max_repeats': 0, 'requests': 0})
+        merged['max_repeats'] = max(merged['max_repeats'], entry['max_repeats'])
+        merged['requests'] += entry['requests']
+
+
+def percentile(hist, bounds, fraction):
+    """Upper bucket bound holding the *fraction* percentile (None if open-ended/empty)."""
+    total = sum(hist)
+    if not total:
+        return None
+    target = total * fraction
+    running = 0
+    for index, count in enumerate(hist):
+        running += count
+        if running >= target:
+            return bounds[index] if index < len(bounds) else None
+    return None
+
+
+def get_view_stats():
+    """Return the rolling statistics of every recorded view, slowest first."""
+    slot_seconds = _slot_seconds()
+    current = int(time.time() // slot_seconds)
+    slots = range(current - _window_seconds() // slot_seconds, current + 1)
+
+    results = []
+    for view_name in sorted(cache.get(_VIEWS_KEY) or ()):
+        keys = [_slot_key(view_name, slot) for slot in slots]
+        total = _empty_slot()
+        for stats in cache.get_many(keys).values():
+            _merge(total, stats)
+        if not total['requests']:
+            continue
+        requests = total['requests']
+        total.update({
+            'view_name': view_name,
+            'avg_queries': total['queries_total'] / requests,
+            'avg_sql_ms': total['sql_ms_total'] / requests,
+            'avg_wall_ms': total['wall_ms_total'] / requests,
+            'p95_queries': percentile(total['queries_hist'], QUERY_BUCKETS, 0.95),
+            'p95_wall_ms': percentile(total['wall_ms_hist'], MS_BUCKETS, 0.95),
+            'duplicate_list': sorted(
+                total['duplicates'].items(), key=lambda item: item[1]['max_repeats'], reverse=True
+            ),
+            'budget': budget_for(view_name),
+        })
+        results.append(total)
+    return sorted(results, key=lambda stats: stats['sql_ms_total'], reverse=True)
+
+
+def reset_view_stats():
+    """Forget every recorded view (slots expire on their own)."""
+    cache.delete(_VIEWS_KEY)
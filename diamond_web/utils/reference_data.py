@@ -0,0 +1,301 @@
+"""Versioned cache for master (reference) tables and the option lists built from them.
+
+Master tables such as Kanwil, KPP, ILAP or MediaBackup change a few times a
+year but are read on almost every request to fill dropdowns.  Each option
+list is built once and kept in two tiers:
+
+1. the shared cache (Redis in production), keyed by the current reference
+   data version, so every web process and worker reuses the same build;
+2. a per-process dict, so repeated reads within a process skip Redis too.
+
+The version is a random token stored in the shared cache.  Any
+``post_save``/``post_delete`` on a tracked model (see ``diamond_web.signals``)
+and every successful Oracle referensi sync replace it, which makes all
+previously built lists unreachable at once.  Processes re-read the version
+at most every ``REFERENCE_DATA_LOCAL_TTL`` seconds.
+
+Views returning purely reference data can use ``reference_etag`` with
+``django.views.decorators.http.condition`` so browsers revalidate with
+``If-None-Match`` and get a 304 instead of the full list.
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max, Min
+
+from ..models import (
+    BentukData,
+    CaraPenyampaian,
+    DasarHukum,
+    ILAP,
+    JenisDataILAP,
+    JenisPrioritasData,
+    JenisTabel,
+    Kanwil,
+    KategoriILAP,
+    KategoriWilayah,
+    KlasifikasiJenisData,
+    KPP,
+    MediaBackup,
+    PIC,
+    PeriodeJenisData,
+    PeriodePengiriman,
+    StatusPenelitian,
+)
+from .db_routing import primary_reads
+
+# Models whose writes invalidate the reference data cache.
+REFERENCE_MODELS = (
+    Kanwil,
+    KPP,
+    KategoriWilayah,
+    KategoriILAP,
+    ILAP,
+    JenisTabel,
+    DasarHukum,
+    PeriodePengiriman,
+    BentukData,
+    CaraPenyampaian,
+    StatusPenelitian,
+    MediaBackup,
+    JenisDataILAP,
+    KlasifikasiJenisData,
+    JenisPrioritasData,
+    PeriodeJenisData,
+    PIC,
+)
+
+_VERSION_KEY = 'reference_data_version'
+
+_local_lock = threading.Lock()
+_local_state = {'version': None, 'checked_at': 0.0, 'values': {}}
+
+
+def _local_ttl():
+    return getattr(settings, 'REFERENCE_DATA_LOCAL_TTL', 5)
+
+
+def _cache_timeout():
+    return getattr(settings, 'REFERENCE_DATA_CACHE_TIMEOUT', 24 * 60 * 60)
+
+
+def reference_version():
+    """Return the current reference data version token."""
+    now = time.monotonic()
+    with _local_lock:
+        if _local_state['version'] and now - _local_state['checked_at'] < _local_ttl():
+            return _local_state['version']
+
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        cache.add(_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(_VERSION_KEY)
+
+    with _local_lock:
+        if version != _local_state['version']:
+            _local_state['values'] = {}
+        _local_state['version'] = version
+        _local_state['checked_at'] = now
+    return version
+
+
+def invalidate_reference_data():
+    """Start a new reference data version (all processes rebuild on next read)."""
+    version = uuid.uuid4().hex
+    cache.set(_VERSION_KEY, version, timeout=None)
+    with _local_lock:
+        _local_state['version'] = version
+        _local_state['checked_at'] = time.monotonic()
+        _local_state['values'] = {}
+
+
+def reference_etag(*parts):
+    """Return an ETag for a response built only from reference data (plus *parts*)."""
+    raw = '|'.join([reference_version(), *(str(part) for part in parts)])
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Option list builders
+# ---------------------------------------------------------------------------
+
+def _kanwil():
+    return list(Kanwil.objects.values('id', 'kode_kanwil', 'nama_kanwil').order_by('kode_kanwil'))
+
+
+def _kpp():
+    return list(KPP.objects.values('id', 'kode_kpp', 'nama_kpp').order_by('kode_kpp'))
+
+
+def _kategori_wilayah():
+    return list(KategoriWilayah.objects.values('id', 'deskripsi').order_by('id'))
+
+
+def _kategori_ilap():
+    return list(KategoriILAP.objects.values('id', 'id_kategori', 'nama_kategori').order_by('nama_kategori'))
+
+
+def _ilap():
+    return list(ILAP.objects.values(
+        'id', 'id_ilap', 'nama_ilap', 'id_kategori_id', 'id_kategori_wilayah_id', 'id_kpp_id', 'id_kpp__id_kanwil_id',
+    ).order_by('id_ilap'))
+
+
+def _ilap_regional_ids():
+    return list(ILAP.objects.filter(
+        id_kategori_wilayah__deskripsi__icontains='regional'
+    ).values_list('id', flat=True))
+
+
+def _jenis_data_ilap():
+    return list(JenisDataILAP.objects.values(
+        'id', 'id_ilap_id', 'id_jenis_data', 'nama_jenis_data', 'id_sub_jenis_data',
+        'nama_sub_jenis_data', 'nama_tabel_I', 'id_jenis_tabel_id',
+    ).order_by('id'))
+
+
+def _jenis_data():
+    return list(JenisDataILAP.objects.values('id_jenis_data', 'nama_jenis_data').distinct().order_by('id_jenis_data'))
+
+
+def _sub_jenis_data():
+    return list(
+        JenisDataILAP.objects.values('id_sub_jenis_data', 'nama_sub_jenis_data').distinct().order_by('id_sub_jenis_data')
+    )
+
+
+def _jenis_tabel():
+    return list(JenisTabel.objects.values('id', 'deskripsi').order_by('id'))
+
+
+def _dasar_hukum():
+    return list(DasarHukum.objects.values('id', 'deskripsi').order_by('id'))
+
+
+def _periode_pengiriman():
+    return list(PeriodePengiriman.objects.values('id', 'periode_penyampaian').order_by('id'))
+
+
+def _bentuk_data():
+    return list(BentukData.objects.values('id', 'deskripsi').order_by('id'))
+
+
+def _cara_penyampaian():
+    return list(CaraPenyampaian.objects.values('id', 'deskripsi').order_by('id'))
+
+
+def _status_penelitian():
+    return list(StatusPenelitian.objects.values('id', 'deskripsi').order_by('id'))
+
+
+def _media_backup():
+    return list(MediaBackup.objects.values('id', 'deskripsi').order_by('deskripsi'))
+
+
+def _klasifikasi_by_sub_jenis():
+    """{JenisDataILAP.id: [(DasarHukum.id, deskripsi), ...]} in KlasifikasiJenisData order."""
+    result = defaultdict(list)
+    rows = KlasifikasiJenisData.objects.filter(id_klasifikasi_tabel__isnull=False).values_list(
+        'id_sub_jenis_data_id', 'id_klasifikasi_tabel_id', 'id_klasifikasi_tabel__deskripsi'
+    ).order_by('id')
+    for sub_jenis_id, dasar_hukum_id, deskripsi in rows:
+        result[sub_jenis_id].append((dasar_hukum_id, deskripsi))
+    return dict(result)
+
+
+def _prioritas_sub_jenis_ids():
+    return set(JenisPrioritasData.objects.filter(
+        id_sub_jenis_data_ilap__isnull=False
+    ).values_list('id_sub_jenis_data_ilap_id', flat=True))
+
+
+def _periode_pengiriman_by_sub_jenis():
+    result = defaultdict(set)
+    rows = PeriodeJenisData.objects.filter(id_periode_pengiriman__isnull=False).values_list(
+        'id_sub_jenis_data_ilap_id', 'id_periode_pengiriman_id'
+    )
+    for sub_jenis_id, periode_pengiriman_id in rows:
+        result[sub_jenis_id].add(periode_pengiriman_id)
+    return dict(result)
+
+
+def _periode_tahun_range():
+    return PeriodeJenisData.objects.aggregate(
+        min_year=Min('start_date__year'),
+        max_year=Max('start_date__year'),
+    )
+
+
+def _open_pics():
+    """{(JenisDataILAP.id, tipe): [user dict, ...]} for PICs without end_date, in PIC order."""
+    result = defaultdict(list)
+    rows = PIC.objects.filter(end_date__isnull=True).values(
+        'id_sub_jenis_data_ilap_id', 'tipe', 'start_date',
+        'id_user_id', 'id_user__username', 'id_user__first_name', 'id_user__last_name',
+    ).order_by('tipe', 'id')
+    for row in rows:
+        result[(row['id_sub_jenis_data_ilap_id'], row['tipe'])].append({
+            'start_date': row['start_date'],
+            'id': row['id_user_id'],
+            'username': row['id_user__username'],
+            'first_name': row['id_user__first_name'] or '',
+            'last_name': row['id_user__last_name'] or '',
+        })
+    return dict(result)
+
+
+_BUILDERS = {
+    'kanwil': _kanwil,
+    'kpp': _kpp,
+    'kategori_wilayah': _kategori_wilayah,
+    'kategori_ilap': _kategori_ilap,
+    'ilap': _ilap,
+    'ilap_regional_ids': _ilap_regional_ids,
+    'jenis_data_ilap': _jenis_data_ilap,
+    'jenis_data': _jenis_data,
+    'sub_jenis_data': _sub_jenis_data,
+    'jenis_tabel': _jenis_tabel,
+    'dasar_hukum': _dasar_hukum,
+    'periode_pengiriman': _periode_pengiriman,
+    'bentuk_data': _bentuk_data,
+    'cara_penyampaian': _cara_penyampaian,
+    'status_penelitian': _status_penelitian,
+    'media_backup': _media_backup,
+    'klasifikasi_by_sub_jenis': _klasifikasi_by_sub_jenis,
+    'prioritas_sub_jenis_ids': _prioritas_sub_jenis_ids,
+    'periode_pengiriman_by_sub_jenis': _periode_pengiriman_by_sub_jenis,
+    'periode_tahun_range': _periode_tahun_range,
+    'open_pics': _open_pics,
+}
+
+
+def get_reference(name):
+    """Return the prebuilt reference list/map *name* (see ``_BUILDERS``).
+
+    The returned object is shared between callers: treat it as read-only.
+    """
+    builder = _BUILDERS[name]
+    version = reference_version()
+
+    with _local_lock:
+        if _local_state['version'] == version and name in _local_state['values']:
+            return _local_state['values'][name]
+
+    key = f'reference_data_{name}_{version}'
+    value = cache.get(key)
+    if value is None:
+        # Never cache rows read from a lagging reporting replica
+        with primary_reads():
+            value = builder()
+        cache.set(key, value, _cache_timeout())
+
+    with _local_lock:
+        if _local_state['version'] == version:
+            _local_state['values'][name] = value
+    return value
@@ -0,0 +1,224 @@
+"""SLA engine: persisted deadlines and prioritas flag of each tiket.
+
+Every tiket stores three derived columns so list pages can filter and sort
+on plain indexed values instead of correlated subqueries:
+
+- ``deadline_identifikasi``: ``tgl_rekam_pide`` + the PIDE durasi jatuh tempo
+  (seksi ``user_pide``) valid on that date;
+- ``deadline_pengendalian``: ``tgl_transfer`` + the PMDE durasi jatuh tempo
+  (seksi ``user_pmde``) valid on that date;
+- ``is_prioritas``: ``tgl_terima_dip`` falls inside a JenisPrioritasData
+  range of the tiket's sub jenis data.
+
+A durasi is valid on a date when ``start_date <= date`` and ``end_date`` is
+empty or ``>= date``; the one with the latest ``start_date`` wins.  A
+missing date or missing/zero durasi leaves the deadline empty.
+
+The values are kept current by:
+
+- ``refresh_tiket_sla`` from the Tiket ``post_save`` receiver, when one of
+  the source fields changed (see ``Tiket.from_db``);
+- ``recompute_sla`` from the DurasiJatuhTempo/JenisPrioritasData receivers
+  (for the affected sub jenis data) and after the bulk tiket sync.
+
+``manage.py check_sla_deadlines`` diffs the stored values against a fresh
+computation and can repair them with ``--fix``.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from ..models.durasi_jatuh_tempo import DurasiJatuhTempo
+from ..models.jenis_prioritas_data import JenisPrioritasData
+from ..models.tiket import Tiket
+
+logger = logging.getLogger(__name__)
+
+SEKSI_IDENTIFIKASI = 'user_pide'
+SEKSI_PENGENDALIAN = 'user_pmde'
+
+SLA_FIELDS = ('deadline_identifikasi', 'deadline_pengendalian', 'is_prioritas')
+
+RECOMPUTE_BATCH_SIZE = 2000
+
+_VALUE_FIELDS = (
+    'id',
+    'id_periode_data__id_sub_jenis_data_ilap_id',
+    'tgl_rekam_pide',
+    'tgl_transfer',
+    'tgl_terima_dip',
+) + SLA_FIELDS
+
+
+def _as_date(value):
+    if value is None:
+        return None
+    return value.date() if isinstance(value, datetime) else value
+
+
+class SlaRules:
+    """Durasi jatuh tempo and prioritas ranges, indexed by sub jenis data id."""
+
+    def __init__(self, durasi=None, prioritas=None):
+        # {(sub_jenis_id, seksi_name): [(start_date, end_date, durasi), ...]} newest start first
+        self.durasi = durasi or {}
+        # {sub_jenis_id: [(start_date, end_date), ...]}
+        self.prioritas = prioritas or {}
+
+    @classmethod
+    def load(cls, sub_jenis_ids=None, durasi_model=DurasiJatuhTempo, prioritas_model=JenisPrioritasData):
+        """Load the rules (two queries), optionally only for *sub_jenis_ids*.
+
+        The model arguments let data migrations pass their historical models.
+        """
+        durasi_qs = durasi_model.objects.filter(
+            seksi__name__in=(SEKSI_IDENTIFIKASI, SEKSI_PENGENDALIAN)
+        )
+        prioritas_qs = prioritas_model.objects.all()
+        if sub_jenis_ids is not None:
+            durasi_qs = durasi_qs.filter(id_sub_jenis_data_id__in=sub_jenis_ids)
+            prioritas_qs = prioritas_qs.filter(id_sub_jenis_data_ilap_id__in=sub_jenis_ids)
+
+        durasi = defaultdict(list)
+        rows = durasi_qs.values_list(
+            'id_sub_jenis_data_id', 'seksi__name', 'start_date', 'end_date', 'durasi'
+        ).order_by('-start_date', 'id')
+        for sub_jenis_id, seksi_name, start_date, end_date, days in rows:
+            durasi[(sub_jenis_id, seksi_name)].append((start_date, end_date, days))
+
+        prioritas = defaultdict(list)
+        rows = prioritas_qs.values_list('id_sub_jenis_data_ilap_id', 'start_date', 'end_date')
+        for sub_jenis_id, start_date, end_date in rows:
+            prioritas[sub_jenis_id].append((start_date, end_date))
+
+        return cls(dict(durasi), dict(prioritas))
+
+    def durasi_on(self, sub_jenis_id, seksi_name, on_date):
+        """Return the durasi (days) valid on *on_date*, or None."""
+        for start_date, end_date, days in self.durasi.get((sub_jenis_id, seksi_name), ()):
+            if start_date <= on_date and (end_date is None or end_date >= on_date):
+                return days
+        return None
+
+    def deadline(self, sub_jenis_id, seksi_name, base):
+        """Return *base* (date/datetime) + the valid durasi as a date, or None."""
+        base_date = _as_date(base)
+        if base_date is None:
+            return None
+        days = self.durasi_on(sub_jenis_id, seksi_name, base_date)
+        return base_date + timedelta(days=days) if days else None
+
+    def is_prioritas(self, sub_jenis_id, tgl_terima_dip):
+        terima_date = _as_date(tgl_terima_dip)
+        if terima_date is None:
+            return False
+        return any(
+            end_date is not None and start_date <= terima_date <= end_date
+            for start_date, end_date in self.prioritas.get(sub_jenis_id, ())
+        )
+
+
+def compute_sla(rules, sub_jenis_id, tgl_rekam_pide, tgl_transfer, tgl_terima_dip):
+    """Return ``{field: value}`` for the SLA_FIELDS of one tiket."""
+    return {
+        'deadline_identifikasi': rules.deadline(sub_jenis_id, SEKSI_IDENTIFIKASI, tgl_rekam_pide),
+        'deadline_pengendalian': rules.deadline(sub_jenis_id, SEKSI_PENGENDALIAN, tgl_transfer),
+        'is_prioritas': rules.is_prioritas(sub_jenis_id, tgl_terima_dip),
+    }
+
+
+def iter_sla_diffs(queryset=None, rules=None, batch_size=RECOMPUTE_BATCH_SIZE):
+    """Yield ``(tiket_id, stored, expected)`` for tikets whose stored SLA values are stale.
+
+    Reads the tikets in primary key order, *batch_size* rows at a time, as
+    plain values (no model instances).
+    """
+    queryset = Tiket.objects.all() if queryset is None else queryset
+    rules = SlaRules.load() if rules is None else rules
+    last_id = 0
+    while True:
+        rows = list(
+            queryset.filter(id__gt=last_id).order_by('id').values(*_VALUE_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return
+        for row in rows:
+            expected = compute_sla(
+                rules,
+                row['id_periode_data__id_sub_jenis_data_ilap_id'],
+                row['tgl_rekam_pide'],
+                row['tgl_transfer'],
+                row['tgl_terima_dip'],
+            )
+            stored = {name: row[name] for name in SLA_FIELDS}
+            if stored != expected:
+                yield row['id'], stored, expected
+        last_id = rows[-1]['id']
+
+
+def _write_sla(model, pending):
+    """Store ``{tiket_id: values}``: one UPDATE per distinct value tuple."""
+    groups = defaultdict(list)
+    for tiket_id, values in pending.items():
+        groups[tuple(values[name] for name in SLA_FIELDS)].append(tiket_id)
+    for key, tiket_ids in groups.items():
+        model.objects.filter(id__in=tiket_ids).update(**dict(zip(SLA_FIELDS, key)))
+
+
+def recompute_sla(queryset=None, rules=None, batch_size=RECOMPUTE_BATCH_SIZE):
+    """Recompute and store the SLA values of *queryset* (default: all tikets).
+
+    Only stale rows are written.  Tikets sharing the same values (same
+    deadline dates) are updated together, so a batch costs a handful of
+    ``UPDATE ... WHERE id IN (...)`` statements rather than one per row.
+    Returns the number of tikets updated.
+    """
+    queryset = Tiket.objects.all() if queryset is None else queryset
+    model = queryset.model
+    updated = 0
+    pending = {}
+    for tiket_id, _stored, expected in iter_sla_diffs(queryset, rules, batch_size=batch_size):
+        pending[tiket_id] = expected
+        if len(pending) >= batch_size:
+            _write_sla(model, pending)
+            updated += len(pending)
+            pending = {}
+    if pending:
+        _write_sla(model, pending)
+        updated += len(pending)
+    if updated:
+        logger.info('SLA values recomputed for %s tiket', updated)
+    return updated
+
+
+def recompute_sla_for_sub_jenis(sub_jenis_id):
+    """Recompute the tikets of one sub jenis data (after a durasi/prioritas change)."""
+    return recompute_sla(Tiket.objects.filter(id_periode_data__id_sub_jenis_data_ilap_id=sub_jenis_id))
+
+
+def refresh_tiket_sla(tiket):
+    """Update the SLA values of a just-saved *tiket* if its source fields changed.
+
+    Costs nothing when the source fields are unchanged since the tiket was
+    loaded, otherwise two rule queries plus one UPDATE if a value differs.
+    """
+    source = tiket.sla_source()
+    if source == getattr(tiket, '_sla_source', None):
+        return False
+    tiket._sla_source = source
+
+    sub_jenis_id = tiket.id_periode_data.id_sub_jenis_data_ilap_id
+    expected = compute_sla(
+        SlaRules.load([sub_jenis_id]),
+        sub_jenis_id,
+        tiket.tgl_rekam_pide,
+        tiket.tgl_transfer,
+        tiket.tgl_terima_dip,
+    )
+    if all(getattr(tiket, name) == value for name, value in expected.items()):
+        return False
+    Tiket.objects.filter(pk=tiket.pk).update(**expected)
+    for name, value in expected.items():
+        setattr(tiket, name, value)
+    return True
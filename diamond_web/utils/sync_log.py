@@ -0,0 +1,278 @@
+"""Sync run catalog helpers and buffered failed-row logging.
+
+Each sync/check run is recorded as a :class:`~diamond_web.models.SyncRun` row
+(type, start/end, counts, duration, log and error-file paths) so the sync
+status page can query an indexed table instead of listing and ``stat``-ing
+the ``sync_logs`` directory on every request.  The cron scripts record
+their own runs (keyed by log file, :func:`file_run_id`) through
+``manage.py catalog_sync_log``.
+
+Failed rows are written through :class:`FailedRowWriter`, which buffers rows
+in memory and appends them to the CSV in batches, instead of reopening the
+file once per failed row.  Old log files referenced by the catalog are
+gzip-compressed and eventually deleted by :func:`rotate_sync_logs`.
+"""
+
+import csv
+import gzip
+import logging
+import os
+import shutil
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+SYNC_LOGS_DIR = getattr(settings, 'SYNC_LOGS_DIR', os.path.join(settings.BASE_DIR, 'sync_logs'))
+
+# Run types recorded in the catalog.
+REFERENSI_SYNC = 'referensi_sync'
+REFERENSI_CHECK = 'referensi_check'
+TIKET_SYNC = 'tiket_sync'
+TIKET_CHECK = 'tiket_check'
+
+SYNC_TYPE_DISPLAY = {
+    'daily_sync': 'Daily Sync',
+    REFERENSI_SYNC: 'Sinkronisasi Data Referensi',
+    REFERENSI_CHECK: 'Cek Data Referensi',
+    TIKET_SYNC: 'Sinkronisasi Data Tiket',
+    TIKET_CHECK: 'Cek Data Tiket',
+    'cleanup_dryrun': 'Cleanup (Dry Run)',
+    'cleanup_exec': 'Cleanup (Execute)',
+    'cleanup_pre_production': 'Cleanup Pre Production',
+    'cleanup_verify': 'Cleanup Verify',
+    'cleanup_pre_production_error': 'Cleanup Pre Production (Error)',
+    'sync_failed_rows': 'Tiket Sync (Failed Rows)',
+    'sync_referensi_failed_rows': 'Referensi Sync (Failed Rows)',
+}
+
+# Failed-row CSV file name prefixes (``<prefix>_<run_id>.csv``).
+TIKET_FAILED_ROWS_PREFIX = 'sync_failed_rows'
+REFERENSI_FAILED_ROWS_PREFIX = 'sync_referensi_failed_rows'
+
+FAILED_ROWS_FLUSH_EVERY = 200
+
+COMPRESS_AFTER_DAYS = getattr(settings, 'SYNC_LOG_COMPRESS_AFTER_DAYS', 7)
+RETENTION_DAYS = getattr(settings, 'SYNC_LOG_RETENTION_DAYS', 90)
+
+
+def get_type_display_name(sync_type):
+    """Convert a sync type slug to a human-readable display name."""
+    if sync_type in SYNC_TYPE_DISPLAY:
+        return SYNC_TYPE_DISPLAY[sync_type]
+    return sync_type.replace('_', ' ').title()
+
+
+def file_run_id(path):
+    """Catalog run id of a run known by its log file (cron scripts, imported files)."""
+    return f'file:{os.path.basename(path)}'
+
+
+def failed_rows_path(prefix, run_id):
+    """Return the failed-rows CSV path for *run_id*."""
+    return os.path.join(SYNC_LOGS_DIR, f'{prefix}_{run_id}.csv')
+
+
+def find_failed_rows_file(prefix, run_id):
+    """Return the existing failed-rows file of *run_id*, or None.
+
+    A finished run's catalog entry holds the current path, which is
+    ``.csv.gz`` once :func:`rotate_sync_logs` compressed it; the plain
+    :func:`failed_rows_path` covers runs still writing or never cataloged.
+    """
+    from ..models import SyncRun
+    cataloged = SyncRun.objects.filter(run_id=str(run_id)).values_list('error_file_path', flat=True).first()
+    for path in (cataloged, failed_rows_path(prefix, run_id)):
+        if path and os.path.basename(path).startswith(f'{prefix}_') and os.path.isfile(path):
+            return path
+    return None
+
+
+def open_failed_rows(path):
+    """Open a failed-rows file for reading, decompressing a rotated ``.gz`` on the fly."""
+    return gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')
+
+
+class FailedRowWriter:
+    """Buffered CSV writer for rows that failed during a sync.
+
+    Rows are kept in memory and appended to *path* every *flush_every* rows
+    (and on :meth:`close`), so an error-heavy sync opens the file once per
+    batch rather than once per row.  The file and its header are only
+    created when the first batch is flushed, so runs without failures leave
+    no file behind.  Each row is prefixed with the time it was recorded.
+
+    Usable as a context manager; leaving the block flushes the buffer.
+    """
+
+    def __init__(self, path, header, flush_every=FAILED_ROWS_FLUSH_EVERY):
+        self.path = path
+        self.header = ['Timestamp'] + list(header)
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self._buffer = []
+
+    def writerow(self, values):
+        """Buffer one failed row; flushes when the buffer is full."""
+        self._buffer.append([timezone.now().isoformat()] + list(values))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Append buffered rows to the CSV file."""
+        if not self._buffer:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_header = not os.path.exists(self.path)
+            with open(self.path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if write_header:
+                    writer.writerow(self.header)
+                writer.writerows(self._buffer)
+            self.rows_written += len(self._buffer)
+        except OSError as e:
+            logger.error(f'Failed to write failed rows to {self.path}: {e}')
+        self._buffer = []
+
+    def close(self):
+        """Flush any remaining rows."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def start_run(sync_type, run_id, user=None, log_path=None):
+    """Record the start of a run in the catalog and return the SyncRun."""
+    from ..models import SyncRun
+    run, _ = SyncRun.objects.update_or_create(
+        run_id=str(run_id),
+        defaults={
+            'sync_type': sync_type,
+            'status': SyncRun.STATUS_RUNNING,
+            'started_at': timezone.now(),
+            'triggered_by': user if getattr(user, 'pk', None) else None,
+            'log_path': log_path,
+        },
+    )
+    return run
+
+
+def finish_run(run, summary=None, error=None, stopped=False, error_file_path=None):
+    """Store the outcome of *run*: counts from *summary*, status and duration.
+
+    Args:
+        run: The SyncRun returned by :func:`start_run`.
+        summary: Result dict of the sync/check (``source_rows``, ``inserts``,
+            ``updates``, ``errors``), if the run produced one.
+        error: Error message when the run failed or was stopped.
+        stopped: True when the run was interrupted by the user.
+        error_file_path: Failed-rows CSV; recorded only if it exists.
+    """
+    from ..models import SyncRun
+    summary = summary or {}
+    now = timezone.now()
+    if stopped:
+        run.status = SyncRun.STATUS_STOPPED
+    elif error:
+        run.status = SyncRun.STATUS_FAILED
+    else:
+        run.status = SyncRun.STATUS_SUCCESS
+    run.finished_at = now
+    run.duration_seconds = (now - run.started_at).total_seconds()
+    run.source_rows = summary.get('source_rows', 0) or 0
+    run.inserts = summary.get('inserts', 0) or 0
+    run.updates = summary.get('updates', 0) or 0
+    errors = summary.get('errors') or []
+    run.error_count = len(errors) if isinstance(errors, (list, tuple)) else int(errors)
+    run.message = (error or '')[:255] or None
+    if error_file_path and os.path.exists(error_file_path):
+        run.error_file_path = error_file_path
+    run.save()
+
+    try:
+        rotate_sync_logs(now=now)
+    except Exception as e:
+        logger.warning(f'Sync log rotation failed (non-blocking): {e}')
+    return run
+
+
+def _gzip_file(path):
+    """Compress *path* to ``path.gz`` and remove the original; return the new path.
+
+    On failure the partial ``.gz`` is removed and the original kept.
+    """
+    gz_path = f'{path}.gz'
+    try:
+        with open(path, 'rb') as src, gzip.open(gz_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+    except OSError:
+        try:
+            os.remove(gz_path)
+        except FileNotFoundError:
+            pass
+        raise
+    os.remove(path)
+    return gz_path
+
+
+def rotate_sync_logs(now=None, compress_after_days=COMPRESS_AFTER_DAYS, retention_days=RETENTION_DAYS):
+    """Compress and expire log files referenced by the run catalog.
+
+    Runs finished more than *compress_after_days* ago get their log and
+    failed-rows files gzip-compressed; a run is marked compressed only when
+    none of its files failed, so a failure is retried next time.  Files of
+    runs older than
+    *retention_days* are deleted (the catalog row itself is kept).  Only the
+    catalog is queried — the directory is never listed.
+
+    Returns:
+        tuple: ``(compressed_runs, expired_runs)`` counts.
+    """
+    from ..models import SyncRun
+    now = now or timezone.now()
+    compressed = expired = 0
+
+    to_compress = SyncRun.objects.filter(
+        compressed=False,
+        finished_at__lt=now - timedelta(days=compress_after_days),
+    )
+    for run in to_compress.iterator():
+        failed = False
+        for field in ('log_path', 'error_file_path'):
+            path = getattr(run, field)
+            if path and os.path.isfile(path) and not path.endswith('.gz'):
+                try:
+                    setattr(run, field, _gzip_file(path))
+                except OSError as e:
+                    logger.warning(f'Failed to compress {path}: {e}')
+                    failed = True
+        run.compressed = not failed
+        run.save(update_fields=['log_path', 'error_file_path', 'compressed'])
+        compressed += run.compressed
+
+    to_expire = SyncRun.objects.filter(
+        finished_at__lt=now - timedelta(days=retention_days),
+    ).exclude(log_path__isnull=True, error_file_path__isnull=True)
+    for run in to_expire.iterator():
+        for field in ('log_path', 'error_file_path'):
+            path = getattr(run, field)
+            if path:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f'Failed to delete {path}: {e}')
+                setattr(run, field, None)
+        run.save(update_fields=['log_path', 'error_file_path'])
+        expired += 1
+
+    return compressed, expired
@@ -0,0 +1,385 @@
+"""Synthetic data set for performance tests and load testing.
+
+``seed_synthetic`` fills the database with a realistic, deterministic
+volume of master data and tikets using ``bulk_create`` only, so even the full
+size (500 ILAP, 5,000 jenis data, 200,000 tikets, 1,000,000 tiket actions)
+loads in minutes rather than hours.  Used by ``manage.py seed_synthetic`` and
+by the ``synthetic_data`` pytest fixture (diamond_web/tests/conftest.py).
+
+Every generated row is recognisable by the ``SYN`` prefix of its code or
+name.  ``bulk_create`` bypasses model signals, so once the rows are written
+the SLA columns and the latest actions are recomputed and the reference data
+and dossier caches are invalidated explicitly.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+from django.contrib.auth.models import Group, User
+from django.db import transaction
+
+from ..constants.tiket_action_types import TiketActionType
+from ..constants.tiket_status import (
+    STATUS_DIBATALKAN,
+    STATUS_DIKEMBALIKAN,
+    STATUS_DIKIRIM_KE_PIDE,
+    STATUS_DIREKAM,
+    STATUS_DITELITI,
+    STATUS_IDENTIFIKASI,
+    STATUS_PENGENDALIAN_MUTU,
+    STATUS_SELESAI,
+)
+from ..models import (
+    ILAP,
+    PIC,
+    BentukData,
+    CaraPenyampaian,
+    DurasiJatuhTempo,
+    JenisDataILAP,
+    JenisTabel,
+    KategoriILAP,
+    KategoriWilayah,
+    PeriodeJenisData,
+    PeriodePengiriman,
+    StatusData,
+    Tiket,
+    TiketAction,
+    TiketPIC,
+)
+from . import reference_data, sla, tiket_dossier, tiket_timeline
+
+PREFIX = 'SYN'
+
+DEFAULT_COUNTS = {
+    'ilap': 500,
+    'jenis_data': 5000,
+    'tiket': 200000,
+    'tiket_action': 1000000,
+    'tiket_pic': 50000,
+    'users': 60,
+}
+
+BATCH_SIZE = 5000
+
+YEARS = (2023, 2024, 2025)
+
+# status -> relative frequency; most tikets of past years are finished
+STATUS_WEIGHTS = {
+    STATUS_DIREKAM: 6,
+    STATUS_DITELITI: 4,
+    STATUS_DIKEMBALIKAN: 1,
+    STATUS_DIKIRIM_KE_PIDE: 4,
+    STATUS_IDENTIFIKASI: 8,
+    STATUS_PENGENDALIAN_MUTU: 12,
+    STATUS_DIBATALKAN: 2,
+    STATUS_SELESAI: 63,
+}
+
+# Workflow actions recorded up to each status (in order)
+ACTION_PATH = {
+    STATUS_DIREKAM: (TiketActionType.DIREKAM,),
+    STATUS_DITELITI: (TiketActionType.DIREKAM, TiketActionType.DITELITI),
+    STATUS_DIKEMBALIKAN: (TiketActionType.DIREKAM, TiketActionType.DIKEMBALIKAN),
+    STATUS_DIKIRIM_KE_PIDE: (TiketActionType.DIREKAM, TiketActionType.DITELITI, TiketActionType.DIKIRIM_KE_PIDE),
+    STATUS_IDENTIFIKASI: (
+        TiketActionType.DIREKAM, TiketActionType.DITELITI, TiketActionType.DIKIRIM_KE_PIDE,
+        TiketActionType.IDENTIFIKASI,
+    ),
+    STATUS_PENGENDALIAN_MUTU: (
+        TiketActionType.DIREKAM, TiketActionType.DITELITI, TiketActionType.DIKIRIM_KE_PIDE,
+        TiketActionType.IDENTIFIKASI, TiketActionType.DITRANSFER_KE_PMDE,
+    ),
+    STATUS_DIBATALKAN: (TiketActionType.DIREKAM, TiketActionType.DIBATALKAN),
+    STATUS_SELESAI: (
+        TiketActionType.DIREKAM, TiketActionType.DITELITI, TiketActionType.DIKIRIM_KE_PIDE,
+        TiketActionType.IDENTIFIKASI, TiketActionType.DITRANSFER_KE_PMDE, TiketActionType.SELESAI,
+    ),
+}
+
+SEKSI_GROUPS = {
+    PIC.TipePIC.P3DE: 'user_p3de',
+    PIC.TipePIC.PIDE: 'user_pide',
+    PIC.TipePIC.PMDE: 'user_pmde',
+}
+
+
+def scaled_counts(scale=1.0, **overrides):
+    """Return ``DEFAULT_COUNTS`` multiplied by *scale* (at least 1 each), then *overrides*."""
+    counts = {name: max(1, int(round(value * scale))) for name, value in DEFAULT_COUNTS.items()}
+    counts['users'] = max(counts['users'], len(SEKSI_GROUPS))
+    counts.update({name: value for name, value in overrides.items() if value is not None})
+    return counts
+
+
+def synthetic_data_exists():
+    """True when a previous run already seeded synthetic tikets or ILAPs."""
+    return (
+        ILAP.objects.filter(nama_ilap__startswith=f'{PREFIX} ').exists()
+        or Tiket.objects.filter(nomor_tiket__startswith=PREFIX).exists()
+    )
+
+
+def _bulk_create(model, rows, batch_size=BATCH_SIZE):
+    """``bulk_create`` an iterable in chunks; return the created objects."""
+    created = []
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, batch_size))
+        if not chunk:
+            return created
+        created.extend(model.objects.bulk_create(chunk, batch_size=batch_size))
+
+
+def _named_rows(model, names, field='deskripsi'):
+    """Existing rows of *model* with the given names, creating the missing ones."""
+    existing = {getattr(row, field): row for row in model.objects.filter(**{f'{field}__in': names})}
+    missing = [model(**{field: name}) for name in names if name not in existing]
+    for row in model.objects.bulk_create(missing):
+        existing[getattr(row, field)] = row
+    return [existing[name] for name in names]
+
+
+def _masters():
+    kategori = []
+    for number in range(1, 6):
+        row, _ = KategoriILAP.objects.get_or_create(
+            nama_kategori=f'{PREFIX} Kategori {number}', defaults={'id_kategori': f'Y{number}'},
+        )
+        kategori.append(row)
+    periode_pengiriman = [
+        PeriodePengiriman.objects.get_or_create(periode_penyampaian=name, defaults={'periode_penerimaan': name})[0]
+        for name in ('Bulanan', 'Triwulan', 'Semester', 'Tahunan')
+    ]
+    return {
+        'kategori': kategori,
+        'wilayah': _named_rows(KategoriWilayah, [f'{PREFIX} Pusat', f'{PREFIX} Regional']),
+        'jenis_tabel': _named_rows(JenisTabel, ['Diidentifikasi', 'Tidak Diidentifikasi', 'Tidak Terstruktur']),
+        'status_data': _named_rows(StatusData, ['Aktif', 'Tidak Aktif']),
+        'bentuk_data': _named_rows(BentukData, [f'{PREFIX} Softcopy', f'{PREFIX} Hardcopy']),
+        'cara_penyampaian': _named_rows(CaraPenyampaian, [f'{PREFIX} Email', f'{PREFIX} Portal']),
+        'periode_pengiriman': periode_pengiriman,
+    }
+
+
+def _users(count):
+    """Create *count* users spread over the P3DE/PIDE/PMDE groups; return ``{tipe: [user]}``."""
+    groups = {tipe: Group.objects.get_or_create(name=name)[0] for tipe, name in SEKSI_GROUPS.items()}
+    tipes = list(SEKSI_GROUPS)
+    users = _bulk_create(User, (
+        User(username=f'{PREFIX.lower()}_{number:05d}', first_name=PREFIX, last_name=f'User {number}', password='!')
+        for number in range(count)
+    ))
+    by_tipe = {tipe: [] for tipe in tipes}
+    memberships = []
+    for index, user in enumerate(users):
+        tipe = tipes[index % len(tipes)]
+        by_tipe[tipe].append(user)
+        memberships.append(User.groups.through(user_id=user.pk, group_id=groups[tipe].pk))
+    _bulk_create(User.groups.through, memberships)
+    return by_tipe
+
+
+def _random_datetime(rng, year):
+    start = datetime(year, 1, 1, 8)
+    return start + timedelta(days=rng.randrange(330), minutes=rng.randrange(9 * 60))
+
+
+def _tiket(rng, number, periode_data, masters, statuses, weights):
+    status = rng.choices(statuses, weights)[0]
+    tahun = rng.choice(YEARS)
+    tgl_terima_dip = _random_datetime(rng, tahun)
+    tiket = Tiket(
+        nomor_tiket=f'{PREFIX}{number:09d}',
+        status_tiket=status,
+        id_periode_data=periode_data,
+        periode=rng.randint(1, 12),
+        tahun=tahun,
+        penyampaian=1,
+        id_bentuk_data=rng.choice(masters['bentuk_data']),
+        id_cara_penyampaian=rng.choice(masters['cara_penyampaian']),
+        baris_diterima=rng.randint(1, 500000),
+        tgl_terima_dip=tgl_terima_dip,
+        backup=status != STATUS_DIREKAM,
+        tanda_terima=status not in (STATUS_DIREKAM, STATUS_DIBATALKAN),
+    )
+    path = ACTION_PATH[status]
+    if TiketActionType.DITELITI in path:
+        tiket.tgl_teliti = tgl_terima_dip + timedelta(days=1)
+        tiket.baris_lengkap = tiket.baris_diterima
+        tiket.baris_tidak_lengkap = 0
+    if TiketActionType.DIKIRIM_KE_PIDE in path:
+        tiket.tgl_kirim_pide = tgl_terima_dip + timedelta(days=2)
+    if TiketActionType.IDENTIFIKASI in path:
+        tiket.tgl_rekam_pide = tgl_terima_dip + timedelta(days=3)
+    if TiketActionType.DITRANSFER_KE_PMDE in path:
+        tiket.tgl_transfer = tgl_terima_dip + timedelta(days=5)
+    if status == STATUS_DIKEMBALIKAN:
+        tiket.tgl_dikembalikan = tgl_terima_dip + timedelta(days=1)
+    if status == STATUS_DIBATALKAN:
+        tiket.tgl_dibatalkan = tgl_terima_dip + timedelta(days=1)
+    if status == STATUS_SELESAI:
+        tiket.sudah_qc = tiket.lolos_qc = tiket.baris_diterima
+        tiket.belum_qc = tiket.tidak_lolos_qc = 0
+    return tiket
+
+
+def _tiket_actions(rng, tikets, users, total):
+    """Workflow actions for each tiket, padded with repeated DIREKAM edits up to *total*."""
+    all_users = [user for group in users.values() for user in group]
+    extra_per_tiket = max(0, total - sum(len(ACTION_PATH[t.status_tiket]) for t in tikets)) / max(1, len(tikets))
+    produced = 0
+    for tiket in tikets:
+        actions = list(ACTION_PATH[tiket.status_tiket])
+        extra = int(extra_per_tiket) + (rng.random() < extra_per_tiket % 1)
+        actions[1:1] = [TiketActionType.DIREKAM] * extra
+        for step, action in enumerate(actions):
+            if produced >= total:
+                return
+            produced += 1
+            yield TiketAction(
+                id_tiket_id=tiket.pk,
+                id_user=rng.choice(all_users),
+                timestamp=tiket.tgl_terima_dip + timedelta(hours=step),
+                action=action,
+                catatan=f'{PREFIX} aksi {step + 1}',
+            )
+
+
+def _tiket_pics(rng, tikets, pics_by_jenis, total):
+    """Active TiketPIC rows (one per role along the tiket's path) until *total*."""
+    produced = 0
+    for tiket in tikets:
+        roles = [TiketPIC.Role.P3DE]
+        if tiket.tgl_kirim_pide:
+            roles.append(TiketPIC.Role.PIDE)
+        if tiket.tgl_transfer:
+            roles.append(TiketPIC.Role.PMDE)
+        pics = pics_by_jenis[tiket.id_periode_data.id_sub_jenis_data_ilap_id]
+        for role in roles:
+            if produced >= total:
+                return
+            produced += 1
+            yield TiketPIC(
+                id_tiket_id=tiket.pk,
+                id_user_id=pics[role],
+                timestamp=tiket.tgl_terima_dip,
+                role=role,
+                active=True,
+            )
+
+
+def seed_synthetic(counts=None, seed=0, batch_size=BATCH_SIZE, log=None):
+    """Create a synthetic data set and return the number of rows created per model.
+
+    *counts* defaults to ``DEFAULT_COUNTS`` (see ``scaled_counts``); *seed*
+    makes the data set reproducible.  *log* is an optional callable receiving
+    progress messages.
+    """
+    counts = counts or scaled_counts()
+    rng = random.Random(seed)
+    log = log or (lambda message: None)
+    role_for_tipe = {
+        PIC.TipePIC.P3DE: TiketPIC.Role.P3DE,
+        PIC.TipePIC.PIDE: TiketPIC.Role.PIDE,
+        PIC.TipePIC.PMDE: TiketPIC.Role.PMDE,
+    }
+
+    with transaction.atomic():
+        masters = _masters()
+        users = _users(counts['users'])
+
+        ilaps = _bulk_create(ILAP, (
+            ILAP(
+                id_ilap=f'S{number:04d}',
+                id_kategori=masters['kategori'][number % len(masters['kategori'])],
+                nama_ilap=f'{PREFIX} ILAP {number:04d}',
+                id_kategori_wilayah=masters['wilayah'][number % len(masters['wilayah'])],
+                create_date=date(2022, 1, 1),
+            )
+            for number in range(counts['ilap'])
+        ), batch_size)
+        log(f'ILAP: {len(ilaps)}')
+
+        jenis_data = _bulk_create(JenisDataILAP, (
+            JenisDataILAP(
+                id_ilap=ilaps[number % len(ilaps)],
+                id_jenis_data=f'S{number // 10:06d}',
+                id_sub_jenis_data=f'S{number:08d}',
+                nama_jenis_data=f'{PREFIX} Jenis Data {number // 10}',
+                nama_sub_jenis_data=f'{PREFIX} Sub Jenis Data {number}',
+                nama_tabel_I=f'TABEL_I_{number}',
+                nama_tabel_U=f'TABEL_U_{number}',
+                id_jenis_tabel=masters['jenis_tabel'][number % len(masters['jenis_tabel'])],
+                id_status_data=masters['status_data'][0],
+            )
+            for number in range(counts['jenis_data'])
+        ), batch_size)
+        log(f'JenisDataILAP: {len(jenis_data)}')
+
+        periode_data = _bulk_create(PeriodeJenisData, (
+            PeriodeJenisData(
+                id_sub_jenis_data_ilap=row,
+                id_periode_pengiriman=rng.choice(masters['periode_pengiriman']),
+                start_date=date(2022, 1, 1),
+                akhir_penyampaian=15,
+            )
+            for row in jenis_data
+        ), batch_size)
+
+        seksi = {name: Group.objects.get(name=name) for name in (sla.SEKSI_IDENTIFIKASI, sla.SEKSI_PENGENDALIAN)}
+        _bulk_create(DurasiJatuhTempo, (
+            DurasiJatuhTempo(id_sub_jenis_data=row, seksi=group, durasi=durasi, start_date=date(2022, 1, 1))
+            for row in jenis_data
+            for group, durasi in ((seksi[sla.SEKSI_IDENTIFIKASI], 14), (seksi[sla.SEKSI_PENGENDALIAN], 30))
+        ), batch_size)
+
+        pics_by_jenis = {}
+        pic_rows = []
+        for row in jenis_data:
+            pics_by_jenis[row.pk] = {}
+            for tipe, group_users in users.items():
+                user = rng.choice(group_users)
+                pics_by_jenis[row.pk][role_for_tipe[tipe]] = user.pk
+                pic_rows.append(PIC(
+                    tipe=tipe, id_sub_jenis_data_ilap=row, id_user=user, start_date=date(2022, 1, 1),
+                ))
+        pics = _bulk_create(PIC, pic_rows, batch_size)
+        log(f'PIC: {len(pics)}')
+
+        statuses, weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+        tikets = _bulk_create(Tiket, (
+            _tiket(rng, number, periode_data[number % len(periode_data)], masters, statuses, weights)
+            for number in range(counts['tiket'])
+        ), batch_size)
+        log(f'Tiket: {len(tikets)}')
+
+        tiket_pic_count = len(_bulk_create(
+            TiketPIC, _tiket_pics(rng, tikets, pics_by_jenis, counts['tiket_pic']), batch_size,
+        ))
+        log(f'TiketPIC: {tiket_pic_count}')
+
+        action_count = 0
+        for chunk_start in range(0, len(tikets), batch_size):
+            chunk = tikets[chunk_start:chunk_start + batch_size]
+            remaining = counts['tiket_action'] - action_count
+            share = remaining * len(chunk) // (len(tikets) - chunk_start)
+            actions = _bulk_create(TiketAction, _tiket_actions(rng, chunk, users, share), batch_size)
+            tiket_timeline.record_latest_actions(actions)
+            action_count += len(actions)
+        log(f'TiketAction: {action_count}')
+
+        sla.recompute_sla(Tiket.objects.filter(nomor_tiket__startswith=PREFIX))
+
+    reference_data.invalidate_reference_data()
+    tiket_dossier.invalidate_all_tiket_dossiers()
+
+    return {
+        'ilap': len(ilaps),
+        'jenis_data': len(jenis_data),
+        'pic': len(pics),
+        'tiket': len(tikets),
+        'tiket_pic': tiket_pic_count,
+        'tiket_action': action_count,
+        'users': sum(len(group) for group in users.values()),
+    }
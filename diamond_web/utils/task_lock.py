@@ -0,0 +1,73 @@
+"""Cross-process singleton lock for sync jobs.
+
+Two syncs of the same type (e.g. two tiket syncs, one from the UI and one
+from the daily cron) must never run at the same time.  The lock lives in the
+shared cache (Redis in production) so it is seen by every web process,
+Celery worker and management command.  It is taken with an atomic
+``cache.add`` and expires after the sync queue's hard time limit, so a
+worker killed mid-run cannot leave it behind for long.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def _default_timeout():
+    """Lock lifetime: the sync queue's hard time limit."""
+    return settings.TASK_QUEUE_CONFIG.get('sync', {}).get('time_limit', 3 * 3600)
+
+
+class LockBusyError(Exception):
+    """Raised when a singleton lock is already held by another run."""
+
+    def __init__(self, name, owner):
+        self.name = name
+        self.owner = owner
+        super().__init__(f'{name} sedang berjalan (run {owner})')
+
+
+class SingletonLock:
+    """Named lock held by one run (*owner*, usually the sync_id) at a time.
+
+    Usage::
+
+        with SingletonLock(SYNC_TIKET, owner=sync_id):
+            ...  # raises LockBusyError if another tiket sync holds the lock
+
+    Args:
+        name: Lock name, one of the job kinds in ``utils.job_state``.
+        owner: Identifier of the run taking the lock.
+        timeout: Seconds before the lock expires on its own.
+    """
+
+    def __init__(self, name, owner=None, timeout=None):
+        self.name = name
+        self.owner = str(owner) if owner is not None else None
+        self.timeout = timeout or _default_timeout()
+        self.key = f'singleton_lock_{name}'
+
+    def acquire(self):
+        """Take the lock; return False if another owner holds it."""
+        return cache.add(self.key, self.owner, timeout=self.timeout)
+
+    def release(self):
+        """Release the lock if this owner still holds it."""
+        if cache.get(self.key) == self.owner:
+            cache.delete(self.key)
+
+    def holder(self):
+        """Return the owner currently holding the lock, or None."""
+        return cache.get(self.key)
+
+    def __enter__(self):
+        if not self.acquire():
+            raise LockBusyError(self.name, self.holder())
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
@@ -0,0 +1,243 @@
+"""Tiket dossier: everything the tiket detail page and documents need, in a few queries.
+
+The tiket row itself (with its reference data via ``select_related``) is
+always read fresh.  The related lists -- actions, PICs, backups, tanda terima
+items, klasifikasi and the riwayat tiket of the same period -- are loaded
+with ``Prefetch`` / an annotated ``Exists`` in a fixed number of queries,
+independent of how many rows each list has, and cached per tiket version.
+The actions of a closed tiket include its archived ones
+(utils/tiket_timeline.py).
+
+Versions are bumped by the signal receivers in ``diamond_web.signals``
+whenever a TiketAction, TiketPIC, BackupData, DetilTandaTerima or Tiket is
+written.  Bulk writes that bypass signals (the Oracle tiket sync) call
+``invalidate_all_tiket_dossiers`` instead.
+"""
+
+import uuid
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+from django.db.models import Case, CharField, Exists, OuterRef, Prefetch, Value, When, prefetch_related_objects
+
+from ..constants.tiket_action_types import ROLE_BADGES, get_action_badge_class, get_action_label
+from ..constants.tiket_status import STATUS_BADGE_CLASSES, STATUS_LABELS
+from ..models.backup_data import BackupData
+from ..models.detil_tanda_terima import DetilTandaTerima
+from ..models.klasifikasi_jenis_data import KlasifikasiJenisData
+from ..models.pic import PIC
+from ..models.tiket import Tiket
+from ..models.tiket_action import TiketAction
+from ..models.tiket_pic import TiketPIC
+from . import tiket_timeline
+
+DOSSIER_CACHE_TIMEOUT = 60 * 60
+
+TIKET_SELECT_RELATED = (
+    'id_periode_data__id_sub_jenis_data_ilap__id_ilap__id_kategori',
+    'id_periode_data__id_sub_jenis_data_ilap__id_ilap__id_kategori_wilayah',
+    'id_periode_data__id_sub_jenis_data_ilap__id_ilap__id_kpp__id_kanwil',
+    'id_periode_data__id_sub_jenis_data_ilap__id_jenis_tabel',
+    'id_periode_data__id_periode_pengiriman',
+    'id_bentuk_data',
+    'id_cara_penyampaian',
+    'id_status_penelitian',
+    'id_jenis_prioritas_data',
+)
+
+_EPOCH_KEY = 'tiket_dossier_epoch'
+
+
+def _tiket_version_key(tiket_id):
+    return f'tiket_dossier_version_{tiket_id}'
+
+
+def _group_version_key(sub_jenis_data_id, periode, tahun):
+    return f'tiket_dossier_group_{sub_jenis_data_id}_{periode}_{tahun}'
+
+
+def _bump(key):
+    cache.set(key, uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_tiket_dossier(tiket_id):
+    """Drop the cached dossier of one tiket (called on TiketAction/TiketPIC/... writes)."""
+    _bump(_tiket_version_key(tiket_id))
+
+
+def invalidate_tiket_dossiers(tiket_ids):
+    """Drop the cached dossiers of many tikets at once (set-based workflow writes)."""
+    cache.set_many({_tiket_version_key(tiket_id): uuid.uuid4().hex for tiket_id in tiket_ids}, timeout=None)
+
+
+def invalidate_tiket_group(sub_jenis_data_id, periode, tahun):
+    """Drop cached dossiers whose riwayat tiket list covers this period."""
+    _bump(_group_version_key(sub_jenis_data_id, periode, tahun))
+
+
+def invalidate_all_tiket_dossiers():
+    """Drop every cached dossier (bulk sync, PIC or klasifikasi changes)."""
+    _bump(_EPOCH_KEY)
+
+
+def _user_display(user):
+    full_name = (user.get_full_name() or '').strip()
+    return f"{user.username} - {full_name}" if full_name else user.username
+
+
+@dataclass
+class TiketDossier:
+    """The tiket and its related rows, enriched for display.
+
+    Only user-independent data is held here so one cached dossier serves
+    every viewer; per-user checks are answered from the loaded PIC list.
+    """
+    tiket: Tiket
+    klasifikasi: list = field(default_factory=list)
+    actions: list = field(default_factory=list)
+    pics: list = field(default_factory=list)
+    backups: list = field(default_factory=list)
+    tanda_terima_items: list = field(default_factory=list)
+    riwayat_tikets: list = field(default_factory=list)
+
+    def has_pic(self, user, active_only=False):
+        """Return True if *user* is assigned to the tiket (optionally only active assignments)."""
+        return any(
+            pic.id_user_id == user.pk and (pic.active or not active_only)
+            for pic in self.pics
+        )
+
+    def user_is_active_pic(self, user, role):
+        """Active TiketPIC assignment for *role* AND a valid PIC record (no end_date)."""
+        return any(
+            pic.id_user_id == user.pk and pic.role == role and pic.active and pic.is_pic_active
+            for pic in self.pics
+        )
+
+    def first_active_pic(self, role):
+        """Return the earliest active TiketPIC of *role*, or None."""
+        candidates = [pic for pic in self.pics if pic.role == role and pic.active]
+        return min(candidates, key=lambda pic: pic.id) if candidates else None
+
+    @property
+    def latest_tanda_terima(self):
+        """Return the TandaTerimaData of the newest DetilTandaTerima, or None."""
+        return self.tanda_terima_items[0].id_tanda_terima if self.tanda_terima_items else None
+
+
+def _cache_key(tiket):
+    sub_jenis_data_id = tiket.id_periode_data.id_sub_jenis_data_ilap_id
+    keys = [
+        _EPOCH_KEY,
+        _tiket_version_key(tiket.pk),
+        _group_version_key(sub_jenis_data_id, tiket.periode, tiket.tahun),
+    ]
+    versions = cache.get_many(keys)
+    return 'tiket_dossier_{}_{}'.format(
+        tiket.pk, '_'.join(versions.get(key, '0') for key in keys)
+    )
+
+
+def _pic_queryset(sub_jenis_data_id):
+    """TiketPIC rows annotated with ``is_pic_active`` (valid PIC record of the same tipe)."""
+    return TiketPIC.objects.select_related('id_user').annotate(
+        pic_tipe=Case(
+            When(role=TiketPIC.Role.P3DE, then=Value(PIC.TipePIC.P3DE)),
+            When(role=TiketPIC.Role.PIDE, then=Value(PIC.TipePIC.PIDE)),
+            When(role=TiketPIC.Role.PMDE, then=Value(PIC.TipePIC.PMDE)),
+            output_field=CharField(),
+        ),
+        is_pic_active=Exists(PIC.objects.filter(
+            tipe=OuterRef('pic_tipe'),
+            id_user=OuterRef('id_user'),
+            id_sub_jenis_data_ilap_id=sub_jenis_data_id,
+            end_date__isnull=True,
+        )),
+    ).order_by('role', 'id_user__username')
+
+
+def _load_related(tiket):
+    """Load and enrich the related lists of *tiket* (six queries, seven for a closed tiket)."""
+    sub_jenis_data_id = tiket.id_periode_data.id_sub_jenis_data_ilap_id
+    prefetch_related_objects(
+        [tiket],
+        Prefetch(
+            'tiketaction_set',
+            queryset=TiketAction.objects.select_related('id_user').order_by('-timestamp', '-id'),
+            to_attr='dossier_actions',
+        ),
+        Prefetch('tiketpic_set', queryset=_pic_queryset(sub_jenis_data_id), to_attr='dossier_pics'),
+        Prefetch(
+            'backups',
+            queryset=BackupData.objects.select_related('id_user', 'id_media_backup').order_by('-id'),
+            to_attr='dossier_backups',
+        ),
+        Prefetch(
+            'detiltandaterima_set',
+            queryset=DetilTandaTerima.objects.select_related(
+                'id_tanda_terima__id_ilap', 'id_tanda_terima__id_perekam'
+            ).order_by('-id'),
+            to_attr='dossier_tanda_terima',
+        ),
+    )
+
+    tiket.dossier_actions = tiket_timeline.tiket_actions(tiket, live=tiket.dossier_actions)
+    for action in tiket.dossier_actions:
+        action.badge_label = get_action_label(action.action)
+        action.badge_class = get_action_badge_class(action.action)
+        action.user_display = _user_display(action.id_user)
+
+    for pic in tiket.dossier_pics:
+        badge = ROLE_BADGES.get(pic.role, {'label': str(pic.role), 'class': 'bg-info'})
+        pic.badge_label = badge['label']
+        pic.badge_class = badge['class']
+        pic.user_display = _user_display(pic.id_user)
+
+    try:
+        klasifikasi = [
+            item.id_klasifikasi_tabel.deskripsi
+            for item in KlasifikasiJenisData.objects.filter(
+                id_sub_jenis_data_id=sub_jenis_data_id
+            ).select_related('id_klasifikasi_tabel')
+        ]
+    except Exception:
+        klasifikasi = []
+
+    riwayat_tikets = list(Tiket.objects.filter(
+        id_periode_data__id_sub_jenis_data_ilap_id=sub_jenis_data_id,
+        periode=tiket.periode,
+        tahun=tiket.tahun,
+    ).select_related('id_status_penelitian').order_by('tgl_terima_dip'))
+    for rt in riwayat_tikets:
+        rt.status_label = STATUS_LABELS.get(rt.status_tiket, '-')
+        rt.status_badge_class = STATUS_BADGE_CLASSES.get(rt.status_tiket, 'bg-secondary')
+        rt.status_penelitian_label = rt.id_status_penelitian.deskripsi if rt.id_status_penelitian else '-'
+
+    return {
+        'klasifikasi': klasifikasi,
+        'actions': tiket.dossier_actions,
+        'pics': tiket.dossier_pics,
+        'backups': tiket.dossier_backups,
+        'tanda_terima_items': tiket.dossier_tanda_terima,
+        'riwayat_tikets': riwayat_tikets,
+    }
+
+
+def get_tiket_dossier(pk, use_cache=True):
+    """Return the TiketDossier of tiket *pk*.
+
+    Costs one query when the dossier is cached and seven when it is not
+    (eight for a closed tiket, whose archived actions are read too),
+    whatever the number of actions, PICs or backups.
+
+    Raises:
+        Tiket.DoesNotExist: If no tiket has this primary key.
+    """
+    tiket = Tiket.objects.select_related(*TIKET_SELECT_RELATED).get(pk=pk)
+    key = _cache_key(tiket) if use_cache else None
+    related = cache.get(key) if key else None
+    if related is None:
+        related = _load_related(tiket)
+        if key:
+            cache.set(key, related, DOSSIER_CACHE_TIMEOUT)
+    return TiketDossier(tiket=tiket, **related)
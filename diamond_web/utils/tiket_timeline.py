@@ -0,0 +1,180 @@
+"""Tiket activity timeline: live and archived actions, latest action per type.
+
+``TiketAction`` is append-only and grows by several rows per tiket per
+transition.  Three structures keep its readers from scanning that history:
+
+* ``TiketLatestAction`` holds the timestamp of the latest action of each type
+  per tiket.  :func:`record_latest_actions` maintains it on insert: the
+  ``post_save`` receiver in ``diamond_web.signals`` for single creates, an
+  explicit call after every ``bulk_create`` (which bypasses signals).  The
+  dashboards' "has this tiket ever been dikembalikan" checks read it.
+* :func:`archive_closed_tiket_actions` (``manage.py archive_tiket_actions``)
+  moves the actions of closed tikets (Selesai, Dibatalkan) idle for more than
+  ``TIKET_ACTION_ARCHIVE_AFTER_DAYS`` into ``TiketActionArchive``, chunk by
+  chunk, keeping their primary keys.  ``TiketLatestAction`` is left as is.
+* :func:`tiket_actions` reads the timeline of one tiket from both tables.
+  Only closed tikets are archived and a closed tiket never moves again, so
+  the archive is not queried for open ones.
+"""
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef
+
+from ..constants.tiket_status import STATUS_DIBATALKAN, STATUS_SELESAI
+from ..models.tiket import Tiket
+from ..models.tiket_action import TiketAction
+from ..models.tiket_action_archive import TiketActionArchive
+from ..models.tiket_latest_action import TiketLatestAction
+
+CLOSED_STATUSES = (STATUS_SELESAI, STATUS_DIBATALKAN)
+ARCHIVE_CHUNK_SIZE = 1000
+BULK_BATCH_SIZE = 1000
+
+ACTION_FIELDS = ('id', 'id_tiket_id', 'id_user_id', 'timestamp', 'action', 'catatan')
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _archive_after_days():
+    return _setting('TIKET_ACTION_ARCHIVE_AFTER_DAYS', 365)
+
+
+def _is_newer(timestamp, than):
+    """Whether *timestamp* replaces *than* as the latest (a missing timestamp never wins)."""
+    return than is None or (timestamp is not None and timestamp >= than)
+
+
+def _timeline_key(action):
+    # Newest first with the database's ('-timestamp', '-id'); undated actions last
+    return (action.timestamp is not None, action.timestamp or datetime.min, action.pk)
+
+
+def record_latest_actions(actions):
+    """Fold newly inserted *actions* (TiketAction instances) into ``TiketLatestAction``.
+
+    Two queries whatever the number of actions: the current latest rows of
+    the (tiket, type) pairs concerned, and one upsert of those that moved.
+    Actions without a type are ignored.
+    """
+    latest = {}
+    for action in actions:
+        if action.action is None:
+            continue
+        key = (action.id_tiket_id, action.action)
+        if key not in latest or _is_newer(action.timestamp, latest[key]):
+            latest[key] = action.timestamp
+    if not latest:
+        return
+
+    for tiket_id, action, timestamp in TiketLatestAction.objects.filter(
+        id_tiket_id__in={tiket_id for tiket_id, _ in latest},
+        action__in={action for _, action in latest},
+    ).values_list('id_tiket_id', 'action', 'timestamp'):
+        key = (tiket_id, action)
+        if key in latest and not _is_newer(latest[key], timestamp):
+            del latest[key]
+
+    TiketLatestAction.objects.bulk_create(
+        [TiketLatestAction(id_tiket_id=tiket_id, action=action, timestamp=timestamp)
+         for (tiket_id, action), timestamp in latest.items()],
+        batch_size=BULK_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['id_tiket', 'action'],
+        update_fields=['timestamp'],
+    )
+
+
+def rebuild_latest_actions():
+    """Recompute ``TiketLatestAction`` from the live and archived actions.
+
+    For writes that remove actions (cleanup_pre_production); inserts go
+    through :func:`record_latest_actions`.
+
+    Returns:
+        int: Number of (tiket, type) rows written.
+    """
+    latest = {}
+    for model in (TiketActionArchive, TiketAction):
+        for tiket_id, action, timestamp in (
+            model.objects.exclude(action=None).order_by()
+            .values('id_tiket_id', 'action').annotate(latest=Max('timestamp'))
+            .values_list('id_tiket_id', 'action', 'latest')
+        ):
+            key = (tiket_id, action)
+            if key not in latest or _is_newer(timestamp, latest[key]):
+                latest[key] = timestamp
+    with transaction.atomic():
+        TiketLatestAction.objects.all().delete()
+        TiketLatestAction.objects.bulk_create(
+            [TiketLatestAction(id_tiket_id=tiket_id, action=action, timestamp=timestamp)
+             for (tiket_id, action), timestamp in latest.items()],
+            batch_size=BULK_BATCH_SIZE,
+        )
+    return len(latest)
+
+
+def tiket_actions(tiket, live=None):
+    """Timeline of *tiket*, newest first, from the live and the archive table.
+
+    Args:
+        tiket: The Tiket.
+        live: Its live actions when already loaded (the dossier prefetch);
+            read here with their users otherwise.
+
+    Returns:
+        list: TiketAction and TiketActionArchive instances; both have the
+        same fields.
+    """
+    if live is None:
+        live = TiketAction.objects.filter(id_tiket=tiket).select_related('id_user').order_by('-timestamp', '-id')
+    live = list(live)
+    if tiket.status_tiket not in CLOSED_STATUSES:
+        return live
+    archived = TiketActionArchive.objects.filter(id_tiket=tiket).select_related('id_user')
+    return sorted([*live, *archived], key=_timeline_key, reverse=True)
+
+
+def archivable_tikets(older_than_days=None, now=None):
+    """Closed tikets with live actions whose latest action is more than *older_than_days* old.
+
+    *older_than_days* defaults to ``TIKET_ACTION_ARCHIVE_AFTER_DAYS``.
+    """
+    if older_than_days is None:
+        older_than_days = _archive_after_days()
+    cutoff = (now or datetime.now()) - timedelta(days=older_than_days)
+    return Tiket.objects.filter(
+        Exists(TiketAction.objects.filter(id_tiket=OuterRef('pk'))),
+        status_tiket__in=CLOSED_STATUSES,
+    ).annotate(
+        last_action_at=Max('tiketlatestaction__timestamp'),
+    ).filter(last_action_at__lt=cutoff)
+
+
+def archive_closed_tiket_actions(older_than_days=None, chunk_size=ARCHIVE_CHUNK_SIZE, now=None):
+    """Move the actions of :func:`archivable_tikets` into ``TiketActionArchive``.
+
+    Each chunk of at most *chunk_size* actions is copied and deleted in its
+    own transaction, so the live table is never locked for long and an
+    interrupted run resumes where it stopped.
+
+    Returns:
+        int: Number of actions archived.
+    """
+    pending = TiketAction.objects.filter(
+        id_tiket__in=archivable_tikets(older_than_days, now).values('pk'),
+    ).order_by('pk')
+    archived, last_pk = 0, 0
+    while chunk := list(pending.filter(pk__gt=last_pk).values_list(*ACTION_FIELDS)[:chunk_size]):
+        with transaction.atomic():
+            TiketActionArchive.objects.bulk_create(
+                [TiketActionArchive(**dict(zip(ACTION_FIELDS, row))) for row in chunk],
+                batch_size=BULK_BATCH_SIZE,
+            )
+            TiketAction.objects.filter(pk__in=[row[0] for row in chunk]).delete()
+        archived += len(chunk)
+        last_pk = chunk[-1][0]
+    return archived
@@ -46,6 +46,7 @@ from .bulk_document_generation import *
 from .sync_data_referensi import *
 from .sync_tiket import *
 from .sync_log_status import *
+from .diagnostics import *
 from .profil import *
 from .profil_ilap import *
 from .quality_control import *
@@ -1,9 +1,11 @@
+from collections import defaultdict
 from datetime import datetime
+from itertools import islice
 from django.urls import reverse_lazy, reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import CreateView, UpdateView, DeleteView, TemplateView
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.views.decorators.http import require_GET
 from django.db.models import Count, Q
@@ -12,17 +14,23 @@ from io import BytesIO
 from openpyxl import Workbook
 
 from ..utils import format_periode
+from ..utils.reference_data import get_reference
 
 from ..models.backup_data import BackupData
 from ..models.tiket import Tiket
 from ..models.tiket_action import TiketAction
 from ..models.tiket_pic import TiketPIC
-from ..models.media_backup import MediaBackup
+
 from ..forms.backup_data import BackupDataForm
 from ..constants.tiket_action_types import BackupActionType
 from ..constants.tiket_status import STATUS_DIKIRIM_KE_PIDE, STATUS_DIREKAM, STATUS_DITELITI
+from ..utils.db_routing import current_read_alias, use_reporting_db
+from ..utils.pdf_table import stream_pdf_table
 from .mixins import AjaxFormMixin, UserP3DERequiredMixin, ActiveTiketP3DERequiredForEditMixin, SafeDeleteMixin
 
+# Backups serialized per PIC query when exporting
+EXPORT_CHUNK_SIZE = 2000
+
 
 def create_tiket_action(tiket, user, catatan, action_type):
     """Create an audit trail TiketAction for a tiket.
@@ -163,14 +171,43 @@ def _format_backup_periode_data(tiket_obj):
         return f"{tiket_obj.periode}/{tiket_obj.tahun}" if tiket_obj else '-'
 
 
-def _build_backup_data_row(obj, request=None, include_actions=False):
+def _tiket_pic_map(tiket_ids, using=None):
+    """Active PICs of *tiket_ids*, fetched with one query.
+
+    Args:
+        tiket_ids: Iterable of Tiket primary keys (e.g. of one DataTables
+            page or one export chunk).
+        using: Database alias to read from; the router decides when ``None``.
+
+    Returns:
+        dict: ``{tiket_id: {role: [(user_id, display_name), ...]}}``, where
+        the display name is the user's full name or, when empty, the
+        username.
+    """
+    pics = defaultdict(lambda: defaultdict(list))
+    rows = TiketPIC.objects.db_manager(using).filter(
+        id_tiket__in=set(tiket_ids),
+        active=True,
+        id_user__isnull=False,
+    ).values_list(
+        'id_tiket_id', 'role', 'id_user_id', 'id_user__first_name', 'id_user__last_name', 'id_user__username',
+    )
+    for tiket_id, role, user_id, first_name, last_name, username in rows:
+        full_name = f"{(first_name or '').strip()} {(last_name or '').strip()}".strip()
+        pics[tiket_id][role].append((user_id, full_name or username))
+    return pics
+
+
+def _build_backup_data_row(obj, pic_map, request=None, include_actions=False):
     """Serialize a BackupData instance into a dict for DataTables or export.
 
-    Resolves related models (kategori, ilap, sub-jenis, PIC names) and
-    optionally builds action button HTML if the user has edit permission.
+    Resolves related models (kategori, ilap, sub-jenis) from the
+    select_related chain and the PIC names from *pic_map*, so building a
+    row runs no queries.
 
     Args:
         obj: BackupData model instance to serialize.
+        pic_map: Active PICs of the batch's tikets, from ``_tiket_pic_map``.
         request: Optional HttpRequest; required when ``include_actions`` is
             ``True`` to check user permissions.
         include_actions: bool. If ``True``, generates edit/delete button HTML
@@ -188,26 +225,15 @@ def _build_backup_data_row(obj, request=None, include_actions=False):
     ilap = subjenis.id_ilap if subjenis else None
     kategori = ilap.id_kategori if ilap else None
 
-    pic_names = []
-    if tiket:
-        for p in TiketPIC.objects.select_related('id_user').filter(
-            id_tiket=tiket,
-            role=TiketPIC.Role.P3DE,
-            active=True,
-        ):
-            if not p.id_user:
-                continue
-            full_name = f"{(p.id_user.first_name or '').strip()} {(p.id_user.last_name or '').strip()}".strip()
-            pic_names.append(full_name or p.id_user.username)
-    pic_label = ', '.join(sorted(set([n for n in pic_names if n]))) if pic_names else '-'
+    tiket_pics = pic_map.get(tiket.pk, {}) if tiket else {}
+    pic_names = {name for _, name in tiket_pics.get(TiketPIC.Role.P3DE, ()) if name}
+    pic_label = ', '.join(sorted(pic_names)) if pic_names else '-'
 
     actions = ''
     if include_actions and request and tiket:
-        is_active_pic = TiketPIC.objects.filter(
-            id_tiket=tiket,
-            id_user=request.user,
-            active=True,
-        ).exists()
+        is_active_pic = any(
+            user_id == request.user.pk for role_pics in tiket_pics.values() for user_id, _ in role_pics
+        )
         if tiket.status_tiket is not None and tiket.status_tiket < STATUS_DIKIRIM_KE_PIDE and is_active_pic:
             actions = (
                 f"<button class='btn btn-sm btn-primary me-1' data-action='edit' data-url='{reverse('backup_data_update', args=[obj.pk])}' title='Edit'><i class='feather-edit-2'></i></button>"
@@ -254,121 +280,11 @@ def _get_backup_media_counts(qs):
         for row in agg if row['id_media_backup_id']
     }
 
-    result = []
-    for media in MediaBackup.objects.all().order_by('deskripsi'):
-        result.append({
-            'id': media.id,
-            'deskripsi': media.deskripsi,
-            'count': counts.get(media.id, 0),
-        })
-    return result
-
-
-def _pdf_escape(value):
-    """Escape special characters for PDF string content.
-
-    Escapes backslashes and parentheses so the value can be safely embedded
-    in PDF text operators. Also ensures the result is Latin-1 encodable by
-    replacing unsupported characters.
-
-    Args:
-        value: Any value to escape (will be converted to string).
-
-    Returns:
-        str: Latin-1-safe string with escaped PDF special characters.
-    """
-    text = str(value or '')
-    text = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
-    return text.encode('latin-1', errors='replace').decode('latin-1')
-
-
-def _build_simple_table_pdf(title, headers, rows):
-    """Generate a lightweight PDF as bytes without external PDF libraries.
-
-    Builds a minimal PDF document manually by constructing PDF objects,
-    streams, and the cross-reference table. Each row is prefixed with its
-    number. Pagination is handled automatically.
-
-    Args:
-        title: str. The document title displayed at the top of each page.
-        headers: list of str. Column header labels.
-        rows: list of list of str. Table data rows (each inner list is a row
-            of cell values).
+    return [
+        {'id': media['id'], 'deskripsi': media['deskripsi'], 'count': counts.get(media['id'], 0)}
+        for media in get_reference('media_backup')
+    ]
 
-    Returns:
-        bytes: The raw PDF content, ready to be served as an HTTP response.
-    """
-    page_width = 595
-    page_height = 842
-    margin = 36
-    line_height = 13
-    top = page_height - margin
-    bottom = margin
-
-    lines = [' | '.join(headers)]
-    for idx, row in enumerate(rows, start=1):
-        lines.append(f"{idx}. " + ' | '.join(str(c) for c in row))
-
-    max_lines_per_page = max(1, int((top - bottom - 2 * line_height) // line_height))
-    pages = []
-    for i in range(0, len(lines), max_lines_per_page):
-        pages.append(lines[i:i + max_lines_per_page])
-    if not pages:
-        pages = [[]]
-
-    objects = []
-
-    def _add_obj(content):
-        objects.append(content)
-        return len(objects)
-
-    catalog_id = _add_obj('')
-    pages_id = _add_obj('')
-    font_id = _add_obj('<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
-
-    page_ids = []
-    for page_no, page_lines in enumerate(pages, start=1):
-        cmds = []
-        cmds.append(f"BT /F1 11 Tf {margin} {top} Td ({_pdf_escape(title)} - Halaman {page_no}) Tj ET")
-        y = top - (line_height * 2)
-        for line in page_lines:
-            cmds.append(f"BT /F1 9 Tf {margin} {y} Td ({_pdf_escape(line)}) Tj ET")
-            y -= line_height
-        stream_data = '\n'.join(cmds).encode('latin-1', errors='replace')
-        content_id = _add_obj(
-            f"<< /Length {len(stream_data)} >>\nstream\n".encode('latin-1') + stream_data + b"\nendstream"
-        )
-        page_id = _add_obj(
-            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 {page_width} {page_height}] "
-            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>"
-        )
-        page_ids.append(page_id)
-
-    objects[catalog_id - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>"
-    kids = ' '.join([f"{pid} 0 R" for pid in page_ids])
-    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>"
-
-    pdf = BytesIO()
-    pdf.write(b"%PDF-1.4\n")
-    offsets = [0]
-    for i, obj in enumerate(objects, start=1):
-        offsets.append(pdf.tell())
-        pdf.write(f"{i} 0 obj\n".encode('latin-1'))
-        if isinstance(obj, bytes):
-            pdf.write(obj)
-        else:
-            pdf.write(str(obj).encode('latin-1', errors='replace'))
-        pdf.write(b"\nendobj\n")
-
-    xref_pos = pdf.tell()
-    pdf.write(f"xref\n0 {len(objects) + 1}\n".encode('latin-1'))
-    pdf.write(b"0000000000 65535 f \n")
-    for off in offsets[1:]:
-        pdf.write(f"{off:010d} 00000 n \n".encode('latin-1'))
-    pdf.write(
-        f"trailer\n<< /Size {len(objects) + 1} /Root {catalog_id} 0 R >>\nstartxref\n{xref_pos}\n%%EOF".encode('latin-1')
-    )
-    return pdf.getvalue()
 
 class BackupDataListView(LoginRequiredMixin, UserP3DERequiredMixin, TemplateView):
     """List view for BackupData.
@@ -738,6 +654,7 @@ class BackupDataDeleteView(SafeDeleteMixin, LoginRequiredMixin, UserP3DERequired
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'user_p3de']).exists())
 @require_GET
+@use_reporting_db
 def backup_data_data(request):
     """Server-side DataTables endpoint for BackupData.
 
@@ -839,8 +756,9 @@ def backup_data_data(request):
     else:
         qs = qs.order_by('-id')
 
-    qs_page = qs[start:start + length]
-    data = [_build_backup_data_row(obj, request=request, include_actions=True) for obj in qs_page]
+    qs_page = list(qs[start:start + length])
+    pic_map = _tiket_pic_map(obj.id_tiket_id for obj in qs_page)
+    data = [_build_backup_data_row(obj, pic_map, request=request, include_actions=True) for obj in qs_page]
 
     return JsonResponse({
         'draw': draw,
@@ -1056,25 +974,41 @@ def backup_data_filter_options(request):
 
 
 def _get_export_rows(request):
-    """Build a sorted list of serialized BackupData rows for export.
+    """Serialized BackupData rows for export, read lazily.
+
+    Applies current GET filters and orders by year/tiket number/id. The
+    queryset is streamed in chunks of ``EXPORT_CHUNK_SIZE`` rows; the PICs
+    of each chunk are fetched with one query, so an export runs a fixed
+    number of queries per chunk instead of two per row.
 
-    Applies current GET filters, orders by year/tiket number/id, and returns
-    serialized dicts without action buttons.
+    The database alias is chosen here, so the rows may be read after the
+    view returned (a streamed response) and still come from the database
+    the view was routed to.
 
     Args:
         request: The HTTP request (used for both base queryset and filters).
 
     Returns:
-        list[dict]: Serialized BackupData rows suitable for Excel/PDF export.
+        Iterator[dict]: Serialized BackupData rows (without action buttons)
+        suitable for Excel/PDF export.
     """
     qs = _apply_backup_data_filters(_get_backup_data_base_queryset(request), request.GET)
     qs = qs.order_by('id_tiket__tahun', 'id_tiket__nomor_tiket', 'id')
-    return [_build_backup_data_row(obj, request=request, include_actions=False) for obj in qs]
+    return _iter_export_rows(qs.using(current_read_alias(BackupData)), request)
+
+
+def _iter_export_rows(qs, request):
+    objects = qs.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    while chunk := list(islice(objects, EXPORT_CHUNK_SIZE)):
+        pic_map = _tiket_pic_map((obj.id_tiket_id for obj in chunk), using=qs.db)
+        for obj in chunk:
+            yield _build_backup_data_row(obj, pic_map, request=request, include_actions=False)
 
 
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'user_p3de']).exists())
 @require_GET
+@use_reporting_db
 def backup_data_export_excel(request):
     """Export filtered backup data to XLSX."""
     rows = _get_export_rows(request)
@@ -1122,10 +1056,12 @@ def backup_data_export_excel(request):
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'user_p3de']).exists())
 @require_GET
+@use_reporting_db
 def backup_data_export_pdf(request):
-    """Export filtered backup data to PDF."""
+    """Export filtered backup data to PDF, streamed page by page."""
     rows = _get_export_rows(request)
     headers = [
+        'No',
         'Kategori ILAP',
         'Nama ILAP',
         'Jenis Data',
@@ -1137,8 +1073,9 @@ def backup_data_export_pdf(request):
         'PIC P3DE',
         'Jumlah Data',
     ]
-    table_rows = [
+    table_rows = (
         [
+            idx,
             row['kategori_ilap'],
             row['nama_ilap'],
             row['jenis_data'],
@@ -1150,9 +1087,11 @@ def backup_data_export_pdf(request):
             row['pic_p3de'],
             row['jumlah_data'],
         ]
-        for row in rows
-    ]
-    pdf_bytes = _build_simple_table_pdf('Laporan Backup Data', headers, table_rows)
-    response = HttpResponse(pdf_bytes, content_type='application/pdf')
+        for idx, row in enumerate(rows, start=1)
+    )
+    response = StreamingHttpResponse(
+        stream_pdf_table('Laporan Backup Data', headers, table_rows, compress=True),
+        content_type='application/pdf',
+    )
     response['Content-Disposition'] = 'attachment; filename="backup_data.pdf"'
     return response
\ No newline at end of file
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.bentuk_data import BentukData
 from ..forms.bentuk_data import BentukDataForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class BentukDataListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -168,6 +169,7 @@ class BentukDataDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequire
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def bentuk_data_data(request):
     """Return JSON data for server-side DataTables processing.
 
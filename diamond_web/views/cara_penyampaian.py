@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.cara_penyampaian import CaraPenyampaian
 from ..forms.cara_penyampaian import CaraPenyampaianForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class CaraPenyampaianListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -164,6 +165,7 @@ class CaraPenyampaianDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERe
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def cara_penyampaian_data(request):
     """Return paginated, searchable, orderable JSON data for DataTables.
 
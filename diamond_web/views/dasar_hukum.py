@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.dasar_hukum import DasarHukum
 from ..forms.dasar_hukum import DasarHukumForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class DasarHukumListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -127,6 +128,7 @@ class DasarHukumDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequire
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def dasar_hukum_data(request):
     """Server-side DataTables endpoint for `DasarHukum`.
 
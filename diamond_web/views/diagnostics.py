@@ -0,0 +1,97 @@
+from django.conf import settings
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import FileResponse, Http404
+from django.shortcuts import redirect, render
+from django.utils.safestring import mark_safe
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_http_methods
+
+from ..utils import profiling
+from ..utils.query_stats import MS_BUCKETS, QUERY_BUCKETS, get_view_stats, reset_view_stats
+
+__all__ = ['query_diagnostics', 'profile_diagnostics', 'profile_detail', 'profile_download']
+
+
+def _is_superuser(user):
+    return user.is_authenticated and user.is_superuser
+
+
+@login_required
+@user_passes_test(_is_superuser)
+@require_http_methods(["GET", "POST"])
+@never_cache
+def query_diagnostics(request):
+    """Show per-view query count, SQL time and wall time histograms.
+
+    Data is recorded by ``QueryBudgetMiddleware`` when
+    ``QUERY_BUDGET_ENABLED`` is set.  POST clears the list of views.
+    """
+    if request.method == 'POST':
+        reset_view_stats()
+        return redirect('query_diagnostics')
+
+    context = {
+        'enabled': getattr(settings, 'QUERY_BUDGET_ENABLED', False),
+        'view_stats': get_view_stats(),
+        'query_buckets': [f'≤{bound}' for bound in QUERY_BUCKETS] + [f'>{QUERY_BUCKETS[-1]}'],
+        'ms_buckets': [f'≤{bound}' for bound in MS_BUCKETS] + [f'>{MS_BUCKETS[-1]}'],
+        'window_hours': getattr(settings, 'QUERY_STATS_WINDOW_SECONDS', 24 * 60 * 60) / 3600,
+        'duplicate_threshold': getattr(settings, 'QUERY_BUDGET_DUPLICATE_THRESHOLD', 5),
+    }
+    return render(request, 'diagnostics/queries.html', context)
+
+
+@login_required
+@user_passes_test(_is_superuser)
+@require_http_methods(["GET", "POST"])
+@never_cache
+def profile_diagnostics(request):
+    """List the stored request/task profiles (see utils/profiling.py).
+
+    POST deletes all stored profiles.
+    """
+    if request.method == 'POST':
+        profiling.clear_profiles()
+        return redirect('profile_diagnostics')
+
+    context = {
+        'enabled': getattr(settings, 'PROFILER_ENABLED', True),
+        'profiles': profiling.list_profiles(),
+        'sample_rate': getattr(settings, 'PROFILER_SAMPLE_RATE', 0.0),
+        'profiled_tasks': getattr(settings, 'PROFILER_TASKS', ()),
+        'max_profiles': getattr(settings, 'PROFILER_MAX_PROFILES', 50),
+    }
+    return render(request, 'diagnostics/profiles.html', context)
+
+
+def _profile_file(profile_id, ext):
+    path = profiling.profile_path(profile_id, ext)
+    if path is None:
+        raise Http404('Profil tidak ditemukan')
+    return path
+
+
+@login_required
+@user_passes_test(_is_superuser)
+@require_http_methods(["GET"])
+@never_cache
+def profile_detail(request, profile_id):
+    """Show the call tree of one stored profile."""
+    with open(_profile_file(profile_id, '.html'), encoding='utf-8') as fh:
+        call_tree = fh.read()
+    meta = next((entry for entry in profiling.list_profiles() if entry['id'] == profile_id), {})
+    context = {
+        'profile': meta,
+        # Rendered by render_call_tree, which escapes every label
+        'call_tree': mark_safe(call_tree),
+    }
+    return render(request, 'diagnostics/profile_detail.html', context)
+
+
+@login_required
+@user_passes_test(_is_superuser)
+@require_http_methods(["GET"])
+def profile_download(request, profile_id):
+    """Download the raw pstats dump of one stored profile."""
+    path = _profile_file(profile_id, '.prof')
+    return FileResponse(open(path, 'rb'), as_attachment=True, filename=f'{profile_id}.prof')
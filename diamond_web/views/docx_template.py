@@ -12,6 +12,7 @@ from django.shortcuts import render, get_object_or_404
 
 from ..models.docx_template import DocxTemplate
 from ..forms.docx_template import DocxTemplateForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 
@@ -95,6 +96,7 @@ class DocxTemplateDeleteView(LoginRequiredMixin, AdminP3DERequiredMixin, SafeDel
 @login_required
 @user_passes_test(lambda u: u.is_superuser or u.groups.filter(name='admin').exists() or u.groups.filter(name='admin_p3de').exists())
 @require_GET
+@use_reporting_db
 def docx_template_data(request):
     """Return template data as JSON for DataTable."""
     # Get all templates
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.durasi_jatuh_tempo import DurasiJatuhTempo
 from ..forms.durasi_jatuh_tempo import DurasiJatuhTempoForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminPIDERequiredMixin, AdminPMDERequiredMixin, SafeDeleteMixin
 from datetime import date as _date
 
@@ -182,6 +183,7 @@ class DurasiJatuhTempoPIDEDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_pide']).exists())
 @require_GET
+@use_reporting_db
 def durasi_jatuh_tempo_pide_data(request):
     """Server-side DataTables endpoint for PIDE `DurasiJatuhTempo`.
 
@@ -414,6 +416,7 @@ class DurasiJatuhTempoPMDEDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_pmde']).exists())
 @require_GET
+@use_reporting_db
 def durasi_jatuh_tempo_pmde_data(request):
     """Server-side DataTables endpoint for PMDE `DurasiJatuhTempo`.
 
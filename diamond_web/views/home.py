@@ -14,7 +14,7 @@ from diamond_web.views.task_to_do import (
 )
 from diamond_web.models.tiket import Tiket
 from diamond_web.models.tiket_pic import TiketPIC
-from diamond_web.models.tiket_action import TiketAction
+from diamond_web.models.tiket_latest_action import TiketLatestAction
 from diamond_web.models.pic import PIC
 from diamond_web.models.jenis_data_ilap import JenisDataILAP
 from diamond_web.constants.tiket_status import (
@@ -27,6 +27,7 @@ from diamond_web.constants.tiket_status import (
     STATUS_LABELS,
 )
 from diamond_web.constants.tiket_action_types import TiketActionType
+from diamond_web.utils.db_routing import use_reporting_db
 
 @login_required
 def home(request):
@@ -89,7 +90,7 @@ def home(request):
             'pengembalian_seluruhnya_dari_pide': Tiket.objects.filter(
                 id__in=p3de_tiket_ids
             ).filter(
-                Exists(TiketAction.objects.filter(
+                Exists(TiketLatestAction.objects.filter(
                     id_tiket=OuterRef('pk'),
                     action=TiketActionType.DIKEMBALIKAN
                 ))
@@ -292,7 +293,7 @@ def _build_tiket_base_qs(category, user):
         ),
         'pengembalian_seluruhnya_dari_pide': (
             _get_p3de_tiket_ids,
-            Exists(TiketAction.objects.filter(
+            Exists(TiketLatestAction.objects.filter(
                 id_tiket=OuterRef('pk'),
                 action=TiketActionType.DIKEMBALIKAN
             ))
@@ -371,6 +372,7 @@ def _build_jenis_data_tanpa_pic_qs(category, user):
 
 @login_required
 @require_GET
+@use_reporting_db
 def home_data(request):
     """Server-side DataTables endpoint for home page tiket categories.
 
@@ -10,6 +10,7 @@ from django.utils import timezone
 
 from ..models.ilap import ILAP
 from ..forms.ilap import ILAPForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 
@@ -82,6 +83,7 @@ def get_next_ilap_id(request):
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def ilap_data(request):
     """Server-side DataTables endpoint for `ILAP`.
 
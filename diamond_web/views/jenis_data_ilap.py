@@ -11,6 +11,7 @@ from ..models.jenis_data_ilap import JenisDataILAP
 from ..models.ilap import ILAP
 import re
 from ..forms.jenis_data_ilap import JenisDataILAPForm, JenisDataILAPUpdateForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class JenisDataILAPListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -130,6 +131,7 @@ class JenisDataILAPDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequ
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def jenis_data_ilap_data(request):
     """Server-side DataTables endpoint for `JenisDataILAP`.
 
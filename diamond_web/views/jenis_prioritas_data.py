@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.jenis_prioritas_data import JenisPrioritasData
 from ..forms.jenis_prioritas_data import JenisPrioritasDataForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 from datetime import date as _date
 
@@ -158,6 +159,7 @@ class JenisPrioritasDataDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3D
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def jenis_prioritas_data_data(request):
     """Server-side DataTables endpoint for `JenisPrioritasData`.
 
@@ -8,6 +8,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.jenis_tabel import JenisTabel
 from ..forms.jenis_tabel import JenisTabelForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class JenisTabelListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -108,6 +109,7 @@ class JenisTabelDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequire
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def jenis_tabel_data(request):
     """Server-side DataTables endpoint for `JenisTabel`.
 
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.kanwil import Kanwil
 from ..forms.kanwil import KanwilForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 
@@ -228,6 +229,7 @@ class KanwilDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequiredMix
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def kanwil_data(request):
     """Return paginated, searchable, and ordered Kanwil data for DataTables.
 
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.kategori_ilap import KategoriILAP
 from ..forms.kategori_ilap import KategoriILAPForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class KategoriILAPListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -193,6 +194,7 @@ class KategoriILAPDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequi
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def kategori_ilap_data(request):
     """Server-side DataTables endpoint for `KategoriILAP`.
 
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.kategori_wilayah import KategoriWilayah
 from ..forms.kategori_wilayah import KategoriWilayahForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class KategoriWilayahListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -126,6 +127,7 @@ class KategoriWilayahDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERe
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def kategori_wilayah_data(request):
     """Server-side DataTables endpoint for `KategoriWilayah`.
 
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.klasifikasi_jenis_data import KlasifikasiJenisData
 from ..forms.klasifikasi_jenis_data import KlasifikasiJenisDataForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class KlasifikasiJenisDataListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -127,6 +128,7 @@ class KlasifikasiJenisDataDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def klasifikasi_jenis_data_data(request):
     """Server-side DataTables endpoint for `KlasifikasiJenisData`.
 
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.kpp import KPP
 from ..forms.kpp import KPPForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 
@@ -233,6 +234,7 @@ class KPPDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequiredMixin,
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def kpp_data(request):
     """Serve server-side processed data for the KPP DataTable.
 
@@ -17,6 +17,8 @@ from ..models.jenis_data_ilap import JenisDataILAP
 from ..models.klasifikasi_jenis_data import KlasifikasiJenisData
 from ..models.periode_pengiriman import PeriodePengiriman
 from ..models.dasar_hukum import DasarHukum
+from ..utils.db_routing import use_reporting_db
+from .mixins import ReportingDatabaseMixin
 
 
 def is_pmde_user(user):
@@ -98,7 +100,7 @@ def _get_filtered_detail_data(params):
     return jenis_data_ilap_list
 
 
-class LaporanDetailHimpunOlahDataView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class LaporanDetailHimpunOlahDataView(LoginRequiredMixin, UserPassesTestMixin, ReportingDatabaseMixin, TemplateView):
     """Display Laporan Detail Penghimpunan dan Pengolahan Data."""
     template_name = 'laporan_detail_himpun_olah_data/list.html'
 
@@ -135,6 +137,7 @@ class LaporanDetailHimpunOlahDataView(LoginRequiredMixin, UserPassesTestMixin, T
 @user_passes_test(is_pmde_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def laporan_detail_himpun_olah_data_data(request):
     """DataTables server-side endpoint for Laporan Detail Penghimpunan dan Pengolahan Data.
 
@@ -235,6 +238,7 @@ def laporan_detail_himpun_olah_data_data(request):
 @user_passes_test(is_pmde_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def laporan_detail_himpun_olah_data_export(request):
     """Export Laporan Detail Penghimpunan dan Pengolahan Data to XLSX or PDF.
 
@@ -8,7 +8,6 @@ from django.views.generic import TemplateView
 from django.http import JsonResponse, HttpResponse
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_protect
-from datetime import datetime, timedelta
 from django.db.models import Q
 from io import BytesIO
 from openpyxl import Workbook
@@ -16,12 +15,23 @@ from openpyxl import Workbook
 from ..models import Tiket
 from ..constants.tiket_status import STATUS_LABELS
 from ..forms.laporan_kelengkapan_data import LaporanKelengkapanDataFilterForm, TiketExportResource
+from ..utils import filter_options
+from ..utils.db_routing import use_reporting_db
+from ..utils.periode_range import PeriodeError, periode_range
+from .mixins import ReportingDatabaseMixin
+
+PERIODE_ERRORS = {
+    'bulanan': 'Bulan tidak valid.',
+    'triwulanan': 'Triwulan tidak valid.',
+    'semester': 'Semester tidak valid.',
+}
+
 
 def is_pmde_user(user):
     """Check if user belongs to PMDE group."""
     return user.is_superuser or user.is_staff or user.groups.filter(name__in=['user_pmde', 'admin', 'admin_pmde']).exists()
 
-class LaporanKelengkapanDataView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class LaporanKelengkapanDataView(LoginRequiredMixin, UserPassesTestMixin, ReportingDatabaseMixin, TemplateView):
     """Display Quality Control Report with filtering by quarter (triwulan) and year."""
     template_name = 'laporan_kelengkapan_data/list.html'
 
@@ -32,14 +42,8 @@ class LaporanKelengkapanDataView(LoginRequiredMixin, UserPassesTestMixin, Templa
     def get_context_data(self, **kwargs):
         """Add filter form and available years to context."""
         context = super().get_context_data(**kwargs)
-        # Get distinct years from Tiket data for filter options
-        tikets = Tiket.objects.all()
-        years = sorted(set(t.tahun for t in tikets), reverse=True)
-
-        current_year = datetime.now().year
-        # If no data, default to current year   
-        if current_year not in years:
-            years.insert(0, current_year)
+        # Tiket years (cached) plus the current year
+        years = filter_options.year_options()
 
         context['years'] = years
         context['form'] = LaporanKelengkapanDataFilterForm(years=years)
@@ -50,6 +54,7 @@ class LaporanKelengkapanDataView(LoginRequiredMixin, UserPassesTestMixin, Templa
 @user_passes_test(is_pmde_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def laporan_kelengkapan_data_data(request): 
     """DataTables server-side endpoint for Laporan Kelengkapan Data.
 
@@ -103,117 +108,21 @@ def laporan_kelengkapan_data_data(request):
             'recordsFiltered': 0,
             'data': [],
         })
-    
+
     try:
-        tahun_int = int(tahun)
-    except (ValueError, TypeError):
-        return JsonResponse({
-            'draw': draw,
-            'recordsTotal': 0,
-            'recordsFiltered': 0,
-            'data': []
-        })
-    
-    #Calculate date range based on periode_type and periode
-    start_date = None
-    end_date = None
-    
-    if periode_type == 'bulanan':
-        try:
-            bulan = int(periode)
-            if bulan < 1 or bulan > 12:
-                return JsonResponse({
-                    'draw': draw,
-                    'recordsTotal': 0,
-                    'recordsFiltered': 0,
-                    'data': []
-                })
-
-            start_date = datetime(tahun_int, bulan, 1)
-            if bulan == 12:
-                end_date = datetime(tahun_int + 1, 1, 1) - timedelta(days=1)
-            else:
-                end_date = datetime(tahun_int, bulan + 1, 1) - timedelta(days=1)    
-        except (ValueError, TypeError):
-            return JsonResponse({
-                'draw': draw,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': []
-            })
-
-    elif periode_type == 'triwulanan':
-        quarter_months = {
-            1: (1, 3),  #int(periode)
-            2: (4, 6),  #int(periode)
-            3: (7, 9),  #int(periode)
-            4: (10, 12) #int(periode)
-        }
-        try:
-            triwulan = int(periode)
-            if triwulan not in quarter_months:
-                return JsonResponse({
-                    'draw': draw,
-                    'recordsTotal': 0,
-                    'recordsFiltered':  0,
-                    'data': []
-                })
-            start_month, end_month = quarter_months[triwulan]
-            start_date = datetime(tahun_int, start_month, 1)
-            if end_month == 12:
-                end_date = datetime(tahun_int + 1, 1, 1 ) - timedelta(days=1)
-            else:
-                end_date = datetime(tahun_int, end_month + 1, 1) - timedelta(days=1)        
-        except (ValueError, TypeError):
-            return JsonResponse({
-                'draw': draw,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': []
-            })  
-    elif periode_type == 'semester':
-        semester_months = {
-            1: (1, 6),  #int(periode)
-            2: (7, 12) #int(periode)
-        }
-        try:
-            semester = int(periode)
-            if semester not in semester_months:
-                return JsonResponse({
-                    'draw': draw,
-                    'recordsTotal': 0,
-                    'recordsFiltered': 0,
-                    'data': []
-                })
-            start_month, end_month = semester_months[semester]
-            start_date = datetime(tahun_int, start_month, 1)
-            if end_month == 12:
-                end_date = datetime(tahun_int + 1, 1, 1) - timedelta(days=1)
-            else:
-                end_date = datetime(tahun_int, end_month + 1, 1) - timedelta(days=1)        
-        except (ValueError, TypeError):
-            return JsonResponse({
-                'draw': draw,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': []
-            })
-    elif periode_type == 'tahunan':
-        start_date = datetime(tahun_int, 1, 1)
-        end_date = datetime(tahun_int + 1, 1, 1) - timedelta(days=1)
-    else:     
+        rentang = periode_range(periode_type, periode, tahun)
+    except PeriodeError:
         return JsonResponse({
             'draw': draw,
             'recordsTotal': 0,
             'recordsFiltered': 0,
             'data': []
         })
-    
-    #Query tikets with tgl_transfer in the calculated date range
+
+    #Query tikets with tgl_transfer in the period
     qs = Tiket.objects.filter(
         tgl_transfer__isnull=False,
-        tgl_transfer__date__gte=start_date.date(),
-        tgl_transfer__date__lte=end_date.date()
+        **rentang.filter_kwargs('tgl_transfer')
     ).select_related(
         'id_periode_data',
         'id_periode_data__id_sub_jenis_data_ilap',
@@ -288,6 +197,7 @@ def laporan_kelengkapan_data_data(request):
 @user_passes_test(is_pmde_user)
 @require_GET
 @csrf_protect
+@use_reporting_db
 def laporan_kelengkapan_data_export(request):
     """Export Laporan Kelengkapan Data to Excel based on current filters.
 
@@ -312,84 +222,21 @@ def laporan_kelengkapan_data_export(request):
         return JsonResponse({'error': 'Periode type, periode, dan tahun harus dipilih.'}, status=400)
 
     try:
-        tahun= int(tahun)
-    except (ValueError, TypeError):
-        return HttpResponse('Invalid year', status=400)
-
-    # Calculate date range based on filters (same logic as data endpoint)
-    start_date = None
-    end_date = None
-    periode_label = ''
-    
+        rentang = periode_range(periode_type, periode, tahun)
+    except PeriodeError as e:
+        if e.field == 'tahun':
+            return HttpResponse('Invalid year', status=400)
+        return JsonResponse({'error': PERIODE_ERRORS.get(periode_type, 'Jenis periode tidak valid.')}, status=400)
     if periode_type == 'bulanan':
-        try:
-            bulan = int(periode)
-            if bulan < 1 or bulan > 12:
-                return JsonResponse({'error': 'Bulan tidak valid.'}, status=400)
-
-            start_date = datetime(tahun, bulan, 1)
-            if bulan == 12:
-                end_date = datetime(tahun + 1, 1, 1) - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, bulan + 1, 1) - timedelta(days=1)    
-            bulan_names = {
-            1: 'Januari', 2: 'Februari', 3: 'Maret', 4: 'April', 5: 'Mei', 6: 'Juni',
-            7: 'Juli', 8: 'Agustus', 9: 'September', 10: 'Oktober', 11: 'November', 12: 'Desember'}
-            periode_label = f"{bulan_names[bulan]} {tahun}" 
-
-        except (ValueError, TypeError):
-            return JsonResponse({'error': 'Bulan tidak valid.'}, status=400)
-        
-    elif periode_type == 'triwulanan':
-        quarter_months = {
-            1: (1, 3),
-            2: (4, 6),
-            3: (7, 9),
-            4: (10, 12)
-        }
-        try:
-            triwulan = int(periode)
-            if triwulan not in quarter_months:
-                return JsonResponse({'error': 'Triwulan tidak valid.'}, status=400)
-            start_month, end_month = quarter_months[triwulan]
-            start_date = datetime(tahun, start_month, 1)
-            if end_month == 12:
-                end_date = datetime(tahun + 1, 1, 1 ) - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, end_month + 1, 1) - timedelta(days=1)        
-            periode_label = f"Triwulan_{triwulan}_{tahun}"
-        except (ValueError, TypeError):
-            return JsonResponse({'error': 'Triwulan tidak valid.'}, status=400) 
-    elif periode_type == 'semester':
-        semester_months = {
-            1: (1, 6),
-            2: (7, 12)
-        }   
-        try:
-            semester = int(periode)
-            if semester not in semester_months:
-                return JsonResponse({'error': 'Semester tidak valid.'}, status=400)
-            start_month, end_month = semester_months[semester]
-            start_date = datetime(tahun, start_month, 1)
-            if end_month == 12:
-                end_date = datetime(tahun + 1, 1, 1) - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, end_month + 1, 1) - timedelta(days=1)        
-            periode_label = f"Semester_{semester}_{tahun}"
-        except (ValueError, TypeError):
-            return JsonResponse({'error': 'Semester tidak valid.'}, status=400)
+        periode_label = rentang.label
     elif periode_type == 'tahunan':
-        start_date = datetime(tahun, 1, 1)
-        end_date = datetime(tahun + 1, 1, 1) - timedelta(days=1)
-        periode_label = f"Tahun_{tahun}"
-
+        periode_label = f"Tahun_{rentang.tahun}"
     else:
-        return JsonResponse({'error': 'Jenis periode tidak valid.'}, status=400)
-    
+        periode_label = rentang.label.replace(' ', '_')
+
     tikets = Tiket.objects.filter(
         tgl_transfer__isnull=False,
-        tgl_transfer__date__gte=start_date.date(),
-        tgl_transfer__date__lte=end_date.date()
+        **rentang.filter_kwargs('tgl_transfer')
     ).select_related(
         'id_periode_data__id_sub_jenis_data_ilap__id_ilap',
         'id_periode_data__id_sub_jenis_data_ilap__id_jenis_tabel'
@@ -6,13 +6,15 @@ from django.views.decorators.http import require_GET, require_http_methods
 from django.views.generic import TemplateView
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_protect
-from datetime import datetime
 from io import BytesIO
 from openpyxl import Workbook
 
 from ..models.tiket import Tiket
 from ..forms.laporan_metrik_data_eksternal import LaporanMetrikDataEksternalFilterForm, LaporanMetrikDataEksternalExportResource
 from ..constants.jenis_tabel import JENIS_TABEL_DIIDENTIFIKASI, JENIS_TABEL_TIDAK_DIIDENTIFIKASI
+from ..utils.db_routing import use_reporting_db
+from ..utils.periode_range import datetime_range
+from .mixins import ReportingDatabaseMixin
 
 
 def _is_pide_user(user):
@@ -54,21 +56,8 @@ def _get_filtered_tikets(params):
         'id_periode_data__id_sub_jenis_data_ilap__id_jenis_tabel'
     )
     
-    # Filter by date range
-    if tgl_mulai_str:
-        try:
-            # datetime-local format: YYYY-MM-DDTHH:MM
-            tgl_mulai = datetime.strptime(tgl_mulai_str, '%Y-%m-%dT%H:%M')
-            tikets = tikets.filter(tgl_transfer__gte=tgl_mulai)
-        except ValueError:
-            pass
-            
-    if tgl_akhir_str:
-        try:
-            tgl_akhir = datetime.strptime(tgl_akhir_str, '%Y-%m-%dT%H:%M')
-            tikets = tikets.filter(tgl_transfer__lte=tgl_akhir)
-        except ValueError:
-            pass
+    # Filter by date range; Tanggal Akhir covers its whole minute
+    tikets = tikets.filter(**datetime_range(tgl_mulai_str, tgl_akhir_str).filter_kwargs('tgl_transfer'))
             
     # Filter by ILAP
     if id_ilap and id_ilap != 'all' and id_ilap != '':
@@ -90,7 +79,7 @@ def _get_filtered_tikets(params):
     return tikets.order_by('tgl_transfer')
 
 
-class LaporanMetrikDataEksternalView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class LaporanMetrikDataEksternalView(LoginRequiredMixin, UserPassesTestMixin, ReportingDatabaseMixin, TemplateView):
     """Display Laporan Metrik Data Eksternal by filtering tikets
     based on a date range and other parameters.
     """
@@ -122,6 +111,7 @@ class LaporanMetrikDataEksternalView(LoginRequiredMixin, UserPassesTestMixin, Te
 @user_passes_test(_is_pide_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def laporan_metrik_data_eksternal_data(request):
     """DataTables server-side endpoint for Third Party Data (External Data) Metric Report.
     
@@ -200,6 +190,7 @@ def laporan_metrik_data_eksternal_data(request):
 @user_passes_test(_is_pide_user)
 @require_GET
 @csrf_protect
+@use_reporting_db
 def laporan_metrik_data_eksternal_export(request):
     """Export Laporan Metrik Data Eksternal to XLSX file.
 
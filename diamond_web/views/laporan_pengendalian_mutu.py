@@ -7,7 +7,6 @@ from django.views.generic import TemplateView
 from django.http import JsonResponse, HttpResponse
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_protect
-from datetime import datetime, timedelta
 from django.db.models import Q
 from io import BytesIO
 from openpyxl import Workbook
@@ -15,6 +14,16 @@ from openpyxl import Workbook
 from ..models.tiket import Tiket
 from ..constants.tiket_status import STATUS_LABELS
 from ..forms.laporan_pengendalian_mutu import LaporanPengendalianMutuFilterForm, TiketExportResource
+from ..utils import filter_options
+from ..utils.db_routing import use_reporting_db
+from ..utils.periode_range import PeriodeError, periode_range
+from .mixins import ReportingDatabaseMixin
+
+PERIODE_ERRORS = {
+    'bulanan': 'Invalid month',
+    'triwulanan': 'Invalid quarter',
+    'semester': 'Invalid semester',
+}
 
 
 def _is_pmde_user(user):
@@ -22,7 +31,7 @@ def _is_pmde_user(user):
     return user.is_superuser or user.is_staff or user.groups.filter(name__in=['user_pmde', 'admin', 'admin_pmde']).exists()
 
 
-class LaporanPengendalianMutuView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class LaporanPengendalianMutuView(LoginRequiredMixin, UserPassesTestMixin, ReportingDatabaseMixin, TemplateView):
     """Display Quality Control Report with filtering by quarter (triwulan) and year.
     
     This view renders a template with filter form and DataTables table that displays
@@ -40,15 +49,9 @@ class LaporanPengendalianMutuView(LoginRequiredMixin, UserPassesTestMixin, Templ
     def get_context_data(self, **kwargs):
         """Add years list and form to context for filter dropdown."""
         context = super().get_context_data(**kwargs)
-        # Get unique years from tiket data
-        tikets = Tiket.objects.all()
-        years = sorted(set(t.tahun for t in tikets), reverse=True)
-        
-        # Always include current year
-        current_year = datetime.now().year
-        if current_year not in years:
-            years = [current_year] + list(years)
-        
+        # Tiket years (cached) plus the current year
+        years = filter_options.year_options()
+
         context['years'] = years
         # Initialize form with years
         context['form'] = LaporanPengendalianMutuFilterForm(years=years)
@@ -59,6 +62,7 @@ class LaporanPengendalianMutuView(LoginRequiredMixin, UserPassesTestMixin, Templ
 @user_passes_test(_is_pmde_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def laporan_pengendalian_mutu_data(request):
     """DataTables server-side endpoint for Quality Control Report.
     
@@ -110,118 +114,19 @@ def laporan_pengendalian_mutu_data(request):
         })
     
     try:
-        tahun = int(tahun)
-    except (ValueError, TypeError):
+        rentang = periode_range(periode_type, periode, tahun)
+    except PeriodeError:
         return JsonResponse({
             'draw': draw,
             'recordsTotal': 0,
             'recordsFiltered': 0,
             'data': []
         })
-    
-    # Calculate date range based on periode type
-    start_date = None
-    end_date = None
-    
-    if periode_type == 'bulanan':
-        try:
-            bulan = int(periode)
-            if bulan < 1 or bulan > 12:
-                return JsonResponse({
-                    'draw': draw,
-                    'recordsTotal': 0,
-                    'recordsFiltered': 0,
-                    'data': []
-                })
-            start_date = datetime(tahun, bulan, 1).date()
-            # Calculate end date for the month
-            if bulan == 12:
-                end_date = datetime(tahun + 1, 1, 1).date() - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, bulan + 1, 1).date() - timedelta(days=1)
-        except (ValueError, TypeError):
-            return JsonResponse({
-                'draw': draw,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': []
-            })
-    
-    elif periode_type == 'triwulanan':
-        quarter_months = {
-            1: (1, 3),      # Q1: Jan-Mar
-            2: (4, 6),      # Q2: Apr-Jun
-            3: (7, 9),      # Q3: Jul-Sep
-            4: (10, 12),    # Q4: Oct-Dec
-        }
-        try:
-            triwulan = int(periode)
-            if triwulan not in quarter_months:
-                return JsonResponse({
-                    'draw': draw,
-                    'recordsTotal': 0,
-                    'recordsFiltered': 0,
-                    'data': []
-                })
-            start_month, end_month = quarter_months[triwulan]
-            start_date = datetime(tahun, start_month, 1).date()
-            if end_month == 12:
-                end_date = datetime(tahun + 1, 1, 1).date() - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, end_month + 1, 1).date() - timedelta(days=1)
-        except (ValueError, TypeError):
-            return JsonResponse({
-                'draw': draw,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': []
-            })
-    
-    elif periode_type == 'semester':
-        semester_months = {
-            1: (1, 6),      # Semester 1: Jan-Jun
-            2: (7, 12),     # Semester 2: Jul-Dec
-        }
-        try:
-            semester = int(periode)
-            if semester not in semester_months:
-                return JsonResponse({
-                    'draw': draw,
-                    'recordsTotal': 0,
-                    'recordsFiltered': 0,
-                    'data': []
-                })
-            start_month, end_month = semester_months[semester]
-            start_date = datetime(tahun, start_month, 1).date()
-            if end_month == 12:
-                end_date = datetime(tahun + 1, 1, 1).date() - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, end_month + 1, 1).date() - timedelta(days=1)
-        except (ValueError, TypeError):
-            return JsonResponse({
-                'draw': draw,
-                'recordsTotal': 0,
-                'recordsFiltered': 0,
-                'data': []
-            })
-    
-    elif periode_type == 'tahunan':
-        start_date = datetime(tahun, 1, 1).date()
-        end_date = datetime(tahun, 12, 31).date()
-    
-    else:
-        return JsonResponse({
-            'draw': draw,
-            'recordsTotal': 0,
-            'recordsFiltered': 0,
-            'data': []
-        })
-    
+
     # Query tikets with tgl_transfer in the specified period
     tikets = Tiket.objects.filter(
         tgl_transfer__isnull=False,
-        tgl_transfer__date__gte=start_date,
-        tgl_transfer__date__lte=end_date
+        **rentang.filter_kwargs('tgl_transfer')
     ).select_related(
         'id_periode_data__id_sub_jenis_data_ilap__id_ilap',
         'id_periode_data__id_sub_jenis_data_ilap__id_jenis_tabel'
@@ -278,6 +183,7 @@ def laporan_pengendalian_mutu_data(request):
 @user_passes_test(_is_pmde_user)
 @require_GET
 @csrf_protect
+@use_reporting_db
 def laporan_pengendalian_mutu_export(request):
     """Export Laporan Pengendalian Mutu to XLSX file.
     
@@ -297,86 +203,17 @@ def laporan_pengendalian_mutu_export(request):
         return HttpResponse('Invalid parameters', status=400)
     
     try:
-        tahun = int(tahun)
-    except (ValueError, TypeError):
-        return HttpResponse('Invalid year', status=400)
-    
-    # Calculate date range based on periode type
-    start_date = None
-    end_date = None
-    periode_label = ''
-    
-    if periode_type == 'bulanan':
-        try:
-            bulan = int(periode)
-            if bulan < 1 or bulan > 12:
-                return HttpResponse('Invalid month', status=400)
-            start_date = datetime(tahun, bulan, 1).date()
-            if bulan == 12:
-                end_date = datetime(tahun + 1, 1, 1).date() - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, bulan + 1, 1).date() - timedelta(days=1)
-            
-            bulan_names = ['', 'Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
-                          'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember']
-            periode_label = f'{bulan_names[bulan]} {tahun}'
-        except (ValueError, TypeError):
-            return HttpResponse('Invalid month', status=400)
-    
-    elif periode_type == 'triwulanan':
-        quarter_months = {
-            1: (1, 3),
-            2: (4, 6),
-            3: (7, 9),
-            4: (10, 12),
-        }
-        try:
-            triwulan = int(periode)
-            if triwulan not in quarter_months:
-                return HttpResponse('Invalid quarter', status=400)
-            start_month, end_month = quarter_months[triwulan]
-            start_date = datetime(tahun, start_month, 1).date()
-            if end_month == 12:
-                end_date = datetime(tahun + 1, 1, 1).date() - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, end_month + 1, 1).date() - timedelta(days=1)
-            periode_label = f'Triwulan {triwulan} {tahun}'
-        except (ValueError, TypeError):
-            return HttpResponse('Invalid quarter', status=400)
-    
-    elif periode_type == 'semester':
-        semester_months = {
-            1: (1, 6),
-            2: (7, 12),
-        }
-        try:
-            semester = int(periode)
-            if semester not in semester_months:
-                return HttpResponse('Invalid semester', status=400)
-            start_month, end_month = semester_months[semester]
-            start_date = datetime(tahun, start_month, 1).date()
-            if end_month == 12:
-                end_date = datetime(tahun + 1, 1, 1).date() - timedelta(days=1)
-            else:
-                end_date = datetime(tahun, end_month + 1, 1).date() - timedelta(days=1)
-            periode_label = f'Semester {semester} {tahun}'
-        except (ValueError, TypeError):
-            return HttpResponse('Invalid semester', status=400)
-    
-    elif periode_type == 'tahunan':
-        start_date = datetime(tahun, 1, 1).date()
-        end_date = datetime(tahun, 12, 31).date()
-        periode_label = f'{tahun}'
-    
-    else:
-        return HttpResponse('Invalid periode type', status=400)
-    
-    
+        rentang = periode_range(periode_type, periode, tahun)
+    except PeriodeError as e:
+        if e.field == 'tahun':
+            return HttpResponse('Invalid year', status=400)
+        return HttpResponse(PERIODE_ERRORS.get(periode_type, 'Invalid periode type'), status=400)
+    periode_label = rentang.label
+
     # Query tikets
     tikets = Tiket.objects.filter(
         tgl_transfer__isnull=False,
-        tgl_transfer__date__gte=start_date,
-        tgl_transfer__date__lte=end_date
+        **rentang.filter_kwargs('tgl_transfer')
     ).select_related(
         'id_periode_data__id_sub_jenis_data_ilap__id_ilap',
         'id_periode_data__id_sub_jenis_data_ilap__id_jenis_tabel'
@@ -1,20 +1,39 @@
 """Laporan Register Penerimaan Data view - Data Receipt Register Report."""
 
+import tempfile
+
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db.models import OuterRef, Prefetch, Subquery
 from django.views.decorators.http import require_GET, require_http_methods
 from django.views.generic import TemplateView
-from django.http import JsonResponse, HttpResponse
+from django.http import FileResponse, JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_protect
-from datetime import datetime, timedelta
-from io import BytesIO
+from datetime import datetime
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, NamedStyle, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
 from ..models.tiket import Tiket
 from ..models.detil_tanda_terima import DetilTandaTerima
+from ..models.klasifikasi_jenis_data import KlasifikasiJenisData
+from ..models.tanda_terima_data import TandaTerimaData
 from ..utils import format_periode
+from ..utils.db_routing import use_reporting_db
+from ..utils.periode_range import PeriodeError, periode_range
+from .mixins import ReportingDatabaseMixin
+
+# Tikets read per query when exporting
+EXPORT_CHUNK_SIZE = 2000
+
+REGISTER_HEADERS = [
+    'No', 'Nama ILAP', 'Dasar Hukum', 'Jenis Data ILAP', 'Bentuk Data',
+    'Periode / Tahun Data', 'Jumlah Data Diterima',
+    'Nomor Surat Pengantar', 'Tanggal Surat Pengantar',
+    'Nomor Tanda Terima', 'Tanggal Tanda Terima',
+]
+REGISTER_COLUMN_WIDTHS = [5, 30, 25, 30, 15, 18, 20, 25, 22, 30, 22]
 
 
 def _is_p3de_user(user):
@@ -24,7 +43,7 @@ def _is_p3de_user(user):
     ).exists()
 
 
-class LaporanRegisterPenerimaanView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class LaporanRegisterPenerimaanView(LoginRequiredMixin, UserPassesTestMixin, ReportingDatabaseMixin, TemplateView):
     """Display Data Receipt Register Report filtered by month and year.
 
     Template: laporan_register_penerimaan/list.html
@@ -60,14 +79,73 @@ class LaporanRegisterPenerimaanView(LoginRequiredMixin, UserPassesTestMixin, Tem
         return context
 
 
+def _register_queryset(rentang):
+    """Tikets received (tgl_terima_dip) in *rentang* with everything a register row shows.
+
+    One query plus one prefetch per batch of tikets: the ILAP, sub jenis data,
+    periode pengiriman and bentuk data are joined, the dasar hukum of each
+    sub jenis data is prefetched into ``register_klasifikasi`` and the earliest
+    tanda terima of the tiket (by tanggal_tanda_terima, active or not) is
+    annotated as ``tt_nomor``, ``tt_tahun`` and ``tt_tanggal``.
+    """
+    first_tanda_terima = DetilTandaTerima.objects.filter(id_tiket=OuterRef('pk')).order_by(
+        'id_tanda_terima__tanggal_tanda_terima', 'id',
+    )
+    return Tiket.objects.filter(
+        **rentang.filter_kwargs('tgl_terima_dip'),
+    ).select_related(
+        'id_periode_data__id_sub_jenis_data_ilap__id_ilap',
+        'id_periode_data__id_periode_pengiriman',
+        'id_bentuk_data',
+    ).prefetch_related(
+        Prefetch(
+            'id_periode_data__id_sub_jenis_data_ilap__klasifikasijenisdata_set',
+            queryset=KlasifikasiJenisData.objects.select_related('id_klasifikasi_tabel').order_by('id'),
+            to_attr='register_klasifikasi',
+        ),
+    ).annotate(
+        tt_nomor=Subquery(first_tanda_terima.values('id_tanda_terima__nomor_tanda_terima')[:1]),
+        tt_tahun=Subquery(first_tanda_terima.values('id_tanda_terima__tahun_terima')[:1]),
+        tt_tanggal=Subquery(first_tanda_terima.values('id_tanda_terima__tanggal_tanda_terima')[:1]),
+    ).order_by('tgl_terima_dip', 'id')
+
+
+def _register_row(tiket):
+    """Columns of one register row after 'No', in the order of ``REGISTER_HEADERS``."""
+    sub_jenis = tiket.id_periode_data.id_sub_jenis_data_ilap
+    dasar_hukum = ', '.join(k.id_klasifikasi_tabel.deskripsi for k in sub_jenis.register_klasifikasi)
+    if tiket.tt_nomor is not None:
+        nomor_tt = TandaTerimaData(nomor_tanda_terima=tiket.tt_nomor, tahun_terima=tiket.tt_tahun).nomor_tanda_terima_format
+    else:
+        nomor_tt = '-'
+    periode_pengiriman = tiket.id_periode_data.id_periode_pengiriman
+    deskripsi_periode = periode_pengiriman.periode_penerimaan if periode_pengiriman else ''
+
+    return {
+        'nama_ilap': sub_jenis.id_ilap.nama_ilap,
+        'dasar_hukum': dasar_hukum or '-',
+        'jenis_data_ilap': sub_jenis.nama_jenis_data,
+        'bentuk_data': tiket.id_bentuk_data.deskripsi if tiket.id_bentuk_data else '-',
+        'periode_tahun_data': format_periode(deskripsi_periode, tiket.periode, tiket.tahun),
+        'jumlah_data_diterima': tiket.baris_diterima or 0,
+        'nomor_surat_pengantar': tiket.nomor_surat_pengantar or '-',
+        'tanggal_surat_pengantar': tiket.tanggal_surat_pengantar.strftime('%d/%m/%Y') if tiket.tanggal_surat_pengantar else '-',
+        'nomor_tanda_terima': nomor_tt,
+        'tanggal_tanda_terima': tiket.tt_tanggal.strftime('%d/%m/%Y') if tiket.tt_tanggal else '-',
+    }
+
+
 @login_required
 @user_passes_test(_is_p3de_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def register_penerimaan_data(request):
     """DataTables server-side endpoint for Register Penerimaan Data.
 
     Filters tikets by tgl_terima_dip within the specified month and year.
+    A page costs three queries whatever its length: the count, the page
+    itself and the dasar hukum prefetch.
 
     Parameters:
     - bulan: Month (1-12)
@@ -99,84 +177,18 @@ def register_penerimaan_data(request):
         return JsonResponse({'draw': draw, 'recordsTotal': 0, 'recordsFiltered': 0, 'data': []})
 
     try:
-        bulan = int(bulan)
-        tahun = int(tahun)
-        if bulan < 1 or bulan > 12:
-            return JsonResponse({'draw': draw, 'recordsTotal': 0, 'recordsFiltered': 0, 'data': []})
-    except (ValueError, TypeError):
+        rentang = periode_range('bulanan', bulan, tahun)
+    except PeriodeError:
         return JsonResponse({'draw': draw, 'recordsTotal': 0, 'recordsFiltered': 0, 'data': []})
 
-    start_date = datetime(tahun, bulan, 1).date()
-    if bulan == 12:
-        end_date = datetime(tahun + 1, 1, 1).date() - timedelta(days=1)
-    else:
-        end_date = datetime(tahun, bulan + 1, 1).date() - timedelta(days=1)
-
-    tikets = Tiket.objects.filter(
-        tgl_terima_dip__date__gte=start_date,
-        tgl_terima_dip__date__lte=end_date,
-    ).select_related(
-        'id_periode_data__id_sub_jenis_data_ilap__id_ilap',
-        'id_periode_data__id_periode_pengiriman',
-        'id_bentuk_data',
-    ).prefetch_related(
-        'detiltandaterima_set__id_tanda_terima',
-        'id_periode_data__id_sub_jenis_data_ilap__klasifikasijenisdata_set__id_klasifikasi_tabel',
-    ).order_by('tgl_terima_dip', 'id')
-
+    tikets = _register_queryset(rentang)
     records_total = tikets.count()
     records_filtered = records_total
 
-    tikets_page = tikets[start:start + length]
-
-    # Pre-fetch tanda terima for these tikets
-    tiket_ids = [t.id for t in tikets_page]
-    detil_qs = DetilTandaTerima.objects.filter(
-        id_tiket__in=tiket_ids
-    ).select_related('id_tanda_terima').order_by('id_tanda_terima__tanggal_tanda_terima')
-
-    tanda_terima_map = {}
-    for detil in detil_qs:
-        tanda_terima_map.setdefault(detil.id_tiket_id, []).append(detil.id_tanda_terima)
-
-    data = []
-    for idx, tiket in enumerate(tikets_page, start=start + 1):
-        sub_jenis = tiket.id_periode_data.id_sub_jenis_data_ilap
-        ilap = sub_jenis.id_ilap
-
-        # Dasar hukum via KlasifikasiJenisData
-        dasar_hukum_list = [
-            k.id_klasifikasi_tabel.deskripsi
-            for k in sub_jenis.klasifikasijenisdata_set.all()
-        ]
-        dasar_hukum = ', '.join(dasar_hukum_list) if dasar_hukum_list else '-'
-
-        # Tanda terima
-        tanda_terima_entries = tanda_terima_map.get(tiket.id, [])
-        if tanda_terima_entries:
-            tt = tanda_terima_entries[0]
-            nomor_tt = tt.nomor_tanda_terima_format
-            tanggal_tt = tt.tanggal_tanda_terima.strftime('%d/%m/%Y') if tt.tanggal_tanda_terima else '-'
-        else:
-            nomor_tt = '-'
-            tanggal_tt = '-'
-
-        periode_pengiriman = tiket.id_periode_data.id_periode_pengiriman
-        deskripsi_periode = periode_pengiriman.periode_penerimaan if periode_pengiriman else ''
-
-        data.append({
-            'no': idx,
-            'nama_ilap': ilap.nama_ilap,
-            'dasar_hukum': dasar_hukum,
-            'jenis_data_ilap': sub_jenis.nama_jenis_data,
-            'bentuk_data': tiket.id_bentuk_data.deskripsi if tiket.id_bentuk_data else '-',
-            'periode_tahun_data': format_periode(deskripsi_periode, tiket.periode, tiket.tahun),
-            'jumlah_data_diterima': tiket.baris_diterima or 0,
-            'nomor_surat_pengantar': tiket.nomor_surat_pengantar or '-',
-            'tanggal_surat_pengantar': tiket.tanggal_surat_pengantar.strftime('%d/%m/%Y') if tiket.tanggal_surat_pengantar else '-',
-            'nomor_tanda_terima': nomor_tt,
-            'tanggal_tanda_terima': tanggal_tt,
-        })
+    data = [
+        {'no': idx, **_register_row(tiket)}
+        for idx, tiket in enumerate(tikets[start:start + length], start=start + 1)
+    ]
 
     return JsonResponse({
         'draw': draw,
@@ -186,12 +198,46 @@ def register_penerimaan_data(request):
     })
 
 
+def _register_styles():
+    """Named styles of the export: header, row and alternate (shaded) row."""
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    row = NamedStyle('register_row', border=border, alignment=Alignment(vertical='center', wrap_text=True))
+    return [
+        NamedStyle(
+            'register_header', border=border, font=Font(bold=True, color='FFFFFF'),
+            fill=PatternFill(start_color='1F4E79', end_color='1F4E79', fill_type='solid'),
+            alignment=Alignment(horizontal='center', vertical='center', wrap_text=True),
+        ),
+        row,
+        NamedStyle(
+            'register_row_alt', border=border, alignment=row.alignment,
+            fill=PatternFill(start_color='DEEAF1', end_color='DEEAF1', fill_type='solid'),
+        ),
+    ]
+
+
+def _styled_cells(ws, values, style):
+    cells = []
+    for value in values:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        cells.append(cell)
+    return cells
+
+
 @login_required
 @user_passes_test(_is_p3de_user)
 @require_GET
+@use_reporting_db
 def register_penerimaan_export(request):
     """Export Register Penerimaan Data to XLSX.
 
+    The tikets are read in chunks of ``EXPORT_CHUNK_SIZE`` (one query plus
+    one dasar hukum prefetch per chunk) and appended to a write-only
+    workbook, which keeps the rows on disk instead of in memory.  The
+    workbook is saved to a temporary file and streamed from there.
+
     GET Parameters:
     - bulan: Month (1-12)
     - tahun: Year
@@ -203,132 +249,44 @@ def register_penerimaan_export(request):
         return HttpResponse('Invalid parameters', status=400)
 
     try:
-        bulan = int(bulan)
-        tahun = int(tahun)
-        if bulan < 1 or bulan > 12:
+        rentang = periode_range('bulanan', bulan, tahun)
+    except PeriodeError as e:
+        if e.field == 'periode' and str(bulan).isdigit():
             return HttpResponse('Invalid month', status=400)
-    except (ValueError, TypeError):
         return HttpResponse('Invalid parameters', status=400)
+    periode_label = rentang.label
 
-    bulan_names = ['', 'Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
-                   'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember']
-    periode_label = f'{bulan_names[bulan]} {tahun}'
-
-    start_date = datetime(tahun, bulan, 1).date()
-    if bulan == 12:
-        end_date = datetime(tahun + 1, 1, 1).date() - timedelta(days=1)
-    else:
-        end_date = datetime(tahun, bulan + 1, 1).date() - timedelta(days=1)
-
-    tikets = Tiket.objects.filter(
-        tgl_terima_dip__date__gte=start_date,
-        tgl_terima_dip__date__lte=end_date,
-    ).select_related(
-        'id_periode_data__id_sub_jenis_data_ilap__id_ilap',
-        'id_periode_data__id_periode_pengiriman',
-        'id_bentuk_data',
-    ).prefetch_related(
-        'id_periode_data__id_sub_jenis_data_ilap__klasifikasijenisdata_set__id_klasifikasi_tabel',
-    ).order_by('tgl_terima_dip', 'id')
-
-    tiket_ids = [t.id for t in tikets]
-    detil_qs = DetilTandaTerima.objects.filter(
-        id_tiket__in=tiket_ids
-    ).select_related('id_tanda_terima').order_by('id_tanda_terima__tanggal_tanda_terima')
-
-    tanda_terima_map = {}
-    for detil in detil_qs:
-        tanda_terima_map.setdefault(detil.id_tiket_id, []).append(detil.id_tanda_terima)
-
-    # Build Excel
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Register Penerimaan Data'
+    wb = Workbook(write_only=True)
+    for style in _register_styles():
+        wb.add_named_style(style)
+    ws = wb.create_sheet('Register Penerimaan Data')
+    for col_idx, width in enumerate(REGISTER_COLUMN_WIDTHS, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
 
     # Title row
-    ws.merge_cells('A1:K1')
-    ws['A1'] = f'Register Penerimaan Data - {periode_label}'
-    ws['A1'].font = Font(bold=True, size=13)
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws.merged_cells.add(f'A1:{get_column_letter(len(REGISTER_HEADERS))}1')
+    title = WriteOnlyCell(ws, value=f'Register Penerimaan Data - {periode_label}')
+    title.font = Font(bold=True, size=13)
+    title.alignment = Alignment(horizontal='center')
+    ws.append([title])
 
     # Header row
-    headers = [
-        'No', 'Nama ILAP', 'Dasar Hukum', 'Jenis Data ILAP', 'Bentuk Data',
-        'Periode / Tahun Data', 'Jumlah Data Diterima',
-        'Nomor Surat Pengantar', 'Tanggal Surat Pengantar',
-        'Nomor Tanda Terima', 'Tanggal Tanda Terima',
-    ]
-    header_fill = PatternFill(start_color='1F4E79', end_color='1F4E79', fill_type='solid')
-    header_font = Font(bold=True, color='FFFFFF')
-    thin_border = Border(
-        left=Side(style='thin'), right=Side(style='thin'),
-        top=Side(style='thin'), bottom=Side(style='thin')
-    )
-
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=2, column=col_idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        cell.border = thin_border
+    ws.row_dimensions[2].height = 30
+    ws.append(_styled_cells(ws, REGISTER_HEADERS, 'register_header'))
 
     # Data rows
-    for row_idx, tiket in enumerate(tikets, 3):
-        idx = row_idx - 2
-        sub_jenis = tiket.id_periode_data.id_sub_jenis_data_ilap
-        ilap = sub_jenis.id_ilap
-        dasar_hukum_list = [k.id_klasifikasi_tabel.deskripsi for k in sub_jenis.klasifikasijenisdata_set.all()]
-        dasar_hukum = ', '.join(dasar_hukum_list) if dasar_hukum_list else '-'
-
-        tanda_terima_entries = tanda_terima_map.get(tiket.id, [])
-        if tanda_terima_entries:
-            tt = tanda_terima_entries[0]
-            nomor_tt = tt.nomor_tanda_terima_format
-            tanggal_tt = tt.tanggal_tanda_terima.strftime('%d/%m/%Y') if tt.tanggal_tanda_terima else '-'
-        else:
-            nomor_tt = '-'
-            tanggal_tt = '-'
-
-        periode_pengiriman = tiket.id_periode_data.id_periode_pengiriman
-        deskripsi_periode = periode_pengiriman.periode_penerimaan if periode_pengiriman else ''
-
-        row_data = [
-            idx,
-            ilap.nama_ilap,
-            dasar_hukum,
-            sub_jenis.nama_jenis_data,
-            tiket.id_bentuk_data.deskripsi if tiket.id_bentuk_data else '-',
-            format_periode(deskripsi_periode, tiket.periode, tiket.tahun),
-            tiket.baris_diterima or 0,
-            tiket.nomor_surat_pengantar or '-',
-            tiket.tanggal_surat_pengantar.strftime('%d/%m/%Y') if tiket.tanggal_surat_pengantar else '-',
-            nomor_tt,
-            tanggal_tt,
-        ]
-
-        alt_fill = PatternFill(start_color='DEEAF1', end_color='DEEAF1', fill_type='solid') if idx % 2 == 0 else None
-        for col_idx, value in enumerate(row_data, 1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.border = thin_border
-            cell.alignment = Alignment(vertical='center', wrap_text=True)
-            if alt_fill:
-                cell.fill = alt_fill
-
-    # Auto-fit column widths
-    col_widths = [5, 30, 25, 30, 15, 18, 20, 25, 22, 30, 22]
-    for col_idx, width in enumerate(col_widths, 1):
-        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    tikets = _register_queryset(rentang).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    for idx, tiket in enumerate(tikets, 1):
+        style = 'register_row_alt' if idx % 2 == 0 else 'register_row'
+        ws.append(_styled_cells(ws, [idx, *_register_row(tiket).values()], style))
 
-    ws.row_dimensions[2].height = 30
-
-    excel_file = BytesIO()
+    excel_file = tempfile.TemporaryFile()
     wb.save(excel_file)
+    excel_file.seek(0)
 
-    response = HttpResponse(
-        excel_file.getvalue(),
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = (
-        f'attachment; filename="Register_Penerimaan_Data_{periode_label.replace(" ", "_")}.xlsx"'
+    return FileResponse(
+        excel_file,
+        as_attachment=True,
+        filename=f'Register_Penerimaan_Data_{periode_label.replace(" ", "_")}.xlsx',
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
     )
-    return response
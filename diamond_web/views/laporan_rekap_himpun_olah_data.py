@@ -21,6 +21,8 @@ from ..models.periode_jenis_data import PeriodeJenisData
 from ..models.jenis_tabel import JenisTabel
 from ..models.dasar_hukum import DasarHukum
 from ..models.kategori_ilap import KategoriILAP
+from ..utils.db_routing import use_reporting_db
+from .mixins import ReportingDatabaseMixin
 
 
 def is_pmde_user(user):
@@ -94,7 +96,7 @@ def _get_filtered_data(params):
     return ilaps
 
 
-class LaporanRekapHimpunOlahDataView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class LaporanRekapHimpunOlahDataView(LoginRequiredMixin, UserPassesTestMixin, ReportingDatabaseMixin, TemplateView):
     """Display Laporan Rekap Penghimpunan dan Pengolahan Data."""
     template_name = 'laporan_rekap_himpun_olah_data/list.html'
 
@@ -131,6 +133,7 @@ class LaporanRekapHimpunOlahDataView(LoginRequiredMixin, UserPassesTestMixin, Te
 @user_passes_test(is_pmde_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def laporan_rekap_himpun_olah_data_data(request):
     """DataTables server-side endpoint for Laporan Rekap Penghimpunan dan Pengolahan Data.
 
@@ -258,6 +261,7 @@ def laporan_rekap_himpun_olah_data_data(request):
 @user_passes_test(is_pmde_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def laporan_rekap_himpun_olah_data_export(request):
     """Export Laporan Rekap Penghimpunan dan Pengolahan Data to XLSX or PDF.
 
@@ -6,12 +6,14 @@ from django.views.decorators.http import require_GET, require_http_methods
 from django.views.generic import TemplateView
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_protect
-from datetime import datetime
 from io import BytesIO
 from openpyxl import Workbook
 
 from ..models.tiket import Tiket
 from ..forms.laporan_sla_perekaman import LaporanSLAPerekamanFilterForm, LaporanSLAPerekamanExportResource
+from ..utils.db_routing import use_reporting_db
+from ..utils.periode_range import datetime_range
+from .mixins import ReportingDatabaseMixin
 
 
 def _is_pide_user(user):
@@ -53,21 +55,8 @@ def _get_filtered_tikets(params):
         'id_periode_data__id_sub_jenis_data_ilap__id_jenis_tabel'
     )
     
-    # Filter by date range
-    if tgl_mulai_str:
-        try:
-            # datetime-local format: YYYY-MM-DDTHH:MM
-            tgl_mulai = datetime.strptime(tgl_mulai_str, '%Y-%m-%dT%H:%M')
-            tikets = tikets.filter(tgl_kirim_pide__gte=tgl_mulai)
-        except ValueError:
-            pass
-            
-    if tgl_akhir_str:
-        try:
-            tgl_akhir = datetime.strptime(tgl_akhir_str, '%Y-%m-%dT%H:%M')
-            tikets = tikets.filter(tgl_kirim_pide__lte=tgl_akhir)
-        except ValueError:
-            pass
+    # Filter by date range; Tanggal Akhir covers its whole minute
+    tikets = tikets.filter(**datetime_range(tgl_mulai_str, tgl_akhir_str).filter_kwargs('tgl_kirim_pide'))
             
     # Filter by ILAP
     if id_ilap and id_ilap != 'all' and id_ilap != '':
@@ -89,7 +78,7 @@ def _get_filtered_tikets(params):
     return tikets.order_by('tgl_kirim_pide')
 
 
-class LaporanSLAPerekamanView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class LaporanSLAPerekamanView(LoginRequiredMixin, UserPassesTestMixin, ReportingDatabaseMixin, TemplateView):
     """Display Laporan SLA Perekaman by filtering tikets
     based on a date range and other parameters.
     """
@@ -121,6 +110,7 @@ class LaporanSLAPerekamanView(LoginRequiredMixin, UserPassesTestMixin, TemplateV
 @user_passes_test(_is_pide_user)
 @require_http_methods(["GET", "POST"])
 @csrf_protect
+@use_reporting_db
 def laporan_sla_perekaman_data(request):
     """DataTables server-side endpoint for SLA Perekaman Report.
     
@@ -196,6 +186,7 @@ def laporan_sla_perekaman_data(request):
 @user_passes_test(_is_pide_user)
 @require_GET
 @csrf_protect
+@use_reporting_db
 def laporan_sla_perekaman_export(request):
     """Export Laporan SLA Perekaman to XLSX file.
 
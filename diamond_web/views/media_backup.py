@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.media_backup import MediaBackup
 from ..forms.media_backup import MediaBackupForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class MediaBackupListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -168,6 +169,7 @@ class MediaBackupDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequir
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def media_backup_data(request):
     """Server-side DataTables endpoint for `MediaBackup`.
 
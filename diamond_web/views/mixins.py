@@ -4,6 +4,7 @@ from django.template.loader import render_to_string
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.utils import timezone
 from ..models.tiket_pic import TiketPIC
+from ..utils.db_routing import reporting_reads_for
 
 
 class AdminRequiredMixin(UserPassesTestMixin):
@@ -463,6 +464,23 @@ class ActiveTiketPICListRequiredMixin(UserPassesTestMixin):
         return TiketPIC.objects.filter(id_user=user, active=True).exists()
 
 
+class ReportingDatabaseMixin:
+    """Run a read-only view's queries against the ``reporting`` database alias.
+
+    List it after the access mixins so permission checks still read from
+    ``default``.  The response is rendered inside the routing context because
+    a ``TemplateResponse`` evaluates its querysets lazily.  Writes, and reads
+    of sessions pinned after a recent change, stay on ``default`` (see
+    utils/db_routing.py).
+    """
+    def dispatch(self, request, *args, **kwargs):
+        with reporting_reads_for(request):
+            response = super().dispatch(request, *args, **kwargs)
+            if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+                response.render()
+        return response
+
+
 class UserFormKwargsMixin:
     """Add the current request user to form `kwargs`.
 
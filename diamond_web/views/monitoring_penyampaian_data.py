@@ -2,33 +2,26 @@ from django.urls import reverse_lazy
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import TemplateView
 from django.http import JsonResponse
-from django.views.decorators.http import require_GET
+from django.views.decorators.http import condition, require_GET
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.db.models import Q
 from datetime import datetime, timedelta
 import calendar
 from urllib.parse import urlencode
 
-from ..models.jenis_data_ilap import JenisDataILAP
 from ..models.periode_jenis_data import PeriodeJenisData
 from ..models.tiket import Tiket
 from ..models.detil_tanda_terima import DetilTandaTerima
 from ..models.tiket_pic import TiketPIC
 from ..models.pic import PIC
-from ..models.kanwil import Kanwil
-from ..models.kpp import KPP
-from ..models.kategori_wilayah import KategoriWilayah
-from ..models.kategori_ilap import KategoriILAP
-from ..models.ilap import ILAP
-from ..models.jenis_tabel import JenisTabel
-from ..models.dasar_hukum import DasarHukum
 from ..models.klasifikasi_jenis_data import KlasifikasiJenisData
-from ..models.periode_pengiriman import PeriodePengiriman
 from ..utils import format_periode
-from .mixins import UserP3DERequiredMixin, get_active_p3de_jenis_data_ilap_ids
+from ..utils.reference_data import get_reference, reference_etag
+from ..utils.db_routing import use_reporting_db
+from .mixins import UserP3DERequiredMixin, get_active_p3de_jenis_data_ilap_ids, ReportingDatabaseMixin
 
 
-class MonitoringPenyampaianDataListView(LoginRequiredMixin, UserP3DERequiredMixin, TemplateView):
+class MonitoringPenyampaianDataListView(LoginRequiredMixin, UserP3DERequiredMixin, ReportingDatabaseMixin, TemplateView):
     """List view for monitoring data submissions (monitoring penyampaian data).
 
     Renders `monitoring_penyampaian_data/list.html`. Shows monitoring for each sub jenis data
@@ -130,9 +123,145 @@ def get_periods_for_range(start_date, end_date, periode_type):
     return periods
 
 
+def _is_monitoring_admin(user):
+    return user.is_superuser or user.groups.filter(name='admin').exists()
+
+
+def _distinct_rows(rows, fields, sort_field):
+    """Distinct *fields* tuples of *rows* (dicts), sorted by *sort_field*."""
+    seen = {}
+    for row in rows:
+        key = tuple(row[f] for f in fields)
+        seen.setdefault(key, {f: row[f] for f in fields})
+    return sorted(seen.values(), key=lambda r: r[sort_field] or '')
+
+
+def _build_filter_options(user):
+    """Build the filter dropdown options from the reference data cache.
+
+    Admins get every master row; other users only the rows reachable from the
+    sub jenis data where they are an active P3DE PIC.
+    """
+    is_admin = _is_monitoring_admin(user)
+
+    if is_admin:
+        # Admin: show all data
+        kanwil_list = get_reference('kanwil')
+        kpp_list = get_reference('kpp')
+        kategori_wilayah_list = get_reference('kategori_wilayah')
+        kategori_ilap_list = get_reference('kategori_ilap')
+        ilap_list = get_reference('ilap')
+        jenis_data_list = get_reference('jenis_data')
+        sub_jenis_data_list = get_reference('sub_jenis_data')
+        jenis_tabel_list = get_reference('jenis_tabel')
+        dasar_hukum_list = get_reference('dasar_hukum')
+        periode_pengiriman_list = get_reference('periode_pengiriman')
+        active_jenis_data_ilap_ids = None
+    else:
+        # Regular user: filter all data based on active P3DE PIC assignment
+        active_jenis_data_ilap_ids = set(get_active_p3de_jenis_data_ilap_ids(user))
+        active_jenis_data = [
+            j for j in get_reference('jenis_data_ilap') if j['id'] in active_jenis_data_ilap_ids
+        ]
+        active_ilap_ids = {j['id_ilap_id'] for j in active_jenis_data if j['id_ilap_id']}
+        ilap_list = [i for i in get_reference('ilap') if i['id'] in active_ilap_ids]
+
+        # Kanwil/KPP, kategori wilayah and kategori ILAP from related ILAPs
+        kpp_set = {i['id_kpp_id'] for i in ilap_list if i['id_kpp_id']}
+        kanwil_set = {i['id_kpp__id_kanwil_id'] for i in ilap_list if i['id_kpp__id_kanwil_id']}
+        kategori_wilayah_set = {i['id_kategori_wilayah_id'] for i in ilap_list if i['id_kategori_wilayah_id']}
+        kategori_ilap_set = {i['id_kategori_id'] for i in ilap_list if i['id_kategori_id']}
+        kanwil_list = [k for k in get_reference('kanwil') if k['id'] in kanwil_set]
+        kpp_list = [k for k in get_reference('kpp') if k['id'] in kpp_set]
+        kategori_wilayah_list = [k for k in get_reference('kategori_wilayah') if k['id'] in kategori_wilayah_set]
+        kategori_ilap_list = [k for k in get_reference('kategori_ilap') if k['id'] in kategori_ilap_set]
+
+        # Jenis data and sub jenis data from active assignment scope
+        jenis_data_list = _distinct_rows(active_jenis_data, ('id_jenis_data', 'nama_jenis_data'), 'id_jenis_data')
+        sub_jenis_data_list = _distinct_rows(
+            active_jenis_data, ('id_sub_jenis_data', 'nama_sub_jenis_data'), 'id_sub_jenis_data'
+        )
+
+        # Jenis tabel, dasar hukum and periode pengiriman of the active sub jenis data
+        jenis_tabel_set = {j['id_jenis_tabel_id'] for j in active_jenis_data if j['id_jenis_tabel_id']}
+        jenis_tabel_list = [k for k in get_reference('jenis_tabel') if k['id'] in jenis_tabel_set]
+
+        klasifikasi = get_reference('klasifikasi_by_sub_jenis')
+        dasar_hukum_set = {
+            dasar_hukum_id
+            for jenis_id in active_jenis_data_ilap_ids
+            for dasar_hukum_id, _ in klasifikasi.get(jenis_id, ())
+        }
+        dasar_hukum_list = [k for k in get_reference('dasar_hukum') if k['id'] in dasar_hukum_set]
+
+        periode_map = get_reference('periode_pengiriman_by_sub_jenis')
+        periode_pengiriman_set = set().union(*(periode_map.get(j, set()) for j in active_jenis_data_ilap_ids))
+        periode_pengiriman_list = [k for k in get_reference('periode_pengiriman') if k['id'] in periode_pengiriman_set]
+
+    # Get unique tahun from periode_jenis_data and generate range up to current year
+    tahun_range = get_reference('periode_tahun_range')
+    min_year = tahun_range.get('min_year') or datetime.now().year
+    max_year = max(tahun_range.get('max_year') or datetime.now().year, datetime.now().year)
+    tahun_options = [{'id': str(year), 'name': str(year)} for year in range(min_year, max_year + 1)]
+
+    # Get PIC P3DE list based on user role
+    if is_admin:
+        # Admin: show all P3DE users
+        pic_users = {}
+        for (_, tipe), users in get_reference('open_pics').items():
+            if tipe == PIC.TipePIC.P3DE:
+                for u in users:
+                    pic_users.setdefault(u['id'], u)
+        pic_p3de_options = [
+            {
+                'id': str(u['id']),
+                'name': f"{u['username']} - {u['first_name']} {u['last_name']}".strip()
+            }
+            for u in sorted(pic_users.values(), key=lambda u: (u['first_name'], u['last_name'], u['username']))
+        ]
+    elif active_jenis_data_ilap_ids:
+        # Regular User P3DE: show only their own name if they have active P3DE PIC
+        pic_p3de_options = [
+            {
+                'id': str(user.id),
+                'name': f"{user.username} - {user.first_name} {user.last_name}".strip()
+            }
+        ]
+    else:
+        pic_p3de_options = []
+
+    return {
+        'tahun': tahun_options,
+        'pic_p3de': pic_p3de_options,
+        'kanwil': [{'id': str(k['id']), 'name': f"{k['kode_kanwil']} - {k['nama_kanwil']}"} for k in kanwil_list],
+        'kpp': [{'id': str(k['id']), 'name': f"{k['kode_kpp']} - {k['nama_kpp']}"} for k in kpp_list],
+        'kategori_wilayah': [{'id': str(k['id']), 'name': k['deskripsi']} for k in kategori_wilayah_list],
+        'kategori_ilap': [{'id': str(k['id']), 'name': f"{k['id_kategori']} - {k['nama_kategori']}"} for k in kategori_ilap_list],
+        'ilap': [{'id': str(k['id']), 'name': f"{k['id_ilap']} - {k['nama_ilap']}"} for k in ilap_list],
+        'jenis_data': [{'id': k['id_jenis_data'], 'name': f"{k['id_jenis_data']} - {k['nama_jenis_data']}"} for k in jenis_data_list],
+        'sub_jenis_data': [{'id': k['id_sub_jenis_data'], 'name': f"{k['id_sub_jenis_data']} - {k['nama_sub_jenis_data']}"} for k in sub_jenis_data_list],
+        'jenis_tabel': [{'id': str(k['id']), 'name': k['deskripsi']} for k in jenis_tabel_list],
+        'dasar_hukum': [{'id': str(k['id']), 'name': k['deskripsi']} for k in dasar_hukum_list],
+        'periode_pengiriman': [{'id': str(k['id']), 'name': k['periode_penyampaian']} for k in periode_pengiriman_list],
+    }
+
+
+def _filter_options_etag(request, *args, **kwargs):
+    """ETag for ``get_filter_options=1`` requests, which only use reference data.
+
+    Data requests return None (no ETag).  The user and the date are part of
+    the tag because non-admin options depend on the user's active PIC period.
+    """
+    if not request.GET.get('get_filter_options'):
+        return None
+    return reference_etag('monitoring_penyampaian_data', request.user.pk, datetime.now().date())
+
+
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'user_p3de']).exists())
 @require_GET
+@condition(etag_func=_filter_options_etag)
+@use_reporting_db
 def monitoring_penyampaian_data_data(request):
     """DataTables server-side endpoint for Monitoring Penyampaian Data.
 
@@ -165,172 +294,7 @@ def monitoring_penyampaian_data_data(request):
     """
     # Check if requesting filter options
     if request.GET.get('get_filter_options'):
-        from django.db.models import Min, Max
-        
-        # Determine if user is admin or regular user
-        is_admin = request.user.is_superuser or request.user.groups.filter(name='admin').exists()
-        
-        # Get active JenisDataILAP IDs for current user (used for filtering all dropdowns for non-admin users)
-        active_jenis_data_ilap_ids = get_active_p3de_jenis_data_ilap_ids(request.user) if not is_admin else None
-        
-        # Build filter querysets based on user role
-        if is_admin:
-            # Admin: show all data
-            kanwil_list = Kanwil.objects.all().values('id', 'kode_kanwil', 'nama_kanwil').order_by('kode_kanwil')
-            kpp_list = KPP.objects.all().values('id', 'kode_kpp', 'nama_kpp').order_by('kode_kpp')
-            kategori_wilayah_list = KategoriWilayah.objects.all().values('id', 'deskripsi').order_by('id')
-            kategori_ilap_list = KategoriILAP.objects.all().values('id', 'id_kategori', 'nama_kategori').order_by('nama_kategori')
-            ilap_list = ILAP.objects.all().values('id', 'id_ilap', 'nama_ilap').order_by('id_ilap')
-            jenis_data_list = JenisDataILAP.objects.values('id_jenis_data', 'nama_jenis_data').distinct().order_by('id_jenis_data')
-            sub_jenis_data_list = JenisDataILAP.objects.values('id_sub_jenis_data', 'nama_sub_jenis_data').distinct().order_by('id_sub_jenis_data')
-            jenis_tabel_list = JenisTabel.objects.all().values('id', 'deskripsi').order_by('id')
-            dasar_hukum_list = DasarHukum.objects.all().values('id', 'deskripsi').order_by('id')
-            periode_pengiriman_list = PeriodePengiriman.objects.all().values('id', 'periode_penyampaian').order_by('id')
-        else:
-            # Regular user: filter all data based on active P3DE PIC assignment
-            if active_jenis_data_ilap_ids:
-                active_jenis_data_qs = JenisDataILAP.objects.filter(
-                    id__in=active_jenis_data_ilap_ids
-                ).select_related(
-                    'id_ilap',
-                    'id_ilap__id_kpp',
-                    'id_ilap__id_kpp__id_kanwil',
-                    'id_ilap__id_kategori',
-                    'id_ilap__id_kategori_wilayah',
-                    'id_jenis_tabel',
-                )
-
-                active_jenis_data = list(active_jenis_data_qs)
-                active_ilap_ids = {j.id_ilap_id for j in active_jenis_data if j.id_ilap_id}
-                ilap_qs = ILAP.objects.filter(id__in=active_ilap_ids).select_related(
-                    'id_kpp__id_kanwil',
-                    'id_kategori',
-                    'id_kategori_wilayah',
-                )
-                ilap_list = ilap_qs.values('id', 'id_ilap', 'nama_ilap').order_by('id_ilap')
-
-                # Get kanwil/kpp from related ILAPs
-                kanwil_set = set()
-                kpp_set = set()
-                for ilap in ilap_qs:
-                    if ilap.id_kpp:
-                        kpp_set.add(ilap.id_kpp.id)
-                        if ilap.id_kpp.id_kanwil:
-                            kanwil_set.add(ilap.id_kpp.id_kanwil.id)
-                
-                kanwil_list = Kanwil.objects.filter(id__in=kanwil_set).values('id', 'kode_kanwil', 'nama_kanwil').order_by('kode_kanwil')
-                kpp_list = KPP.objects.filter(id__in=kpp_set).values('id', 'kode_kpp', 'nama_kpp').order_by('kode_kpp')
-                
-                # Get kategori_wilayah from related ILAPs
-                kategori_wilayah_set = {
-                    ilap.id_kategori_wilayah.id
-                    for ilap in ilap_qs
-                    if ilap.id_kategori_wilayah
-                }
-                
-                kategori_wilayah_list = KategoriWilayah.objects.filter(id__in=kategori_wilayah_set).values('id', 'deskripsi').order_by('id')
-                
-                # Get kategori_ilap from related ILAPs
-                kategori_ilap_set = {
-                    ilap.id_kategori.id
-                    for ilap in ilap_qs
-                    if ilap.id_kategori
-                }
-                
-                kategori_ilap_list = KategoriILAP.objects.filter(id__in=kategori_ilap_set).values('id', 'id_kategori', 'nama_kategori').order_by('nama_kategori')
-                
-                # Get jenis_data and sub_jenis_data from active assignment scope
-                jenis_data_list = active_jenis_data_qs.values('id_jenis_data', 'nama_jenis_data').distinct().order_by('id_jenis_data')
-                sub_jenis_data_list = active_jenis_data_qs.values('id_sub_jenis_data', 'nama_sub_jenis_data').distinct().order_by('id_sub_jenis_data')
-                
-                # Get jenis_tabel and dasar_hukum from active ILAPs' sub jenis data
-                jenis_tabel_set = {
-                    jdd.id_jenis_tabel.id
-                    for jdd in active_jenis_data
-                    if jdd.id_jenis_tabel
-                }
-                
-                jenis_tabel_list = JenisTabel.objects.filter(id__in=jenis_tabel_set).values('id', 'deskripsi').order_by('id')
-                
-                # Get dasar_hukum from active sub jenis data
-                dasar_hukum_set = set()
-                for kj in KlasifikasiJenisData.objects.filter(id_sub_jenis_data_id__in=active_jenis_data_ilap_ids):
-                    if kj.id_klasifikasi_tabel:
-                        dasar_hukum_set.add(kj.id_klasifikasi_tabel.id)
-                
-                dasar_hukum_list = DasarHukum.objects.filter(id__in=dasar_hukum_set).values('id', 'deskripsi').order_by('id')
-                
-                # Get periode_pengiriman from active sub jenis data
-                periode_pengiriman_set = set()
-                for pjd in PeriodeJenisData.objects.filter(id_sub_jenis_data_ilap_id__in=active_jenis_data_ilap_ids):
-                    if pjd.id_periode_pengiriman:
-                        periode_pengiriman_set.add(pjd.id_periode_pengiriman.id)
-                
-                periode_pengiriman_list = PeriodePengiriman.objects.filter(id__in=periode_pengiriman_set).values('id', 'periode_penyampaian').order_by('id')
-            else:
-                # No active assignments, return empty lists
-                kanwil_list = []
-                kpp_list = []
-                kategori_wilayah_list = []
-                kategori_ilap_list = []
-                ilap_list = []
-                jenis_data_list = []
-                sub_jenis_data_list = []
-                jenis_tabel_list = []
-                dasar_hukum_list = []
-                periode_pengiriman_list = []
-        
-        # Get unique tahun from periode_jenis_data and generate range up to current year
-        tahun_range = PeriodeJenisData.objects.aggregate(
-            min_year=Min('start_date__year'),
-            max_year=Max('start_date__year')
-        )
-        min_year = tahun_range.get('min_year') or datetime.now().year
-        max_year = max(tahun_range.get('max_year') or datetime.now().year, datetime.now().year)
-        tahun_options = [{'id': str(year), 'name': str(year)} for year in range(min_year, max_year + 1)]
-        
-        # Get PIC P3DE list based on user role
-        if is_admin:
-            # Admin: show all P3DE users
-            pic_p3de_list = PIC.objects.filter(
-                tipe=PIC.TipePIC.P3DE,
-                end_date__isnull=True
-            ).values('id_user__id', 'id_user__username', 'id_user__first_name', 'id_user__last_name').distinct().order_by('id_user__first_name', 'id_user__last_name', 'id_user__username')
-            pic_p3de_options = [
-                {
-                    'id': str(pic['id_user__id']),
-                    'name': f"{pic['id_user__username']} - {pic['id_user__first_name']} {pic['id_user__last_name']}".strip()
-                }
-                for pic in pic_p3de_list
-            ]
-        else:
-            # Regular User P3DE: show only their own name if they have active P3DE PIC
-            if active_jenis_data_ilap_ids:
-                pic_p3de_options = [
-                    {
-                        'id': str(request.user.id),
-                        'name': f"{request.user.username} - {request.user.first_name} {request.user.last_name}".strip()
-                    }
-                ]
-            else:
-                pic_p3de_options = []
-        
-        return JsonResponse({
-            'filter_options': {
-                'tahun': tahun_options,
-                'pic_p3de': pic_p3de_options,
-                'kanwil': [{'id': str(k['id']), 'name': f"{k['kode_kanwil']} - {k['nama_kanwil']}"} for k in kanwil_list],
-                'kpp': [{'id': str(k['id']), 'name': f"{k['kode_kpp']} - {k['nama_kpp']}"} for k in kpp_list],
-                'kategori_wilayah': [{'id': str(k['id']), 'name': k['deskripsi']} for k in kategori_wilayah_list],
-                'kategori_ilap': [{'id': str(k['id']), 'name': f"{k['id_kategori']} - {k['nama_kategori']}"} for k in kategori_ilap_list],
-                'ilap': [{'id': str(k['id']), 'name': f"{k['id_ilap']} - {k['nama_ilap']}"} for k in ilap_list],
-                'jenis_data': [{'id': k['id_jenis_data'], 'name': f"{k['id_jenis_data']} - {k['nama_jenis_data']}"} for k in jenis_data_list],
-                'sub_jenis_data': [{'id': k['id_sub_jenis_data'], 'name': f"{k['id_sub_jenis_data']} - {k['nama_sub_jenis_data']}"} for k in sub_jenis_data_list],
-                'jenis_tabel': [{'id': str(k['id']), 'name': k['deskripsi']} for k in jenis_tabel_list],
-                'dasar_hukum': [{'id': str(k['id']), 'name': k['deskripsi']} for k in dasar_hukum_list],
-                'periode_pengiriman': [{'id': str(k['id']), 'name': k['periode_penyampaian']} for k in periode_pengiriman_list],
-            }
-        })
+        return JsonResponse({'filter_options': _build_filter_options(request.user)})
     
     draw = int(request.GET.get('draw', '1'))
     start = int(request.GET.get('start', '0'))
@@ -8,6 +8,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.jenis_data_ilap import JenisDataILAP
 from ..forms.nama_tabel import NamaTabelForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminPIDERequiredMixin, SafeDeleteMixin
 
 class NamaTabelListView(LoginRequiredMixin, AdminPIDERequiredMixin, TemplateView):
@@ -129,6 +130,7 @@ class NamaTabelDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminPIDERequired
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def nama_tabel_data(request):
     """Server-side DataTables endpoint for `JenisDataILAP` (Nama Tabel).
 
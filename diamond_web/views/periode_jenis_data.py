@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.periode_jenis_data import PeriodeJenisData
 from ..forms.periode_jenis_data import PeriodeJenisDataForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 from datetime import date as _date
 
@@ -165,6 +166,7 @@ class PeriodeJenisDataDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DER
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def periode_jenis_data_data(request):
     """Server-side DataTables endpoint for `PeriodeJenisData`.
 
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.periode_pengiriman import PeriodePengiriman
 from ..forms.periode_pengiriman import PeriodePengirimanForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class PeriodePengirimanListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -127,6 +128,7 @@ class PeriodePengirimanDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DE
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def periode_pengiriman_data(request):
     """Server-side DataTables endpoint for `PeriodePengiriman`.
 
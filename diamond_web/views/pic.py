@@ -11,6 +11,7 @@ from ..models.pic import PIC
 from ..forms.pic import PICForm
 from ..constants.tiket_action_types import PICActionType
 from ..constants.tiket_status import STATUS_DIBATALKAN
+from ..utils.db_routing import use_reporting_db
 from .mixins import (
     AjaxFormMixin,
     AdminP3DERequiredMixin,
@@ -808,6 +809,7 @@ def _pic_data_common(request, tipe):
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de', 'user_p3de']).exists())
 @require_GET
+@use_reporting_db
 def pic_p3de_data(request):
     """DataTables endpoint for P3DE `PIC` rows.
 
@@ -821,6 +823,7 @@ def pic_p3de_data(request):
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_pide', 'user_pide']).exists())
 @require_GET
+@use_reporting_db
 def pic_pide_data(request):
     """DataTables endpoint for PIDE `PIC` rows.
 
@@ -834,6 +837,7 @@ def pic_pide_data(request):
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_pmde', 'user_pmde']).exists())
 @require_GET
+@use_reporting_db
 def pic_pmde_data(request):
     """DataTables endpoint for PMDE `PIC` rows.
 
@@ -13,24 +13,16 @@ from django.views.generic import TemplateView
 from django.http import JsonResponse
 from django.urls import reverse
 from django.views.decorators.csrf import csrf_protect
-from django.db import connection as db_connection
-from django.db.models import Q, Value
+from django.db.models import DateField
 from django.db.models.functions import Cast
-from django.db.models import (
-    DateField, IntegerField, Subquery, OuterRef,
-    Exists
-)
-from django.db.models.expressions import RawSQL
-from django.db.models.functions import Coalesce
-from django.utils import timezone
+from collections import defaultdict
 from datetime import date
 
 from ..models.tiket import Tiket
 from ..models.tiket_pic import TiketPIC
 from ..models.klasifikasi_jenis_data import KlasifikasiJenisData
-from ..models.durasi_jatuh_tempo import DurasiJatuhTempo
-from ..models.jenis_prioritas_data import JenisPrioritasData
 from ..constants.tiket_status import STATUS_PENGENDALIAN_MUTU
+from ..utils.db_routing import use_reporting_db
 
 
 def _is_pmde_user(user):
@@ -59,10 +51,89 @@ class QualityControlView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
         return context
 
 
+def _resolve_page(tikets):
+    """Load the related rows of a page of tikets, one query per relation.
+
+    Returns:
+        tuple: ``({tiket_id: pic_pmde_name}, {sub_jenis_data_id: [kategori, ...]})``.
+        The PIC name is the first active PMDE TiketPIC (lowest id); the
+        kategori list follows KlasifikasiJenisData order.
+    """
+    tiket_ids = [tiket.id for tiket in tikets]
+    sub_jenis_ids = {tiket.id_periode_data.id_sub_jenis_data_ilap_id for tiket in tikets}
+    if not tiket_ids:
+        return {}, {}
+
+    pic_names = {}
+    pic_rows = TiketPIC.objects.filter(
+        id_tiket_id__in=tiket_ids, role=TiketPIC.Role.PMDE, active=True
+    ).order_by('id').values_list(
+        'id_tiket_id', 'id_user__username', 'id_user__first_name', 'id_user__last_name'
+    )
+    for tiket_id, username, first_name, last_name in pic_rows:
+        if tiket_id not in pic_names:
+            full_name = f'{first_name or ""} {last_name or ""}'.strip()
+            pic_names[tiket_id] = full_name or username
+
+    kategori_map = defaultdict(list)
+    klasifikasi_rows = KlasifikasiJenisData.objects.filter(
+        id_sub_jenis_data_id__in=sub_jenis_ids, id_klasifikasi_tabel__isnull=False
+    ).order_by('id').values_list('id_sub_jenis_data_id', 'id_klasifikasi_tabel__kategori')
+    for sub_jenis_id, kategori in klasifikasi_rows:
+        kategori_map[sub_jenis_id].append(kategori)
+
+    return pic_names, dict(kategori_map)
+
+
+def _format_row(tiket, pic_pmde_name, kategori_list, today):
+    """Build the DataTables row of one tiket (no database access)."""
+    sub_jenis_data = tiket.id_periode_data.id_sub_jenis_data_ilap
+    ilap = sub_jenis_data.id_ilap
+    jenis_tabel = sub_jenis_data.id_jenis_tabel
+
+    # Deadline = tgl_transfer + active PMDE durasi (persisted, see utils/sla.py)
+    deadline = '-'
+    jatuh_tempo = '-'
+    deadline_sort_iso = ''
+    sisa_hari_val = ''
+    jatuh_tempo_days = None  # numeric days remaining for frontend row coloring
+    if tiket.deadline_pengendalian:
+        deadline = tiket.deadline_pengendalian.strftime('%d/%m/%Y')
+        deadline_sort_iso = tiket.deadline_pengendalian.strftime('%Y-%m-%d')
+        jatuh_tempo_days = (tiket.deadline_pengendalian - today).days
+        jatuh_tempo = f'{jatuh_tempo_days} hari'
+        sisa_hari_val = str(jatuh_tempo_days)
+
+    # Compute sort-friendly values for orthogonal DataTable sorting
+    tgl_transfer_sort = tiket.tgl_transfer.strftime('%Y-%m-%d') if tiket.tgl_transfer else ''
+    tgl_rematch_sort = tiket.tgl_rematch.strftime('%Y-%m-%d') if tiket.tgl_rematch else ''
+
+    return {
+        'nama_tabel': sub_jenis_data.nama_tabel_I or '',
+        'pic_pmde': pic_pmde_name,
+        'nomor_tiket': tiket.nomor_tiket,
+        'nama_ilap': ilap.nama_ilap if ilap else '',
+        'sub_jenis_data': sub_jenis_data.nama_sub_jenis_data or '',
+        'jenis_tabel': jenis_tabel.deskripsi if jenis_tabel else '',
+        'klasifikasi': ', '.join(kategori_list) if kategori_list else '-',
+        'deadline': {'display': deadline, 'sort': deadline_sort_iso},
+        'tgl_transfer': {'display': tiket.tgl_transfer.strftime('%d/%m/%Y') if tiket.tgl_transfer else '-', 'sort': tgl_transfer_sort},
+        'tgl_rematch': {'display': tiket.tgl_rematch.strftime('%d/%m/%Y') if tiket.tgl_rematch else '-', 'sort': tgl_rematch_sort},
+        'jatuh_tempo': {'display': jatuh_tempo, 'sort': sisa_hari_val},
+        'prioritas': 'Ya' if tiket.is_prioritas else 'Tidak',
+        'jml_baris_i': tiket.baris_i or 0,
+        'jml_selesai': tiket.sudah_qc or 0,
+        'jml_progress': tiket.belum_qc or 0,
+        'sisa_hari': jatuh_tempo_days,  # numeric for frontend row coloring
+        'action': f'<a href="{reverse("tiket_detail", args=[tiket.id])}" class="btn btn-sm btn-primary" title="Lihat Detail"><i class="feather-eye"></i></a>',
+    }
+
+
 @login_required
 @user_passes_test(_is_pmde_user)
 @require_http_methods(["POST", "GET"])
 @csrf_protect
+@use_reporting_db
 def quality_control_data(request):
     """DataTables server-side endpoint for Quality Control page."""
     params = request.POST if request.method == 'POST' else request.GET
@@ -77,77 +148,17 @@ def quality_control_data(request):
     )
     pmde_tiket_ids = pmde_pic.values_list('id_tiket', flat=True)
 
-    # Subquery: active durasi for each ticket's sub_jenis_data & tgl_transfer range
-    durasi_subq = DurasiJatuhTempo.objects.filter(
-        id_sub_jenis_data=OuterRef('id_periode_data__id_sub_jenis_data_ilap'),
-        seksi__name='user_pmde',
-        start_date__lte=Cast(OuterRef('tgl_transfer'), DateField()),
-    ).filter(
-        Q(end_date__isnull=True) | Q(end_date__gte=Cast(OuterRef('tgl_transfer'), DateField()))
-    ).order_by('-start_date').values('durasi')[:1]
-
-    # Base query with date annotations for sorting
+    # Base query with date annotations for sorting; deadline and prioritas
+    # are persisted columns maintained by utils/sla.py
     tikets = Tiket.objects.filter(
         id__in=pmde_tiket_ids,
         status_tiket=STATUS_PENGENDALIAN_MUTU
     ).select_related(
         'id_periode_data__id_sub_jenis_data_ilap__id_ilap',
         'id_periode_data__id_sub_jenis_data_ilap__id_jenis_tabel',
-    ).prefetch_related(
-        'tiketpic_set',
     ).annotate(
         tgl_transfer_date=Cast('tgl_transfer', DateField()),
         tgl_rematch_date=Cast('tgl_rematch', DateField()),
-        # Active durasi for sorting deadline / jatuh tempo
-        active_durasi=Coalesce(
-            Subquery(durasi_subq, output_field=IntegerField()),
-            Value(0)
-        ),
-    ).annotate(
-        # Prioritas: check if tgl_terima_dip falls within JenisPrioritasData range
-        is_prioritas=Exists(
-            JenisPrioritasData.objects.filter(
-                id_sub_jenis_data_ilap=OuterRef('id_periode_data__id_sub_jenis_data_ilap'),
-                start_date__lte=Cast(OuterRef('tgl_terima_dip'), DateField()),
-                end_date__gte=Cast(OuterRef('tgl_terima_dip'), DateField()),
-            )
-        ),
-    ).annotate(
-        # Compute deadline date = tgl_transfer + active_durasi days.
-        # Correlated subquery embedded in RawSQL (no params) to avoid
-        # parameter-binding issues with nested expressions.
-        # SQLite (dev): DATE(date, '+' || days || ' days')
-        # PostgreSQL (prod): (date::date + days * INTERVAL '1 day')::date
-        deadline_date=RawSQL(
-            """
-            DATE("tiket"."tgl_transfer", '+' || CAST(COALESCE(
-                (SELECT "durasi_jatuh_tempo"."durasi"
-                 FROM "durasi_jatuh_tempo"
-                 INNER JOIN "auth_group" ON ("durasi_jatuh_tempo"."seksi" = "auth_group"."id")
-                 WHERE ("durasi_jatuh_tempo"."id_sub_jenis_data" = "periode_jenis_data"."id_sub_jenis_data_ilap"
-                   AND "auth_group"."name" = 'user_pmde'
-                   AND "durasi_jatuh_tempo"."start_date" <= DATE("tiket"."tgl_transfer")
-                   AND ("durasi_jatuh_tempo"."end_date" IS NULL
-                        OR "durasi_jatuh_tempo"."end_date" >= DATE("tiket"."tgl_transfer")))
-                 ORDER BY "durasi_jatuh_tempo"."start_date" DESC LIMIT 1
-            ), 0) AS TEXT) || ' days')
-            """ if db_connection.vendor == 'sqlite' else
-            """
-            ("tiket"."tgl_transfer"::date + COALESCE(
-                (SELECT "durasi_jatuh_tempo"."durasi"
-                 FROM "durasi_jatuh_tempo"
-                 INNER JOIN "auth_group" ON ("durasi_jatuh_tempo"."seksi" = "auth_group"."id")
-                 WHERE ("durasi_jatuh_tempo"."id_sub_jenis_data" = "periode_jenis_data"."id_sub_jenis_data_ilap"
-                   AND "auth_group"."name" = 'user_pmde'
-                   AND "durasi_jatuh_tempo"."start_date" <= "tiket"."tgl_transfer"::date
-                   AND ("durasi_jatuh_tempo"."end_date" IS NULL
-                        OR "durasi_jatuh_tempo"."end_date" >= "tiket"."tgl_transfer"::date))
-                 ORDER BY "durasi_jatuh_tempo"."start_date" DESC LIMIT 1
-            ), 0) * INTERVAL '1 day')::date
-            """,
-            [],
-            output_field=DateField(),
-        ),
     )
 
     # ---- Column search ----
@@ -169,15 +180,10 @@ def quality_control_data(request):
             tikets = tikets.filter(tgl_rematch__icontains=columns_search[8])
         if len(columns_search) > 10 and columns_search[10]:
             search_val = columns_search[10].lower()
-            prioritas_qs = JenisPrioritasData.objects.filter(
-                id_sub_jenis_data_ilap=OuterRef('id_periode_data__id_sub_jenis_data_ilap'),
-                start_date__lte=Cast(OuterRef('tgl_terima_dip'), DateField()),
-                end_date__gte=Cast(OuterRef('tgl_terima_dip'), DateField()),
-            )
             if search_val in ('ya', 'y'):
-                tikets = tikets.filter(Exists(prioritas_qs))
+                tikets = tikets.filter(is_prioritas=True)
             elif search_val in ('tidak', 't', 'tdk'):
-                tikets = tikets.filter(~Exists(prioritas_qs))
+                tikets = tikets.filter(is_prioritas=False)
         if len(columns_search) > 12 and columns_search[12]:
             tikets = tikets.filter(baris_i__icontains=columns_search[12])
         if len(columns_search) > 13 and columns_search[13]:
@@ -198,8 +204,8 @@ def quality_control_data(request):
         6: 'id',
         7: 'tgl_transfer_date',
         8: 'tgl_rematch_date',
-        9: 'deadline_date',
-        10: 'deadline_date',
+        9: 'deadline_pengendalian',
+        10: 'deadline_pengendalian',
         11: 'is_prioritas',
         12: 'baris_i',
         13: 'sudah_qc',
@@ -225,80 +231,19 @@ def quality_control_data(request):
     # Pagination
     tikets = tikets[start:start + length]
 
-    # Build response data
-    data = []
-    for tiket in tikets:
-        sub_jenis_data = tiket.id_periode_data.id_sub_jenis_data_ilap
-        ilap = sub_jenis_data.id_ilap
-        jenis_tabel = sub_jenis_data.id_jenis_tabel
-
-        # Get PIC PMDE name
-        pic_pmde_name = ''
-        pic_pmde = tiket.tiketpic_set.filter(role=TiketPIC.Role.PMDE, active=True).first()
-        if pic_pmde and pic_pmde.id_user:
-            pic_pmde_name = pic_pmde.id_user.get_full_name() or pic_pmde.id_user.username
-
-        # Get klasifikasi (kategori from dasar_hukum) via KlasifikasiJenisData
-        klasifikasi_list = KlasifikasiJenisData.objects.filter(
-            id_sub_jenis_data=sub_jenis_data
-        ).select_related('id_klasifikasi_tabel')
-        kategori_list = [k.id_klasifikasi_tabel.kategori for k in klasifikasi_list if k.id_klasifikasi_tabel]
-        kategori_str = ', '.join(kategori_list) if kategori_list else '-'
-
-        # Lookup active DurasiJatuhTempo for PMDE where tgl_transfer falls in range
-        deadline = '-'
-        jatuh_tempo = '-'
-        if tiket.tgl_transfer:
-            tgl_transfer_date = tiket.tgl_transfer.date() if hasattr(tiket.tgl_transfer, 'date') else tiket.tgl_transfer
-            aktif_durasi = DurasiJatuhTempo.objects.filter(
-                id_sub_jenis_data=sub_jenis_data,
-                seksi__name='user_pmde',
-                start_date__lte=tgl_transfer_date,
-            ).filter(
-                Q(end_date__isnull=True) | Q(end_date__gte=tgl_transfer_date)
-            ).order_by('-start_date').first()
-        else:
-            aktif_durasi = None
-
-        if aktif_durasi and aktif_durasi.durasi:
-            if tiket.tgl_transfer:
-                try:
-                    deadline_date = tiket.tgl_transfer + timezone.timedelta(days=aktif_durasi.durasi)
-                    deadline = deadline_date.strftime('%d/%m/%Y')
-                    sisa_hari = (deadline_date.date() - date.today()).days if hasattr(deadline_date, 'date') else (deadline_date - date.today()).days
-                    jatuh_tempo = f'{sisa_hari} hari'
-                except Exception:
-                    deadline = '-'
-                    jatuh_tempo = '-'
-
-        # Compute sort-friendly values for orthogonal DataTable sorting
-        deadline_sort_iso = deadline_date.strftime('%Y-%m-%d') if deadline != '-' and 'deadline_date' in locals() else ''
-        tgl_transfer_sort = tiket.tgl_transfer.strftime('%Y-%m-%d') if tiket.tgl_transfer else ''
-        tgl_rematch_sort = tiket.tgl_rematch.strftime('%Y-%m-%d') if tiket.tgl_rematch else ''
-        sisa_hari_val = str(sisa_hari) if 'sisa_hari' in locals() else ''
-        # Numeric days remaining for frontend row coloring (None = unknown)
-        jatuh_tempo_days = locals().get('sisa_hari', None)
-
-        row = {
-            'nama_tabel': sub_jenis_data.nama_tabel_I or '',
-            'pic_pmde': pic_pmde_name,
-            'nomor_tiket': tiket.nomor_tiket,
-            'nama_ilap': ilap.nama_ilap if ilap else '',
-            'sub_jenis_data': sub_jenis_data.nama_sub_jenis_data or '',
-            'jenis_tabel': jenis_tabel.deskripsi if jenis_tabel else '',
-            'klasifikasi': kategori_str,
-            'deadline': {'display': deadline, 'sort': deadline_sort_iso},
-            'tgl_transfer': {'display': tiket.tgl_transfer.strftime('%d/%m/%Y') if tiket.tgl_transfer else '-', 'sort': tgl_transfer_sort},
-            'tgl_rematch': {'display': tiket.tgl_rematch.strftime('%d/%m/%Y') if tiket.tgl_rematch else '-', 'sort': tgl_rematch_sort},
-            'jatuh_tempo': {'display': jatuh_tempo, 'sort': sisa_hari_val},
-            'prioritas': 'Ya' if tiket.is_prioritas else 'Tidak',
-            'jml_baris_i': tiket.baris_i or 0,
-            'jml_selesai': tiket.sudah_qc or 0,
-            'jml_progress': tiket.belum_qc or 0,
-            'sisa_hari': jatuh_tempo_days,  # numeric for frontend row coloring
-            'action': f'<a href="{reverse("tiket_detail", args=[tiket.id])}" class="btn btn-sm btn-primary" title="Lihat Detail"><i class="feather-eye"></i></a>',
-        }
-        data.append(row)
+    # Build response data: related rows for the whole page in one query each
+    page = list(tikets)
+    pic_names, kategori_map = _resolve_page(page)
+    today = date.today()
+    data = [
+        _format_row(
+            tiket,
+            pic_names.get(tiket.id, ''),
+            kategori_map.get(tiket.id_periode_data.id_sub_jenis_data_ilap_id, []),
+            today,
+        )
+        for tiket in page
+    ]
 
     return JsonResponse({
         'draw': draw,
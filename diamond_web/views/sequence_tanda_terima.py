@@ -13,6 +13,7 @@ from django.db import models
 from ..models.sequence_tanda_terima import SequenceTandaTerima
 from ..models.tanda_terima_data import TandaTerimaData
 from ..forms.sequence_tanda_terima import SequenceTandaTerimaForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin
 
 
@@ -54,6 +55,7 @@ class SequenceTandaTerimaListView(LoginRequiredMixin, AdminP3DERequiredMixin, Te
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def sequence_tanda_terima_data(request):
     """DataTables server-side endpoint for `SequenceTandaTerima`.
 
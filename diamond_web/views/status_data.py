@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.status_data import StatusData
 from ..forms.status_data import StatusDataForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class StatusDataListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -128,6 +129,7 @@ class StatusDataDeleteView(SafeDeleteMixin, LoginRequiredMixin, AdminP3DERequire
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def status_data_data(request):
     """Server-side DataTables endpoint for `StatusData`.
 
@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 
 from ..models.status_penelitian import StatusPenelitian
 from ..forms.status_penelitian import StatusPenelitianForm
+from ..utils.db_routing import use_reporting_db
 from .mixins import AjaxFormMixin, AdminP3DERequiredMixin, SafeDeleteMixin
 
 class StatusPenelitianListView(LoginRequiredMixin, AdminP3DERequiredMixin, TemplateView):
@@ -106,6 +107,7 @@ class StatusPenelitianDeleteView(LoginRequiredMixin, AdminP3DERequiredMixin, Saf
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'admin_p3de']).exists())
 @require_GET
+@use_reporting_db
 def status_penelitian_data(request):
     """Server-side DataTable endpoint for StatusPenelitian list view.
     
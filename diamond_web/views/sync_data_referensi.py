@@ -1,25 +1,33 @@
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.http import JsonResponse, FileResponse
+from django.http import JsonResponse, FileResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.views.decorators.http import require_GET, require_POST
 from django.views.decorators.cache import never_cache
 from django.core.cache import cache
-from django.utils import timezone
+from django.core.serializers.json import DjangoJSONEncoder
 from django.urls import reverse
 from datetime import datetime, timedelta
 import uuid
 import json
 import logging
 import os
-import csv
 
 from ..utils.oracle_sync import OracleDataSyncService, OracleSyncConfigError
+from ..utils.job_state import JobState, CHECK_REFERENSI, SYNC_REFERENSI
+from ..utils.task_lock import SingletonLock
+from ..utils.sync_log import (
+    SYNC_LOGS_DIR,
+    REFERENSI_FAILED_ROWS_PREFIX,
+    FailedRowWriter,
+    failed_rows_path,
+    find_failed_rows_file,
+    open_failed_rows,
+)
 from ..tasks import check_referensi_data_task, sync_referensi_data_task
 
 logger = logging.getLogger(__name__)
 
 # Create logs directory if it doesn't exist
-SYNC_LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'sync_logs')
 os.makedirs(SYNC_LOGS_DIR, exist_ok=True)
 
 
@@ -47,14 +55,14 @@ def oracle_sync_download_errors(request, sync_id):
         except (ValueError, TypeError):
             return JsonResponse({'success': False, 'message': 'Invalid sync_id format'}, status=400)
         
-        error_log_path = os.path.join(SYNC_LOGS_DIR, f'sync_referensi_failed_rows_{sync_id}.csv')
+        error_log_path = find_failed_rows_file(REFERENSI_FAILED_ROWS_PREFIX, sync_id)
         
-        # Check if file exists
-        if not os.path.exists(error_log_path):
+        # Check if file exists (compressed once the run was rotated)
+        if error_log_path is None:
             return JsonResponse({'success': False, 'message': 'Error log file not found'}, status=404)
         
         # Return file as download
-        response = FileResponse(open(error_log_path, 'rb'), content_type='text/csv')
+        response = FileResponse(open_failed_rows(error_log_path), content_type='text/csv')
         response['Content-Disposition'] = f'attachment; filename="sync_referensi_errors_{sync_id}.csv"'
         return response
     except Exception as exc:
@@ -63,11 +71,15 @@ def oracle_sync_download_errors(request, sync_id):
         return JsonResponse({'success': False, 'message': error_msg or 'Gagal download error log'}, status=500)
 
 
-def _log_failed_row(sync_id, row_identifier, category, error_msg, row_number=None):
-    """Log a failed row to CSV file for review and debugging.
+REFERENSI_FAILED_ROWS_HEADER = ['Row Number', 'Identifier', 'Category', 'Error Reason']
+
+
+def _log_failed_row(failed_rows, row_identifier, category, error_msg, row_number=None):
+    """Record a failed row for review and debugging.
 
     Args:
-        sync_id (str): The UUID string identifying the sync run.
+        failed_rows (FailedRowWriter): Buffered writer of the sync run's
+            'sync_referensi_failed_rows_{sync_id}.csv' file.
         row_identifier (str): Identifier for the failed row (e.g., a key or 'table:key').
         category (str): Category of the failure (e.g., 'Sync Error', 'Skipped Row').
         error_msg (str): Description of the error that occurred.
@@ -75,42 +87,13 @@ def _log_failed_row(sync_id, row_identifier, category, error_msg, row_number=Non
 
     Returns:
         None
-
-    Side Effects:
-        Appends a row to a CSV log file on the filesystem under SYNC_LOGS_DIR.
     """
-    try:
-        # Create CSV log file for this sync run
-        log_filename = os.path.join(SYNC_LOGS_DIR, f'sync_referensi_failed_rows_{sync_id}.csv')
-        
-        # Write header if file doesn't exist
-        file_exists = os.path.exists(log_filename)
-        
-        with open(log_filename, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header on first row
-            if not file_exists:
-                writer.writerow([
-                    'Timestamp',
-                    'Row Number',
-                    'Identifier',
-                    'Category',
-                    'Error Reason'
-                ])
-            
-            # Write failed row data
-            writer.writerow([
-                timezone.now().isoformat(),
-                row_number or '-',
-                row_identifier or '-',
-                category or '-',
-                error_msg or 'Unknown error'
-            ])
-        
-        logger.debug(f"Failed row logged to {log_filename}")
-    except Exception as e:
-        logger.error(f"Failed to log error row: {str(e)}")
+    failed_rows.writerow([
+        row_number or '-',
+        row_identifier or '-',
+        category or '-',
+        error_msg or 'Unknown error'
+    ])
 
 
 def _is_admin_user(user):
@@ -217,16 +200,15 @@ def oracle_sync_check(request):
 
     Side Effects:
         Dispatches a Celery task (check_referensi_data_task) for background
-        execution and sets several cache keys for progress tracking.
+        execution and initialises the job state used for progress tracking.
     """
     try:
         check_id = str(uuid.uuid4())
-
-        cache.set(f'check_referensi_in_progress_{check_id}', True, timeout=3600)
-        cache.set(f'check_referensi_started_at_{check_id}', datetime.now().isoformat(), timeout=3600)
+        job = JobState(CHECK_REFERENSI, check_id)
+        job.start(started_at=datetime.now().isoformat())
 
         task_result = check_referensi_data_task.delay(check_id)
-        cache.set(f'check_referensi_celery_task_id_{check_id}', task_result.id, timeout=3600)
+        job.update(celery_task_id=task_result.id)
         # Fixed key so the page can recover the check_id after navigation
         cache.set('check_referensi_active_check_id', check_id, timeout=3600)
 
@@ -291,22 +273,30 @@ def oracle_sync_run(request):
 
     Returns:
         JsonResponse: A JSON response containing 'success', 'message', and 'sync_id'
-            if the sync was started successfully.
+            if the sync was started successfully, or status 409 with
+            'active_sync_id' if another referensi sync is still running.
 
     Side Effects:
         Dispatches a Celery task (sync_referensi_data_task) for background
-        execution and sets several cache keys for progress tracking.
+        execution and initialises the job state used for progress tracking.
     """
     try:
+        active_sync_id = SingletonLock(SYNC_REFERENSI).holder()
+        if active_sync_id:
+            return JsonResponse({
+                'success': False,
+                'message': 'Sinkronisasi referensi lain sedang berjalan. Tunggu hingga selesai.',
+                'active_sync_id': active_sync_id,
+            }, status=409)
+
         sync_id = str(uuid.uuid4())
 
-        # Initialize cache values for progress tracking BEFORE dispatching
-        cache.set(f'sync_referensi_in_progress_{sync_id}', True, timeout=3600)
-        cache.set(f'sync_referensi_done_{sync_id}', False, timeout=3600)
-        cache.set(f'sync_referensi_started_at_{sync_id}', datetime.now().isoformat(), timeout=3600)
+        # Initialize job state for progress tracking BEFORE dispatching
+        job = JobState(SYNC_REFERENSI, sync_id)
+        job.start(started_at=datetime.now().isoformat())
 
         task_result = sync_referensi_data_task.delay(sync_id, request.user.pk)
-        cache.set(f'sync_referensi_celery_task_id_{sync_id}', task_result.id, timeout=3600)
+        job.update(celery_task_id=task_result.id)
         # Fixed key so the page can recover the sync_id after navigation
         cache.set('sync_referensi_active_sync_id', sync_id, timeout=3600)
 
@@ -337,8 +327,8 @@ def oracle_sync_stop(request):
         JsonResponse: A JSON response confirming the stop request was received.
 
     Side Effects:
-        Revokes the associated Celery task and updates cache keys to mark the
-        sync as stopped with an error message.
+        Revokes the associated Celery task and updates the job state to mark
+        the sync as stopped with an error message.
     """
     try:
         data = json.loads(request.body) if request.content_type == 'application/json' else request.POST
@@ -347,7 +337,8 @@ def oracle_sync_stop(request):
             return JsonResponse({'success': False, 'message': 'sync_id tidak ditemukan'}, status=400)
 
         # Revoke and terminate the Celery task if we have its task ID
-        celery_task_id = cache.get(f'sync_referensi_celery_task_id_{sync_id}')
+        job = JobState(SYNC_REFERENSI, sync_id)
+        celery_task_id = (job.read() or {}).get('celery_task_id')
         if celery_task_id:
             try:
                 from celery import current_app
@@ -356,9 +347,7 @@ def oracle_sync_stop(request):
             except Exception as revoke_err:
                 logger.warning(f'Failed to revoke Celery task {celery_task_id}: {revoke_err}')
 
-        cache.set(f'sync_referensi_stop_requested_{sync_id}', True, timeout=3600)
-        cache.set(f'sync_referensi_error_{sync_id}', 'Sync dihentikan oleh pengguna', timeout=3600)
-        cache.set(f'sync_referensi_done_{sync_id}', True, timeout=3600)
+        job.request_stop('Sync dihentikan oleh pengguna')
 
         return JsonResponse({
             'success': True,
@@ -381,8 +370,8 @@ def oracle_sync_stop_check(request):
         JsonResponse: A JSON response confirming the stop request was received.
 
     Side Effects:
-        Revokes the associated Celery task and updates cache keys to mark the
-        check as stopped with an error message.
+        Revokes the associated Celery task and updates the job state to mark
+        the check as stopped with an error message.
     """
     try:
         data = json.loads(request.body) if request.content_type == 'application/json' else request.POST
@@ -391,7 +380,8 @@ def oracle_sync_stop_check(request):
             return JsonResponse({'success': False, 'message': 'check_id tidak ditemukan'}, status=400)
         
         # Revoke and terminate the Celery task if we have its task ID
-        celery_task_id = cache.get(f'check_referensi_celery_task_id_{check_id}')
+        job = JobState(CHECK_REFERENSI, check_id)
+        celery_task_id = (job.read() or {}).get('celery_task_id')
         if celery_task_id:
             try:
                 from celery import current_app
@@ -400,9 +390,7 @@ def oracle_sync_stop_check(request):
             except Exception as revoke_err:
                 logger.warning(f'Failed to revoke Celery task {celery_task_id}: {revoke_err}')
         
-        cache.set(f'check_referensi_stop_requested_{check_id}', True, timeout=3600)
-        cache.set(f'check_referensi_error_{check_id}', 'Cek Data dihentikan oleh pengguna', timeout=3600)
-        cache.set(f'check_referensi_done_{check_id}', True, timeout=3600)
+        job.request_stop('Cek Data dihentikan oleh pengguna')
         
         return JsonResponse({
             'success': True,
@@ -416,7 +404,7 @@ def oracle_sync_stop_check(request):
 @require_POST
 @never_cache
 def oracle_sync_clear_session(request):
-    """Clear a sync session by deleting all related cache keys.
+    """Clear a sync session by deleting its job state.
 
     Args:
         request: The HTTP POST request object containing 'sync_id' in the body.
@@ -425,27 +413,15 @@ def oracle_sync_clear_session(request):
         JsonResponse: A JSON response indicating whether the session was cleared.
 
     Side Effects:
-        Deletes all cache keys associated with the given sync_id from the cache.
+        Deletes the job state associated with the given sync_id from the cache.
     """
     try:
         sync_id = request.POST.get('sync_id', '')
         if not sync_id:
             return JsonResponse({'success': False, 'message': 'sync_id tidak ditemukan'}, status=400)
         
-        # Delete all cache keys related to this sync
-        cache_keys = [
-            f'sync_referensi_in_progress_{sync_id}',
-            f'sync_referensi_done_{sync_id}',
-            f'sync_referensi_started_at_{sync_id}',
-            f'sync_referensi_result_{sync_id}',
-            f'sync_referensi_error_{sync_id}',
-            f'sync_referensi_stop_requested_{sync_id}',
-            f'sync_referensi_celery_task_id_{sync_id}',
-        ]
-        
-        for key in cache_keys:
-            cache.delete(key)
-        
+        JobState(SYNC_REFERENSI, sync_id).clear()
+
         # Also clear the fixed active-ID key if it still points to this sync
         if cache.get('sync_referensi_active_sync_id') == sync_id:
             cache.delete('sync_referensi_active_sync_id')
@@ -459,6 +435,74 @@ def oracle_sync_clear_session(request):
         return JsonResponse({'success': False, 'message': error_msg or 'Gagal clear session'}, status=500)
 
 
+def _referensi_progress_payload(mode, job_id, state):
+    """Build the progress JSON payload for a referensi check/sync from its job state.
+
+    Shared by oracle_sync_progress (polling) and oracle_sync_events (push).
+
+    Args:
+        mode (str): Either 'check' or 'sync'.
+        job_id (str): The check_id or sync_id.
+        state (dict | None): The dict returned by JobState.read().
+
+    Returns:
+        dict: Payload suitable for JsonResponse.
+    """
+    state = state or {}
+
+    if mode == 'check':
+        if state.get('done'):
+            if state.get('error'):
+                return {
+                    'success': False,
+                    'done': True,
+                    'mode': 'check',
+                    'message': state['error'],
+                }
+            return {
+                'success': True,
+                'done': True,
+                'mode': 'check',
+                'result': state.get('result') or {},
+            }
+        return {
+            'success': True,
+            'done': False,
+            'mode': 'check',
+            'message': 'Check data masih berjalan...',
+            'progress': state.get('progress'),
+        }
+
+    if state.get('done'):
+        if state.get('error'):
+            return {
+                'success': False,
+                'done': True,
+                'message': state['error'],
+            }
+
+        # Build response with download link if error log exists
+        response_data = {
+            'success': True,
+            'done': True,
+            'result': state.get('result') or {},
+        }
+
+        # Add error log download URL if errors were logged
+        if find_failed_rows_file(REFERENSI_FAILED_ROWS_PREFIX, job_id):
+            response_data['error_log_url'] = reverse('oracle_sync_download_errors', kwargs={'sync_id': job_id})
+
+        return response_data
+
+    # Still in progress
+    return {
+        'success': True,
+        'done': False,
+        'message': 'Sync masih berjalan...',
+        'progress': state.get('progress'),
+    }
+
+
 @require_GET
 @never_cache
 def oracle_sync_progress(request):
@@ -477,7 +521,7 @@ def oracle_sync_progress(request):
             or error status depending on the state of the operation.
 
     Side Effects:
-        Reads cache keys for progress tracking (no write operations).
+        Reads the job state in one cache round trip (no write operations).
     """
     try:
         mode = request.GET.get('mode', 'sync')
@@ -485,10 +529,10 @@ def oracle_sync_progress(request):
         # Probe: return active sync_id or check_id from the fixed cache key
         if mode == 'active':
             active_sync_id = cache.get('sync_referensi_active_sync_id')
-            if active_sync_id and not cache.get(f'sync_referensi_done_{active_sync_id}', False):
+            if active_sync_id and not (JobState(SYNC_REFERENSI, active_sync_id).read() or {}).get('done'):
                 return JsonResponse({'success': True, 'active': True, 'type': 'sync', 'sync_id': active_sync_id})
             active_check_id = cache.get('check_referensi_active_check_id')
-            if active_check_id and not cache.get(f'check_referensi_done_{active_check_id}', False):
+            if active_check_id and not (JobState(CHECK_REFERENSI, active_check_id).read() or {}).get('done'):
                 return JsonResponse({'success': True, 'active': True, 'type': 'check', 'check_id': active_check_id})
             return JsonResponse({'success': True, 'active': False})
 
@@ -496,82 +540,58 @@ def oracle_sync_progress(request):
             check_id = request.GET.get('check_id', '')
             if not check_id:
                 return JsonResponse({'success': False, 'message': 'check_id tidak ditemukan'}, status=400)
-
-            is_done = cache.get(f'check_referensi_done_{check_id}', False)
-            if is_done:
-                result = cache.get(f'check_referensi_result_{check_id}')
-                error = cache.get(f'check_referensi_error_{check_id}')
-
-                if error:
-                    return JsonResponse({
-                        'success': False,
-                        'done': True,
-                        'mode': 'check',
-                        'message': error,
-                    })
-
-                return JsonResponse({
-                    'success': True,
-                    'done': True,
-                    'mode': 'check',
-                    'result': result or {},
-                })
-
-            progress = cache.get(f'check_referensi_progress_{check_id}')
-            return JsonResponse({
-                'success': True,
-                'done': False,
-                'mode': 'check',
-                'message': 'Check data masih berjalan...',
-                'progress': progress,
-            })
+            state = JobState(CHECK_REFERENSI, check_id).read()
+            return JsonResponse(_referensi_progress_payload('check', check_id, state))
 
         sync_id = request.GET.get('sync_id', '')
         if not sync_id:
             return JsonResponse({'success': False, 'message': 'sync_id tidak ditemukan'}, status=400)
-        
-        # Check if sync is done
-        is_done = cache.get(f'sync_referensi_done_{sync_id}', False)
-        
-        if is_done:
-            # Get final result or error
-            result = cache.get(f'sync_referensi_result_{sync_id}')
-            error = cache.get(f'sync_referensi_error_{sync_id}')
-            
-            if error:
-                return JsonResponse({
-                    'success': False,
-                    'done': True,
-                    'message': error,
-                })
-            
-            # Build response with download link if error log exists
-            response_data = {
-                'success': True,
-                'done': True,
-                'result': result or {},
-            }
-            
-            # Add error log download URL if errors were logged
-            error_log_path = os.path.join(SYNC_LOGS_DIR, f'sync_referensi_failed_rows_{sync_id}.csv')
-            if os.path.exists(error_log_path):
-                response_data['error_log_url'] = reverse('oracle_sync_download_errors', kwargs={'sync_id': sync_id})
-            
-            return JsonResponse(response_data)
-        
-        # Still in progress
-        progress = cache.get(f'sync_referensi_progress_{sync_id}')
-        return JsonResponse({
-            'success': True,
-            'done': False,
-            'message': 'Sync masih berjalan...',
-            'progress': progress,
-        })
+        state = JobState(SYNC_REFERENSI, sync_id).read()
+        return JsonResponse(_referensi_progress_payload('sync', sync_id, state))
     except Exception as exc:
         error_msg = str(exc).strip()
         return JsonResponse({'success': False, 'message': error_msg or 'Gagal mendapatkan progress'}, status=500)
 
 
+@require_GET
+@never_cache
+def oracle_sync_events(request):
+    """Stream progress of a sync or check operation as Server-Sent Events.
+
+    Same parameters and payload as oracle_sync_progress (modes 'sync' and
+    'check'), but updates are pushed over one open connection whenever the
+    job state changes. The stream closes when the job is done or after
+    STREAM_TIMEOUT seconds; EventSource then reconnects on its own.
+
+    Args:
+        request: The HTTP GET request object with query parameters:
+            - mode (str): Either 'sync' or 'check'.
+            - sync_id (str, optional): Required when mode is 'sync'.
+            - check_id (str, optional): Required when mode is 'check'.
+
+    Returns:
+        StreamingHttpResponse: A 'text/event-stream' response, or a
+            JsonResponse with status 400 when the id is missing.
+    """
+    mode = 'check' if request.GET.get('mode', 'sync') == 'check' else 'sync'
+    param = 'check_id' if mode == 'check' else 'sync_id'
+    job_id = request.GET.get(param, '')
+    if not job_id:
+        return JsonResponse({'success': False, 'message': f'{param} tidak ditemukan'}, status=400)
+
+    job = JobState(CHECK_REFERENSI if mode == 'check' else SYNC_REFERENSI, job_id)
+
+    def _stream():
+        yield 'retry: 2000\n\n'
+        for state in job.listen():
+            payload = _referensi_progress_payload(mode, job_id, state)
+            yield f'data: {json.dumps(payload, cls=DjangoJSONEncoder)}\n\n'
+
+    response = StreamingHttpResponse(_stream(), content_type='text/event-stream')
+    response['X-Accel-Buffering'] = 'no'  # disable Nginx proxy buffering
+    return response
+
+
 @login_required
 @user_passes_test(_is_admin_user)
 @require_POST
@@ -822,35 +842,35 @@ def _sync_referensi_data(service, sync_id=None, request=None, progress_callback=
         summary = service.sync(progress_callback=progress_callback)
         summary_dict = summary.as_dict() if hasattr(summary, 'as_dict') else {'message': 'Sync completed'}
         
-        # Log any errors to CSV file
+        # Log any errors to CSV file (buffered, appended in batches)
         has_data_to_log = False
         
-        if sync_id and hasattr(summary, 'errors') and summary.errors:
-            has_data_to_log = True
-            for idx, error_msg in enumerate(summary.errors, 1):
-                _log_failed_row(
-                    sync_id,
-                    row_identifier=f"Error {idx}",
-                    category="Sync Error",
-                    error_msg=error_msg,
-                    row_number=idx
-                )
-        
-        # Log skipped rows from table summaries (per-row detail)
-        if sync_id and hasattr(summary, 'table_summaries') and summary.table_summaries:
-            for table_summary in summary.table_summaries:
-                skipped_detail = getattr(table_summary, 'skipped_rows_detail', [])
-                if skipped_detail:
+        if sync_id:
+            with FailedRowWriter(failed_rows_path(REFERENSI_FAILED_ROWS_PREFIX, sync_id), REFERENSI_FAILED_ROWS_HEADER) as failed_rows:
+                for idx, error_msg in enumerate(getattr(summary, 'errors', None) or [], 1):
                     has_data_to_log = True
-                    table_name = getattr(table_summary, 'table_name', 'unknown')
-                    for detail in skipped_detail:
-                        _log_failed_row(
-                            sync_id,
-                            row_identifier=f"{table_name}:{detail.get('key', '-')}",
-                            category="Skipped Row (FK missing)",
-                            error_msg=detail.get('reason', 'Unknown'),
-                            row_number=detail.get('row_number')
-                        )
+                    _log_failed_row(
+                        failed_rows,
+                        row_identifier=f"Error {idx}",
+                        category="Sync Error",
+                        error_msg=error_msg,
+                        row_number=idx
+                    )
+                
+                # Log skipped rows from table summaries (per-row detail)
+                for table_summary in getattr(summary, 'table_summaries', None) or []:
+                    skipped_detail = getattr(table_summary, 'skipped_rows_detail', [])
+                    if skipped_detail:
+                        has_data_to_log = True
+                        table_name = getattr(table_summary, 'table_name', 'unknown')
+                        for detail in skipped_detail:
+                            _log_failed_row(
+                                failed_rows,
+                                row_identifier=f"{table_name}:{detail.get('key', '-')}",
+                                category="Skipped Row (FK missing)",
+                                error_msg=detail.get('reason', 'Unknown'),
+                                row_number=detail.get('row_number')
+                            )
         
         # Store flag indicating if error log exists
         if sync_id and has_data_to_log:
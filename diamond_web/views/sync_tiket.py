@@ -1,11 +1,11 @@
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.http import JsonResponse, FileResponse
+from django.http import JsonResponse, FileResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.views.decorators.http import require_GET, require_POST
 from django.views.decorators.cache import never_cache
 from django.db.models import Q
 from django.utils import timezone
-from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.urls import reverse
 from datetime import datetime, timedelta
 import uuid
@@ -16,17 +16,29 @@ import time
 import re
 from functools import wraps
 import os
-import csv
 
 from ..models import Tiket, BentukData, CaraPenyampaian, PeriodeJenisData, JenisPrioritasData, StatusPenelitian, PIC, TiketPIC, TiketAction
 from ..constants.tiket_action_types import PICActionType
 from ..utils.oracle_sync import OracleDataSyncService, OracleSyncConfigError
+from ..utils.job_state import JobState, CHECK_TIKET, SYNC_TIKET, EMPTY_PROGRESS
+from ..utils.task_lock import SingletonLock
+from ..utils.sla import recompute_sla
+from ..utils.sync_log import (
+    SYNC_LOGS_DIR,
+    TIKET_FAILED_ROWS_PREFIX,
+    FailedRowWriter,
+    failed_rows_path,
+    find_failed_rows_file,
+    open_failed_rows,
+)
+from ..utils.tiket_dossier import invalidate_all_tiket_dossiers
+from ..utils import tiket_timeline
+from ..utils.filter_options import invalidate_tiket_years
 from ..tasks import sync_tiket_data_task, check_tiket_data_task
 
 logger = logging.getLogger(__name__)
 
 # Create logs directory if it doesn't exist
-SYNC_LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'sync_logs')
 os.makedirs(SYNC_LOGS_DIR, exist_ok=True)
 
 # Single shared Oracle query used by both _check_tiket_data and _sync_tiket_data.
@@ -378,12 +390,12 @@ def sync_tiket_check(request):
     """
     try:
         check_id = str(uuid.uuid4())
-        cache.set(f'check_tiket_done_{check_id}', False, timeout=3600)
-        cache.set(f'check_tiket_in_progress_{check_id}', True, timeout=3600)
+        job = JobState(CHECK_TIKET, check_id)
+        job.start()
 
         logger.info(f'Dispatching tiket check task (check_id={check_id})...')
         task_result = check_tiket_data_task.delay(check_id)
-        cache.set(f'check_tiket_celery_task_id_{check_id}', task_result.id, timeout=3600)
+        job.update(celery_task_id=task_result.id)
 
         return JsonResponse({
             'success': True,
@@ -429,20 +441,28 @@ def sync_tiket_run(request):
         a message indicating the sync has started.
 
     Raises:
+        409: If another tiket sync is still running.
         400: If Oracle configuration is invalid.
         500: If an unexpected error occurs during dispatch.
     """
     try:
+        active_sync_id = SingletonLock(SYNC_TIKET).holder()
+        if active_sync_id:
+            return JsonResponse({
+                'success': False,
+                'message': 'Sinkronisasi tiket lain sedang berjalan. Tunggu hingga selesai.',
+                'active_sync_id': active_sync_id,
+            }, status=409)
+
         # Generate unique sync ID for tracking progress and stop signals
         sync_id = str(uuid.uuid4())
-        cache.set(f'sync_tiket_stop_{sync_id}', False, timeout=3600)
-        cache.set(f'sync_tiket_done_{sync_id}', False, timeout=3600)
-        cache.set(f'sync_tiket_in_progress_{sync_id}', True, timeout=3600)
+        job = JobState(SYNC_TIKET, sync_id)
+        job.start()
 
         logger.info(f'Starting tiket sync (sync_id={sync_id})...')
 
         task_result = sync_tiket_data_task.delay(sync_id, request.user.pk)
-        cache.set(f'sync_tiket_celery_task_id_{sync_id}', task_result.id, timeout=3600)
+        job.update(celery_task_id=task_result.id)
 
         logger.info(f'Celery sync task dispatched (sync_id={sync_id})')
 
@@ -496,7 +516,8 @@ def sync_tiket_stop(request):
             return JsonResponse({'success': False, 'message': 'invalid sync_id'}, status=400)
 
         # Revoke and terminate the Celery task if we have its task ID
-        celery_task_id = cache.get(f'sync_tiket_celery_task_id_{sync_id}')
+        job = JobState(SYNC_TIKET, sync_id)
+        celery_task_id = (job.read() or {}).get('celery_task_id')
         if celery_task_id:
             try:
                 from celery import current_app
@@ -505,9 +526,7 @@ def sync_tiket_stop(request):
             except Exception as revoke_err:
                 logger.warning(f'Failed to revoke Celery task {celery_task_id}: {revoke_err}')
 
-        cache.set(f'sync_tiket_stop_{sync_id}', True, timeout=3600)
-        cache.set(f'sync_tiket_error_{sync_id}', 'Sync dihentikan oleh pengguna', timeout=3600)
-        cache.set(f'sync_tiket_done_{sync_id}', True, timeout=3600)
+        job.request_stop('Sync dihentikan oleh pengguna')
 
         request.session.modified = False
         return JsonResponse({'success': True, 'message': 'Sync dihentikan.'})
@@ -516,6 +535,72 @@ def sync_tiket_stop(request):
         return JsonResponse({'success': False, 'message': error_msg}, status=500)
 
 
+def _validate_job_id(request, mode):
+    """Return ``(job_id, error_response)`` for the id query parameter of *mode*."""
+    param = 'check_id' if mode == 'check' else 'sync_id'
+    job_id = request.GET.get(param)
+    if not job_id:
+        return None, JsonResponse({'success': False, 'message': f'{param} required'}, status=400)
+    try:
+        uuid.UUID(job_id)
+    except (ValueError, TypeError):
+        return None, JsonResponse({'success': False, 'message': f'invalid {param}'}, status=400)
+    return job_id, None
+
+
+def _tiket_progress_payload(mode, job_id, state):
+    """Build the progress JSON payload for a tiket check/sync from its job state.
+
+    Shared by the polling endpoint (sync_tiket_progress) and the push
+    endpoint (sync_tiket_events) so both report the same shape.
+
+    Args:
+        mode: 'check' or 'sync'.
+        job_id: The check_id or sync_id.
+        state: The dict returned by JobState.read(), or None when absent.
+
+    Returns:
+        dict suitable for JsonResponse.
+    """
+    progress_data = (state or {}).get('progress') or dict(EMPTY_PROGRESS)
+
+    # No state → session expired or never started → tell browser to clear up
+    if state is None:
+        label = 'check' if mode == 'check' else 'sync'
+        return {'success': False, 'done': True, 'progress': progress_data,
+                'message': f'Session {label} kadaluarsa atau tidak ditemukan.'}
+
+    if not state.get('done'):
+        return {'success': True, 'done': False, 'progress': progress_data}
+
+    result = state.get('result')
+    error = state.get('error')
+    if error:
+        return {'success': False, 'done': True, 'progress': progress_data, 'message': error}
+    if not result:
+        # Done but no result yet (race), treat as still running
+        return {'success': True, 'done': False, 'progress': progress_data}
+
+    if mode == 'check':
+        return {
+            'success': True, 'done': True,
+            'progress': progress_data, 'summary': result,
+            'message': f"Check selesai: {result.get('inserts', 0)} akan insert, {result.get('updates', 0)} akan update",
+        }
+
+    response_data = {
+        'success': True,
+        'done': True,
+        'progress': progress_data,
+        'summary': result,
+        'message': f"Sync selesai: {result.get('inserts', 0)} insert, {result.get('updates', 0)} update, {len(result.get('errors', []))} error",
+    }
+    # Add error log download URL if CSV exists
+    if find_failed_rows_file(TIKET_FAILED_ROWS_PREFIX, job_id):
+        response_data['error_log_url'] = reverse('sync_tiket_download_errors', kwargs={'sync_id': job_id})
+    return response_data
+
+
 @require_GET
 @never_cache
 def sync_tiket_progress(request):
@@ -524,7 +609,7 @@ def sync_tiket_progress(request):
     No authentication check is performed to avoid session lock contention.
     Supports two modes: 'check' (dry-run comparison) and 'sync' (data sync).
     Returns progress data including current/total rows, percentage, inserts,
-    updates, and errors.
+    updates, and errors. The whole job state is read in one cache round trip.
 
     Args:
         request: The incoming HTTP request. Expects 'mode' (default 'sync')
@@ -540,118 +625,59 @@ def sync_tiket_progress(request):
         session saves during polling.
     """
     try:
-        mode = request.GET.get('mode', 'sync')
+        mode = 'check' if request.GET.get('mode', 'sync') == 'check' else 'sync'
         request.session.modified = False
 
-        if mode == 'check':
-            check_id = request.GET.get('check_id')
-            if not check_id:
-                return JsonResponse({'success': False, 'message': 'check_id required'}, status=400)
-            try:
-                uuid.UUID(check_id)
-            except (ValueError, TypeError):
-                return JsonResponse({'success': False, 'message': 'invalid check_id'}, status=400)
-
-            is_done = cache.get(f'check_tiket_done_{check_id}')   # None = key absent
-            is_in_progress = cache.get(f'check_tiket_in_progress_{check_id}')  # None = key absent
-            progress_data = cache.get(f'check_tiket_progress_{check_id}') or {
-                'current': 0, 'total': 0, 'percentage': 0,
-                'inserts': 0, 'updates': 0, 'errors': 0,
-            }
+        job_id, error_response = _validate_job_id(request, mode)
+        if error_response:
+            return error_response
 
-            # Both keys absent → session expired or never started → tell browser to clear up
-            if is_done is None and is_in_progress is None:
-                return JsonResponse({'success': False, 'done': True, 'progress': progress_data,
-                                     'message': 'Session check kadaluarsa atau tidak ditemukan.'})
-
-            if is_done:
-                result = cache.get(f'check_tiket_result_{check_id}')
-                error = cache.get(f'check_tiket_error_{check_id}')
-                if error:
-                    return JsonResponse({'success': False, 'done': True, 'progress': progress_data, 'message': error})
-                if result:
-                    return JsonResponse({
-                        'success': True, 'done': True,
-                        'progress': progress_data, 'summary': result,
-                        'message': f"Check selesai: {result.get('inserts', 0)} akan insert, {result.get('updates', 0)} akan update",
-                    })
-                # Done but no result yet (race), treat as still running
-                return JsonResponse({'success': True, 'done': False, 'progress': progress_data})
-
-            return JsonResponse({'success': True, 'done': False, 'progress': progress_data})
-
-        # Default: mode=sync
-        sync_id = request.GET.get('sync_id')
-        if not sync_id:
-            return JsonResponse({'success': False, 'message': 'sync_id required'}, status=400)
-        
-        # Validate sync_id format (UUID)
-        try:
-            uuid.UUID(sync_id)
-        except (ValueError, TypeError):
-            return JsonResponse({'success': False, 'message': 'invalid sync_id'}, status=400)
-        
-        # Check if sync is done
-        is_done = cache.get(f'sync_tiket_done_{sync_id}')          # None = key absent
-        is_in_progress = cache.get(f'sync_tiket_in_progress_{sync_id}')  # None = key absent
-
-        # Both keys absent → session expired → tell browser to clean up
-        if is_done is None and is_in_progress is None:
-            return JsonResponse({'success': False, 'done': True,
-                                 'progress': {'current': 0, 'total': 0, 'percentage': 0,
-                                              'inserts': 0, 'updates': 0, 'errors': 0},
-                                 'message': 'Session sync kadaluarsa atau tidak ditemukan.'})
-
-        # Get progress data
-        progress_data = cache.get(f'sync_tiket_progress_{sync_id}')
-        if progress_data is None:
-            progress_data = {
-                'current': 0,
-                'total': 0,
-                'percentage': 0,
-                'inserts': 0,
-                'updates': 0,
-                'errors': 0,
-            }
-        
-        # If done, check for result or error
-        if is_done:
-            result = cache.get(f'sync_tiket_result_{sync_id}')
-            error = cache.get(f'sync_tiket_error_{sync_id}')
-            
-            if error:
-                return JsonResponse({
-                    'success': False,
-                    'done': True,
-                    'progress': progress_data,
-                    'message': error,
-                })
-            
-            if result:
-                response_data = {
-                    'success': True,
-                    'done': True,
-                    'progress': progress_data,
-                    'summary': result,
-                    'message': f"Sync selesai: {result.get('inserts', 0)} insert, {result.get('updates', 0)} update, {len(result.get('errors', []))} error",
-                }
-                # Add error log download URL if CSV exists
-                error_log_path = os.path.join(SYNC_LOGS_DIR, f'sync_failed_rows_{sync_id}.csv')
-                if os.path.exists(error_log_path):
-                    response_data['error_log_url'] = reverse('sync_tiket_download_errors', kwargs={'sync_id': sync_id})
-                return JsonResponse(response_data)
-        
-        return JsonResponse({
-            'success': True,
-            'done': False,
-            'progress': progress_data,
-        })
+        job = JobState(CHECK_TIKET if mode == 'check' else SYNC_TIKET, job_id)
+        return JsonResponse(_tiket_progress_payload(mode, job_id, job.read()))
     except Exception as exc:
         error_msg = str(exc).strip()
         logger.error(f'Exception in progress endpoint: {error_msg}', exc_info=True)
         return JsonResponse({'success': False, 'message': error_msg}, status=500)
 
 
+@require_GET
+@never_cache
+def sync_tiket_events(request):
+    """Stream progress of a check or sync operation as Server-Sent Events.
+
+    Same parameters and payload as sync_tiket_progress, but the browser keeps
+    one connection open and receives an event each time the job state
+    changes (pushed via Redis pub/sub). The stream ends when the job is done
+    or after STREAM_TIMEOUT seconds, after which EventSource reconnects.
+
+    Args:
+        request: The incoming HTTP request. Expects 'mode' (default 'sync')
+            and either 'check_id' or 'sync_id' query parameters.
+
+    Returns:
+        StreamingHttpResponse with content type 'text/event-stream', or
+        JsonResponse 400 if the id parameter is missing or invalid.
+    """
+    mode = 'check' if request.GET.get('mode', 'sync') == 'check' else 'sync'
+    request.session.modified = False
+
+    job_id, error_response = _validate_job_id(request, mode)
+    if error_response:
+        return error_response
+
+    job = JobState(CHECK_TIKET if mode == 'check' else SYNC_TIKET, job_id)
+
+    def _stream():
+        yield 'retry: 2000\n\n'
+        for state in job.listen():
+            payload = _tiket_progress_payload(mode, job_id, state)
+            yield f'data: {json.dumps(payload, cls=DjangoJSONEncoder)}\n\n'
+
+    response = StreamingHttpResponse(_stream(), content_type='text/event-stream')
+    response['X-Accel-Buffering'] = 'no'  # disable Nginx proxy buffering
+    return response
+
+
 
 @login_required
 @user_passes_test(_is_admin_user)
@@ -661,8 +687,9 @@ def sync_tiket_truncate(request):
     """Delete all tiket records and reset the primary key sequence.
 
     Removes all dependent records (DetilTandaTerima, BackupData,
-    TiketAction, TiketPIC) before deleting all Tiket rows. Resets
-    the auto-increment sequence in a database-agnostic way.
+    TiketAction, TiketActionArchive, TiketLatestAction, TiketPIC) before
+    deleting all Tiket rows. Resets the auto-increment sequence in a
+    database-agnostic way.
 
     Args:
         request: The incoming HTTP request (must be POST).
@@ -673,18 +700,21 @@ def sync_tiket_truncate(request):
 
     Side Effects:
         Deletes all rows from DetilTandaTerima, BackupData, TiketAction,
-        TiketPIC, and Tiket tables. Resets the primary key sequence.
+        TiketActionArchive, TiketLatestAction, TiketPIC, and Tiket tables.
+        Resets the primary key sequence.
     """
     try:
         from django.db import connection
         
         # Delete all dependent records in correct order before Tiket (all have PROTECT FK)
-        from ..models import TiketPIC, TiketAction
+        from ..models import TiketPIC, TiketAction, TiketActionArchive, TiketLatestAction
         from ..models.backup_data import BackupData
         from ..models.detil_tanda_terima import DetilTandaTerima
         DetilTandaTerima.objects.all().delete()
         BackupData.objects.all().delete()
         TiketAction.objects.all().delete()
+        TiketActionArchive.objects.all().delete()
+        TiketLatestAction.objects.all().delete()
         TiketPIC.objects.all().delete()
         
         count = Tiket.objects.all().count()
@@ -714,61 +744,43 @@ def sync_tiket_truncate(request):
         return JsonResponse({'success': False, 'message': error_msg}, status=500)
 
 
-def _log_failed_row(sync_id, nomor_tiket, periode_str, jenis_prioritas_str, tahun_data, error_msg, row_number=None):
-    """Log a failed row to a CSV file for review and debugging.
+TIKET_FAILED_ROWS_HEADER = ['Row Number', 'Nomor Tiket', 'Jenis Prioritas', 'Tahun', 'Periode', 'Error Reason']
+
+
+def _failed_rows_writer(sync_id):
+    """Return a buffered writer for 'sync_failed_rows_{sync_id}.csv', or None without sync_id."""
+    if not sync_id:
+        return None
+    return FailedRowWriter(failed_rows_path(TIKET_FAILED_ROWS_PREFIX, sync_id), TIKET_FAILED_ROWS_HEADER)
+
+
+def _log_failed_row(failed_rows, nomor_tiket, periode_str, jenis_prioritas_str, tahun_data, error_msg, row_number=None):
+    """Record a failed row for review and debugging.
 
-    Creates or appends to a CSV file named 'sync_failed_rows_{sync_id}.csv'
-    in the sync_logs directory. Each row contains timestamp, row number,
-    ticket identifier, metadata, and the error reason.
+    Rows are buffered by *failed_rows* and appended to the run's
+    'sync_failed_rows_{sync_id}.csv' in the sync_logs directory in batches.
+    Each row contains timestamp, row number, ticket identifier, metadata,
+    and the error reason.
 
     Args:
-        sync_id: Unique identifier for the sync run.
+        failed_rows: FailedRowWriter of the sync run (ignored when None).
         nomor_tiket: The ticket number that failed.
         periode_str: The period string from Oracle data.
         jenis_prioritas_str: The jenis prioritas string from Oracle data.
         tahun_data: The year data from Oracle.
         error_msg: Description of the error that occurred.
         row_number: Optional 1-based row number in the source data.
-
-    Side Effects:
-        Writes a row to a CSV log file on disk.
     """
-    try:
-        # Create CSV log file for this sync run
-        log_filename = os.path.join(SYNC_LOGS_DIR, f'sync_failed_rows_{sync_id}.csv')
-        
-        # Write header if file doesn't exist
-        file_exists = os.path.exists(log_filename)
-        
-        with open(log_filename, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header on first row
-            if not file_exists:
-                writer.writerow([
-                    'Timestamp',
-                    'Row Number',
-                    'Nomor Tiket',
-                    'Jenis Prioritas',
-                    'Tahun',
-                    'Periode',
-                    'Error Reason'
-                ])
-            
-            # Write failed row data
-            writer.writerow([
-                timezone.now().isoformat(),
-                row_number or '-',
-                nomor_tiket or '-',
-                jenis_prioritas_str or '-',
-                tahun_data or '-',
-                periode_str or '-',
-                error_msg or 'Unknown error'
-            ])
-        
-        logger.debug(f"Failed row logged to {log_filename}")
-    except Exception as e:
-        logger.error(f"Failed to log error row: {str(e)}")
+    if failed_rows is None:
+        return
+    failed_rows.writerow([
+        row_number or '-',
+        nomor_tiket or '-',
+        jenis_prioritas_str or '-',
+        tahun_data or '-',
+        periode_str or '-',
+        error_msg or 'Unknown error'
+    ])
 
 
 @require_GET
@@ -790,12 +802,12 @@ def sync_tiket_download_errors(request, sync_id):
         except (ValueError, TypeError):
             return JsonResponse({'success': False, 'message': 'Invalid sync_id format'}, status=400)
         
-        error_log_path = os.path.join(SYNC_LOGS_DIR, f'sync_failed_rows_{sync_id}.csv')
+        error_log_path = find_failed_rows_file(TIKET_FAILED_ROWS_PREFIX, sync_id)
         
-        if not os.path.exists(error_log_path):
+        if error_log_path is None:
             return JsonResponse({'success': False, 'message': 'Error log file not found'}, status=404)
         
-        response = FileResponse(open(error_log_path, 'rb'), content_type='text/csv')
+        response = FileResponse(open_failed_rows(error_log_path), content_type='text/csv')
         response['Content-Disposition'] = f'attachment; filename="sync_tiket_errors_{sync_id}.csv"'
         return response
     except Exception as exc:
@@ -834,7 +846,8 @@ def sync_tiket_stop_check(request):
             return JsonResponse({'success': False, 'message': 'invalid check_id'}, status=400)
         
         # Revoke and terminate the Celery task if we have its task ID
-        celery_task_id = cache.get(f'check_tiket_celery_task_id_{check_id}')
+        job = JobState(CHECK_TIKET, check_id)
+        celery_task_id = (job.read() or {}).get('celery_task_id')
         if celery_task_id:
             try:
                 from celery import current_app
@@ -843,9 +856,7 @@ def sync_tiket_stop_check(request):
             except Exception as revoke_err:
                 logger.warning(f'Failed to revoke Celery task {celery_task_id}: {revoke_err}')
         
-        cache.set(f'check_tiket_stop_requested_{check_id}', True, timeout=3600)
-        cache.set(f'check_tiket_error_{check_id}', 'Cek Data dihentikan oleh pengguna', timeout=3600)
-        cache.set(f'check_tiket_done_{check_id}', True, timeout=3600)
+        job.request_stop('Cek Data dihentikan oleh pengguna')
         
         request.session.modified = False
         return JsonResponse({'success': True, 'message': 'Permintaan stop cek data telah dikirim.'})
@@ -950,6 +961,7 @@ def _assign_tiket_pics_sync(tiket, periode_jenis_data, today, base_time, request
             TiketPIC.objects.bulk_create(tiket_pics_to_create, batch_size=batch_size, ignore_conflicts=False)
         if tiket_actions_to_create:
             TiketAction.objects.bulk_create(tiket_actions_to_create, batch_size=batch_size, ignore_conflicts=False)
+            tiket_timeline.record_latest_actions(tiket_actions_to_create)
     except Exception:
         # Silently skip PIC assignment if it fails (don't block sync)
         pass
@@ -1148,7 +1160,7 @@ def _check_tiket_data(service, check_id=None, stop_checker=None):
     """Check tiket data from Oracle without inserting.
     
     Uses a single bulk DB query for exists-check instead of per-row .exists().
-    Writes progress to cache every 1000 rows when check_id is provided.
+    Writes progress to the job state every 1000 rows when check_id is provided.
     
     Args:
         service: OracleDataSyncService instance
@@ -1157,13 +1169,10 @@ def _check_tiket_data(service, check_id=None, stop_checker=None):
     """
     try:
         sql_query = _TIKET_ORACLE_SQL
+        job = JobState(CHECK_TIKET, check_id) if check_id else None
 
-        if check_id:
-            cache.set(f'check_tiket_progress_{check_id}', {
-                'current': 0, 'total': 0, 'percentage': 0,
-                'inserts': 0, 'updates': 0, 'errors': 0,
-                'table_name': 'Menghubungkan ke Oracle...',
-            }, timeout=3600)
+        if job:
+            job.set_progress(**EMPTY_PROGRESS, table_name='Menghubungkan ke Oracle...')
 
         with service._connect_oracle("primary") as conn:
             with conn.cursor() as cursor:
@@ -1186,12 +1195,12 @@ def _check_tiket_data(service, check_id=None, stop_checker=None):
             f'Periode lookup cache loaded: {len(valid_sub_jenis_ids)} sub_jenis_data with PeriodeJenisData'
         )
 
-        if check_id:
-            cache.set(f'check_tiket_progress_{check_id}', {
-                'current': 0, 'total': total, 'percentage': 0,
-                'inserts': 0, 'updates': 0, 'errors': 0,
-                'table_name': f'Memeriksa {total:,} baris...',
-            }, timeout=3600)
+        if job:
+            job.set_progress(
+                current=0, total=total, percentage=0,
+                inserts=0, updates=0, errors=0,
+                table_name=f'Memeriksa {total:,} baris...',
+            )
 
         # --- Bulk exists check: chunked to avoid SQLite variable limit ---
         all_nomor_tikets = []
@@ -1248,13 +1257,13 @@ def _check_tiket_data(service, check_id=None, stop_checker=None):
                 errors.append(f"Row error: {str(e)[:100]}")
 
             # Write progress every 1000 rows
-            if check_id and (idx % 1000 == 0 or idx == total - 1):
+            if job and (idx % 1000 == 0 or idx == total - 1):
                 pct = int((idx + 1) / total * 100) if total else 100
-                cache.set(f'check_tiket_progress_{check_id}', {
-                    'current': idx + 1, 'total': total, 'percentage': pct,
-                    'inserts': inserts, 'updates': updates, 'errors': len(errors),
-                    'table_name': 'Memeriksa baris...',
-                }, timeout=3600)
+                job.set_progress(
+                    current=idx + 1, total=total, percentage=pct,
+                    inserts=inserts, updates=updates, errors=len(errors),
+                    table_name='Memeriksa baris...',
+                )
         
         return {
             'source_rows': total,
@@ -1293,7 +1302,12 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
         request: optional Django request for user info
         stop_checker: optional callable() that returns True if sync should stop
     """
+    failed_rows = _failed_rows_writer(sync_id)
     try:
+        job = JobState(SYNC_TIKET, sync_id) if sync_id else None
+        # Rate-limited: hits the cache every STOP_CHECK_EVERY rows / STOP_CHECK_INTERVAL s
+        user_stop_requested = job.stop_checker() if job else None
+
         # Detect database and set appropriate batch sizes
         from django.db import connection
         db_vendor = connection.vendor  # 'sqlite', 'postgresql', 'mysql'
@@ -1353,6 +1367,8 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
         errors = []
         inserted_keys = []
         updated_keys = []
+        # bulk_create/bulk_update bypass the SLA post_save receiver
+        sla_tiket_ids = []
         
         logger.info('Setting up default lookups...')
         default_bentuk_data = bentuk_data_cache.get('Softcopy') or BentukData.objects.first()
@@ -1369,7 +1385,7 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
         # First pass: validate and parse all rows
         for idx, row in enumerate(rows):
             # Check if sync was stopped
-            if sync_id and cache.get(f'sync_tiket_stop_{sync_id}'):
+            if user_stop_requested and user_stop_requested():
                 errors.append('Sync dihentikan oleh pengguna')
                 logger.info('Sync stopped by user')
                 break
@@ -1379,17 +1395,17 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                 logger.warning(f'Stop signal received during sync after {idx} rows')
                 break
             
-            # Update progress every 50 rows
-            if idx % 50 == 0 and sync_id:
+            # Update progress every 500 rows (one state write + push per update)
+            if idx % 500 == 0 and job:
                 progress_pct = int((idx / len(rows) * 100)) if rows else 0
-                cache.set(f'sync_tiket_progress_{sync_id}', {
-                    'current': idx,
-                    'total': len(rows),
-                    'percentage': progress_pct,
-                    'inserts': inserts,
-                    'updates': updates,
-                    'errors': len(errors),
-                }, timeout=3600)
+                job.set_progress(
+                    current=idx,
+                    total=len(rows),
+                    percentage=progress_pct,
+                    inserts=inserts,
+                    updates=updates,
+                    errors=len(errors),
+                )
             
             try:
                 row_dict = dict(zip(column_names, row))
@@ -1407,7 +1423,7 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                 if tahun_data is None:
                     error_msg = "Tahun data kosong/tidak valid"
                     errors.append(f"Tiket {nomor_tiket}: {error_msg}")
-                    _log_failed_row(sync_id, nomor_tiket, row_dict.get('periode_data'), jenis_prioritas_str, row_dict.get('tahun_data'), error_msg, row_number=idx+1)
+                    _log_failed_row(failed_rows, nomor_tiket, row_dict.get('periode_data'), jenis_prioritas_str, row_dict.get('tahun_data'), error_msg, row_number=idx+1)
                     continue
                 
                 periode_str = row_dict.get('periode_data')
@@ -1422,7 +1438,7 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                 if not periode_jenis_data_obj:
                     error_msg = f"Periode '{periode_str}' not found in database"
                     errors.append(f"Tiket {nomor_tiket}: {error_msg}")
-                    _log_failed_row(sync_id, nomor_tiket, periode_str, jenis_prioritas_str, tahun_data, error_msg, row_number=idx+1)
+                    _log_failed_row(failed_rows, nomor_tiket, periode_str, jenis_prioritas_str, tahun_data, error_msg, row_number=idx+1)
                     continue
                 
                 status_penelitian_obj = None
@@ -1521,7 +1537,7 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                     row_jenis = ''
                     row_tahun = ''
                 errors.append(f"Tiket {row_id}: {error_msg}")
-                _log_failed_row(sync_id, row_id, row_periode, row_jenis, row_tahun, 
+                _log_failed_row(failed_rows, row_id, row_periode, row_jenis, row_tahun, 
                               error_msg, row_number=idx+1)
         
         # Bulk insert new records
@@ -1532,6 +1548,7 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                 try:
                     created_objs = Tiket.objects.bulk_create(batch, batch_size=BATCH_SIZE, ignore_conflicts=False)
                     inserts += len(created_objs)
+                    sla_tiket_ids.extend(t.pk for t in created_objs if t.pk)
                     if len(inserted_keys) < 5:
                         inserted_keys.extend([t.nomor_tiket for t in created_objs[:5-len(inserted_keys)]])
 
@@ -1564,7 +1581,7 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                             errors.append(f"Tiket {tiket_obj.nomor_tiket}: {error_msg}")
                             logger.error(f"Failed to insert tiket {tiket_obj.nomor_tiket}: {error_msg}")
                             _log_failed_row(
-                                sync_id, tiket_obj.nomor_tiket,
+                                failed_rows, tiket_obj.nomor_tiket,
                                 str(getattr(tiket_obj, 'periode', '?')),
                                 str(getattr(tiket_obj, 'id_jenis_prioritas_data', '') 
                                     if getattr(tiket_obj, 'id_jenis_prioritas_data', None) else ''),
@@ -1601,6 +1618,7 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                     try:
                         Tiket.objects.bulk_update(batch_objs, batch_size=BATCH_SIZE, fields=list(batch_updates.keys()))
                         updates += len(batch)
+                        sla_tiket_ids.extend(t.pk for t in batch_objs)
                         if len(updated_keys) < 5:
                             updated_keys.extend([t[0] for t in batch[:5-len(updated_keys)]])
                     except Exception as bulk_error:
@@ -1622,7 +1640,7 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                                 errors.append(f"Tiket {nomor_tiket}: {error_msg}")
                                 logger.error(f"Failed to update tiket {nomor_tiket}: {error_msg}")
                                 _log_failed_row(
-                                    sync_id, nomor_tiket,
+                                    failed_rows, nomor_tiket,
                                     str(getattr(tiket_obj, 'periode', '?')),
                                     str(getattr(tiket_obj, 'id_jenis_prioritas_data', '') 
                                         if getattr(tiket_obj, 'id_jenis_prioritas_data', None) else ''),
@@ -1630,6 +1648,9 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
                                     error_msg
                                 )
 
+        for i in range(0, len(sla_tiket_ids), BATCH_SIZE):
+            recompute_sla(Tiket.objects.filter(pk__in=sla_tiket_ids[i:i + BATCH_SIZE]))
+
         # --- Auto-settle qualifying tickets to Selesai after sync ---
         # Find PeriodeJenisData records linked to "Tidak Diidentifikasi" JenisTabel,
         # then update all matching Tiket records.
@@ -1677,3 +1698,9 @@ def _sync_tiket_data(service, sync_id=None, request=None, stop_checker=None):
             'inserted_keys': [],
             'updated_keys': [],
         }
+    finally:
+        if failed_rows is not None:
+            failed_rows.close()
+        # bulk_create/bulk_update bypass the dossier and year option invalidation signals
+        invalidate_all_tiket_dossiers()
+        invalidate_tiket_years()
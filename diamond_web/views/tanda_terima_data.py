@@ -20,6 +20,7 @@ from ..constants.tiket_action_types import TandaTerimaActionType
 from ..constants.tiket_status import STATUS_DIREKAM, STATUS_DITELITI
 from .mixins import AjaxFormMixin, UserP3DERequiredMixin, ActiveTiketP3DERequiredForEditMixin, SafeDeleteMixin
 from ..constants.tiket_status import STATUS_DIKIRIM_KE_PIDE
+from ..utils.db_routing import use_reporting_db
 
 
 class TandaTerimaDataListView(LoginRequiredMixin, UserP3DERequiredMixin, TemplateView):
@@ -62,6 +63,7 @@ class TandaTerimaDataListView(LoginRequiredMixin, UserP3DERequiredMixin, Templat
 @login_required
 @user_passes_test(lambda u: u.groups.filter(name__in=['admin', 'user_p3de']).exists())
 @require_GET
+@use_reporting_db
 def tanda_terima_data_data(request):
     """DataTables server-side endpoint for `TandaTerimaData`.
 
@@ -1,5 +1,6 @@
 """Tiket workflow views"""
 from .list import TiketListView, tiket_data
+from .bulk_action import tiket_bulk_action
 from .documents import tiket_documents_download
 from .rekam_tiket import (
     TiketRekamCreateView,
@@ -20,6 +21,7 @@ from .selesaikan_tiket import SelesaikanTiketView
 __all__ = [
     'TiketListView',
     'tiket_data',
+    'tiket_bulk_action',
     'tiket_documents_download',
     'TiketDetailView',
     'TiketRekamCreateView',
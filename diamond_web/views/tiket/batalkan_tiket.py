@@ -1,18 +1,16 @@
 """Batalkan Tiket View"""
 
-from datetime import datetime
 from django.urls import reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import UpdateView
 from django.contrib import messages
+from django.http import HttpResponseRedirect
 
 from ...models.tiket import Tiket
-from ...models.tiket_action import TiketAction
 from ...models.tiket_pic import TiketPIC
 from ...forms.batalkan_tiket import BatalkanTiketForm
-from ...constants.tiket_action_types import TiketActionType
+from ...services import tiket_workflow
 from ..mixins import UserP3DERequiredMixin, ActiveTiketP3DERequiredForEditMixin
-from ...constants.tiket_status import STATUS_DIBATALKAN
 
 
 class BatalkanTiketView(LoginRequiredMixin, UserP3DERequiredMixin, ActiveTiketP3DERequiredForEditMixin, UpdateView):
@@ -27,11 +25,13 @@ class BatalkanTiketView(LoginRequiredMixin, UserP3DERequiredMixin, ActiveTiketP3
     Template: tiket/batalkan_tiket_form.html or modal variant for AJAX
     
     Workflow Step: P3DE can cancel tiket at any point before it's sent to PIDE
+    (the BATALKAN transition of ``services.tiket_workflow``)
     
     Access Control:
     - Requires @login_required
     - Requires UserP3DERequiredMixin (user must be in user_p3de group)
-    - Requires test_func() - user must be ACTIVE P3DE PIC for this tiket
+    - Requires test_func() - user must be ACTIVE P3DE PIC for this tiket and
+      the tiket must still be in a status BATALKAN may start from
 
     Side Effects on Form Submission:
     - Tiket.status set to STATUS_DIBATALKAN (canceled)
@@ -52,8 +52,9 @@ class BatalkanTiketView(LoginRequiredMixin, UserP3DERequiredMixin, ActiveTiketP3
         1. User must be in user_p3de group or admin (checked by UserP3DERequiredMixin)
         2. User must be an active P3DE PIC for this specific tiket (checked by ActiveTiketP3DERequiredForEditMixin)
 
-        Both conditions must be true for access. Returns True only if both checks pass,
-        False otherwise (blocks non-P3DE group users and non-active PICs).
+        Both conditions must be true for access, and the tiket must not have
+        been sent to PIDE yet. Returns False otherwise (blocks non-P3DE group
+        users, non-active PICs and tikets BATALKAN may no longer start from).
 
         Queries:
         - Checks user group membership
@@ -71,7 +72,7 @@ class BatalkanTiketView(LoginRequiredMixin, UserP3DERequiredMixin, ActiveTiketP3
         
         # Check 2: User must be an active P3DE PIC for this tiket
         tiket = self.get_object()
-        return TiketPIC.objects.filter(
+        return tiket_workflow.can_run(tiket_workflow.BATALKAN, tiket.status_tiket) and TiketPIC.objects.filter(
             id_tiket=tiket,
             id_user=user,
             active=True,
@@ -95,39 +96,29 @@ class BatalkanTiketView(LoginRequiredMixin, UserP3DERequiredMixin, ActiveTiketP3
         return context
 
     def form_valid(self, form):
-        """Handle form submission to update tiket status and create action record.
+        """Run the BATALKAN transition with the user's cancellation reason.
 
-        Updates tiket status to STATUS_DIBATALKAN, sets tgl_dibatalkan to current
-        datetime, and creates a TiketAction audit trail entry with the cancellation
-        reason provided by the user.
-
-        Side Effects:
-        - Tiket.status set to STATUS_DIBATALKAN
-        - Tiket.tgl_dibatalkan set to current datetime
-        - TiketAction created with DIBATALKAN action and user-provided catatan
+        ``tiket_workflow.run`` sets status_tiket to STATUS_DIBATALKAN and
+        tgl_dibatalkan to the current datetime, and logs the DIBATALKAN
+        TiketAction with the user-provided catatan. A refused transition
+        (status changed meanwhile, PIC removed) is shown as a form error.
 
         Returns:
         - Redirect to tiket detail page via get_success_url()
         """
-        now = datetime.now()
-
-        self.object = form.save(commit=False)
-        self.object.status_tiket = STATUS_DIBATALKAN  # Change status_tiket to STATUS_DIBATALKAN (Dibatalkan)
-        self.object.tgl_dibatalkan = now
-        self.object.save()
-
-        catatan = form.cleaned_data.get('catatan', 'Tiket dibatalkan')
-
-        TiketAction.objects.create(
-            id_tiket=self.object,
-            id_user=self.request.user,
-            timestamp=now,
-            action=TiketActionType.DIBATALKAN,
-            catatan=catatan
-        )
+        try:
+            tiket_workflow.run(
+                tiket_workflow.BATALKAN,
+                self.object,
+                self.request.user,
+                catatan=form.cleaned_data.get('catatan', 'Tiket dibatalkan'),
+            )
+        except tiket_workflow.TransitionError as e:
+            form.add_error(None, str(e))
+            return self.form_invalid(form)
 
         messages.success(
             self.request,
             f'Tiket "{self.object.nomor_tiket}" telah dibatalkan.'
         )
-        return super().form_valid(form)
+        return HttpResponseRedirect(self.get_success_url())
@@ -0,0 +1,183 @@
+"""Bulk workflow actions on the tiket list (identifikasi, transfer ke PMDE, selesaikan, batalkan)."""
+
+import json
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, JsonResponse
+from django.views.decorators.http import require_POST
+
+from ...forms.tiket_bulk_action import (
+    BulkBatalkanForm,
+    BulkIdentifikasiForm,
+    BulkTransferKePMDEForm,
+    SelesaikanRowForm,
+    TransferKePMDERowForm,
+)
+from ...services import tiket_workflow
+
+
+@dataclass(frozen=True)
+class BulkAction:
+    """A transition that can be applied to a selection of tikets.
+
+    ``form_class`` validates the input shared by every selected tiket,
+    ``row_form_class`` the input given per tiket (``rows`` of the payload);
+    ``groups`` are the user groups allowed to use the action.
+    """
+    label: str
+    groups: tuple
+    form_class: type | None = None
+    row_form_class: type | None = None
+
+
+P3DE_GROUPS = ('admin', 'admin_p3de', 'user_p3de')
+PIDE_GROUPS = ('admin', 'admin_pide', 'user_pide')
+PMDE_GROUPS = ('admin', 'admin_pmde', 'user_pmde')
+
+BULK_ACTIONS = {
+    tiket_workflow.IDENTIFIKASI: BulkAction('Identifikasi', PIDE_GROUPS, form_class=BulkIdentifikasiForm),
+    tiket_workflow.TRANSFER_KE_PMDE: BulkAction(
+        'Transfer ke PMDE', PIDE_GROUPS, form_class=BulkTransferKePMDEForm, row_form_class=TransferKePMDERowForm,
+    ),
+    tiket_workflow.SELESAIKAN: BulkAction('Selesaikan', PMDE_GROUPS, row_form_class=SelesaikanRowForm),
+    tiket_workflow.BATALKAN: BulkAction('Batalkan', P3DE_GROUPS, form_class=BulkBatalkanForm),
+}
+
+
+def available_bulk_actions(user):
+    """Bulk actions *user* may use, as ``[{'name', 'label', 'sources', 'rows'}]`` for the tiket list."""
+    if not user or not user.is_authenticated:
+        return []
+    groups = set(user.groups.values_list('name', flat=True))
+    return [
+        {
+            'name': name,
+            'label': action.label,
+            'sources': sorted(tiket_workflow.TRANSITIONS[name].sources),
+            'rows': [
+                {'name': field_name, 'label': field.label}
+                for field_name, field in action.row_form_class.base_fields.items()
+            ] if action.row_form_class else [],
+        }
+        for name, action in BULK_ACTIONS.items()
+        if user.is_superuser or groups & set(action.groups)
+    ]
+
+
+def _error(message, status=400, **extra):
+    return JsonResponse({'success': False, 'message': message, **extra}, status=status)
+
+
+def _form_errors(form):
+    return ' '.join(str(error) for errors in form.errors.values() for error in errors)
+
+
+@login_required
+@require_POST
+def tiket_bulk_action(request, action):
+    """Apply workflow transition *action* to the tikets selected on the tiket list.
+
+    The JSON body carries ``tiket_ids`` (at most ``TIKET_BULK_ACTION_MAX``),
+    the shared ``values`` of the action's form and, for transfer ke PMDE and
+    selesaikan, ``rows``: ``{tiket_id: {field: value}}`` with the counts of
+    each tiket.
+
+    Eligibility (status, active PIC role of the user, per-tiket input) is
+    evaluated for all selected tikets with a single query by
+    ``tiket_workflow.partition``; ineligible tikets are skipped and reported.
+    The eligible ones are moved by one ``tiket_workflow.run``: either all of
+    them are written or, when the run is refused (e.g. a tiket was changed
+    concurrently), none.
+
+    Returns:
+        JsonResponse: ``{'success', 'message', 'processed', 'results'}`` with
+        one ``{'id', 'nomor_tiket', 'success', 'message'}`` entry per
+        selected tiket, in selection order.
+    """
+    bulk_action = BULK_ACTIONS.get(action)
+    if bulk_action is None:
+        raise Http404('Aksi massal tidak dikenal.')
+    if not (request.user.is_superuser or request.user.groups.filter(name__in=bulk_action.groups).exists()):
+        return _error('Forbidden', status=403)
+
+    try:
+        payload = json.loads(request.body)
+        tiket_ids = list(dict.fromkeys(int(tiket_id) for tiket_id in payload.get('tiket_ids') or []))
+    except (AttributeError, TypeError, ValueError):
+        return _error('Data permintaan tidak valid.')
+    shared_values = payload.get('values') or {}
+    rows = payload.get('rows') or {}
+    if not (
+        isinstance(shared_values, dict)
+        and isinstance(rows, dict)
+        and all(row is None or isinstance(row, dict) for row in rows.values())
+    ):
+        return _error('Data permintaan tidak valid.')
+    if not tiket_ids:
+        return _error('Pilih minimal satu tiket.')
+    limit = getattr(settings, 'TIKET_BULK_ACTION_MAX', 200)
+    if len(tiket_ids) > limit:
+        return _error(f'Maksimal {limit} tiket per aksi massal ({len(tiket_ids)} dipilih).')
+
+    values, catatan = {}, None
+    if bulk_action.form_class:
+        form = bulk_action.form_class(data=shared_values)
+        if not form.is_valid():
+            return _error(_form_errors(form), errors=form.errors)
+        values = dict(form.cleaned_data)
+        catatan = values.pop('catatan', None)
+
+    row_errors = {}
+    values_by_tiket = {}
+    if bulk_action.row_form_class:
+        for tiket_id in tiket_ids:
+            row_form = bulk_action.row_form_class(data=rows.get(str(tiket_id)) or {})
+            if row_form.is_valid():
+                values_by_tiket[tiket_id] = row_form.cleaned_data
+            else:
+                row_errors[tiket_id] = _form_errors(row_form)
+
+    eligible, refused = tiket_workflow.partition(
+        action,
+        [tiket_id for tiket_id in tiket_ids if tiket_id not in row_errors],
+        request.user,
+        values=values,
+        values_by_tiket=values_by_tiket,
+    )
+
+    outcome = {
+        refusal.tiket_id: {'nomor_tiket': refusal.nomor_tiket, 'success': False, 'message': refusal.reason}
+        for refusal in refused
+    }
+    outcome.update(
+        (tiket_id, {'nomor_tiket': None, 'success': False, 'message': message})
+        for tiket_id, message in row_errors.items()
+    )
+    run_error = None
+    if eligible:
+        try:
+            tiket_workflow.run(
+                action, eligible, request.user, values=values, catatan=catatan, values_by_tiket=values_by_tiket,
+            )
+        except tiket_workflow.TransitionError as e:
+            run_error = str(e)
+    for tiket in eligible:
+        outcome[tiket.pk] = {
+            'nomor_tiket': tiket.nomor_tiket,
+            'success': run_error is None,
+            'message': run_error or f'{bulk_action.label} berhasil.',
+        }
+
+    processed = len(eligible) if run_error is None else 0
+    if run_error:
+        message = f'Tidak ada tiket yang diproses: {run_error}'
+    else:
+        message = f'{processed} dari {len(tiket_ids)} tiket berhasil diproses ({bulk_action.label}).'
+    return JsonResponse({
+        'success': run_error is None and processed > 0,
+        'message': message,
+        'processed': processed,
+        'results': [{'id': tiket_id, **outcome[tiket_id]} for tiket_id in tiket_ids],
+    })
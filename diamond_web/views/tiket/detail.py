@@ -3,14 +3,11 @@
 from django.views.generic import DetailView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
+from django.http import Http404
 
 from ...models.tiket import Tiket
-from ...models.tiket_action import TiketAction
 from ...models.tiket_pic import TiketPIC
 from ...models.kirim_pide_temp import KirimPideTemp
-from ...models.pic import PIC
-from ...models.klasifikasi_jenis_data import KlasifikasiJenisData
-from ...models.detil_tanda_terima import DetilTandaTerima
 from ...constants.tiket_status import (
     STATUS_LABELS,
     STATUS_BADGE_CLASSES,
@@ -23,12 +20,8 @@ from ...constants.tiket_status import (
     STATUS_DIBATALKAN,
     STATUS_SELESAI,
 )
-from ...constants.tiket_action_types import (
-    ROLE_BADGES,
-    get_action_label,
-    get_action_badge_class,
-)
 from ...utils import format_number_with_separator, format_periode
+from ...utils.tiket_dossier import get_tiket_dossier
 
 
 class TiketDetailView(LoginRequiredMixin, DetailView):
@@ -53,7 +46,7 @@ class TiketDetailView(LoginRequiredMixin, DetailView):
     context_object_name = 'tiket'
 
     def get_object(self, queryset=None):
-        """Retrieve tiket and verify user has permission to view it.
+        """Load the tiket dossier and verify user has permission to view it.
 
         Permission Logic:
         - Superuser: Always allowed
@@ -62,18 +55,21 @@ class TiketDetailView(LoginRequiredMixin, DetailView):
 
         Raises:
         - PermissionDenied: If user is not superuser/admin and has no TiketPIC
-        - Http404: If tiket PK not found (via parent get_object)
+        - Http404: If tiket PK not found
         """
-        obj = super().get_object(queryset)
+        try:
+            self.dossier = get_tiket_dossier(self.kwargs[self.pk_url_kwarg])
+        except Tiket.DoesNotExist:
+            raise Http404('Tiket tidak ditemukan')
+        obj = self.dossier.tiket
         # Allow access if user is superuser or admin
         if self.request.user.is_superuser or self.request.user.groups.filter(name='admin').exists():
             return obj
         # Allow access if user is any kind of PIC for this tiket (active or inactive)
-        if not TiketPIC.objects.filter(id_tiket=obj, id_user=self.request.user).exists():
+        if not self.dossier.has_pic(self.request.user):
             raise PermissionDenied()
         return obj
 
-        
     def get_context_data(self, **kwargs):
         """Build comprehensive context data for the tiket detail template.
 
@@ -86,12 +82,9 @@ class TiketDetailView(LoginRequiredMixin, DetailView):
         - Tanda terima (receipt) items
 
         Database Queries/Side Effects:
-        - Queries KlasifikasiJenisData with select_related('id_klasifikasi_tabel')
-        - Queries TiketAction with select_related('id_user'), ordered by timestamp
-        - Queries TiketPIC with select_related('id_user'), ordered by role
-        - Queries BackupData with select_related('id_user')
-        - Queries DetilTandaTerima with related ILAP and perekam user data
-        - Queries PIC to check if each TiketPIC user has active PIC status
+        - Related rows come from the tiket dossier loaded in get_object
+          (see utils/tiket_dossier.py), cached per tiket version
+        - Queries KirimPideTemp for the current user
 
         Context Variables Added:
         - tiket: The Tiket instance
@@ -110,21 +103,13 @@ class TiketDetailView(LoginRequiredMixin, DetailView):
         - dict: Updated context ready for template rendering
         """
         context = super().get_context_data(**kwargs)
+        dossier = self.dossier
         
         # Get related data
         periode_jenis_data = self.object.id_periode_data
         jenis_data = periode_jenis_data.id_sub_jenis_data_ilap
         ilap = jenis_data.id_ilap
         
-        # Get klasifikasi
-        try:
-            klasifikasi_list = KlasifikasiJenisData.objects.filter(
-                id_sub_jenis_data=jenis_data
-            ).select_related('id_klasifikasi_tabel')
-            klasifikasi_items = [item.id_klasifikasi_tabel.deskripsi for item in klasifikasi_list]
-        except Exception:
-            klasifikasi_items = []
-        
         # Jenis prioritas from tiket (transaction)
         jenis_prioritas_text = 'Ya' if self.object.id_jenis_prioritas_data else 'Tidak'
         
@@ -146,73 +131,18 @@ class TiketDetailView(LoginRequiredMixin, DetailView):
             'deskripsi_periode': periode_jenis_data.id_periode_pengiriman.periode_penyampaian,
             'periode_penerimaan': periode_jenis_data.id_periode_pengiriman.periode_penerimaan,
             'jenis_prioritas': jenis_prioritas_text,
-            'klasifikasi': klasifikasi_items,
+            'klasifikasi': dossier.klasifikasi,
         }
         
         # Add formatted periode to context
         context['periode_formatted'] = periode_formatted
-        
-        # Get actions and enrich with badge info
-        tiket_actions = TiketAction.objects.filter(
-            id_tiket=self.object
-        ).select_related('id_user').order_by('-timestamp', '-id')
-        
-        for action in tiket_actions:
-            action.badge_label = get_action_label(action.action)
-            action.badge_class = get_action_badge_class(action.action)
-            full_name = (action.id_user.get_full_name() or '').strip()
-            action.user_display = (
-                f"{action.id_user.username} - {full_name}"
-                if full_name else action.id_user.username
-            )
-        
-        # Get PICs and enrich with badge info
-        tiket_pics = TiketPIC.objects.filter(
-            id_tiket=self.object
-        ).select_related('id_user').order_by('role', 'id_user__username')
-
-        for pic in tiket_pics:
-            badge = ROLE_BADGES.get(pic.role, {'label': str(pic.role), 'class': 'bg-info'})
-            pic.badge_label = badge['label']
-            pic.badge_class = badge['class']
-            full_name = (pic.id_user.get_full_name() or '').strip()
-            pic.user_display = (
-                f"{pic.id_user.username} - {full_name}"
-                if full_name else pic.id_user.username
-            )
-            
-            # Check if this PIC is active (has an active PIC record without end_date)
-            if pic.role == TiketPIC.Role.P3DE:
-                tipe = PIC.TipePIC.P3DE
-            elif pic.role == TiketPIC.Role.PIDE:
-                tipe = PIC.TipePIC.PIDE
-            elif pic.role == TiketPIC.Role.PMDE:
-                tipe = PIC.TipePIC.PMDE
-            else:
-                tipe = None
-            
-            if tipe:
-                pic.is_pic_active = PIC.objects.filter(
-                    tipe=tipe,
-                    id_user=pic.id_user,
-                    id_sub_jenis_data_ilap=self.object.id_periode_data.id_sub_jenis_data_ilap,
-                    end_date__isnull=True
-                ).exists()
-            else:
-                pic.is_pic_active = False
-        
-        # Backup data list
-        backups = self.object.backups.select_related('id_user').all().order_by('-id')
 
-        # Tanda terima list for this tiket
-        tanda_terima_items = DetilTandaTerima.objects.filter(
-            id_tiket=self.object
-        ).select_related('id_tanda_terima', 'id_tanda_terima__id_ilap', 'id_tanda_terima__id_perekam').order_by('-id')
-
-        context['tiket_actions'] = tiket_actions
-        context['tiket_pics'] = tiket_pics
-        context['backup_list'] = backups
-        context['tanda_terima_items'] = tanda_terima_items
+        # Actions, PICs, backups and tanda terima items are already enriched
+        # with badge/user_display/is_pic_active by the dossier loader
+        context['tiket_actions'] = dossier.actions
+        context['tiket_pics'] = dossier.pics
+        context['backup_list'] = dossier.backups
+        context['tanda_terima_items'] = dossier.tanda_terima_items
         context['status_label'] = STATUS_LABELS.get(self.object.status_tiket, '-')
         context['status_badge_class'] = STATUS_BADGE_CLASSES.get(self.object.status_tiket, 'bg-secondary')
         context['page_title'] = f'Detail Tiket {self.object.nomor_tiket}'
@@ -264,58 +194,12 @@ class TiketDetailView(LoginRequiredMixin, DetailView):
         context['has_kirim_pide_temp'] = kirim_pide_temp is not None
         context['kirim_pide_id_temp'] = kirim_pide_temp.id_temp if kirim_pide_temp else None
 
-        # Determine the sub_jenis_data_ilap for PIC validity check
-        sub_jenis_data_ilap = self.object.id_periode_data.id_sub_jenis_data_ilap
-
         # Check if current user has any active PIC record for this tiket (per role)
         # Must have both: active TiketPIC assignment AND valid PIC record (no end_date)
-        user_is_active_pic_p3de = (
-            TiketPIC.objects.filter(
-                id_tiket=self.object,
-                id_user=self.request.user,
-                active=True,
-                role=TiketPIC.Role.P3DE
-            ).exists()
-            and
-            PIC.objects.filter(
-                tipe=PIC.TipePIC.P3DE,
-                id_user=self.request.user,
-                id_sub_jenis_data_ilap=sub_jenis_data_ilap,
-                end_date__isnull=True
-            ).exists()
-        )
-
-        user_is_active_pic_pide = (
-            TiketPIC.objects.filter(
-                id_tiket=self.object,
-                id_user=self.request.user,
-                active=True,
-                role=TiketPIC.Role.PIDE
-            ).exists()
-            and
-            PIC.objects.filter(
-                tipe=PIC.TipePIC.PIDE,
-                id_user=self.request.user,
-                id_sub_jenis_data_ilap=sub_jenis_data_ilap,
-                end_date__isnull=True
-            ).exists()
-        )
-
-        user_is_active_pic_pmde = (
-            TiketPIC.objects.filter(
-                id_tiket=self.object,
-                id_user=self.request.user,
-                active=True,
-                role=TiketPIC.Role.PMDE
-            ).exists()
-            and
-            PIC.objects.filter(
-                tipe=PIC.TipePIC.PMDE,
-                id_user=self.request.user,
-                id_sub_jenis_data_ilap=sub_jenis_data_ilap,
-                end_date__isnull=True
-            ).exists()
-        )
+        user = self.request.user
+        user_is_active_pic_p3de = dossier.user_is_active_pic(user, TiketPIC.Role.P3DE)
+        user_is_active_pic_pide = dossier.user_is_active_pic(user, TiketPIC.Role.PIDE)
+        user_is_active_pic_pmde = dossier.user_is_active_pic(user, TiketPIC.Role.PMDE)
 
         # overall active flag (any role)
         user_is_active_pic = user_is_active_pic_p3de or user_is_active_pic_pide or user_is_active_pic_pmde
@@ -340,17 +224,6 @@ class TiketDetailView(LoginRequiredMixin, DetailView):
 
         # Riwayat Tiket - same sub_jenis_data, periode, tahun ordered by tgl_terima_dip ascending
         # Include the current tiket in the list
-        riwayat_tikets = Tiket.objects.filter(
-            id_periode_data__id_sub_jenis_data_ilap=sub_jenis_data_ilap,
-            periode=self.object.periode,
-            tahun=self.object.tahun,
-        ).order_by('tgl_terima_dip')
-
-        for rt in riwayat_tikets:
-            rt.status_label = STATUS_LABELS.get(rt.status_tiket, '-')
-            rt.status_badge_class = STATUS_BADGE_CLASSES.get(rt.status_tiket, 'bg-secondary')
-            rt.status_penelitian_label = rt.id_status_penelitian.deskripsi if rt.id_status_penelitian else '-'
-
-        context['riwayat_tikets'] = riwayat_tikets
+        context['riwayat_tikets'] = dossier.riwayat_tikets
 
         return context
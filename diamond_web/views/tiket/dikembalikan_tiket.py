@@ -1,23 +1,15 @@
 """Dikembalikan Tiket View - PIDE action to return tiket to P3DE"""
 
-from datetime import datetime
 from django.urls import reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import UpdateView
 from django.contrib import messages
-from django.http import JsonResponse
-from django.utils.html import format_html
-from django.db import transaction
+from django.http import HttpResponseRedirect, JsonResponse
 
 from ...models.tiket import Tiket
-from ...models.tiket_action import TiketAction
 from ...models.tiket_pic import TiketPIC
-from ...models.notification import Notification
 from ...forms.dikembalikan_tiket import DikembalikanTiketForm
-from django.contrib.auth.models import User
-
-from ...constants.tiket_action_types import TiketActionType
-from ...constants.tiket_status import STATUS_DIBATALKAN
+from ...services import tiket_workflow
 from ..mixins import UserPIDERequiredMixin
 
 
@@ -33,11 +25,13 @@ class DikembalikanTiketView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateVie
     Template: tiket/dikembalikan_tiket_form.html or modal variant for AJAX
 
     Workflow Step: PIDE can return tiket to P3DE during identification/analysis phase
+    (the DIKEMBALIKAN transition of ``services.tiket_workflow``)
 
     Access Control:
     - Requires @login_required
     - Requires UserPIDERequiredMixin (user must be in user_pide group)
-    - Requires test_func() - user must be ACTIVE PIDE PIC for this tiket
+    - Requires test_func() - user must be ACTIVE PIDE PIC for this tiket and
+      the tiket must be Dikirim ke PIDE or Identifikasi
 
     Side Effects on Form Submission:
     - Tiket.status set to STATUS_DIBATALKAN (canceled, instead of DIKEMBALIKAN)
@@ -55,13 +49,14 @@ class DikembalikanTiketView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateVie
         """Verify user is an ACTIVE PIDE PIC for this tiket.
 
         Returns True only if user is actively assigned to this tiket with
-        PIDE role, False otherwise (blocks non-PIC users from editing).
+        PIDE role and the tiket is still with PIDE (status allows the
+        DIKEMBALIKAN transition), False otherwise.
 
         Query:
         - Filters TiketPIC by id_tiket, id_user, active=True, role=PIDE
         """
         tiket = self.get_object()
-        return TiketPIC.objects.filter(
+        return tiket_workflow.can_run(tiket_workflow.DIKEMBALIKAN, tiket.status_tiket) and TiketPIC.objects.filter(
             id_tiket=tiket,
             id_user=self.request.user,
             active=True,
@@ -85,16 +80,16 @@ class DikembalikanTiketView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateVie
         return context
 
     def form_valid(self, form):
-        """Handle form submission: update tiket status and notify P3DE.
+        """Handle form submission: return the tiket to P3DE and notify P3DE.
 
-        Within transaction:
-        1. Set tiket.status to STATUS_DIBATALKAN (instead of DIKEMBALIKAN)
-        2. Set tiket.tgl_dikembalikan to current datetime
-        3. Create TiketAction record with DIKEMBALIKAN action (by PIDE user)
-        4. Create TiketAction record with DIBATALKAN action (attributed to active P3DE PIC)
-        5. Query all active P3DE PICs assigned to tiket
-        6. Create Notification for each P3DE PIC with formatted message
-        7. Return JsonResponse (AJAX) or redirect with success message
+        Runs the DIKEMBALIKAN transition of ``tiket_workflow`` in one
+        transaction:
+        1. status_tiket set to STATUS_DIBATALKAN, tgl_dikembalikan to now and
+           tgl_rekam_pide cleared
+        2. DIKEMBALIKAN TiketAction by the PIDE user
+        3. DIBATALKAN TiketAction attributed to the active P3DE PIC
+        4. Notification for each active P3DE PIC
+        then returns JsonResponse (AJAX) or redirects with a success message.
 
         Raises:
         - Exception handlers catch any errors and return error responses
@@ -104,93 +99,23 @@ class DikembalikanTiketView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateVie
         - Redirect to tiket detail for non-AJAX requests
         """
         try:
-            with transaction.atomic():
-                now = datetime.now()
-
-                self.object = form.save(commit=False)
-                self.object.status_tiket = STATUS_DIBATALKAN  # Changed from DIKEMBALIKAN to DIBATALKAN
-                self.object.tgl_dikembalikan = now
-                self.object.tgl_rekam_pide = None  # Clear recording date when returning to P3DE
-                self.object.save()
-
-                catatan = form.cleaned_data.get('catatan', 'Tiket dikembalikan oleh PIDE')
-
-                # Create tiket action: DIKEMBALIKAN by PIDE user
-                TiketAction.objects.create(
-                    id_tiket=self.object,
-                    id_user=self.request.user,
-                    timestamp=now,
-                    action=TiketActionType.DIKEMBALIKAN,
-                    catatan=catatan
-                )
-
-                # Create tiket action: DIBATALKAN attributed to active P3DE PIC
-                active_p3de_pic = TiketPIC.objects.filter(
-                    id_tiket=self.object,
-                    active=True,
-                    role=TiketPIC.Role.P3DE
-                ).select_related('id_user').first()
-
-                if active_p3de_pic and active_p3de_pic.id_user:
-                    p3de_user = active_p3de_pic.id_user
-                else:
-                    # Fallback: find any user in P3DE group as system attributor
-                    p3de_user = User.objects.filter(
-                        groups__name__in=['user_p3de', 'admin_p3de']
-                    ).first() or self.request.user
-
-                TiketAction.objects.create(
-                    id_tiket=self.object,
-                    id_user=p3de_user,
-                    timestamp=now,
-                    action=TiketActionType.DIBATALKAN,
-                    catatan=f'Tiket dibatalkan (dikembalikan oleh PIDE: {catatan})'
-                )
-
-                # Send notification to active P3DE PIC
-                active_p3de_pics = TiketPIC.objects.filter(
-                    id_tiket=self.object,
-                    active=True,
-                    role=TiketPIC.Role.P3DE
-                ).select_related('id_user')
-
-                # Build URLs and notification message
-                try:
-                    _ = self.request.build_absolute_uri(reverse('tiket_detail', kwargs={'pk': self.object.pk}))
-                except Exception:
-                    _ = reverse('tiket_detail', kwargs={'pk': self.object.pk})
-                detail_path = reverse('tiket_detail', kwargs={'pk': self.object.pk})
-                sender_name = (self.request.user.get_full_name() or self.request.user.username).strip()
-                link_text = self.object.nomor_tiket or str(self.object.pk)
-                
-                # Use format_html to safely escape values and produce a SafeString
-                notif_message = format_html(
-                    'Tiket <a href="{}">{}</a> telah dikembalikan oleh {} dengan catatan: {}',
-                    detail_path,
-                    link_text,
-                    sender_name,
-                    catatan
-                )
-
-                # Create notifications for each P3DE active PIC
-                for pic in active_p3de_pics:
-                    recipient = pic.id_user
-                    Notification.objects.create(
-                        recipient=recipient,
-                        title='Tiket Dikembalikan',
-                        message=notif_message
-                    )
-
-                message = f'Tiket "{self.object.nomor_tiket}" telah dikembalikan dan notifikasi dikirim ke P3DE.'
-
-                if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({
-                        'success': True,
-                        'message': message
-                    })
-
-                messages.success(self.request, message)
-                return super().form_valid(form)
+            tiket_workflow.run(
+                tiket_workflow.DIKEMBALIKAN,
+                self.object,
+                self.request.user,
+                catatan=form.cleaned_data.get('catatan', 'Tiket dikembalikan oleh PIDE'),
+            )
+
+            message = f'Tiket "{self.object.nomor_tiket}" telah dikembalikan dan notifikasi dikirim ke P3DE.'
+
+            if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({
+                    'success': True,
+                    'message': message
+                })
+
+            messages.success(self.request, message)
+            return HttpResponseRedirect(self.get_success_url())
 
         except Exception as e:
             error_message = f'Gagal memperbarui tiket: {str(e)}'
@@ -4,8 +4,7 @@ import re
 from io import BytesIO
 
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.http import HttpResponse
-from django.shortcuts import get_object_or_404
+from django.http import Http404, HttpResponse
 from django.utils import timezone
 from django.views.decorators.http import require_GET
 
@@ -15,6 +14,7 @@ from ...models.tiket import Tiket
 from ...models.tiket_pic import TiketPIC
 from ...models.docx_template import DocxTemplate
 from ...utils.docx_template import fill_template_with_data
+from ...utils.tiket_dossier import get_tiket_dossier
 from ...utils import format_number_with_separator, format_periode
 
 
@@ -139,26 +139,18 @@ def tiket_documents_download(request, pk):
     except ImportError:
         return HttpResponse('Library python-docx belum terpasang.', status=500)
 
-    tiket = get_object_or_404(
-        Tiket.objects.select_related(
-            'id_periode_data__id_sub_jenis_data_ilap__id_ilap__id_kategori',
-            'id_periode_data__id_sub_jenis_data_ilap__id_ilap__id_kpp__id_kanwil',
-            'id_periode_data__id_sub_jenis_data_ilap__id_ilap',
-            'id_periode_data__id_periode_pengiriman',
-            'id_bentuk_data',
-            'id_cara_penyampaian',
-        ),
-        pk=pk,
-    )
+    try:
+        dossier = get_tiket_dossier(pk)
+    except Tiket.DoesNotExist:
+        raise Http404('Tiket tidak ditemukan')
+    tiket = dossier.tiket
 
     if not request.user.groups.filter(name='admin').exists() and not request.user.is_superuser:
-        has_access = TiketPIC.objects.filter(id_tiket=tiket, id_user=request.user, active=True).exists()
-        if not has_access:
+        if not dossier.has_pic(request.user, active_only=True):
             return HttpResponse('Tidak memiliki akses ke tiket ini.', status=403)
 
     # Collect tanda-terima group and associated tiket rows
-    detil = DetilTandaTerima.objects.select_related('id_tanda_terima').filter(id_tiket=tiket).order_by('-id').first()
-    tanda_terima = detil.id_tanda_terima if detil else None
+    tanda_terima = dossier.latest_tanda_terima
 
     if tanda_terima:
         tiket_ids = list(
@@ -175,22 +167,20 @@ def tiket_documents_download(request, pk):
     else:
         tiket_rows = [tiket]
 
-    # Dasar hukum lookup
+    # Dasar hukum lookup (the dossier already holds the klasifikasi of this tiket)
+    sub_jenis_data_id = tiket.id_periode_data.id_sub_jenis_data_ilap_id
+    dasar_hukum_map = {sub_jenis_data_id: dossier.klasifikasi} if dossier.klasifikasi else {}
     jenis_data_ids = {
         t.id_periode_data.id_sub_jenis_data_ilap_id
         for t in tiket_rows
         if t.id_periode_data and t.id_periode_data.id_sub_jenis_data_ilap_id
-    }
-    dasar_hukum_map = {}
-    for row in KlasifikasiJenisData.objects.filter(id_sub_jenis_data_id__in=jenis_data_ids).select_related('id_klasifikasi_tabel'):
-        dasar_hukum_map.setdefault(row.id_sub_jenis_data_id, []).append(row.id_klasifikasi_tabel.deskripsi)
+    } - {sub_jenis_data_id}
+    if jenis_data_ids:
+        for row in KlasifikasiJenisData.objects.filter(id_sub_jenis_data_id__in=jenis_data_ids).select_related('id_klasifikasi_tabel'):
+            dasar_hukum_map.setdefault(row.id_sub_jenis_data_id, []).append(row.id_klasifikasi_tabel.deskripsi)
 
     # PIC P3DE name
-    p3de = TiketPIC.objects.select_related('id_user').filter(
-        id_tiket=tiket,
-        role=TiketPIC.Role.P3DE,
-        active=True,
-    ).order_by('id').first()
+    p3de = dossier.first_active_pic(TiketPIC.Role.P3DE)
     p3de_name = '-'
     if p3de and p3de.id_user:
         p3de_name = p3de.id_user.get_full_name().strip() or p3de.id_user.username
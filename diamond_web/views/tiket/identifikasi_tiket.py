@@ -1,19 +1,16 @@
 """Identifikasi Tiket View - PIDE action to mark tiket as identified"""
 
-from datetime import datetime
 from django.urls import reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import UpdateView
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import HttpResponseRedirect, JsonResponse
 from django.template.loader import render_to_string
 
 from ...models.tiket import Tiket
-from ...models.tiket_action import TiketAction
 from ...models.tiket_pic import TiketPIC
-from ...constants.tiket_action_types import TiketActionType
-from ...constants.tiket_status import STATUS_IDENTIFIKASI
 from ...forms.identifikasi_tiket import IdentifikasiTiketForm
+from ...services import tiket_workflow
 from ..mixins import UserPIDERequiredMixin
 
 
@@ -53,7 +50,7 @@ class IdentifikasiTiketView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateVie
 
         Returns True only if:
         1. User is actively assigned to this tiket with PIDE role
-        2. Tiket.status == 4 (STATUS_DIKIRIM_KE_PIDE)
+        2. Tiket.status allows the IDENTIFIKASI transition (STATUS_DIKIRIM_KE_PIDE)
 
         False otherwise (blocks non-PIC or wrong status tikets from being updated).
 
@@ -69,7 +66,7 @@ class IdentifikasiTiketView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateVie
                 active=True,
                 role=TiketPIC.Role.PIDE
             ).exists()
-            and tiket.status_tiket == 4  # STATUS_DIKIRIM_KE_PIDE
+            and tiket_workflow.can_run(tiket_workflow.IDENTIFIKASI, tiket.status_tiket)
         )
 
     def get(self, request, *args, **kwargs):
@@ -101,29 +98,27 @@ class IdentifikasiTiketView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateVie
     def form_valid(self, form):
         """Handle valid form: mark tiket as IDENTIFIKASI and create audit entry.
 
-        Updates tiket.status to STATUS_IDENTIFIKASI and sets tgl_rekam_pide
-        from validated form data. Creates TiketAction record. Supports both
-        AJAX (returns JsonResponse) and non-AJAX (redirects).
+        Runs the IDENTIFIKASI transition of ``tiket_workflow``: status
+        STATUS_IDENTIFIKASI, tgl_rekam_pide from the validated form data (now
+        if missing) and the IDENTIFIKASI TiketAction. A refused transition is
+        reported like a form error. Supports both AJAX (returns JsonResponse)
+        and non-AJAX (redirects).
 
         Returns:
         - JsonResponse {'success': True, 'message': ...} for AJAX requests
         - Redirect to tiket detail for non-AJAX requests
         """
-        now = datetime.now()
-        tgl_rekam_pide = form.cleaned_data.get('tgl_rekam_pide') or now
-
         tiket = self.object
-        tiket.status_tiket = STATUS_IDENTIFIKASI
-        tiket.tgl_rekam_pide = tgl_rekam_pide
-        tiket.save()
-
-        TiketAction.objects.create(
-            id_tiket=tiket,
-            id_user=self.request.user,
-            timestamp=now,
-            action=TiketActionType.IDENTIFIKASI,
-            catatan='Mulai proses identifikasi'
-        )
+        try:
+            tiket_workflow.run(
+                tiket_workflow.IDENTIFIKASI,
+                tiket,
+                self.request.user,
+                values={'tgl_rekam_pide': form.cleaned_data.get('tgl_rekam_pide')},
+            )
+        except tiket_workflow.TransitionError as e:
+            form.add_error(None, str(e))
+            return self.form_invalid(form)
 
         if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
             return JsonResponse({
@@ -135,7 +130,7 @@ class IdentifikasiTiketView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateVie
             self.request,
             f'Tiket "{tiket.nomor_tiket}" telah diidentifikasi.'
         )
-        return super().form_valid(form)
+        return HttpResponseRedirect(self.get_success_url())
 
     def form_invalid(self, form):
         """Return validation errors as JSON for AJAX requests.
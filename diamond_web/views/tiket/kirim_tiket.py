@@ -1,7 +1,5 @@
 """Kirim Tiket Workflow Step - Generate ND Pengantar PIDE"""
 
-from datetime import datetime
-
 from django.views.generic import FormView, View, TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
@@ -11,21 +9,18 @@ from django.db import transaction
 from django.db import models as db_models
 from django.shortcuts import redirect, get_object_or_404
 from django.core.paginator import Paginator
-from django.utils.html import format_html
 from django.template.loader import render_to_string
 
 from ...models.tiket import Tiket
-from ...models.tiket_action import TiketAction
 from ...models.tiket_pic import TiketPIC
 from ...models.kirim_pide_temp import KirimPideTemp
 from ...models.ilap import ILAP
-from ...models.notification import Notification
 from ...forms.kirim_tiket import KirimTiketForm
 from ...forms.kirim_ke_pide import KirimKePideForm
 from ..mixins import UserP3DERequiredMixin, get_active_p3de_ilap_ids
-from ...constants.tiket_status import STATUS_DITELITI, STATUS_DIKEMBALIKAN, STATUS_DIKIRIM_KE_PIDE
-from ...constants.tiket_action_types import TiketActionType
+from ...constants.tiket_status import STATUS_DITELITI, STATUS_DIKEMBALIKAN
 from ..bulk_document_generation import _generate_docx_for_tickets
+from ...services import tiket_workflow
 
 
 class KirimTiketView(LoginRequiredMixin, UserP3DERequiredMixin, FormView):
@@ -787,13 +782,9 @@ class KirimKePIDEView(LoginRequiredMixin, UserP3DERequiredMixin, View):
     def post(self, request, id_temp):
         """Update all tickets in the group to status 'Dikirim ke PIDE'.
 
-        Within a transaction:
-        1. Validates KirimKePideForm (tgl_nadine, nomor_nd_nadine, tgl_kirim_pide)
-        2. Updates each tiket's status to STATUS_DIKIRIM_KE_PIDE
-        3. Sets ND Nadine reference fields on each tiket
-        4. Creates DIKIRIM_KE_PIDE TiketAction for audit trail
-        5. Sends Notification to all active PIDE PICs
-        6. Cleans up KirimPideTemp records
+        Validates KirimKePideForm (tgl_nadine, nomor_nd_nadine, tgl_kirim_pide),
+        then within a transaction runs the KIRIM_KE_PIDE transition of
+        ``tiket_workflow`` on all tikets and cleans up the KirimPideTemp records.
 
         Args:
             request: The HTTP request object with form data.
@@ -805,28 +796,25 @@ class KirimKePIDEView(LoginRequiredMixin, UserP3DERequiredMixin, View):
         Raises:
             JsonResponse 404: If id_temp not found.
             JsonResponse 403: If user does not own this id_temp.
-            JsonResponse 400: If form validation fails.
+            JsonResponse 400: If form validation fails or the transition is refused.
             JsonResponse 500: On other processing errors.
         """
-        temp_records = list(
-            KirimPideTemp.objects.filter(id_temp=id_temp)
-            .select_related('id_tiket')
-        )
+        temp_records = list(KirimPideTemp.objects.filter(id_temp=id_temp))
         if not temp_records:
             return JsonResponse(
                 {'success': False, 'message': 'Data tidak ditemukan.'},
                 status=404,
             )
-        if any(r.id_user != request.user for r in temp_records):
+        if any(r.id_user_id != request.user.pk for r in temp_records):
             return JsonResponse(
                 {'success': False, 'message': 'Anda tidak berhak.'},
                 status=403,
             )
 
         tiket_ids = [r.id_tiket_id for r in temp_records]
-        tikets = Tiket.objects.filter(id__in=tiket_ids)
+        tikets = list(Tiket.objects.filter(id__in=tiket_ids))
 
-        form = KirimKePideForm(request.POST, tiket_list=list(tikets))
+        form = KirimKePideForm(request.POST, tiket_list=tikets)
         if not form.is_valid():
             return JsonResponse({
                 'success': False,
@@ -834,53 +822,14 @@ class KirimKePIDEView(LoginRequiredMixin, UserP3DERequiredMixin, View):
                 'errors': form.errors,
             }, status=400)
 
-        now = datetime.now()
+        nadine_fields = {
+            name: form.cleaned_data.get(name)
+            for name in ('tgl_nadine', 'nomor_nd_nadine', 'tgl_kirim_pide')
+        }
 
         try:
             with transaction.atomic():
-                tgl_nadine = form.cleaned_data.get('tgl_nadine')
-                nomor_nd_nadine = form.cleaned_data.get('nomor_nd_nadine')
-                tgl_kirim_pide = form.cleaned_data.get('tgl_kirim_pide')
-
-                sender_name = (request.user.get_full_name() or request.user.username).strip()
-
-                for tiket in tikets:
-                    tiket.status_tiket = STATUS_DIKIRIM_KE_PIDE
-                    if tgl_nadine:
-                        tiket.tgl_nadine = tgl_nadine
-                    if nomor_nd_nadine:
-                        tiket.nomor_nd_nadine = nomor_nd_nadine
-                    if tgl_kirim_pide:
-                        tiket.tgl_kirim_pide = tgl_kirim_pide
-                    tiket.save()
-
-                    TiketAction.objects.create(
-                        id_tiket=tiket,
-                        id_user=request.user,
-                        timestamp=now,
-                        action=TiketActionType.DIKIRIM_KE_PIDE,
-                        catatan=f'tiket dikirim ke PIDE',
-                    )
-
-                    # Send notification to active PIDE PICs
-                    tiket_detail_path = reverse('tiket_detail', kwargs={'pk': tiket.pk})
-                    notif_message = format_html(
-                        'Tiket <a href="{}">{}</a> telah dikirim ke PIDE oleh {}.',
-                        tiket_detail_path,
-                        tiket.nomor_tiket or str(tiket.pk),
-                        sender_name,
-                    )
-                    active_pide_pics = TiketPIC.objects.filter(
-                        id_tiket=tiket,
-                        active=True,
-                        role=TiketPIC.Role.PIDE,
-                    ).select_related('id_user')
-                    for pic in active_pide_pics:
-                        Notification.objects.create(
-                            recipient=pic.id_user,
-                            title='Tiket Dikirim ke PIDE',
-                            message=notif_message,
-                        )
+                tiket_workflow.run(tiket_workflow.KIRIM_KE_PIDE, tikets, request.user, values=nadine_fields)
 
                 # Clean up temp records
                 KirimPideTemp.objects.filter(id_temp=id_temp).delete()
@@ -888,6 +837,8 @@ class KirimKePIDEView(LoginRequiredMixin, UserP3DERequiredMixin, View):
             message = f'{len(tikets)} tiket berhasil dikirim ke PIDE.'
             return JsonResponse({'success': True, 'message': message})
 
+        except tiket_workflow.TransitionError as e:
+            return JsonResponse({'success': False, 'message': str(e)}, status=400)
         except Exception as e:
             return JsonResponse({
                 'success': False,
@@ -1,5 +1,6 @@
 """Tiket list view - shared across all workflow steps."""
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.views.decorators.http import require_GET
@@ -25,7 +26,9 @@ from ...models.klasifikasi_jenis_data import KlasifikasiJenisData
 from ..mixins import can_access_tiket_list
 from ...constants.tiket_status import STATUS_LABELS
 from .documents import _is_p3de_user, _format_periode_tiket
+from .bulk_action import available_bulk_actions
 from ...models.durasi_jatuh_tempo import DurasiJatuhTempo
+from ...utils.db_routing import use_reporting_db
 
 
 class TiketListView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
@@ -40,8 +43,9 @@ class TiketListView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
     Template: tiket/list.html
 
     Context:
-    - No additional context variables beyond standard Django template context.
-      DataTables initialization is handled client-side via tiket_data endpoint.
+    - bulk_actions / bulk_action_max for the selection toolbar (bulk
+      workflow actions). DataTables initialization is handled client-side
+      via tiket_data endpoint.
     """
     template_name = 'tiket/list.html'
 
@@ -53,10 +57,24 @@ class TiketListView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
         """
         return can_access_tiket_list(self.request.user)
 
+    def get_context_data(self, **kwargs):
+        """Add the bulk workflow actions available to the user.
+
+        Context:
+        - bulk_actions: list of {'name', 'label', 'sources', 'rows'} dicts
+          (see ``bulk_action.available_bulk_actions``)
+        - bulk_action_max: most tikets one bulk action may select
+        """
+        context = super().get_context_data(**kwargs)
+        context['bulk_actions'] = available_bulk_actions(self.request.user)
+        context['bulk_action_max'] = getattr(settings, 'TIKET_BULK_ACTION_MAX', 200)
+        return context
+
 
 @login_required
 @user_passes_test(lambda u: can_access_tiket_list(u))
 @require_GET
+@use_reporting_db
 def tiket_data(request):
     """DataTables server-side endpoint for tiket listing with dynamic filtering.
 
@@ -1320,6 +1338,7 @@ def tiket_data(request):
             'nama_sub_jenis_data': nama_sub_jenis_data,
             'periode_formatted': periode_formatted,
             'status': STATUS_LABELS.get(obj.status_tiket, '-'),
+            'status_tiket': obj.status_tiket,
             'status_ketersediaan_data': 'Ya' if obj.status_ketersediaan_data else 'Tidak',
             'actions': actions_html
         })
@@ -1,20 +1,16 @@
 """Rekam Hasil Penelitian View"""
 
-from datetime import datetime
 from django.urls import reverse_lazy, reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import UpdateView
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import HttpResponseRedirect, JsonResponse
 
 from ...models.tiket import Tiket
-from ...models.tiket_action import TiketAction
 from ...models.tiket_pic import TiketPIC
-from ...models.status_penelitian import StatusPenelitian
 from ...forms.rekam_hasil_penelitian import RekamHasilPenelitianForm
-from ...constants.tiket_action_types import TiketActionType
+from ...services import tiket_workflow
 from ..mixins import UserP3DERequiredMixin, ActiveTiketP3DERequiredForEditMixin
-from ...constants.tiket_status import STATUS_DITELITI, STATUS_SELESAI
 
 
 class RekamHasilPenelitianView(LoginRequiredMixin, UserP3DERequiredMixin, ActiveTiketP3DERequiredForEditMixin, UpdateView):
@@ -52,12 +48,15 @@ class RekamHasilPenelitianView(LoginRequiredMixin, UserP3DERequiredMixin, Active
         """Verify user is an ACTIVE P3DE PIC for this tiket.
 
         Returns True only if user is actively assigned to this tiket with
-        P3DE role, False otherwise (blocks non-PIC users from editing).
+        P3DE role and the tiket is Direkam or Diteliti (the statuses the
+        REKAM_HASIL_PENELITIAN transition starts from), False otherwise.
 
         Query:
         - Filters TiketPIC by id_tiket, id_user, active=True, role=P3DE
         """
         tiket = self.get_object()
+        if not tiket_workflow.can_run(tiket_workflow.REKAM_HASIL_PENELITIAN, tiket.status_tiket):
+            return False
         return TiketPIC.objects.filter(
             id_tiket=tiket,
             id_user=self.request.user,
@@ -90,14 +89,14 @@ class RekamHasilPenelitianView(LoginRequiredMixin, UserP3DERequiredMixin, Active
         return context
 
     def form_valid(self, form):
-        """Handle form submission: update tiket status and create audit entry.
+        """Handle form submission: run the REKAM_HASIL_PENELITIAN transition.
 
-        Within transaction:
-        1. Set tiket.status to STATUS_DITELITI (researched)
-        2. Set tiket.tgl_teliti to current datetime
-        3. Update tiket.baris_diterima with form value
-        4. Create TiketAction record with research notes (catatan)
-        5. Return JsonResponse (AJAX) or redirect with success message
+        ``tiket_workflow`` writes tgl_teliti, baris_lengkap and
+        baris_tidak_lengkap, derives id_status_penelitian and the status from
+        baris_lengkap (no complete row closes the tiket as STATUS_SELESAI,
+        otherwise STATUS_DITELITI) and logs the DITELITI TiketAction, plus a
+        SELESAI action when the tiket is closed. A refused transition is
+        reported like a form error.
 
         Catatan generation:
         - On update: 'Hasil penelitian diubah' (research results changed)
@@ -105,57 +104,24 @@ class RekamHasilPenelitianView(LoginRequiredMixin, UserP3DERequiredMixin, Active
         - With form field: Uses form catatan field instead
 
         Returns:
-        - JsonResponse {'success': True, 'message': ...} for AJAX requests
+        - JsonResponse {'success': True} for AJAX requests
         - Redirect to tiket detail for non-AJAX requests
         """
-        # Get current timestamp for the audit entry
-        now = datetime.now()
-
-        # Save form fields (tgl_teliti, baris_lengkap, baris_tidak_lengkap)
-        self.object = form.save(commit=False)
-
-        # Calculate id_status_penelitian from baris values
-        baris_lengkap = form.cleaned_data.get('baris_lengkap') or 0
-        baris_diterima = self.object.baris_diterima
-        try:
-            if baris_lengkap == baris_diterima:
-                self.object.id_status_penelitian = StatusPenelitian.objects.get(deskripsi='Lengkap')
-                self.object.status_tiket = STATUS_DITELITI
-            elif baris_lengkap == 0:
-                self.object.id_status_penelitian = StatusPenelitian.objects.get(deskripsi='Tidak Lengkap')
-                self.object.status_tiket = STATUS_SELESAI
-            else:
-                self.object.id_status_penelitian = StatusPenelitian.objects.get(deskripsi='Lengkap Sebagian')
-                self.object.status_tiket = STATUS_DITELITI
-        except StatusPenelitian.DoesNotExist:
-            self.object.status_tiket = STATUS_DITELITI
-
-        self.object.save()
-
-        # Get catatan from form
         catatan = form.cleaned_data.get(
             'catatan',
             'Hasil penelitian diubah' if self.object.tgl_teliti else 'Hasil penelitian direkam'
         )
-
-        # Create tiket_action entry for audit trail
-        TiketAction.objects.create(
-            id_tiket=self.object,
-            id_user=self.request.user,
-            timestamp=now,
-            action=TiketActionType.DITELITI,
-            catatan=catatan
-        )
-
-        # If tiket is set to SELESAI status (baris_lengkap == 0), also create a SELESAI action
-        if self.object.status_tiket == STATUS_SELESAI:
-            TiketAction.objects.create(
-                id_tiket=self.object,
-                id_user=self.request.user,
-                timestamp=now,
-                action=TiketActionType.SELESAI,
-                catatan='Tiket selesai diproses'
+        try:
+            tiket_workflow.run(
+                tiket_workflow.REKAM_HASIL_PENELITIAN,
+                self.object,
+                self.request.user,
+                values={name: form.cleaned_data.get(name) for name in form._meta.fields},
+                catatan=catatan,
             )
+        except tiket_workflow.TransitionError as e:
+            form.add_error(None, str(e))
+            return self.form_invalid(form)
 
         # Check if AJAX request
         if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -166,7 +132,7 @@ class RekamHasilPenelitianView(LoginRequiredMixin, UserP3DERequiredMixin, Active
             self.request,
             f'Hasil penelitian untuk tiket "{self.object.nomor_tiket}" telah direkam.'
         )
-        return super().form_valid(form)
+        return HttpResponseRedirect(self.get_success_url())
 
     def form_invalid(self, form):
         """Return JSON with rendered form HTML for AJAX requests.
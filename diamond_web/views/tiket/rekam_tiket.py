@@ -18,17 +18,27 @@ from ...models.tiket_pic import TiketPIC
 from ...models.pic import PIC
 from ...models.periode_jenis_data import PeriodeJenisData
 from ...models.jenis_prioritas_data import JenisPrioritasData
-from ...models.klasifikasi_jenis_data import KlasifikasiJenisData
 from ...models.backup_data import BackupData
 from ...models.media_backup import MediaBackup
 from ...constants.tiket_action_types import TiketActionType, PICActionType, BackupActionType
 from ...forms.tiket import TiketForm
+from ...utils.reference_data import get_reference
 from ..mixins import UserFormKwargsMixin, UserP3DERequiredMixin, get_active_p3de_ilap_ids
 from ...constants.tiket_status import STATUS_DIREKAM, STATUS_SELESAI
 
 logger = logging.getLogger(__name__)
 
 
+def _format_open_pics(users, today, limit=3):
+    """Join the names of the first *limit* PICs already started on *today*."""
+    names = [
+        f"{u['first_name']} {u['last_name']}".strip() or u['username']
+        for u in users
+        if u['start_date'] and u['start_date'] <= today
+    ]
+    return ', '.join(names[:limit]) or '-'
+
+
 class ILAPPeriodeDataAPIView(View):
     """AJAX API endpoint to fetch available periode jenis data for an ILAP.
 
@@ -50,10 +60,9 @@ class ILAPPeriodeDataAPIView(View):
     - pic_p3de, pic_pide, pic_pmde (comma-separated active PICs)
 
     Side Effects:
-    - Queries PIC table to fetch current active PICs for each role
-    - Queries KlasifikasiJenisData for classification text
-    - Queries JenisPrioritasData for priority flag
-    - Logs errors if query fails for individual records
+    - Reads active PICs, klasifikasi and jenis prioritas from the reference
+      data cache (utils/reference_data.py) instead of querying per record
+    - Falls back to '-' if a lookup fails for individual records
     """
     
     def get(self, request, ilap_id):
@@ -73,8 +82,8 @@ class ILAPPeriodeDataAPIView(View):
                          Returns 400 with error message on failure.
 
         Side Effects:
-            Queries PIC, KlasifikasiJenisData, and JenisPrioritasData tables
-            to enrich the response with current active PICs and metadata.
+            Reads the cached PIC, KlasifikasiJenisData and JenisPrioritasData
+            maps to enrich the response with current active PICs and metadata.
         """
         try:
             from datetime import datetime
@@ -119,60 +128,26 @@ class ILAPPeriodeDataAPIView(View):
 
                 try:
                     klasifikasi_text = ', '.join([
-                        item.id_klasifikasi_tabel.deskripsi
-                        for item in KlasifikasiJenisData.objects.filter(
-                            id_sub_jenis_data=jenis_data
-                        ).select_related('id_klasifikasi_tabel')
+                        deskripsi
+                        for _, deskripsi in get_reference('klasifikasi_by_sub_jenis').get(jenis_data.id, ())
                     ]) or '-'
                 except Exception:
                     klasifikasi_text = '-'
 
                 try:
-                    has_prioritas = JenisPrioritasData.objects.filter(
-                        id_sub_jenis_data_ilap=jenis_data
-                    ).exists()
+                    has_prioritas = jenis_data.id in get_reference('prioritas_sub_jenis_ids')
                     jenis_prioritas_text = 'Ya' if has_prioritas else 'Tidak'
                 except Exception:
                     jenis_prioritas_text = '-'
 
                 try:
-                    pic_p3de = ', '.join([
-                        (pic.id_user.get_full_name().strip() or pic.id_user.username)
-                        for pic in PIC.objects.filter(
-                            tipe=PIC.TipePIC.P3DE,
-                            id_sub_jenis_data_ilap=jenis_data,
-                            start_date__lte=today,
-                            end_date__isnull=True
-                        ).select_related('id_user')[:3]
-                    ]) or '-'
-                except Exception:
-                    pic_p3de = '-'
-
-                try:
-                    pic_pide = ', '.join([
-                        (pic.id_user.get_full_name().strip() or pic.id_user.username)
-                        for pic in PIC.objects.filter(
-                            tipe=PIC.TipePIC.PIDE,
-                            id_sub_jenis_data_ilap=jenis_data,
-                            start_date__lte=today,
-                            end_date__isnull=True
-                        ).select_related('id_user')[:3]
-                    ]) or '-'
-                except Exception:
-                    pic_pide = '-'
-
-                try:
-                    pic_pmde = ', '.join([
-                        (pic.id_user.get_full_name().strip() or pic.id_user.username)
-                        for pic in PIC.objects.filter(
-                            tipe=PIC.TipePIC.PMDE,
-                            id_sub_jenis_data_ilap=jenis_data,
-                            start_date__lte=today,
-                            end_date__isnull=True
-                        ).select_related('id_user')[:3]
-                    ]) or '-'
+                    open_pics = get_reference('open_pics')
+                    pic_p3de, pic_pide, pic_pmde = (
+                        _format_open_pics(open_pics.get((jenis_data.id, tipe), ()), today)
+                        for tipe in (PIC.TipePIC.P3DE, PIC.TipePIC.PIDE, PIC.TipePIC.PMDE)
+                    )
                 except Exception:
-                    pic_pmde = '-'
+                    pic_p3de = pic_pide = pic_pmde = '-'
 
                 data.append({
                     'id': pd.id,
@@ -466,14 +441,10 @@ class TiketRekamCreateView(LoginRequiredMixin, UserP3DERequiredMixin, UserFormKw
         context['form_action'] = reverse('tiket_rekam_create')
         context['page_title'] = 'Rekam Penerimaan Data'
         context['workflow_step'] = 'rekam'
-        context['media_backup_list'] = MediaBackup.objects.all()
+        context['media_backup_list'] = sorted(get_reference('media_backup'), key=lambda m: m['id'])
         
         # Get ILAP categories for client-side validation
-        from ...models.ilap import ILAP
-        ilaps_regional = ILAP.objects.filter(
-            id_kategori_wilayah__deskripsi__icontains='regional'
-        ).values_list('id', flat=True)
-        context['ilaps_regional_ids'] = list(ilaps_regional)
+        context['ilaps_regional_ids'] = list(get_reference('ilap_regional_ids'))
         
         return context
 
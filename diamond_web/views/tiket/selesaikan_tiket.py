@@ -1,19 +1,15 @@
 """Selesaikan Tiket View - PMDE action to complete tiket with QC information"""
 
-from datetime import datetime
 from django.urls import reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import UpdateView
 from django.contrib import messages
-from django.http import JsonResponse
-from django.db import transaction
+from django.http import HttpResponseRedirect, JsonResponse
 
 from ...models.tiket import Tiket
-from ...models.tiket_action import TiketAction
 from ...models.tiket_pic import TiketPIC
 from ...forms.selesaikan_tiket import SelesaikanTiketForm
-from ...constants.tiket_action_types import TiketActionType
-from ...constants.tiket_status import STATUS_PENGENDALIAN_MUTU, STATUS_SELESAI
+from ...services import tiket_workflow
 from ..mixins import UserPMDERequiredMixin
 
 
@@ -50,7 +46,7 @@ class SelesaikanTiketView(LoginRequiredMixin, UserPMDERequiredMixin, UpdateView)
 
         Returns True only if:
         1. User is actively assigned to this tiket with PMDE role
-        2. Tiket.status == STATUS_PENGENDALIAN_MUTU (6)
+        2. Tiket.status allows the SELESAIKAN transition (STATUS_PENGENDALIAN_MUTU)
 
         False otherwise (blocks non-PIC or wrong status tikets from being completed).
 
@@ -66,7 +62,7 @@ class SelesaikanTiketView(LoginRequiredMixin, UserPMDERequiredMixin, UpdateView)
                 active=True,
                 role=TiketPIC.Role.PMDE
             ).exists()
-            and tiket.status_tiket == STATUS_PENGENDALIAN_MUTU  # STATUS_PENGENDALIAN_MUTU
+            and tiket_workflow.can_run(tiket_workflow.SELESAIKAN, tiket.status_tiket)
         )
 
     def get_context_data(self, **kwargs):
@@ -88,11 +84,11 @@ class SelesaikanTiketView(LoginRequiredMixin, UserPMDERequiredMixin, UpdateView)
     def form_valid(self, form):
         """Handle form submission: finalize tiket with QC information.
 
-        Within transaction:
-        1. Set tiket.status to STATUS_SELESAI
-        2. Create TiketAction with PENGENDALIAN_MUTU action (records QC phase with counts)
-        3. Create TiketAction with SELESAI action (marks final completion)
-        4. Return JsonResponse (AJAX) or redirect with success message
+        Runs the SELESAIKAN transition of ``tiket_workflow`` in one transaction:
+        1. status_tiket set to STATUS_SELESAI and the QC counts written
+        2. TiketAction with PENGENDALIAN_MUTU action (records QC phase with counts)
+        3. TiketAction with SELESAI action (marks final completion)
+        then returns JsonResponse (AJAX) or redirects with a success message.
 
         QC Information Captured:
         - sudah_qc: Count of records that have undergone QC
@@ -105,41 +101,23 @@ class SelesaikanTiketView(LoginRequiredMixin, UserPMDERequiredMixin, UpdateView)
         - Redirect to tiket detail for non-AJAX requests
         """
         try:
-            with transaction.atomic():
-                now = datetime.now()
-
-                self.object = form.save(commit=False)
-                self.object.status_tiket = STATUS_SELESAI
-                self.object.save()
-
-                # Create first action: PENGENDALIAN_MUTU (to record QC phase with details)
-                TiketAction.objects.create(
-                    id_tiket=self.object,
-                    id_user=self.request.user,
-                    timestamp=now,
-                    action=TiketActionType.PENGENDALIAN_MUTU,
-                    catatan=f'Sudah QC:{self.object.sudah_qc}, Lolos QC:{self.object.lolos_qc}, Tidak Lolos QC:{self.object.tidak_lolos_qc}, QC C:{self.object.qc_c}'
-                )
-
-                # Create second action: SELESAI (final status)
-                TiketAction.objects.create(
-                    id_tiket=self.object,
-                    id_user=self.request.user,
-                    timestamp=now,
-                    action=TiketActionType.SELESAI,
-                    catatan='Tiket selesai diproses'
-                )
-
-                message = f'Tiket "{self.object.nomor_tiket}" berhasil diselesaikan.'
-
-                if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({
-                        'success': True,
-                        'message': message
-                    })
-
-                messages.success(self.request, message)
-                return super().form_valid(form)
+            tiket_workflow.run(
+                tiket_workflow.SELESAIKAN,
+                self.object,
+                self.request.user,
+                values={name: form.cleaned_data.get(name) for name in form._meta.fields},
+            )
+
+            message = f'Tiket "{self.object.nomor_tiket}" berhasil diselesaikan.'
+
+            if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({
+                    'success': True,
+                    'message': message
+                })
+
+            messages.success(self.request, message)
+            return HttpResponseRedirect(self.get_success_url())
 
         except Exception as e:
             error_message = f'Gagal menyelesaikan tiket: {str(e)}'
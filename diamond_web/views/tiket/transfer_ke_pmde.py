@@ -1,21 +1,15 @@
 """Transfer ke PMDE View - PIDE action to transfer tiket to PMDE"""
 
-from datetime import datetime
 from django.urls import reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import UpdateView
 from django.contrib import messages
-from django.http import JsonResponse
-from django.utils.html import format_html
-from django.db import transaction
+from django.http import HttpResponseRedirect, JsonResponse
 
 from ...models.tiket import Tiket
-from ...models.tiket_action import TiketAction
 from ...models.tiket_pic import TiketPIC
-from ...models.notification import Notification
 from ...forms.transfer_ke_pmde import TransferKePMDEForm
-from ...constants.tiket_action_types import TiketActionType
-from ...constants.tiket_status import STATUS_PENGENDALIAN_MUTU
+from ...services import tiket_workflow
 from ..mixins import UserPIDERequiredMixin
 
 
@@ -54,7 +48,7 @@ class TransferKePMDEView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateView):
 
         Returns True only if:
         1. User is actively assigned to this tiket with PIDE role
-        2. Tiket.status == 5 (STATUS_IDENTIFIKASI)
+        2. Tiket.status allows the TRANSFER_KE_PMDE transition (STATUS_IDENTIFIKASI)
 
         False otherwise (blocks non-PIC or wrong status tikets from being transferred).
 
@@ -70,7 +64,7 @@ class TransferKePMDEView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateView):
                 active=True,
                 role=TiketPIC.Role.PIDE
             ).exists()
-            and tiket.status_tiket == 5  # STATUS_IDENTIFIKASI
+            and tiket_workflow.can_run(tiket_workflow.TRANSFER_KE_PMDE, tiket.status_tiket)
         )
 
     def get_context_data(self, **kwargs):
@@ -92,12 +86,13 @@ class TransferKePMDEView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateView):
     def form_valid(self, form):
         """Handle form submission: update tiket status and notify PMDE.
 
-        Within transaction:
-        1. Set tiket.status to STATUS_PENGENDALIAN_MUTU
-        2. Create TiketAction record with identified rows summary (I, U, Res, CDE)
-        3. Query all active PMDE PICs assigned to tiket
-        4. Create Notification for each PMDE PIC with formatted message
-        5. Return JsonResponse (AJAX) or redirect with success message
+        Runs the TRANSFER_KE_PMDE transition of ``tiket_workflow`` in one
+        transaction:
+        1. status_tiket set to STATUS_PENGENDALIAN_MUTU and the form's
+           baris_i/baris_u/baris_res/baris_cde/tgl_transfer written
+        2. TiketAction with the identified rows summary (I, U, Res, CDE)
+        3. Notification for each active PMDE PIC
+        then returns JsonResponse (AJAX) or redirects with a success message.
 
         Raises:
         - Exception handlers catch any errors and return error responses
@@ -107,65 +102,23 @@ class TransferKePMDEView(LoginRequiredMixin, UserPIDERequiredMixin, UpdateView):
         - Redirect to tiket detail for non-AJAX requests
         """
         try:
-            with transaction.atomic():
-                now = datetime.now()
-
-                self.object = form.save(commit=False)
-                self.object.status_tiket = STATUS_PENGENDALIAN_MUTU
-                self.object.save()
-
-                # Create tiket action
-                TiketAction.objects.create(
-                    id_tiket=self.object,
-                    id_user=self.request.user,
-                    timestamp=now,
-                    action=TiketActionType.DITRANSFER_KE_PMDE,
-                    catatan=f'Transfer ke PMDE - I:{self.object.baris_i}, U:{self.object.baris_u}, Res:{self.object.baris_res}, CDE:{self.object.baris_cde}'
-                )
-
-                # Send notification to active PMDE PIC
-                active_pmde_pics = TiketPIC.objects.filter(
-                    id_tiket=self.object,
-                    active=True,
-                    role=TiketPIC.Role.PMDE
-                ).select_related('id_user')
-
-                # Build URLs and notification message
-                try:
-                    _ = self.request.build_absolute_uri(reverse('tiket_detail', kwargs={'pk': self.object.pk}))
-                except Exception:
-                    _ = reverse('tiket_detail', kwargs={'pk': self.object.pk})
-                detail_path = reverse('tiket_detail', kwargs={'pk': self.object.pk})
-                sender_name = (self.request.user.get_full_name() or self.request.user.username).strip()
-                link_text = self.object.nomor_tiket or str(self.object.pk)
-                
-                # Use format_html to safely escape values and produce a SafeString
-                notif_message = format_html(
-                    'Tiket <a href="{}">{}</a> telah ditransfer ke Pengendalian Mutu oleh {}',
-                    detail_path,
-                    link_text,
-                    sender_name
-                )
-
-                # Create notifications for each PMDE active PIC
-                for pic in active_pmde_pics:
-                    recipient = pic.id_user
-                    Notification.objects.create(
-                        recipient=recipient,
-                        title='Tiket Ditransfer ke Pengendalian Mutu',
-                        message=notif_message
-                    )
-
-                message = f'Tiket "{self.object.nomor_tiket}" telah ditransfer ke PMDE dan notifikasi dikirim.'
-
-                if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({
-                        'success': True,
-                        'message': message
-                    })
-
-                messages.success(self.request, message)
-                return super().form_valid(form)
+            tiket_workflow.run(
+                tiket_workflow.TRANSFER_KE_PMDE,
+                self.object,
+                self.request.user,
+                values={name: form.cleaned_data.get(name) for name in form._meta.fields},
+            )
+
+            message = f'Tiket "{self.object.nomor_tiket}" telah ditransfer ke PMDE dan notifikasi dikirim.'
+
+            if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({
+                    'success': True,
+                    'message': message
+                })
+
+            messages.success(self.request, message)
+            return HttpResponseRedirect(self.get_success_url())
 
         except Exception as e:
             error_message = f'Gagal memperbarui tiket: {str(e)}'
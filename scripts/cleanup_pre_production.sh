@@ -26,20 +26,7 @@ LOCK_FILE="/tmp/diamond_cleanup_pre_production.lock"
 
 TIMESTAMP=$(date '+%Y-%m-%d_%H-%M-%S')
 LOG_FILE="$LOG_DIR/cleanup_pre_production_$TIMESTAMP.log"
-
-# ---------- Prevent concurrent runs ----------
-if [ -f "$LOCK_FILE" ]; then
-    LOCK_PID=$(cat "$LOCK_FILE")
-    if kill -0 "$LOCK_PID" 2>/dev/null; then
-        echo "[$TIMESTAMP] ERROR: Cleanup already running (PID $LOCK_PID). Exiting." >> "$LOG_DIR/cleanup_pre_production_error.log"
-        exit 1
-    else
-        # Stale lock file
-        rm -f "$LOCK_FILE"
-    fi
-fi
-echo $$ > "$LOCK_FILE"
-trap 'rm -f "$LOCK_FILE"' EXIT
+ERROR_LOG="$LOG_DIR/cleanup_pre_production_error_$TIMESTAMP.log"
 
 # ---------- Environment setup ----------
 export DJANGO_SETTINGS_MODULE=config.settings
@@ -67,6 +54,31 @@ log_step() {
     echo "========================================" | tee -a "$LOG_FILE"
 }
 
+# Record a run in the Status Sinkronisasi catalog (never fails the script)
+catalog_run() {
+    python manage.py catalog_sync_log "$@" >/dev/null 2>&1 \
+        || log "WARN" "Gagal mencatat run di katalog: catalog_sync_log $*"
+}
+
+cd "$DJANGO_DIR"
+
+# ---------- Prevent concurrent runs ----------
+if [ -f "$LOCK_FILE" ]; then
+    LOCK_PID=$(cat "$LOCK_FILE")
+    if kill -0 "$LOCK_PID" 2>/dev/null; then
+        echo "[$TIMESTAMP] ERROR: Cleanup already running (PID $LOCK_PID). Exiting." >> "$ERROR_LOG"
+        catalog_run finish "$ERROR_LOG" --type cleanup_pre_production_error --exit-code 1 \
+            --message "Cleanup already running (PID $LOCK_PID)"
+        exit 1
+    else
+        # Stale lock file
+        rm -f "$LOCK_FILE"
+    fi
+fi
+echo $$ > "$LOCK_FILE"
+MASTER_CATALOGED=false
+trap 'EXIT_STATUS=$?; [ "$MASTER_CATALOGED" = true ] && catalog_run finish "$LOG_FILE" --type cleanup_pre_production --exit-code $EXIT_STATUS; rm -f "$LOCK_FILE"' EXIT
+
 # ---------- Safety check: hanya jalan di tanggal yang benar ----------
 # Mode dry-run (--dry-run) boleh jalan kapan saja untuk testing / simulasi
 # Tanpa --dry-run, script hanya akan jalan pada TARGET_DATE untuk eksekusi nyata
@@ -79,7 +91,8 @@ TARGET_DATE="2026-07-01"
 CURRENT_DATE=$(date '+%Y-%m-%d')
 
 if [ "$CURRENT_DATE" != "$TARGET_DATE" ] && [ "$DRY_RUN_MODE" = false ]; then
-    echo "[$TIMESTAMP] WARN: Script hanya boleh dijalankan pada $TARGET_DATE (saat ini: $CURRENT_DATE)." >> "$LOG_DIR/cleanup_pre_production_error.log"
+    echo "[$TIMESTAMP] WARN: Script hanya boleh dijalankan pada $TARGET_DATE (saat ini: $CURRENT_DATE)." >> "$ERROR_LOG"
+    catalog_run finish "$ERROR_LOG" --type cleanup_pre_production_error
     exit 0
 fi
 
@@ -91,7 +104,8 @@ fi
 
 # ---------- Start ----------
 mkdir -p "$LOG_DIR"
-cd "$DJANGO_DIR"
+catalog_run start "$LOG_FILE" --type cleanup_pre_production
+MASTER_CATALOGED=true
 
 log "INFO" "=== Pre-Production Cleanup dimulai ==="
 log "INFO" "Log file: $LOG_FILE"
@@ -102,14 +116,17 @@ log_step "STEP 1/3: Dry-Run (estimasi data yang akan dihapus)"
 
 DRYRUN_LOG="$LOG_DIR/cleanup_dryrun_$TIMESTAMP.log"
 log "INFO" "Menjalankan dry-run..."
+catalog_run start "$DRYRUN_LOG" --type cleanup_dryrun
 
 if python manage.py cleanup_pre_production --dry-run >> "$DRYRUN_LOG" 2>&1; then
+    catalog_run finish "$DRYRUN_LOG"
     log "OK" "Dry-run selesai. Detail:"
     while IFS= read -r line; do
         log "INFO" "  $line"
     done < <(tail -20 "$DRYRUN_LOG")
 else
     EXIT_CODE=$?
+    catalog_run finish "$DRYRUN_LOG" --exit-code "$EXIT_CODE"
     log "ERROR" "Dry-run gagal (exit code: $EXIT_CODE)."
     log "ERROR" "Lihat detail: $DRYRUN_LOG"
     exit "$EXIT_CODE"
@@ -122,13 +139,16 @@ CLEANUP_LOG="$LOG_DIR/cleanup_exec_$TIMESTAMP.log"
 log "INFO" "Menjalankan penghapusan (log: $CLEANUP_LOG)..."
 
 MANAGE_CMD="python manage.py cleanup_pre_production $DRY_RUN_FLAG"
+catalog_run start "$CLEANUP_LOG" --type cleanup_exec
 if $MANAGE_CMD >> "$CLEANUP_LOG" 2>&1; then
+    catalog_run finish "$CLEANUP_LOG"
     log "OK" "Penghapusan BERHASIL."
     while IFS= read -r line; do
         log "INFO" "  $line"
     done < <(tail -10 "$CLEANUP_LOG")
 else
     EXIT_CODE=$?
+    catalog_run finish "$CLEANUP_LOG" --exit-code "$EXIT_CODE"
     log "ERROR" "Penghapusan GAGAL (exit code: $EXIT_CODE)."
     log "ERROR" "Lihat detail: $CLEANUP_LOG"
     exit "$EXIT_CODE"
@@ -140,13 +160,18 @@ log_step "STEP 3/3: Verifikasi"
 VERIF_LOG="$LOG_DIR/cleanup_verify_$TIMESTAMP.log"
 log "INFO" "Memverifikasi tidak ada lagi tiket dengan old_db=False..."
 
+catalog_run start "$VERIF_LOG" --type cleanup_verify
 if python manage.py cleanup_pre_production --dry-run >> "$VERIF_LOG" 2>&1; then
+    catalog_run finish "$VERIF_LOG"
     VERIF_LINES=$(wc -l < "$VERIF_LOG")
     if grep -q "tidak ada tiket" "$VERIF_LOG"; then
         log "OK" "Verifikasi: TIDAK ada tiket dengan old_db=False — bersih."
     else
         log "WARN" "Verifikasi: Masih ada tiket dengan old_db=False. Cek log: $VERIF_LOG"
     fi
+else
+    catalog_run finish "$VERIF_LOG" --exit-code "$?"
+    log "WARN" "Verifikasi gagal dijalankan. Cek log: $VERIF_LOG"
 fi
 
 # ===== Summary =====
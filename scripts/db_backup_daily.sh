@@ -1,7 +1,8 @@
 #!/bin/bash
 # =============================================================================
 # Daily Database Backup Cron Script
-# Runs: django-dbbackup to create database and media backups
+# Runs: django-dbbackup to create database and media backups, then deletes
+#       read notifications older than NOTIFICATION_RETENTION_DAYS
 # Schedule: every day at 00:00 WIB (GMT+7)
 # Logs: /home/pajak/diamond-web/backups/logs/
 # Retention: keeps last 30 days of backups by default
@@ -158,6 +159,25 @@ else
     log "INFO" "No old backups to purge (retention: $RETENTION_DAYS days)."
 fi
 
+# ============================================================================
+# STEP 4: Cleanup read notifications (after the backup, so they are kept in it)
+# ============================================================================
+log_step "STEP 4/4: Cleanup Read Notifications (cleanup_read_notifications)"
+
+NOTIF_LOG="$LOG_DIR/cleanup_notifications_$TIMESTAMP.log"
+log "INFO" "Deleting read notifications past NOTIFICATION_RETENTION_DAYS (log: $NOTIF_LOG)..."
+
+if python manage.py cleanup_read_notifications >> "$NOTIF_LOG" 2>&1; then
+    log "OK" "Cleanup notifikasi BERHASIL."
+    tail -2 "$NOTIF_LOG" | while IFS= read -r line; do
+        log "INFO" "  $line"
+    done
+else
+    NOTIF_EXIT=$?
+    log "ERROR" "Cleanup notifikasi GAGAL (exit code: $NOTIF_EXIT)."
+    log "ERROR" "Lihat detail: $NOTIF_LOG"
+fi
+
 # ============================================================================
 # Summary
 # ============================================================================
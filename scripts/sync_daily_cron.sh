@@ -12,24 +12,14 @@ DJANGO_DIR="/home/pajak/diamond-web"
 VENV_DIR="$DJANGO_DIR/venv"
 LOG_DIR="$DJANGO_DIR/sync_logs"
 ENV_FILE="$DJANGO_DIR/.env"
-LOCK_FILE="/tmp/diamond_oracle_sync.lock"
 
 TIMESTAMP=$(date '+%Y-%m-%d_%H-%M-%S')
 LOG_FILE="$LOG_DIR/daily_sync_$TIMESTAMP.log"
 
-# ---------- Prevent concurrent runs ----------
-if [ -f "$LOCK_FILE" ]; then
-    LOCK_PID=$(cat "$LOCK_FILE")
-    if kill -0 "$LOCK_PID" 2>/dev/null; then
-        echo "[$TIMESTAMP] ERROR: Sync already running (PID $LOCK_PID). Exiting." >> "$LOG_DIR/daily_sync_error.log"
-        exit 1
-    else
-        # Stale lock file
-        rm -f "$LOCK_FILE"
-    fi
-fi
-echo $$ > "$LOCK_FILE"
-trap 'rm -f "$LOCK_FILE"' EXIT
+# ---------- Concurrent runs ----------
+# No shell lock file: sync_oracle_data / sync_tiket_data take a singleton lock
+# in Redis (shared with the Celery sync tasks), so a second sync of the same
+# type exits with an error instead of overlapping a running one.
 
 # ---------- Environment setup ----------
 export DJANGO_SETTINGS_MODULE=config.settings
@@ -57,6 +47,16 @@ log_step() {
     echo "========================================" | tee -a "$LOG_FILE"
 }
 
+# Record the run in the Status Sinkronisasi catalog (never fails the script)
+catalog_run() {
+    python manage.py catalog_sync_log "$@" >/dev/null 2>&1 \
+        || log "WARN" "Gagal mencatat run di katalog: catalog_sync_log $*"
+}
+
+cd "$DJANGO_DIR"
+catalog_run start "$LOG_FILE" --type daily_sync
+trap 'catalog_run finish "$LOG_FILE" --type daily_sync --exit-code $?' EXIT
+
 # ---------- Date cutoff check ----------
 CUTOFF_DATE="2026-07-01"
 CUTOFF_EPOCH=$(date -d "$CUTOFF_DATE" +%s)
@@ -73,7 +73,6 @@ log "INFO" "=== Daily Oracle sync dimulai ==="
 log "INFO" "Log file: $LOG_FILE"
 
 mkdir -p "$LOG_DIR"
-cd "$DJANGO_DIR"
 
 TOTAL_EXIT_CODE=0
 
@@ -83,7 +82,7 @@ log_step "STEP 1/2: Oracle Referensi Sync"
 REFERENSI_LOG="$LOG_DIR/referensi_sync_$TIMESTAMP.log"
 log "INFO" "Memulai referensi sync (log: $REFERENSI_LOG)..."
 
-if python manage.py sync_oracle_data >> "$REFERENSI_LOG" 2>&1; then
+if python manage.py sync_oracle_data --log-file "$REFERENSI_LOG" >> "$REFERENSI_LOG" 2>&1; then
     log "OK" "Referensi sync BERHASIL."
     # Extract summary from log
     tail -5 "$REFERENSI_LOG" | while IFS= read -r line; do
@@ -103,7 +102,7 @@ log_step "STEP 2/2: Oracle Tiket Sync"
 TIKET_LOG="$LOG_DIR/tiket_sync_$TIMESTAMP.log"
 log "INFO" "Memulai tiket sync (log: $TIKET_LOG)..."
 
-if python manage.py sync_tiket_data >> "$TIKET_LOG" 2>&1; then
+if python manage.py sync_tiket_data --log-file "$TIKET_LOG" >> "$TIKET_LOG" 2>&1; then
     log "OK" "Tiket sync BERHASIL."
     tail -5 "$TIKET_LOG" | while IFS= read -r line; do
         log "INFO" "  $line"